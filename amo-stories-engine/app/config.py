@@ -43,10 +43,31 @@ class Settings(BaseSettings):
 
     # ──── Storage ────
     db_path: str = "./data/stories.db"
+    db_reader_pool_size: int = 4            # read connections for AsyncStoryStateDB / StoryStatePool
+
+    # ──── LLM gateway ────
+    llm_max_concurrency: int = 16            # in-flight requests per model
+    llm_max_retries: int = 3                 # retries on 429/5xx/timeouts
+    llm_retry_base_s: float = 1.0            # backoff ceiling doubles per retry (full jitter)
+    llm_retry_max_s: float = 20.0
+
+    # ──── LLM response cache ────
+    llm_cache_enabled: bool = True           # deterministic stages opt in via llm_cache.cached()
+    llm_cache_ttl_s: int = 7 * 24 * 3600
+    llm_cache_max_mb: int = 64
+
+    # ──── Tracing ────
+    tracing_enabled: bool = True             # stage/LLM spans → data/traces.db
+    trace_retention_hours: int = 72
+    debug_endpoints: bool = False            # serve /debug/* in production too
 
     # ──── Pipeline ────
     max_rewrite_attempts: int = 3
     critic_min_score: float = 7.0
+    critic_auto_approve: bool = True         # clean heuristic prescreen skips the LLM critic
+    critic_min_prose_chars: int = 1500
+    critic_patch_rewrites: bool = True       # rewrite only the paragraphs the critic names
+    critic_patch_max_ratio: float = 0.5      # naming more of the chapter → full rewrite
     writer_max_tokens: int = 4096
     writer_temperature: float = 0.85
 
@@ -66,6 +87,31 @@ class Settings(BaseSettings):
     scene_max_words: int = 500
     scene_min_words: int = 200
 
+    # ──── StoryBrain ────
+    brain_pool_max_size: int = 128           # open NeuralMemory brains (one SQLite db each)
+    brain_pool_idle_s: int = 600             # close brains unused for this long
+    brain_outbox_batch_size: int = 32        # memories encoded per outbox worker pass
+    brain_outbox_retry_base_s: float = 5.0   # first retry delay of a failed memory, doubled per attempt
+    brain_outbox_wait_s: float = 3.0         # query waits at most this long for its story's stores,
+                                             # capped at half of context_recall_timeout_s
+
+    # ──── Context providers ────
+    # Per-provider budgets for the context node (narrative/context.py);
+    # a provider that runs over contributes no block this time
+    context_recall_timeout_s: float = 8.0     # NeuralMemory recall
+    context_loader_timeout_s: float = 3.0     # ledger / world state / companions (SQLite)
+
+    # ──── Speculation ────
+    # Pre-generate the next scene for the likeliest choices while the
+    # player reads. Tokens are estimated per speculative scene.
+    speculation_enabled: bool = True
+    speculation_max_choices: int = 2
+    speculation_scene_tokens: int = 12000
+    speculation_user_token_budget: int = 150000   # per user per window
+    speculation_budget_window_s: int = 3600
+    speculation_ttl_s: int = 900
+    speculation_max_entries: int = 64
+
     # ──── Fate Buffer ────
     fate_buffer_start_decay: int = 15
     fate_buffer_decay_rate: float = 2.5
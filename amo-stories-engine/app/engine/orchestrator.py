@@ -13,23 +13,32 @@ This is the central coordinator that:
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import time
 from dataclasses import dataclass
+from typing import Any
 
 from app.config import settings
 from app.engine.crng import CRNGEngine, CRNGResult
 from app.engine.fate_buffer import FateBuffer
+from app.engine.speculation import (
+    SpeculationScheduler,
+    get_speculation_scheduler,
+    scene_input_key,
+)
 from app.memory.encoding import build_rolling_summary, encode_chapter_from_state
-from app.memory.state import StoryStateDB
+from app.memory.async_state import AsyncStoryStateDB
 from app.memory.story_brain import get_or_create_brain
 from app.models.identity import IdentityEvent, IdentityEventType, apply_delta
 from app.models.pipeline import NarrativeState
 from app.models.player import PlayerState
 from app.models.story import Chapter, Choice, Scene, Story
-from app.narrative.pipeline import run_pipeline
+from app.narrative.pipeline import run_pipeline, wait_for_ledger
 from app.narrative.scene_writer import SceneWriterInput, run_scene_writer
+from app.narrative.streaming import prose_muted
+from app.narrative.tracing import traced
 
 # Combat engine (Phase A + B)
 from app.engine.combat import (
@@ -52,6 +61,9 @@ from app.models.power import (
 
 logger = logging.getLogger(__name__)
 
+# Strong refs to background critic/speculation tasks (the loop only keeps weak ones)
+_follow_up_tasks: set[asyncio.Task] = set()
+
 
 @dataclass
 class ChapterResult:
@@ -105,6 +117,17 @@ class SingleSceneResult:
     awakening_results: list[dict] | None = None
 
 
+@dataclass
+class _ScenePrep:
+    """SceneWriter input plus the state generate_single_scene needs after it."""
+    writer_input: SceneWriterInput
+    existing_scenes: list[Scene]
+    skill_name: str
+    skill_usage_this_chapter: int
+    combat_summary: dict | None
+    brain: Any
+
+
 class StoryOrchestrator:
     """Central coordinator for chapter generation.
 
@@ -118,7 +141,7 @@ class StoryOrchestrator:
         )
     """
 
-    def __init__(self, db: StoryStateDB) -> None:
+    def __init__(self, db: AsyncStoryStateDB) -> None:
         self.db = db
         self.crng = CRNGEngine(
             pity_base_chance=settings.pity_base_chance,
@@ -141,7 +164,7 @@ class StoryOrchestrator:
         except Exception:
             return None
 
-    def _get_prev_chapter_ending(self, chapters: list) -> str:
+    async def _get_prev_chapter_ending(self, chapters: list) -> str:
         """Return the prose of the last scene in the most recent chapter.
 
         Used to bridge chapter-to-chapter continuity — the planner and
@@ -152,7 +175,7 @@ class StoryOrchestrator:
             return ""
         prev_ch = chapters[-1]
         try:
-            last_scene = self.db.get_latest_scene(prev_ch.id)
+            last_scene = await self.db.get_latest_scene(prev_ch.id)
             if last_scene and last_scene.prose:
                 logger.info(
                     f"Cross-chapter bridge: loaded last scene of chapter "
@@ -216,7 +239,7 @@ class StoryOrchestrator:
             tone=tone,
             protagonist_name=protagonist_name or "Nhân vật chính",
         )
-        self.db.create_story(story)
+        await self.db.create_story(story)
         logger.info(f"Story created: {story.id} (scene_mode={settings.scene_mode})")
 
         if settings.scene_mode:
@@ -228,11 +251,7 @@ class StoryOrchestrator:
             # Update story title from first scene
             if result.scenes and result.scenes[0].title:
                 story.title = result.scenes[0].title
-                self.db.conn.execute(
-                    "UPDATE stories SET title = ? WHERE id = ?",
-                    (story.title, story.id)
-                )
-                self.db.conn.commit()
+                await self.db.update_story(story.id, title=story.title)
             return story, result
         else:
             # Legacy monolithic chapter
@@ -242,13 +261,10 @@ class StoryOrchestrator:
             )
             if result.state.writer_output and result.state.writer_output.chapter_title:
                 story.title = result.state.writer_output.chapter_title
-                self.db.conn.execute(
-                    "UPDATE stories SET title = ? WHERE id = ?",
-                    (story.title, story.id)
-                )
-                self.db.conn.commit()
+                await self.db.update_story(story.id, title=story.title)
             return story, result
 
+    @traced("chapter")
     async def generate_chapter(
         self,
         story_id: str,
@@ -269,12 +285,15 @@ class StoryOrchestrator:
         8. Store in NeuralMemory
         """
         # ── 1. Load state ──
-        story = self.db.get_story(story_id)
+        # The previous chapter persists in the background (ledger, world
+        # state, memory); let it land before anything here reads it
+        await wait_for_ledger(story_id)
+        story = await self.db.get_story(story_id)
         if not story:
             raise ValueError(f"Story {story_id} not found")
 
-        player = self.db.get_player_by_user(user_id)
-        chapters = self.db.get_story_chapters(story_id)
+        player = await self.db.get_player_by_user(user_id)
+        chapters = await self.db.get_story_chapters(story_id)
         chapter_number = len(chapters) + 1
 
         # Rate limiting
@@ -293,7 +312,7 @@ class StoryOrchestrator:
                 previous_summary += f"\n\n{semantic_ctx}"
 
         # ── 2c. Previous chapter ending prose (cross-chapter continuity) ──
-        previous_chapter_ending = self._get_prev_chapter_ending(chapters)
+        previous_chapter_ending = await self._get_prev_chapter_ending(chapters)
 
         # ── 3. CRNG roll ──
         crng_result = CRNGResult()
@@ -368,7 +387,7 @@ class StoryOrchestrator:
             chapter.critic_score = state.critic_output.score
         chapter.rewrite_count = state.rewrite_count
 
-        self.db.save_chapter(chapter)
+        await self.db.save_chapter(chapter)
         logger.info(f"Chapter {chapter_number} saved: {chapter.id}")
 
         # ── 7b. Update companion affinity from chapter ──
@@ -384,8 +403,8 @@ class StoryOrchestrator:
                 from app.memory.companion_store import batch_update_affinity
                 from app.narrative.companion_context import TONE_AFFINITY_MULTIPLIER
                 tone_mult = TONE_AFFINITY_MULTIPLIER.get(story.tone or "", 1.0)
-                batch_update_affinity(
-                    self.db, story_id, _companion_deltas,
+                await self.db.write(
+                    batch_update_affinity, story_id, _companion_deltas,
                     chapter=chapter_number, tone_multiplier=tone_mult,
                 )
                 logger.info(f"Companion affinity updated: {_companion_deltas}")
@@ -414,7 +433,7 @@ class StoryOrchestrator:
                 updated_player.pity_counter += 1
 
             # Update player in DB
-            self.db.update_player(updated_player)
+            await self.db.update_player(updated_player)
 
             # ── 8b. Update play style from chapter choice ──
             try:
@@ -428,7 +447,7 @@ class StoryOrchestrator:
                     choice_type=choice_type,
                     consequence_tags=consequence_tags,
                 )
-                self.db.update_player(updated_player)
+                await self.db.update_player(updated_player)
             except Exception as exc:
                 logger.warning(f"Play style update failed: {exc}")
 
@@ -439,7 +458,7 @@ class StoryOrchestrator:
                 if evo_event:
                     logger.info(f"Archetype evolution event: {evo_event}")
                     # Store as identity event for planner to pick up
-                    self.db.log_identity_event(IdentityEvent(
+                    await self.db.log_identity_event(IdentityEvent(
                         player_id=player.id,
                         event_type=IdentityEventType.DRIFT,
                         chapter_number=chapter_number,
@@ -465,15 +484,15 @@ class StoryOrchestrator:
                 ),
                 delta_snapshot=delta.model_dump(),
             )
-            self.db.log_identity_event(event)
+            await self.db.log_identity_event(event)
 
             # Log flags
             for flag_key in delta.new_flags:
-                self.db.set_player_flag(player.id, flag_key, chapter_number)
+                await self.db.set_player_flag(player.id, flag_key, chapter_number)
 
             # Confrontation event
             if delta.confrontation_triggered:
-                self.db.log_identity_event(IdentityEvent(
+                await self.db.log_identity_event(IdentityEvent(
                     player_id=player.id,
                     event_type=IdentityEventType.CONFRONTATION,
                     chapter_number=chapter_number,
@@ -482,7 +501,7 @@ class StoryOrchestrator:
 
             # Breakthrough event
             if delta.breakthrough_triggered:
-                self.db.log_identity_event(IdentityEvent(
+                await self.db.log_identity_event(IdentityEvent(
                     player_id=player.id,
                     event_type=IdentityEventType.BREAKTHROUGH,
                     chapter_number=chapter_number,
@@ -490,7 +509,7 @@ class StoryOrchestrator:
                 ))
                 # Reset breakthrough meter
                 updated_player.breakthrough_meter = 0
-                self.db.update_player(updated_player)
+                await self.db.update_player(updated_player)
 
             identity_delta_summary = {
                 "dqs": delta.dqs_change,
@@ -520,6 +539,7 @@ class StoryOrchestrator:
     # Scene-Based Chapter Generation
     # ══════════════════════════════════════════
 
+    @traced("scene_chapter")
     async def generate_scene_chapter(
         self,
         story_id: str,
@@ -541,12 +561,15 @@ class StoryOrchestrator:
         import json as _json
 
         # ── 1. Load state ──
-        story = self.db.get_story(story_id)
+        # The previous chapter persists in the background (ledger, world
+        # state, memory); let it land before anything here reads it
+        await wait_for_ledger(story_id)
+        story = await self.db.get_story(story_id)
         if not story:
             raise ValueError(f"Story {story_id} not found")
 
-        player = self.db.get_player_by_user(user_id)
-        chapters = self.db.get_story_chapters(story_id)
+        player = await self.db.get_player_by_user(user_id)
+        chapters = await self.db.get_story_chapters(story_id)
         chapter_number = len(chapters) + 1
 
         if chapter_number > settings.max_chapters_per_story:
@@ -564,7 +587,7 @@ class StoryOrchestrator:
                 previous_summary += f"\n\n{semantic_ctx}"
 
         # ── 2c. Previous chapter ending prose (cross-chapter continuity) ──
-        previous_chapter_ending = self._get_prev_chapter_ending(chapters)
+        previous_chapter_ending = await self._get_prev_chapter_ending(chapters)
 
         # ── 3. CRNG + Fate Buffer ──
         crng_result = CRNGResult()
@@ -624,7 +647,8 @@ class StoryOrchestrator:
                 logger.warning(f"Adaptive context build failed: {exc}")
 
         logger.info(f"Scene pipeline: running planner for chapter {chapter_number}")
-        state = await run_pipeline(pipeline_input)
+        with prose_muted():  # only the beats are used — scenes stream below
+            state = await run_pipeline(pipeline_input)
 
         planner_output = state.planner_output
         if not planner_output or not planner_output.beats:
@@ -648,7 +672,7 @@ class StoryOrchestrator:
             total_scenes=total_scenes,
             chosen_choice=choice,
         )
-        self.db.save_chapter(chapter)
+        await self.db.save_chapter(chapter)
         logger.info(f"Chapter {chapter_number} shell saved: {chapter.id}")
 
         # ── 6. Scene loop ──
@@ -686,7 +710,7 @@ class StoryOrchestrator:
                 combat_summary = self._resolve_combat_for_beat(
                     player=player, beat=beat, floor=player.current_floor,
                 )
-                self.db.update_player(player)
+                await self.db.update_player(player)
                 logger.info(
                     f"Combat resolved (scene loop): "
                     f"outcome={combat_summary.get('outcome', '?')}"
@@ -716,7 +740,7 @@ class StoryOrchestrator:
             scene.chapter_id = chapter.id
 
             # Save scene to DB
-            self.db.save_scene(scene)
+            await self.db.save_scene(scene)
             scenes.append(scene)
 
             # Store scene in NeuralMemory
@@ -752,7 +776,7 @@ class StoryOrchestrator:
         chapter.prose = combined_prose
         chapter.summary = combined_summary
         chapter.choices = scenes[-1].choices if scenes else []
-        self.db.save_chapter(chapter)
+        await self.db.save_chapter(chapter)
 
         # ── 7b. Update companion affinity from chapter (scene mode) ──
         _companion_deltas: dict[str, int] = {}
@@ -767,8 +791,8 @@ class StoryOrchestrator:
                 from app.memory.companion_store import batch_update_affinity
                 from app.narrative.companion_context import TONE_AFFINITY_MULTIPLIER
                 tone_mult = TONE_AFFINITY_MULTIPLIER.get(story.tone or "", 1.0)
-                batch_update_affinity(
-                    self.db, story_id, _companion_deltas,
+                await self.db.write(
+                    batch_update_affinity, story_id, _companion_deltas,
                     chapter=chapter_number, tone_multiplier=tone_mult,
                 )
                 logger.info(f"Companion affinity updated (scene mode): {_companion_deltas}")
@@ -786,7 +810,7 @@ class StoryOrchestrator:
             else:
                 updated_player.pity_counter += 1
 
-            self.db.update_player(updated_player)
+            await self.db.update_player(updated_player)
 
             # ── 8b. Update play style from chapter choice ──
             try:
@@ -800,7 +824,7 @@ class StoryOrchestrator:
                     choice_type=choice_type,
                     consequence_tags=consequence_tags,
                 )
-                self.db.update_player(updated_player)
+                await self.db.update_player(updated_player)
             except Exception as exc:
                 logger.warning(f"Play style update failed: {exc}")
 
@@ -810,7 +834,7 @@ class StoryOrchestrator:
                 evo_event = check_archetype_evolution(updated_player)
                 if evo_event:
                     logger.info(f"Archetype evolution event: {evo_event}")
-                    self.db.log_identity_event(IdentityEvent(
+                    await self.db.log_identity_event(IdentityEvent(
                         player_id=player.id,
                         event_type=IdentityEventType.DRIFT,
                         chapter_number=chapter_number,
@@ -835,13 +859,13 @@ class StoryOrchestrator:
                 ),
                 delta_snapshot=delta.model_dump(),
             )
-            self.db.log_identity_event(event)
+            await self.db.log_identity_event(event)
 
             for flag_key in delta.new_flags:
-                self.db.set_player_flag(player.id, flag_key, chapter_number)
+                await self.db.set_player_flag(player.id, flag_key, chapter_number)
 
             if delta.confrontation_triggered:
-                self.db.log_identity_event(IdentityEvent(
+                await self.db.log_identity_event(IdentityEvent(
                     player_id=player.id,
                     event_type=IdentityEventType.CONFRONTATION,
                     chapter_number=chapter_number,
@@ -849,14 +873,14 @@ class StoryOrchestrator:
                 ))
 
             if delta.breakthrough_triggered:
-                self.db.log_identity_event(IdentityEvent(
+                await self.db.log_identity_event(IdentityEvent(
                     player_id=player.id,
                     event_type=IdentityEventType.BREAKTHROUGH,
                     chapter_number=chapter_number,
                     description="Breakthrough triggered!",
                 ))
                 updated_player.breakthrough_meter = 0
-                self.db.update_player(updated_player)
+                await self.db.update_player(updated_player)
 
             identity_delta_summary = {
                 "dqs": delta.dqs_change,
@@ -905,7 +929,7 @@ class StoryOrchestrator:
             tension=5,
             mood="neutral",
         )
-        self.db.save_scene(scene)
+        await self.db.save_scene(scene)
 
         return SceneChapterResult(
             chapter=chapter,
@@ -918,6 +942,7 @@ class StoryOrchestrator:
     # Interactive Scene-by-Scene (Phase B)
     # ══════════════════════════════════════════
 
+    @traced("chapter_plan")
     async def generate_chapter_plan(
         self,
         story_id: str,
@@ -933,12 +958,15 @@ class StoryOrchestrator:
         import json as _json
 
         # ── 1. Load state ──
-        story = self.db.get_story(story_id)
+        # The previous chapter persists in the background (ledger, world
+        # state, memory); let it land before anything here reads it
+        await wait_for_ledger(story_id)
+        story = await self.db.get_story(story_id)
         if not story:
             raise ValueError(f"Story {story_id} not found")
 
-        player = self.db.get_player_by_user(user_id)
-        chapters = self.db.get_story_chapters(story_id)
+        player = await self.db.get_player_by_user(user_id)
+        chapters = await self.db.get_story_chapters(story_id)
         chapter_number = len(chapters) + 1
 
         if chapter_number > settings.max_chapters_per_story:
@@ -956,7 +984,7 @@ class StoryOrchestrator:
                 previous_summary += f"\n\n{semantic_ctx}"
 
         # ── 2c. Previous chapter ending prose (cross-chapter continuity) ──
-        previous_chapter_ending = self._get_prev_chapter_ending(chapters)
+        previous_chapter_ending = await self._get_prev_chapter_ending(chapters)
 
         # ── 3. CRNG + Fate Buffer ──
         crng_result = CRNGResult()
@@ -1037,7 +1065,7 @@ class StoryOrchestrator:
             chosen_choice=choice,
             identity_delta_json=identity_delta_json,
         )
-        self.db.save_chapter(chapter)
+        await self.db.save_chapter(chapter)
         logger.info(f"ChapterPlan: chapter {chapter_number} shell saved ({total_scenes} beats)")
 
         return ChapterPlanResult(
@@ -1047,6 +1075,7 @@ class StoryOrchestrator:
             _pipeline_state=state,
         )
 
+    @traced("single_scene")
     async def generate_single_scene(
         self,
         story_id: str,
@@ -1066,15 +1095,15 @@ class StoryOrchestrator:
         import json as _json
 
         # ── 1. Load state ──
-        story = self.db.get_story(story_id)
+        story = await self.db.get_story(story_id)
         if not story:
             raise ValueError(f"Story {story_id} not found")
 
-        chapter = self.db.get_chapter(chapter_id)
+        chapter = await self.db.get_chapter(chapter_id)
         if not chapter:
             raise ValueError(f"Chapter {chapter_id} not found")
 
-        player = self.db.get_player_by_user(story.user_id)
+        player = await self.db.get_player_by_user(story.user_id)
 
         # ── 2. Load planner output from chapter ──
         from app.models.pipeline import PlannerOutput
@@ -1094,174 +1123,35 @@ class StoryOrchestrator:
         beat = beats[beat_index]
         is_chapter_end = (scene_number == total_scenes)
 
-        # ── 3. Load previous scenes for context ──
-        existing_scenes = self.db.get_chapter_scenes(chapter_id)
-        existing_scenes.sort(key=lambda s: s.scene_number)
-
-        prev_prose = ""
-        prev_prose_2 = ""
-        if existing_scenes:
-            prev_prose = existing_scenes[-1].prose
-            if len(existing_scenes) >= 2:
-                prev_prose_2 = existing_scenes[-2].prose
-        elif scene_number == 1 and chapter.chapter_number > 1:
-            # Cross-chapter continuity: scene 1 of chapter N has no existing scenes yet.
-            # Use the last scene of chapter N-1 so the writer opens consistently.
-            all_chapters = self.db.get_story_chapters(story_id)
-            prev_ch = next(
-                (c for c in all_chapters if c.chapter_number == chapter.chapter_number - 1),
-                None,
-            )
-            if prev_ch:
-                prev_last = self.db.get_latest_scene(prev_ch.id)
-                if prev_last:
-                    prev_prose = prev_last.prose
-                    logger.info(
-                        f"Cross-chapter SceneWriter bridge: using last scene of "
-                        f"chapter {chapter.chapter_number - 1} ({len(prev_prose)} chars)"
-                    )
-
-        # ── 4. Skill data ──
-        skill_data = None
-        skill_name = ""
-        if player and player.unique_skill:
-            skill_data = player.unique_skill.model_dump()
-            skill_name = player.unique_skill.name
-
-        # ── 4b. Track skill usage ──
-        # Count how many times skill was used in this chapter so far
-        skill_usage_this_chapter = 0
-        if skill_name and player:
-            # Check existing scenes' chosen choices for skill pattern
-            for s in existing_scenes:
-                if s.chosen_choice_id:
-                    for c in s.choices:
-                        if c.id == s.chosen_choice_id and f"[{skill_name}]" in c.text:
-                            skill_usage_this_chapter += 1
-                            break
-            # Check current incoming choice (from previous scene)
-            if choice and f"[{skill_name}]" in (choice.text or ""):
-                skill_usage_this_chapter += 1
-                # Increment global skill usage counter in progression
-                skill_id = player.unique_skill.name  # Use name as ID for now
-                player.progression.skill_usage[skill_id] = (
-                    player.progression.skill_usage.get(skill_id, 0) + 1
-                )
-                player.progression.total_scenes += 1
-
-        # Fate instruction
-        fate_instruction = ""
-        if player:
-            fate_status = self.fate.get_status(player)
-            fate_instruction = fate_status.narrative_instruction
-
-        # ── 4c. Load previous scene's critic feedback ──
-        prev_critic_feedback = ""
-        if existing_scenes:
-            prev_critic_feedback = existing_scenes[-1].critic_feedback or ""
-
-        # ── 4d. Combat resolution (before writer) ──
-        combat_summary = None
-        if beat.scene_type == "combat" and player:
-            combat_summary = self._resolve_combat_for_beat(
-                player=player, beat=beat, floor=player.current_floor,
-                skill_usage_this_chapter=skill_usage_this_chapter,
-                player_decisions=combat_decisions,
-            )
-            # Persist combat-updated player state immediately
-            self.db.update_player(player)
-            logger.info(
-                f"Combat resolved: score={combat_summary.get('combat_score', '?')}, "
-                f"outcome={combat_summary.get('outcome', '?')}"
-            )
-
-        # ── 4e. Semantic memory query ──
-        brain = await get_or_create_brain(story_id, story.brain_id)
-        semantic_context = ""
-        if brain.available:
-            query_text = beat.description or (choice.text if choice else "")
-            semantic_context = await brain.query_context(query_text)
-
-        # ── 4f. Build evolution + resonance context for writer ──
-        evolution_context = ""
-        resonance_context_str = ""
-        if player:
-            # Resonance prose descriptors (spec §10.3)
-            from app.engine.resonance_mastery import build_resonance_context
-            res_ctx = build_resonance_context(player.resonance or {})
-            if res_ctx:
-                resonance_context_str = "\n".join(
-                    f"- {p}: {desc}" for p, desc in res_ctx.items()
-                )
-
-            # Evolution context for active mutation arc
-            evo = player.skill_evolution
-            if evo and evo.mutation_in_progress:
-                arc = evo.mutation_arc_scene
-                evolution_context = (
-                    f"⚡ Skill [{evo.mutation_in_progress}] đang mutation "
-                    f"(scene {arc}/3).\n"
-                )
-                if arc == 1:
-                    evolution_context += (
-                        "→ Skill hành xử bất thường — misfire, yếu, hoặc ngược. "
-                        "Mô tả sự bất ổn trong prose."
-                    )
-                elif arc == 2:
-                    evolution_context += (
-                        "→ DECISION POINT — player phải chọn: chấp nhận / "
-                        "chống lại / ép hybrid. TẠO 3 CHOICES phản ánh 3 lựa chọn này."
-                    )
-                elif arc == 3:
-                    evolution_context += (
-                        "→ Skill hoàn thành transformation. Mô tả sự tiến hóa — "
-                        "cảm giác mạnh mẽ hơn, không mất mát."
-                    )
-
-        # ── 5. Generate scene ──
-        scene_start = time.monotonic()
-
-        # ── 4g. Build adaptive context for scene writer ──
-        # Writer gets narrative texture (format_writer_context), not the full metadata dump.
-        adaptive_ctx_str = ""
-        if player:
-            try:
-                from app.engine.adaptive_context_builder import (
-                    build_adaptive_context,
-                    format_writer_context,
-                )
-                adaptive_ctx = build_adaptive_context(player, world_state=self._load_world_state_safe(story_id))
-                adaptive_ctx_str = format_writer_context(adaptive_ctx)
-            except Exception as exc:
-                logger.warning(f"Adaptive context build failed: {exc}")
-
-        scene_input = SceneWriterInput(
-            chapter_number=chapter.chapter_number,
+        prep = await self._prepare_single_scene(
+            story=story,
+            chapter=chapter,
+            player=player,
+            beats=beats,
             scene_number=scene_number,
-            total_scenes=total_scenes,
-            beat=beat,
-            all_beats=beats,
-            protagonist_name=story.protagonist_name,
-            previous_scene_prose=prev_prose,
-            previous_scene_prose_2=prev_prose_2,
-            chosen_choice=choice,      # ← User's actual choice from previous scene!
-            is_chapter_end=is_chapter_end,
-            player_state=player.model_dump() if player else None,
-            unique_skill=skill_data,
-            fate_instruction=fate_instruction,
-            preference_tags=story.preference_tags,
-            skill_usage_this_chapter=skill_usage_this_chapter,
-            critic_feedback=prev_critic_feedback,
-            combat_brief=beat.combat_brief,  # Injected by _resolve_combat
-            semantic_context=semantic_context,
-            evolution_context=evolution_context,
-            resonance_context=resonance_context_str,
-            adaptive_context=adaptive_ctx_str,
-            tone=story.tone,
-            gender=player.gender if player else "neutral",
+            choice=choice,
+            combat_decisions=combat_decisions,
         )
+        existing_scenes = prep.existing_scenes
+        skill_name = prep.skill_name
+        skill_usage_this_chapter = prep.skill_usage_this_chapter
+        combat_summary = prep.combat_summary
+        brain = prep.brain
 
-        scene = await run_scene_writer(scene_input)
+        # ── 5. Generate scene ──
+        scene_start = time.monotonic()
+        scene = None
+        if settings.speculation_enabled:
+            scheduler = get_speculation_scheduler()
+            scene = await scheduler.claim(
+                story_id, scene_input_key(story_id, prep.writer_input),
+            )
+            # Siblings were written for choices the player did not pick
+            scheduler.invalidate(story_id)
+            if scene is not None:
+                logger.info(f"SingleScene: speculation hit for scene {scene_number}")
+        if scene is None:
+            scene = await run_scene_writer(prep.writer_input)
         scene.chapter_id = chapter_id
 
         # ── 5b. Heuristic critic (sync, instant) ──
@@ -1270,7 +1160,7 @@ class StoryOrchestrator:
         scene.critic_score = heuristic.score
 
         # Save scene to DB
-        self.db.save_scene(scene)
+        await self.db.save_scene(scene)
 
         # Store scene in NeuralMemory
         if brain.available:
@@ -1284,16 +1174,25 @@ class StoryOrchestrator:
             )
 
         # ── 5c. Async LLM critic (background, zero latency) ──
-        asyncio.ensure_future(self._run_async_scene_critic(
-            scene=scene,
-            beat_description=beat.description,
-            total_scenes=total_scenes,
-            skill_name=skill_name,
-        ))
+        # Speculation waits for it: the critic feedback is part of the next input.
+        # Created muted so the task's context never holds this scene's ProseStream.
+        with prose_muted():
+            follow_up = asyncio.create_task(
+                self._critic_then_speculate(
+                    scene=scene,
+                    story_id=story_id,
+                    beat_description=beat.description,
+                    total_scenes=total_scenes,
+                    skill_name=skill_name,
+                ),
+                name=f"critic_scene_{scene_number}",
+            )
+        _follow_up_tasks.add(follow_up)
+        follow_up.add_done_callback(_follow_up_tasks.discard)
 
         # Persist player progression updates
         if player and choice:
-            self.db.update_player(player)
+            await self.db.update_player(player)
 
         elapsed = time.monotonic() - scene_start
         logger.info(
@@ -1314,7 +1213,7 @@ class StoryOrchestrator:
             )
             # Save hints to scene record (for UI display)
             scene.identity_delta_json = json.dumps(scene_identity_hints)
-            self.db.save_scene(scene)
+            await self.db.save_scene(scene)
 
             # Persist hints to PlayerState (micro-updates are real)
             hints = scene_identity_hints
@@ -1326,7 +1225,7 @@ class StoryOrchestrator:
                     setattr(player, field, hints[field])
             if "alignment" in hints:
                 player.alignment = hints["alignment"]
-            self.db.update_player(player)
+            await self.db.update_player(player)
 
         # ── 6b. Unique Skill Growth tracking ──
         growth_events = {}
@@ -1388,7 +1287,7 @@ class StoryOrchestrator:
                 # Always include growth writer context
                 growth_events["writer_context"] = build_growth_writer_context(player)
 
-            self.db.update_player(player)
+            await self.db.update_player(player)
 
         # ── 6c. Resonance Mastery update (after combat) ──
         resonance_events = {}
@@ -1517,7 +1416,7 @@ class StoryOrchestrator:
                         "count": mastery.dual_mastery_count,
                     }
 
-            self.db.update_player(player)
+            await self.db.update_player(player)
 
         # ── 6d. Skill Evolution check (per scene) ──
         skill_evolution_event = None
@@ -1545,7 +1444,7 @@ class StoryOrchestrator:
                     player.skill_evolution.mutation_arc_scene,
                     mutation_arc_info.get("status"),
                 )
-                self.db.update_player(player)
+                await self.db.update_player(player)
 
             # 6d-ii: Check for new evolution triggers (blocked during mutation)
             skill_evolution_event = check_skill_evolution(
@@ -1593,7 +1492,7 @@ class StoryOrchestrator:
                     chapter.chapter_number,
                     scene_number,
                 )
-            self.db.update_player(player)
+            await self.db.update_player(player)
 
         # ── 6e. Integration eligibility check (rest scenes only) ──
         integration_options = None
@@ -1651,7 +1550,7 @@ class StoryOrchestrator:
                             )
                             break
                 if awakening_results:
-                    self.db.update_player(player)
+                    await self.db.update_player(player)
 
         # ── 7. If last scene: finalize chapter ──
         identity_delta_summary = scene_identity_hints  # Start with per-scene hints
@@ -1668,7 +1567,7 @@ class StoryOrchestrator:
             chapter.prose = combined_prose
             chapter.summary = combined_summary
             chapter.choices = scene.choices
-            self.db.save_chapter(chapter)
+            await self.db.save_chapter(chapter)
 
             # Apply identity delta (from planner pipeline state stored in chapter)
             if player:
@@ -1698,7 +1597,7 @@ class StoryOrchestrator:
                 )
                 # Sync skill instability from player instability
                 player.unique_skill.instability = player.instability * 0.5
-                self.db.update_player(player)
+                await self.db.update_player(player)
 
         return SingleSceneResult(
             scene=scene,
@@ -1717,6 +1616,297 @@ class StoryOrchestrator:
             awakening_results=awakening_results or None,
         )
 
+    @traced("prepare_scene")
+    async def _prepare_single_scene(
+        self,
+        story: Story,
+        chapter: Chapter,
+        player: PlayerState | None,
+        beats: list,
+        scene_number: int,
+        choice: Choice | None = None,
+        combat_decisions: list | None = None,
+    ) -> _ScenePrep:
+        """Build the SceneWriter input for one scene (steps 3–4g).
+
+        Mutates ``player`` the way a real request does (skill usage
+        counters, combat results) — speculative callers pass a copy and
+        skip combat beats, whose resolution is random and persisted.
+        """
+        story_id = story.id
+        chapter_id = chapter.id
+        total_scenes = len(beats)
+        beat = beats[scene_number - 1]
+        is_chapter_end = (scene_number == total_scenes)
+
+        # The previous chapter persists in the background (ledger, world
+        # state, memory); both scene requests and speculation land here
+        await wait_for_ledger(story_id)
+
+        # ── 3. Load previous scenes for context ──
+        existing_scenes = await self.db.get_chapter_scenes(chapter_id)
+        existing_scenes.sort(key=lambda s: s.scene_number)
+
+        prev_prose = ""
+        prev_prose_2 = ""
+        if existing_scenes:
+            prev_prose = existing_scenes[-1].prose
+            if len(existing_scenes) >= 2:
+                prev_prose_2 = existing_scenes[-2].prose
+        elif scene_number == 1 and chapter.chapter_number > 1:
+            # Cross-chapter continuity: scene 1 of chapter N has no existing scenes yet.
+            # Use the last scene of chapter N-1 so the writer opens consistently.
+            all_chapters = await self.db.get_story_chapters(story_id)
+            prev_ch = next(
+                (c for c in all_chapters if c.chapter_number == chapter.chapter_number - 1),
+                None,
+            )
+            if prev_ch:
+                prev_last = await self.db.get_latest_scene(prev_ch.id)
+                if prev_last:
+                    prev_prose = prev_last.prose
+                    logger.info(
+                        f"Cross-chapter SceneWriter bridge: using last scene of "
+                        f"chapter {chapter.chapter_number - 1} ({len(prev_prose)} chars)"
+                    )
+
+        # ── 4. Skill data ──
+        skill_data = None
+        skill_name = ""
+        if player and player.unique_skill:
+            skill_data = player.unique_skill.model_dump()
+            skill_name = player.unique_skill.name
+
+        # ── 4b. Track skill usage ──
+        # Count how many times skill was used in this chapter so far
+        skill_usage_this_chapter = 0
+        if skill_name and player:
+            # Check existing scenes' chosen choices for skill pattern
+            for s in existing_scenes:
+                if s.chosen_choice_id:
+                    for c in s.choices:
+                        if c.id == s.chosen_choice_id and f"[{skill_name}]" in c.text:
+                            skill_usage_this_chapter += 1
+                            break
+            # Check current incoming choice (from previous scene)
+            if choice and f"[{skill_name}]" in (choice.text or ""):
+                skill_usage_this_chapter += 1
+                # Increment global skill usage counter in progression
+                skill_id = player.unique_skill.name  # Use name as ID for now
+                player.progression.skill_usage[skill_id] = (
+                    player.progression.skill_usage.get(skill_id, 0) + 1
+                )
+                player.progression.total_scenes += 1
+
+        # Fate instruction
+        fate_instruction = ""
+        if player:
+            fate_status = self.fate.get_status(player)
+            fate_instruction = fate_status.narrative_instruction
+
+        # ── 4c. Load previous scene's critic feedback ──
+        prev_critic_feedback = ""
+        if existing_scenes:
+            prev_critic_feedback = existing_scenes[-1].critic_feedback or ""
+
+        # ── 4d. Combat resolution (before writer) ──
+        combat_summary = None
+        if beat.scene_type == "combat" and player:
+            combat_summary = self._resolve_combat_for_beat(
+                player=player, beat=beat, floor=player.current_floor,
+                skill_usage_this_chapter=skill_usage_this_chapter,
+                player_decisions=combat_decisions,
+            )
+            # Persist combat-updated player state immediately
+            await self.db.update_player(player)
+            logger.info(
+                f"Combat resolved: score={combat_summary.get('combat_score', '?')}, "
+                f"outcome={combat_summary.get('outcome', '?')}"
+            )
+
+        # ── 4e. Semantic memory query ──
+        brain = await get_or_create_brain(story_id, story.brain_id)
+        semantic_context = ""
+        if brain.available:
+            query_text = beat.description or (choice.text if choice else "")
+            semantic_context = await brain.query_context(query_text)
+
+        # ── 4f. Build evolution + resonance context for writer ──
+        evolution_context = ""
+        resonance_context_str = ""
+        if player:
+            # Resonance prose descriptors (spec §10.3)
+            from app.engine.resonance_mastery import build_resonance_context
+            res_ctx = build_resonance_context(player.resonance or {})
+            if res_ctx:
+                resonance_context_str = "\n".join(
+                    f"- {p}: {desc}" for p, desc in res_ctx.items()
+                )
+
+            # Evolution context for active mutation arc
+            evo = player.skill_evolution
+            if evo and evo.mutation_in_progress:
+                arc = evo.mutation_arc_scene
+                evolution_context = (
+                    f"⚡ Skill [{evo.mutation_in_progress}] đang mutation "
+                    f"(scene {arc}/3).\n"
+                )
+                if arc == 1:
+                    evolution_context += (
+                        "→ Skill hành xử bất thường — misfire, yếu, hoặc ngược. "
+                        "Mô tả sự bất ổn trong prose."
+                    )
+                elif arc == 2:
+                    evolution_context += (
+                        "→ DECISION POINT — player phải chọn: chấp nhận / "
+                        "chống lại / ép hybrid. TẠO 3 CHOICES phản ánh 3 lựa chọn này."
+                    )
+                elif arc == 3:
+                    evolution_context += (
+                        "→ Skill hoàn thành transformation. Mô tả sự tiến hóa — "
+                        "cảm giác mạnh mẽ hơn, không mất mát."
+                    )
+
+        # ── 4g. Build adaptive context for scene writer ──
+        # Writer gets narrative texture (format_writer_context), not the full metadata dump.
+        adaptive_ctx_str = ""
+        if player:
+            try:
+                from app.engine.adaptive_context_builder import (
+                    build_adaptive_context,
+                    format_writer_context,
+                )
+                adaptive_ctx = build_adaptive_context(player, world_state=self._load_world_state_safe(story_id))
+                adaptive_ctx_str = format_writer_context(adaptive_ctx)
+            except Exception as exc:
+                logger.warning(f"Adaptive context build failed: {exc}")
+
+        scene_input = SceneWriterInput(
+            chapter_number=chapter.chapter_number,
+            scene_number=scene_number,
+            total_scenes=total_scenes,
+            beat=beat,
+            all_beats=beats,
+            protagonist_name=story.protagonist_name,
+            previous_scene_prose=prev_prose,
+            previous_scene_prose_2=prev_prose_2,
+            chosen_choice=choice,      # ← User's actual choice from previous scene!
+            is_chapter_end=is_chapter_end,
+            player_state=player.model_dump() if player else None,
+            unique_skill=skill_data,
+            fate_instruction=fate_instruction,
+            preference_tags=story.preference_tags,
+            skill_usage_this_chapter=skill_usage_this_chapter,
+            critic_feedback=prev_critic_feedback,
+            combat_brief=beat.combat_brief,  # Injected by _resolve_combat
+            semantic_context=semantic_context,
+            evolution_context=evolution_context,
+            resonance_context=resonance_context_str,
+            adaptive_context=adaptive_ctx_str,
+            tone=story.tone,
+            gender=player.gender if player else "neutral",
+        )
+
+        return _ScenePrep(
+            writer_input=scene_input,
+            existing_scenes=existing_scenes,
+            skill_name=skill_name,
+            skill_usage_this_chapter=skill_usage_this_chapter,
+            combat_summary=combat_summary,
+            brain=brain,
+        )
+
+    async def _critic_then_speculate(
+        self,
+        scene: Scene,
+        story_id: str,
+        beat_description: str,
+        total_scenes: int,
+        skill_name: str,
+    ) -> None:
+        """Background follow-up to a delivered scene: critic, then speculation."""
+        await self._run_async_scene_critic(
+            scene=scene,
+            beat_description=beat_description,
+            total_scenes=total_scenes,
+            skill_name=skill_name,
+        )
+        if settings.speculation_enabled and not scene.is_chapter_end:
+            await self._speculate_next_scene(story_id, scene)
+
+    @traced("speculation")
+    async def _speculate_next_scene(self, story_id: str, scene: Scene) -> None:
+        """Pre-write the next scene for the player's likeliest choices.
+
+        Results are keyed by the exact writer input, so they are only used
+        if the real request ends up building the same one.
+        """
+        from app.engine.play_style_engine import rank_choices
+        from app.models.pipeline import PlannerOutput
+
+        next_number = scene.scene_number + 1
+        try:
+            story = await self.db.get_story(story_id)
+            chapter = await self.db.get_chapter(scene.chapter_id)
+            if not story or not chapter:
+                return
+            beats = PlannerOutput(**json.loads(chapter.planner_output_json)).beats
+            if next_number > len(beats) or beats[next_number - 1].scene_type == "combat":
+                return
+
+            player = await self.db.get_player_by_user(story.user_id)
+            choices = list(scene.choices)
+            if player:
+                recent_risks = [
+                    c.risk_level
+                    for s in await self.db.get_chapter_scenes(chapter.id)
+                    for c in s.choices
+                    if s.chosen_choice_id and c.id == s.chosen_choice_id
+                ]
+                choices = rank_choices(choices, player.play_style, recent_risks)
+
+            scheduler = get_speculation_scheduler()
+            with prose_muted():  # never leak into a live ProseStream
+                await self._schedule_speculations(
+                    story, chapter, player, beats, next_number,
+                    choices[:settings.speculation_max_choices], scheduler,
+                )
+        except Exception as e:
+            logger.warning(f"Speculation for scene {next_number} failed: {e}")
+
+    async def _schedule_speculations(
+        self,
+        story: Story,
+        chapter: Chapter,
+        player: PlayerState | None,
+        beats: list,
+        scene_number: int,
+        choices: list[Choice],
+        scheduler: SpeculationScheduler,
+    ) -> None:
+        """Build each choice's next-scene input and start its writer call."""
+        for choice in choices:
+            prep = await self._prepare_single_scene(
+                story=story,
+                chapter=chapter,
+                player=player.model_copy(deep=True) if player else None,
+                beats=beats,
+                scene_number=scene_number,
+                choice=choice,
+            )
+            if scheduler.schedule(
+                story_id=story.id,
+                user_id=story.user_id,
+                key=scene_input_key(story.id, prep.writer_input),
+                run=functools.partial(run_scene_writer, prep.writer_input),
+                estimated_tokens=settings.speculation_scene_tokens,
+            ):
+                logger.info(
+                    f"Speculation: scene {scene_number} for choice {choice.id} "
+                    f"(risk={choice.risk_level}) scheduled"
+                )
+
+    @traced("scene_critic")
     async def _run_async_scene_critic(
         self,
         scene: "Scene",
@@ -1734,12 +1924,8 @@ class StoryOrchestrator:
                 run_scene_critic_async,
                 format_critic_for_next_scene,
             )
-            from langchain_google_genai import ChatGoogleGenerativeAI
-            llm = ChatGoogleGenerativeAI(
-                model=settings.critic_model,
-                temperature=0.3,
-                google_api_key=settings.google_api_key,
-            )
+            from app.narrative.llm_gateway import get_llm
+            llm = get_llm(settings.critic_model, 0.3)
             result = await run_scene_critic_async(
                 scene=scene,
                 beat_description=beat_description,
@@ -1752,7 +1938,7 @@ class StoryOrchestrator:
                 # Update scene with critic results
                 scene.critic_score = result["score"]
                 scene.critic_feedback = format_critic_for_next_scene(result)
-                self.db.save_scene(scene)
+                await self.db.save_scene(scene)
                 logger.info(
                     f"AsyncCritic: scene {scene.scene_number} — "
                     f"score={result['score']:.1f}, feedback saved for next scene"
@@ -1865,7 +2051,7 @@ class StoryOrchestrator:
         # Apply delta (apply_delta handles total_chapters and pity_counter)
         updated_player = apply_delta(player, delta)
 
-        self.db.update_player(updated_player)
+        await self.db.update_player(updated_player)
 
         # Log events
         event = IdentityEvent(
@@ -1879,13 +2065,13 @@ class StoryOrchestrator:
             ),
             delta_snapshot=delta.model_dump(),
         )
-        self.db.log_identity_event(event)
+        await self.db.log_identity_event(event)
 
         for flag_key in delta.new_flags:
-            self.db.set_player_flag(player.id, flag_key, chapter.chapter_number)
+            await self.db.set_player_flag(player.id, flag_key, chapter.chapter_number)
 
         if delta.confrontation_triggered:
-            self.db.log_identity_event(IdentityEvent(
+            await self.db.log_identity_event(IdentityEvent(
                 player_id=player.id,
                 event_type=IdentityEventType.CONFRONTATION,
                 chapter_number=chapter.chapter_number,
@@ -1893,14 +2079,14 @@ class StoryOrchestrator:
             ))
 
         if delta.breakthrough_triggered:
-            self.db.log_identity_event(IdentityEvent(
+            await self.db.log_identity_event(IdentityEvent(
                 player_id=player.id,
                 event_type=IdentityEventType.BREAKTHROUGH,
                 chapter_number=chapter.chapter_number,
                 description="Breakthrough triggered!",
             ))
             updated_player.breakthrough_meter = 0
-            self.db.update_player(updated_player)
+            await self.db.update_player(updated_player)
 
         return {
             "dqs": delta.dqs_change,
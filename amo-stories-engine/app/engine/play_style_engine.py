@@ -217,3 +217,41 @@ def format_play_style_prompt(play_style: PlayStyleState) -> str:
         f"Moral: {label(play_style.moral_axis)} ({play_style.moral_axis}), "
         f"Combat: {label(play_style.combat_preference)} ({play_style.combat_preference})"
     )
+
+
+# ──────────────────────────────────────────────
+# Choice Prediction
+# ──────────────────────────────────────────────
+
+# How much the player's recent picks outweigh the long-run risk axis
+RECENT_RISK_WEIGHT: float = 0.6
+
+
+def preferred_risk_level(
+    play_style: PlayStyleState,
+    recent_risk_levels: list[int] | None = None,
+) -> float:
+    """Estimate the risk level (1-5) this player is most likely to pick.
+
+    Blends the risk_appetite axis (mapped 0-100 → 1-5) with the mean
+    risk of the player's recent choices, when there are any.
+    """
+    from_axis = 1 + 4 * play_style.risk_appetite / AXIS_MAX
+    if not recent_risk_levels:
+        return from_axis
+    recent = sum(recent_risk_levels) / len(recent_risk_levels)
+    return RECENT_RISK_WEIGHT * recent + (1 - RECENT_RISK_WEIGHT) * from_axis
+
+
+def rank_choices(
+    choices: list,
+    play_style: PlayStyleState,
+    recent_risk_levels: list[int] | None = None,
+) -> list:
+    """Order choices from most to least likely to be picked.
+
+    Choices whose risk_level is closest to ``preferred_risk_level`` come
+    first; ties keep the writer's order.
+    """
+    target = preferred_risk_level(play_style, recent_risk_levels)
+    return sorted(choices, key=lambda c: abs(c.risk_level - target))
@@ -1,7 +1,7 @@
 """Amoisekai — AI Skill Evolution Generation.
 
 LLM-powered generation of mutated, hybrid, and integrated skills.
-Uses the same ChatGoogleGenerativeAI pattern as skill_narrator.py.
+Uses the shared LLM gateway (app.narrative.llm_gateway).
 
 Ref: SKILL_EVOLUTION_SPEC v1.1 §4.6, §4.6.1, §5.4
 """
@@ -158,13 +158,9 @@ _INTEGRATION_USER_TEMPLATE = """\
 # ══════════════════════════════════════════════
 
 def _make_llm(temperature: float = 0.7):
-    """Create LLM for skill evolution generation."""
-    from langchain_google_genai import ChatGoogleGenerativeAI
-    return ChatGoogleGenerativeAI(
-        model=settings.writer_model,
-        temperature=temperature,
-        api_key=settings.google_api_key,
-    )
+    """LLM for skill evolution generation (shared gateway client)."""
+    from app.narrative.llm_gateway import get_llm
+    return get_llm(settings.writer_model, temperature)
 
 
 def _parse_json_response(raw: str) -> dict:
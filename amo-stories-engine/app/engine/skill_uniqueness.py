@@ -1,19 +1,21 @@
 """Embedding-based skill uniqueness verification.
 
 Uses Google's text-embedding-004 to embed skill descriptions and check
-cosine similarity against existing skills in the database.
+cosine similarity against existing skills in the database. Comparisons
+run against the in-memory ``SkillIndex`` (app/memory/skill_index.py),
+not the table.
 
 Spec reference: SOUL_FORGE_SPEC §7.1
 """
 
 from __future__ import annotations
 
-import json
 import logging
 import math
-import sqlite3
 from typing import TYPE_CHECKING
 
+from app.memory.skill_index import decode_embedding, encode_embedding, get_skill_index
+
 if TYPE_CHECKING:
     from app.memory.state import StoryStateDB
 
@@ -29,6 +31,7 @@ CREATE TABLE IF NOT EXISTS skill_embeddings (
     skill_name TEXT NOT NULL DEFAULT '',
     skill_text TEXT NOT NULL DEFAULT '',
     embedding_json TEXT NOT NULL DEFAULT '[]',
+    embedding BLOB,
     created_at TEXT DEFAULT (datetime('now'))
 );
 """
@@ -119,6 +122,11 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
 def ensure_embeddings_table(db: StoryStateDB) -> None:
     """Create skill_embeddings table if it doesn't exist."""
     db.conn.executescript(SKILL_EMBEDDINGS_SCHEMA)
+    # Migration: float32 BLOB replaces embedding_json for new rows
+    cols = {r[1] for r in db.conn.execute("PRAGMA table_info(skill_embeddings)").fetchall()}
+    if "embedding" not in cols:
+        db.conn.execute("ALTER TABLE skill_embeddings ADD COLUMN embedding BLOB")
+        db.conn.commit()
 
 
 def save_skill_embedding(
@@ -128,15 +136,16 @@ def save_skill_embedding(
     skill_text: str,
     embedding: list[float],
 ) -> None:
-    """Save a skill embedding to the database."""
+    """Save a skill embedding to the database and the skill index."""
     ensure_embeddings_table(db)
     db.conn.execute(
         """INSERT OR REPLACE INTO skill_embeddings
-           (player_id, skill_name, skill_text, embedding_json)
-           VALUES (?, ?, ?, ?)""",
-        (player_id, skill_name, skill_text, json.dumps(embedding)),
+           (player_id, skill_name, skill_text, embedding_json, embedding)
+           VALUES (?, ?, ?, '[]', ?)""",
+        (player_id, skill_name, skill_text, encode_embedding(embedding)),
     )
     db.conn.commit()
+    get_skill_index(db).vectors.upsert(player_id, skill_name, embedding)
 
 
 def get_all_skill_embeddings(
@@ -145,16 +154,16 @@ def get_all_skill_embeddings(
     """Return all existing skill embeddings as (name, text, vector) tuples."""
     ensure_embeddings_table(db)
     rows = db.conn.execute(
-        "SELECT skill_name, skill_text, embedding_json FROM skill_embeddings"
+        "SELECT skill_name, skill_text, embedding_json, embedding FROM skill_embeddings"
     ).fetchall()
-    results: list[tuple[str, str, list[float]]] = []
-    for r in rows:
-        try:
-            emb = json.loads(r["embedding_json"] or "[]")
-            results.append((r["skill_name"], r["skill_text"], emb))
-        except (json.JSONDecodeError, KeyError):
-            continue
-    return results
+    return [
+        (
+            r["skill_name"],
+            r["skill_text"],
+            decode_embedding(r["embedding"], r["embedding_json"]).tolist(),
+        )
+        for r in rows
+    ]
 
 
 # ──────────────────────────────────────────────
@@ -177,22 +186,15 @@ async def check_skill_uniqueness(
     if db is None:
         return 1.0, None
 
-    existing = get_all_skill_embeddings(db)
-    if not existing:
+    index = get_skill_index(db)
+    if not len(index.vectors):
         return 1.0, None
 
     # Embed the new skill
     skill_text = f"{skill_name}: {skill_description}. {skill_mechanic}"
     new_embedding = await embed_text(skill_text)
 
-    max_sim = 0.0
-    most_similar: str | None = None
-
-    for name, _, emb in existing:
-        sim = cosine_similarity(new_embedding, emb)
-        if sim > max_sim:
-            max_sim = sim
-            most_similar = name
+    max_sim, most_similar = index.vectors.most_similar(new_embedding)
 
     uniqueness_score = max(0.0, 1.0 - max_sim)
 
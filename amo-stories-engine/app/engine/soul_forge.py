@@ -16,6 +16,8 @@ import logging
 import statistics
 from datetime import datetime, timezone
 
+from app.memory.skill_index import SkillNameIndex
+from app.narrative.llm_cache import cached
 from app.models.soul_forge import (
     BehavioralFingerprint,
     IdentitySignals,
@@ -914,7 +916,7 @@ Return JSON:
 }}"""
 
     try:
-        response = await llm.ainvoke(prompt)
+        response = await cached(llm, "soul_fragment").ainvoke(prompt)
         content = response.content.strip()
         # Strip markdown code blocks if present
         if content.startswith("```"):
@@ -1167,7 +1169,7 @@ async def _parse_backstory_signals(backstory: str, llm: object) -> dict:
     )
 
     try:
-        response = await llm.ainvoke(prompt)
+        response = await cached(llm, "backstory_signals").ainvoke(prompt)
         text = response.content.strip()
         # Strip markdown code blocks if present
         if text.startswith("```"):
@@ -1183,7 +1185,7 @@ async def _parse_backstory_signals(backstory: str, llm: object) -> dict:
 async def forge_skill(
     session: SoulForgeSession,
     llm: object,
-    existing_names: list[str] | None = None,
+    existing_names: list[str] | SkillNameIndex | None = None,
     db: object | None = None,
 ) -> UniqueSkill:
     """AI-generate a unique skill with up to 3 retries for uniqueness.
@@ -1197,6 +1199,9 @@ async def forge_skill(
     Uniqueness is checked two ways (§7.1):
       - Name similarity (string-based)
       - Mechanic similarity (embedding-based, cosine > 0.85 = too similar)
+
+    Pass ``existing_names`` as the shared ``SkillNameIndex`` to avoid
+    re-indexing every existing name per forge.
     """
     import random
     from app.engine.skill_uniqueness import check_skill_uniqueness
@@ -1216,7 +1221,10 @@ async def forge_skill(
     session.identity_signals = signals
 
     fallback_archetype = derive_archetype(signals)
-    existing = set(existing_names or [])
+    existing = (
+        existing_names if isinstance(existing_names, SkillNameIndex)
+        else SkillNameIndex(existing_names or [])
+    )
 
     base_prompt = _build_forge_prompt_v2(signals)
     rejected_names: list[str] = []
@@ -1373,37 +1381,18 @@ def _build_retry_prompt(
 
 
 def _is_name_too_similar(
-    name: str, existing_names: set[str]
+    name: str, existing_names: set[str] | SkillNameIndex
 ) -> bool:
     """Check if a skill name is too similar to existing ones.
 
-    Simple string matching for now. Can be upgraded to embedding-based
-    similarity in the future (see §Uniqueness Verification).
+    Exact match, substring containment (either direction, both names
+    longer than 3 chars), or >60% word overlap — see ``SkillNameIndex``.
     """
     if not existing_names:
         return False
-
-    name_lower = name.lower().strip()
-
-    for existing in existing_names:
-        ex_lower = existing.lower().strip()
-        # Exact match
-        if name_lower == ex_lower:
-            return True
-        # Substring containment (either direction)
-        if len(name_lower) > 3 and len(ex_lower) > 3:
-            if name_lower in ex_lower or ex_lower in name_lower:
-                return True
-        # Word overlap > 60%
-        name_words = set(name_lower.split())
-        ex_words = set(ex_lower.split())
-        if name_words and ex_words:
-            overlap = len(name_words & ex_words)
-            total = max(len(name_words), len(ex_words))
-            if total > 0 and overlap / total > 0.6:
-                return True
-
-    return False
+    if not isinstance(existing_names, SkillNameIndex):
+        existing_names = SkillNameIndex(existing_names)
+    return existing_names.collides(name)
 
 
 def forge_skill_sync(session: SoulForgeSession) -> UniqueSkill:
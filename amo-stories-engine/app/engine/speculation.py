@@ -0,0 +1,199 @@
+"""Speculative scene generation — pre-writes the next scene in the background.
+
+After a scene is delivered, the orchestrator asks the scheduler to run
+the SceneWriter for the likeliest next choices. Each result is cached
+under a hash of the exact SceneWriterInput it was written for, so a
+speculated scene is only used when the real request would have sent the
+writer the same input. Anything that changes the story state between
+delivery and the player's pick (player stats, critic feedback, a
+different choice) changes the key and the entry is simply never claimed.
+
+Spend is capped per user with a rolling token budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, fields
+from typing import Any
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Fields left out of the cache key: semantic recall is re-queried for
+# every scene and may reorder results without the story having changed
+_UNKEYED_FIELDS = frozenset({"semantic_context"})
+
+
+def scene_input_key(story_id: str, writer_input: Any) -> str:
+    """Hash a SceneWriterInput (dataclass) into a speculation cache key."""
+    payload = {
+        f.name: getattr(writer_input, f.name)
+        for f in fields(writer_input)
+        if f.name not in _UNKEYED_FIELDS
+    }
+    payload["story_id"] = story_id
+    raw = json.dumps(payload, sort_keys=True, default=_json_default, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+# ──────────────────────────────────────────────
+# Budget
+# ──────────────────────────────────────────────
+
+class TokenBudget:
+    """Rolling per-user token allowance for speculative work."""
+
+    def __init__(self, tokens_per_window: int, window_s: float) -> None:
+        self.tokens_per_window = tokens_per_window
+        self.window_s = window_s
+        self._spent: dict[str, deque[tuple[float, int]]] = {}
+
+    def spent(self, user_id: str) -> int:
+        history = self._spent.get(user_id)
+        if not history:
+            return 0
+        cutoff = time.monotonic() - self.window_s
+        while history and history[0][0] < cutoff:
+            history.popleft()
+        return sum(tokens for _, tokens in history)
+
+    def try_spend(self, user_id: str, tokens: int) -> bool:
+        if self.spent(user_id) + tokens > self.tokens_per_window:
+            return False
+        self._spent.setdefault(user_id, deque()).append((time.monotonic(), tokens))
+        return True
+
+
+# ──────────────────────────────────────────────
+# Scheduler
+# ──────────────────────────────────────────────
+
+@dataclass
+class _Entry:
+    story_id: str
+    task: asyncio.Task
+    created: float
+
+
+class SpeculationScheduler:
+    """Runs speculative writer calls and hands their results to real requests.
+
+    Entries hold the running task, so a player who picks before the
+    speculation finishes waits for it instead of starting over.
+    """
+
+    def __init__(
+        self,
+        budget: TokenBudget,
+        max_entries: int = 64,
+        ttl_s: float = 900,
+    ) -> None:
+        self.budget = budget
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._entries: dict[str, _Entry] = {}
+        self._stats = {"scheduled": 0, "hits": 0, "misses": 0, "budget_denied": 0, "discarded": 0}
+
+    def schedule(
+        self,
+        story_id: str,
+        user_id: str,
+        key: str,
+        run: Callable[[], Awaitable[Any]],
+        estimated_tokens: int,
+    ) -> bool:
+        """Start ``run`` in the background; False if cached or over budget."""
+        if key in self._entries:
+            return False
+        if not self.budget.try_spend(user_id, estimated_tokens):
+            self._stats["budget_denied"] += 1
+            logger.info(f"Speculation: budget exhausted for user {user_id}")
+            return False
+
+        self._evict()
+        task = asyncio.create_task(run(), name=f"speculate_{story_id}_{key[:8]}")
+        task.add_done_callback(_log_failure)
+        self._entries[key] = _Entry(story_id=story_id, task=task, created=time.monotonic())
+        self._stats["scheduled"] += 1
+        return True
+
+    async def claim(self, story_id: str, key: str) -> Any | None:
+        """Return the speculated result for ``key``, or None on a miss."""
+        entry = self._entries.pop(key, None)
+        if entry is None or entry.story_id != story_id or self._expired(entry):
+            if entry is not None:
+                entry.task.cancel()
+            self._stats["misses"] += 1
+            return None
+        try:
+            result = await entry.task
+        except Exception:
+            self._stats["misses"] += 1
+            return None
+        self._stats["hits"] += 1
+        return result
+
+    def invalidate(self, story_id: str) -> None:
+        """Drop (and cancel) every speculation for a story."""
+        for key in [k for k, e in self._entries.items() if e.story_id == story_id]:
+            self._drop(key)
+
+    def stats(self) -> dict:
+        claimed = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "pending": sum(1 for e in self._entries.values() if not e.task.done()),
+            "cached": len(self._entries),
+            "hit_rate": round(self._stats["hits"] / claimed, 3) if claimed else 0.0,
+        }
+
+    def _expired(self, entry: _Entry) -> bool:
+        return time.monotonic() - entry.created > self.ttl_s
+
+    def _evict(self) -> None:
+        for key in [k for k, e in self._entries.items() if self._expired(e)]:
+            self._drop(key)
+        while len(self._entries) >= self.max_entries:
+            self._drop(next(iter(self._entries)))  # oldest first (insertion order)
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        entry.task.cancel()
+        self._stats["discarded"] += 1
+
+
+def _log_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Speculation {task.get_name()} failed: {task.exception()}")
+
+
+_scheduler: SpeculationScheduler | None = None
+
+
+def get_speculation_scheduler() -> SpeculationScheduler:
+    """Get the process-wide scheduler (created from settings on first use)."""
+    global _scheduler  # noqa: PLW0603
+    if _scheduler is None:
+        _scheduler = SpeculationScheduler(
+            budget=TokenBudget(
+                tokens_per_window=settings.speculation_user_token_budget,
+                window_s=settings.speculation_budget_window_s,
+            ),
+            max_entries=settings.speculation_max_entries,
+            ttl_s=settings.speculation_ttl_s,
+        )
+    return _scheduler
@@ -8,6 +8,7 @@ Run with:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -16,6 +17,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.config import settings
+from app.memory.async_state import AsyncStoryStateDB
 from app.memory.state import StoryStateDB
 
 logger = logging.getLogger(__name__)
@@ -25,6 +27,7 @@ logger = logging.getLogger(__name__)
 # ──────────────────────────────────────────────
 
 _db: StoryStateDB | None = None
+_async_db: AsyncStoryStateDB | None = None
 
 
 def get_db() -> StoryStateDB:
@@ -36,6 +39,14 @@ def get_db() -> StoryStateDB:
     return _db
 
 
+def get_async_db() -> AsyncStoryStateDB:
+    """Get the global AsyncStoryStateDB (pooled, for async routes and the orchestrator)."""
+    global _async_db  # noqa: PLW0603
+    if _async_db is None:
+        _async_db = AsyncStoryStateDB(settings.db_file, readers=settings.db_reader_pool_size)
+    return _async_db
+
+
 # ──────────────────────────────────────────────
 # Lifespan
 # ──────────────────────────────────────────────
@@ -52,13 +63,35 @@ async def lifespan(app: FastAPI):
 
     # Startup: init DB
     db = get_db()
+    async_db = get_async_db()
+    await async_db.connect()
+    # Build the Soul Forge skill index off the loop, before the first forge
+    from app.memory.skill_index import get_skill_index
+    await async_db.read(get_skill_index)
+    # StoryBrain stores are encoded in the background from here on
+    from app.memory.brain_outbox import get_brain_outbox
+    await get_brain_outbox().start()
     logger.info(f"[Amo Stories] DB connected: {settings.db_path}")
     logger.info(f"[Amo Stories] CORS origins: {settings.cors_origin_list}")
     logger.info(f"[Amo Stories] Environment: {settings.env}")
 
     yield
 
-    # Shutdown: close DB
+    # Shutdown: finish background chapter persistence, stop the brain outbox
+    # (pending stores stay queued on disk), close story brains, write out
+    # buffered traces, then DB (flushes queued writes first)
+    from app.memory.state_pool import close_state_pool
+    from app.memory.story_brain import get_brain_pool
+    from app.narrative.pipeline import wait_for_ledger
+    from app.narrative.tracing import get_trace_store
+    await wait_for_ledger()
+    await get_brain_outbox().close()
+    await get_brain_pool().close_all()
+    trace_store = get_trace_store()
+    await trace_store.flush()
+    trace_store.close()
+    await async_db.close()
+    await asyncio.to_thread(close_state_pool)  # waits for loader threads' reads
     db.close()
     logger.info("[Amo Stories] DB closed. Goodbye!")
 
@@ -144,6 +177,7 @@ from app.routers.player import router as player_router  # noqa: E402
 from app.routers.soul_forge import router as soul_forge_router  # noqa: E402
 from app.routers.scene import router as scene_router  # noqa: E402
 from app.routers.skill_router import router as skill_router  # noqa: E402
+from app.routers.debug import router as debug_router  # noqa: E402
 
 app.include_router(story_router)
 app.include_router(stream_router)
@@ -151,6 +185,9 @@ app.include_router(player_router)
 app.include_router(soul_forge_router)
 app.include_router(scene_router)
 app.include_router(skill_router)
+# Trace summaries expose internals — same rule as the API explorer
+if not _is_production or settings.debug_endpoints:
+    app.include_router(debug_router)
 
 
 # ──────────────────────────────────────────────
@@ -0,0 +1,216 @@
+"""Async front for StoryStateDB — pooled readers, one serialized writer.
+
+``StoryStateDB`` runs every query on a single blocking ``sqlite3``
+connection, so calling it from a coroutine stalls the event loop for all
+players while the disk works. ``AsyncStoryStateDB`` exposes the same
+methods as coroutines and runs them off the loop:
+
+- reads go to a small pool of connections, one query per connection at a
+  time, so concurrent stories read in parallel (WAL mode);
+- writes are queued to a single writer task that owns the only writing
+  connection, so they never contend with each other for the SQLite lock.
+
+A write is awaited until it has committed, so a read issued after it
+sees its result.
+
+    db = AsyncStoryStateDB(settings.db_file)
+    await db.connect()
+    story = await db.get_story(story_id)
+    await db.save_scene(scene)
+    await db.write(batch_update_affinity, story_id, deltas)   # sync helper
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from app.memory.state import StoryStateDB
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# StoryStateDB methods, by the connection they must run on. Every public
+# method of StoryStateDB must be listed in exactly one of these.
+READ_METHODS = (
+    "get_story",
+    "get_user_stories",
+    "get_chapter",
+    "get_story_chapters",
+    "get_latest_chapter",
+    "get_scene",
+    "get_chapter_scenes",
+    "get_latest_scene",
+    "get_player",
+    "get_player_by_user",
+    "get_flags",
+    "has_flag",
+    "get_identity_events",
+    "get_all_skill_names",
+    "get_story_ledger",
+    "get_world_state",
+    "get_story_companions",
+    "get_companion",
+)
+WRITE_METHODS = (
+    "create_story",
+    "update_story",
+    "save_chapter",
+    "mark_choice",
+    "save_scene",
+    "mark_scene_choice",
+    "create_player",
+    "update_player",
+    "reset_daily_turns",
+    "increment_turns",
+    "set_flag",
+    "set_player_flag",
+    "log_identity_event",
+    "save_story_ledger",
+    "save_world_state",
+    "save_companion",
+    "delete_story",
+    "delete_player",
+)
+
+_STOP = object()
+
+
+class AsyncStoryStateDB:
+    """Coroutine version of ``StoryStateDB`` backed by a connection pool.
+
+    Opens lazily on first use; ``connect()`` may be awaited up front to
+    run the schema migrations at startup instead.
+    """
+
+    def __init__(self, db_path: str | Path, readers: int = 4) -> None:
+        self._db_path = db_path
+        self._reader_count = max(1, readers)
+        self._writer_db: StoryStateDB | None = None
+        self._readers: asyncio.Queue[StoryStateDB] | None = None
+        self._reader_dbs: list[StoryStateDB] = []
+        self._writes: asyncio.Queue[Any] | None = None
+        self._writer_task: asyncio.Task | None = None
+        self._open_lock = asyncio.Lock()
+
+    # ── Lifecycle ──
+
+    async def connect(self) -> None:
+        async with self._open_lock:
+            if self._writer_task is not None:
+                return
+            # The writer connection runs the schema/migrations first so the
+            # readers open an up-to-date database
+            writer = StoryStateDB(self._db_path)
+            await asyncio.to_thread(writer.connect, threaded=True)
+            readers: asyncio.Queue[StoryStateDB] = asyncio.Queue()
+            for _ in range(self._reader_count):
+                reader = StoryStateDB(self._db_path)
+                await asyncio.to_thread(reader.connect, threaded=True, read_only=True)
+                self._reader_dbs.append(reader)
+                readers.put_nowait(reader)
+
+            self._writer_db = writer
+            self._readers = readers
+            self._writes = asyncio.Queue()
+            self._writer_task = asyncio.create_task(
+                self._write_loop(), name="story_state_writer",
+            )
+        logger.info(f"AsyncStoryStateDB: opened with {self._reader_count} readers")
+
+    async def close(self) -> None:
+        """Finish queued writes and running reads, then close every connection."""
+        async with self._open_lock:
+            if self._writer_task is None:
+                return
+            assert self._writes is not None and self._writer_db is not None
+            self._writes.put_nowait(_STOP)
+            await self._writer_task
+            self._writer_task = None
+            # Take every reader back first: a connection must not be closed
+            # while another thread is still running a query on it
+            assert self._readers is not None
+            for _ in self._reader_dbs:
+                await self._readers.get()
+            for reader in self._reader_dbs:
+                await asyncio.to_thread(reader.close)
+            self._reader_dbs.clear()
+            await asyncio.to_thread(self._writer_db.close)
+            self._writer_db = None
+
+    # ── Dispatch ──
+
+    async def read(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn(db, *args, **kwargs)`` on a pooled reader connection."""
+        if self._writer_task is None:
+            await self.connect()
+        readers = self._readers
+        assert readers is not None
+        reader = await readers.get()
+        job = asyncio.ensure_future(asyncio.to_thread(fn, reader, *args, **kwargs))
+
+        def release(done: asyncio.Future) -> None:
+            # A cancelled caller leaves the query running in its thread; the
+            # connection only goes back to the pool once the query is over
+            if not done.cancelled():
+                done.exception()
+            readers.put_nowait(reader)
+
+        job.add_done_callback(release)
+        return await asyncio.shield(job)
+
+    async def write(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Queue ``fn(db, *args, **kwargs)`` for the writer; wait for it to commit."""
+        if self._writer_task is None:
+            await self.connect()
+        assert self._writes is not None
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._writes.put_nowait((fn, args, kwargs, future))
+        return await future
+
+    async def _write_loop(self) -> None:
+        assert self._writes is not None and self._writer_db is not None
+        while (item := await self._writes.get()) is not _STOP:
+            fn, args, kwargs, future = item
+            if future.cancelled():
+                continue
+            try:
+                result = await asyncio.to_thread(fn, self._writer_db, *args, **kwargs)
+            except Exception as exc:
+                self._writer_db.conn.rollback()
+                if not future.cancelled():
+                    future.set_exception(exc)
+                continue
+            if not future.cancelled():
+                future.set_result(result)
+
+
+def _reader_method(name: str) -> Callable[..., Any]:
+    method = getattr(StoryStateDB, name)
+
+    @functools.wraps(method)
+    async def call(self: AsyncStoryStateDB, *args: Any, **kwargs: Any) -> Any:
+        return await self.read(method, *args, **kwargs)
+
+    return call
+
+
+def _writer_method(name: str) -> Callable[..., Any]:
+    method = getattr(StoryStateDB, name)
+
+    @functools.wraps(method)
+    async def call(self: AsyncStoryStateDB, *args: Any, **kwargs: Any) -> Any:
+        return await self.write(method, *args, **kwargs)
+
+    return call
+
+
+for _name in READ_METHODS:
+    setattr(AsyncStoryStateDB, _name, _reader_method(_name))
+for _name in WRITE_METHODS:
+    setattr(AsyncStoryStateDB, _name, _writer_method(_name))
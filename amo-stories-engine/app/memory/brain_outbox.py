@@ -0,0 +1,375 @@
+"""Durable write-behind queue for StoryBrain memories.
+
+``StoryBrain.store_scene`` / ``store_chapter_summary`` used to run the
+whole ``MemoryEncoder.encode`` pipeline (entity extraction plus dozens of
+SQLite commits) before the scene loop could move on. While the outbox is
+running a store only inserts a row into a local SQLite table and returns;
+a background worker encodes the rows:
+
+- rows are grouped per brain and encoded in one storage transaction;
+- storing the same scene/chapter again before the worker reaches it
+  replaces the pending row instead of encoding twice;
+- a failed row is retried after an exponential backoff
+  (``next_attempt_at``), so a broken brain is not re-encoded in a loop;
+- rows left over by a crash or shutdown are encoded on the next start.
+
+``StoryBrain.query_context`` first waits for the pending rows of its own
+brain (``wait_for``), so a query sees everything stored for that story
+before it and never waits on other stories.
+
+    outbox = get_brain_outbox()
+    await outbox.start()
+    await brain.store_scene(...)     # returns once the row is committed
+    await brain.query_context(q)     # waits for this brain's rows only
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS brain_outbox (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    brain_id        TEXT NOT NULL,
+    story_id        TEXT NOT NULL,
+    dedupe_key      TEXT NOT NULL,
+    content         TEXT NOT NULL,
+    metadata_json   TEXT NOT NULL DEFAULT '{}',
+    tags_json       TEXT NOT NULL DEFAULT '[]',
+    version         INTEGER NOT NULL DEFAULT 1,
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,    -- unix time; 0 = ready now
+    created_at      TEXT DEFAULT (datetime('now')),
+    UNIQUE (brain_id, dedupe_key)
+);
+"""
+
+
+@dataclass
+class OutboxEntry:
+    """One pending memory: the arguments of a ``MemoryEncoder.encode`` call."""
+
+    id: int
+    brain_id: str
+    story_id: str
+    content: str
+    metadata: dict = field(default_factory=dict)
+    tags: set[str] = field(default_factory=set)
+    version: int = 1
+    attempts: int = 0
+
+
+class BrainOutbox:
+    """SQLite-backed outbox plus the worker task that drains it."""
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        batch_size: int = 32,
+        max_attempts: int = 3,
+        retry_base_s: float = 5.0,
+    ) -> None:
+        self._db_path = Path(db_path)
+        self._batch_size = max(1, batch_size)
+        self._max_attempts = max_attempts
+        self._retry_base_s = retry_base_s   # doubled after every failed attempt
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()   # one statement at a time on the shared connection
+        self._waiters: dict[str, dict[int, asyncio.Future[None]]] = defaultdict(dict)
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._stats = {
+            "enqueued": 0, "coalesced": 0, "encoded": 0,
+            "retried": 0, "dropped": 0, "batches": 0,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    # ── Lifecycle ──
+
+    async def start(self) -> None:
+        """Open the outbox and start the worker (picks up leftover rows)."""
+        if self._task is not None:
+            return
+        await asyncio.to_thread(self._open)
+        leftover = await asyncio.to_thread(self._fetch, None)
+        for entry in leftover:
+            self._waiter(entry.brain_id, entry.id)
+        self._task = asyncio.create_task(self._run(), name="brain_outbox_worker")
+        if leftover:
+            logger.info(f"BrainOutbox: resuming {len(leftover)} pending memories")
+            self._wakeup.set()
+
+    async def close(self) -> None:
+        """Stop the worker. Unfinished rows stay in the table for the next start."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        # Queries waiting on this outbox go ahead with what is already encoded
+        for waiters in self._waiters.values():
+            for future in waiters.values():
+                if not future.done():
+                    future.set_result(None)
+        self._waiters.clear()
+        await asyncio.to_thread(self._close)
+
+    # ── Producer side ──
+
+    async def enqueue(
+        self,
+        story_id: str,
+        brain_id: str,
+        dedupe_key: str,
+        content: str,
+        metadata: dict | None = None,
+        tags: set[str] | None = None,
+    ) -> int:
+        """Commit a memory to the outbox and return its row id.
+
+        A pending row with the same ``(brain_id, dedupe_key)`` is replaced
+        in place (it keeps its id and queue position).
+        """
+        entry_id, version = await asyncio.to_thread(
+            self._upsert, story_id, brain_id, dedupe_key, content,
+            json.dumps(metadata or {}, ensure_ascii=False),
+            json.dumps(sorted(tags or ()), ensure_ascii=False),
+        )
+        self._stats["coalesced" if version > 1 else "enqueued"] += 1
+        self._waiter(brain_id, entry_id)
+        self._wakeup.set()
+        return entry_id
+
+    async def wait_for(self, brain_id: str, timeout: float | None = None) -> bool:
+        """Wait until every row enqueued so far for ``brain_id`` is encoded.
+
+        Returns False if ``timeout`` ran out first.
+        """
+        pending = list(self._waiters.get(brain_id, {}).values())
+        if not pending:
+            return True
+        _, still_pending = await asyncio.wait(pending, timeout=timeout)
+        return not still_pending
+
+    def stats(self) -> dict:
+        return {
+            **self._stats,
+            "pending": sum(len(w) for w in self._waiters.values()),
+            "running": self.running,
+        }
+
+    # ── Worker ──
+
+    async def _run(self) -> None:
+        while True:
+            # Sleep until woken by an enqueue or the earliest retry is due
+            delay = await asyncio.to_thread(self._next_delay)
+            if delay is None:
+                await self._wakeup.wait()
+            elif delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except TimeoutError:
+                    pass
+            self._wakeup.clear()
+            while entries := await asyncio.to_thread(
+                self._fetch, self._batch_size, time.time(),
+            ):
+                await self._process(entries)
+
+    async def _process(self, entries: list[OutboxEntry]) -> None:
+        from app.memory.story_brain import get_or_create_brain
+
+        self._stats["batches"] += 1
+        by_brain: dict[str, list[OutboxEntry]] = defaultdict(list)
+        for entry in entries:
+            by_brain[entry.brain_id].append(entry)
+
+        done: list[OutboxEntry] = []
+        failed: list[OutboxEntry] = []
+        for brain_id, group in by_brain.items():
+            try:
+                brain = await get_or_create_brain(group[0].story_id, brain_id)
+                results = await brain.encode_entries(group)
+            except Exception as e:
+                logger.error(f"BrainOutbox: batch for brain {brain_id} failed: {e}")
+                results = [False] * len(group)
+            for entry, ok in zip(group, results):
+                (done if ok else failed).append(entry)
+
+        finished, dropped = await asyncio.to_thread(self._finish, done, failed)
+        self._stats["encoded"] += len(finished)
+        self._stats["retried"] += len(failed) - len(dropped)
+        self._stats["dropped"] += len(dropped)
+        for entry in dropped:
+            logger.error(
+                f"BrainOutbox: dropping memory {entry.id} of brain {entry.brain_id} "
+                f"after {self._max_attempts} attempts"
+            )
+        for entry in finished + dropped:
+            self._resolve(entry.brain_id, entry.id)
+
+    def _waiter(self, brain_id: str, entry_id: int) -> None:
+        waiters = self._waiters[brain_id]
+        if entry_id not in waiters:
+            waiters[entry_id] = asyncio.get_running_loop().create_future()
+
+    def _resolve(self, brain_id: str, entry_id: int) -> None:
+        waiters = self._waiters.get(brain_id)
+        if not waiters:
+            return
+        future = waiters.pop(entry_id, None)
+        if future is not None and not future.done():
+            future.set_result(None)
+        if not waiters:
+            del self._waiters[brain_id]
+
+    # ── SQLite (run in worker threads) ──
+
+    def _open(self) -> None:
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        # Migration: retry backoff column for outboxes created before it
+        cols = {r[1] for r in conn.execute("PRAGMA table_info(brain_outbox)").fetchall()}
+        if "next_attempt_at" not in cols:
+            conn.execute(
+                "ALTER TABLE brain_outbox ADD COLUMN next_attempt_at REAL NOT NULL DEFAULT 0"
+            )
+            conn.commit()
+        self._conn = conn
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _upsert(
+        self, story_id: str, brain_id: str, dedupe_key: str,
+        content: str, metadata_json: str, tags_json: str,
+    ) -> tuple[int, int]:
+        assert self._conn is not None
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT INTO brain_outbox
+                       (brain_id, story_id, dedupe_key, content, metadata_json, tags_json)
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (brain_id, dedupe_key) DO UPDATE SET
+                       content = excluded.content,
+                       metadata_json = excluded.metadata_json,
+                       tags_json = excluded.tags_json,
+                       version = version + 1,
+                       attempts = 0,
+                       next_attempt_at = 0""",
+                (brain_id, story_id, dedupe_key, content, metadata_json, tags_json),
+            )
+            row = self._conn.execute(
+                "SELECT id, version FROM brain_outbox WHERE brain_id = ? AND dedupe_key = ?",
+                (brain_id, dedupe_key),
+            ).fetchone()
+        return row["id"], row["version"]
+
+    def _fetch(self, limit: int | None, now: float | None = None) -> list[OutboxEntry]:
+        """Pending rows in queue order; with ``now``, only those due by then."""
+        assert self._conn is not None
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM brain_outbox WHERE next_attempt_at <= ? ORDER BY id LIMIT ?",
+                (now if now is not None else float("inf"), limit if limit is not None else -1),
+            ).fetchall()
+        return [
+            OutboxEntry(
+                id=row["id"],
+                brain_id=row["brain_id"],
+                story_id=row["story_id"],
+                content=row["content"],
+                metadata=json.loads(row["metadata_json"]),
+                tags=set(json.loads(row["tags_json"])),
+                version=row["version"],
+                attempts=row["attempts"],
+            )
+            for row in rows
+        ]
+
+    def _finish(
+        self, done: list[OutboxEntry], failed: list[OutboxEntry],
+    ) -> tuple[list[OutboxEntry], list[OutboxEntry]]:
+        """Delete encoded rows and count failures; return (finished, dropped).
+
+        A failed row is due again after ``retry_base_s * 2**attempts``. A
+        row replaced while it was being encoded has a newer version and
+        stays queued (and due).
+        """
+        assert self._conn is not None
+        now = time.time()
+        finished: list[OutboxEntry] = []
+        dropped: list[OutboxEntry] = []
+        with self._lock, self._conn:
+            for entry in done:
+                cur = self._conn.execute(
+                    "DELETE FROM brain_outbox WHERE id = ? AND version = ?",
+                    (entry.id, entry.version),
+                )
+                if cur.rowcount:
+                    finished.append(entry)
+            for entry in failed:
+                if entry.attempts + 1 >= self._max_attempts:
+                    cur = self._conn.execute(
+                        "DELETE FROM brain_outbox WHERE id = ? AND version = ?",
+                        (entry.id, entry.version),
+                    )
+                    if cur.rowcount:
+                        dropped.append(entry)
+                        continue
+                self._conn.execute(
+                    """UPDATE brain_outbox SET attempts = attempts + 1, next_attempt_at = ?
+                       WHERE id = ? AND version = ?""",
+                    (now + self._retry_base_s * 2 ** entry.attempts, entry.id, entry.version),
+                )
+        return finished, dropped
+
+    def _next_delay(self) -> float | None:
+        """Seconds until the earliest pending row is due, or None when empty."""
+        assert self._conn is not None
+        with self._lock:
+            due = self._conn.execute(
+                "SELECT MIN(next_attempt_at) FROM brain_outbox"
+            ).fetchone()[0]
+        return None if due is None else max(0.0, due - time.time())
+
+
+_outbox: BrainOutbox | None = None
+
+
+def get_brain_outbox() -> BrainOutbox:
+    """Get the process-wide outbox (not started until ``start()``)."""
+    global _outbox
+    if _outbox is None:
+        _outbox = BrainOutbox(
+            Path(settings.db_path).parent / "brains" / "outbox.db",
+            batch_size=settings.brain_outbox_batch_size,
+            retry_base_s=settings.brain_outbox_retry_base_s,
+        )
+    return _outbox
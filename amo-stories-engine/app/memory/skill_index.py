@@ -0,0 +1,295 @@
+"""In-memory index for Soul Forge skill uniqueness checks.
+
+Every forge attempt compares the new skill against all existing ones:
+
+- name collisions (``soul_forge._is_name_too_similar``) are answered from an
+  inverted index of words and character trigrams, so only names that can
+  possibly collide are compared;
+- mechanic similarity (``skill_uniqueness.check_skill_uniqueness``) is one
+  matrix-vector product over L2-normalised float32 embeddings.
+
+The index is built from the database once per process (``get_skill_index``)
+and kept current by the writes that change skills — ``StoryStateDB``
+create/update/delete_player and ``save_skill_embedding`` — so a forge never
+re-reads the players or skill_embeddings tables.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from app.memory.state import StoryStateDB
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(name: str) -> str:
+    return name.lower().strip()
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+# ──────────────────────────────────────────────
+# Names
+# ──────────────────────────────────────────────
+
+class SkillNameIndex:
+    """Answers ``_is_name_too_similar`` without scanning every name.
+
+    A name collides with an existing one when (case-insensitively) it is
+    equal to it, one contains the other (both longer than 3 chars), or
+    more than 60% of the words of the longer name are shared.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._names: Counter[str] = Counter()      # normalized name → owners
+        self._by_word: defaultdict[str, set[str]] = defaultdict(set)
+        self._by_trigram: defaultdict[str, set[str]] = defaultdict(set)
+        self._lock = threading.Lock()
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str) -> None:
+        norm = _normalize(name)
+        if not norm:
+            return
+        with self._lock:
+            self._names[norm] += 1
+            if self._names[norm] > 1:
+                return
+            for word in norm.split():
+                self._by_word[word].add(norm)
+            for gram in _trigrams(norm):
+                self._by_trigram[gram].add(norm)
+
+    def remove(self, name: str) -> None:
+        norm = _normalize(name)
+        with self._lock:
+            if self._names[norm] > 1:
+                self._names[norm] -= 1
+                return
+            self._names.pop(norm, None)
+            for word in norm.split():
+                _discard(self._by_word, word, norm)
+            for gram in _trigrams(norm):
+                _discard(self._by_trigram, gram, norm)
+
+    def collides(self, name: str) -> bool:
+        norm = _normalize(name)
+        with self._lock:
+            if not self._names:
+                return False
+            if norm in self._names:
+                return True
+            if len(norm) > 3 and (self._has_substring(norm) or self._has_superstring(norm)):
+                return True
+            words = set(norm.split())
+            return bool(words) and self._has_word_overlap(words)
+
+    def _has_substring(self, norm: str) -> bool:
+        """An existing name (len > 3) occurs inside ``norm``."""
+        return any(
+            norm[i:j] in self._names
+            for i in range(len(norm))
+            for j in range(i + 4, len(norm) + 1)
+        )
+
+    def _has_superstring(self, norm: str) -> bool:
+        """``norm`` occurs inside an existing name: it has all of norm's trigrams."""
+        postings = [self._by_trigram.get(gram) for gram in _trigrams(norm)]
+        if not postings or any(p is None for p in postings):
+            return False
+        rarest = min(postings, key=len)  # type: ignore[arg-type]
+        return any(norm in candidate for candidate in rarest)  # type: ignore[union-attr]
+
+    def _has_word_overlap(self, words: set[str]) -> bool:
+        # overlap / max(len) > 0.6 needs overlap > 0.6·k, i.e. at least
+        # ``need`` shared words — so every match shares one of the
+        # k - need + 1 rarest words and only those postings are scanned
+        k = len(words)
+        need = 3 * k // 5 + 1
+        rarest = sorted(words, key=lambda w: len(self._by_word.get(w, ())))
+        candidates: set[str] = set()
+        for word in rarest[:k - need + 1]:
+            candidates |= self._by_word.get(word, set())
+        for candidate in candidates:
+            other = set(candidate.split())
+            if 5 * len(words & other) > 3 * max(k, len(other)):
+                return True
+        return False
+
+
+def _discard(postings: defaultdict[str, set[str]], key: str, norm: str) -> None:
+    bucket = postings.get(key)
+    if bucket is not None:
+        bucket.discard(norm)
+        if not bucket:
+            del postings[key]
+
+
+# ──────────────────────────────────────────────
+# Embeddings
+# ──────────────────────────────────────────────
+
+class SkillVectorIndex:
+    """Normalised float32 embedding matrix, one row per player."""
+
+    def __init__(self) -> None:
+        self._matrix: np.ndarray | None = None
+        self._size = 0
+        self._rows: dict[str, int] = {}        # player_id → row
+        self._row_names: list[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def upsert(self, player_id: str, skill_name: str, embedding: Iterable[float]) -> None:
+        vec = np.asarray(embedding, dtype=np.float32).ravel()
+        if vec.size == 0:
+            return
+        norm = float(np.linalg.norm(vec))
+        if norm > 0:
+            vec = vec / norm
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = np.zeros((64, vec.size), dtype=np.float32)
+            if vec.size != self._matrix.shape[1]:
+                logger.warning(
+                    f"SkillVectorIndex: skipping {player_id} "
+                    f"({vec.size} dims, index has {self._matrix.shape[1]})"
+                )
+                return
+            row = self._rows.get(player_id)
+            if row is None:
+                if self._size == self._matrix.shape[0]:
+                    grown = np.zeros((self._size * 2, vec.size), dtype=np.float32)
+                    grown[:self._size] = self._matrix
+                    self._matrix = grown
+                row = self._size
+                self._size += 1
+                self._rows[player_id] = row
+                self._row_names.append(skill_name)
+            self._matrix[row] = vec
+            self._row_names[row] = skill_name
+
+    def most_similar(self, embedding: Iterable[float]) -> tuple[float, str | None]:
+        """Highest cosine similarity to ``embedding`` and that skill's name."""
+        query = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(query))
+        with self._lock:
+            if (
+                not self._size
+                or self._matrix is None
+                or norm == 0
+                or query.size != self._matrix.shape[1]
+            ):
+                return 0.0, None
+            scores = self._matrix[:self._size] @ (query / norm)
+            best = int(np.argmax(scores))
+            score = float(scores[best])
+            name = self._row_names[best]
+        if score <= 0:
+            return 0.0, None
+        return score, name
+
+
+def encode_embedding(embedding: Iterable[float]) -> bytes:
+    """float32 bytes for the ``skill_embeddings.embedding`` BLOB column."""
+    return np.asarray(embedding, dtype=np.float32).tobytes()
+
+
+def decode_embedding(blob: bytes | None, legacy_json: str | None = None) -> np.ndarray:
+    """Read a stored embedding (BLOB, or JSON from rows written before the BLOB column)."""
+    if blob:
+        return np.frombuffer(blob, dtype=np.float32)
+    try:
+        return np.asarray(json.loads(legacy_json or "[]"), dtype=np.float32)
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return np.zeros(0, dtype=np.float32)
+
+
+# ──────────────────────────────────────────────
+# Per-database index
+# ──────────────────────────────────────────────
+
+class SkillIndex:
+    """Skill names and embeddings of every player in one database."""
+
+    def __init__(self) -> None:
+        self.names = SkillNameIndex()
+        self.vectors = SkillVectorIndex()
+        self._player_names: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def set_player_skill(self, player_id: str, skill_name: str) -> None:
+        with self._lock:
+            previous = self._player_names.pop(player_id, None)
+            if skill_name:
+                self._player_names[player_id] = skill_name
+        if previous == skill_name:
+            return
+        if previous:
+            self.names.remove(previous)
+        if skill_name:
+            self.names.add(skill_name)
+
+    @classmethod
+    def load(cls, db: StoryStateDB) -> SkillIndex:
+        index = cls()
+        rows = db.conn.execute(
+            """SELECT id, CASE WHEN json_valid(unique_skill_json)
+                               THEN json_extract(unique_skill_json, '$.name') END AS name
+               FROM players WHERE unique_skill_json IS NOT NULL"""
+        ).fetchall()
+        for row in rows:
+            if row["name"]:
+                index.set_player_skill(row["id"], row["name"])
+
+        has_embeddings = db.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='skill_embeddings'"
+        ).fetchone()
+        if has_embeddings:
+            for row in db.conn.execute("SELECT * FROM skill_embeddings"):
+                keys = row.keys()
+                vec = decode_embedding(
+                    row["embedding"] if "embedding" in keys else None,
+                    row["embedding_json"],
+                )
+                index.vectors.upsert(row["player_id"], row["skill_name"], vec)
+
+        logger.info(
+            f"SkillIndex: loaded {len(index.names)} names, {len(index.vectors)} embeddings"
+        )
+        return index
+
+
+_indexes: dict[str, SkillIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_skill_index(db: StoryStateDB) -> SkillIndex:
+    """Get the index for ``db``'s database file, loading it on first use."""
+    with _indexes_lock:
+        index = _indexes.get(db.db_path)
+        if index is None:
+            index = _indexes[db.db_path] = SkillIndex.load(db)
+    return index
+
+
+def loaded_skill_index(db_path: str) -> SkillIndex | None:
+    """The index for ``db_path`` if one has been loaded (for write hooks)."""
+    return _indexes.get(db_path)
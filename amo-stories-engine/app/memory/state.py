@@ -12,6 +12,7 @@ import json
 import sqlite3
 from pathlib import Path
 
+from app.memory.skill_index import loaded_skill_index
 from app.models.story import Chapter, Choice, Scene, Story
 from app.models.progression import PlayerProgression
 from app.models.player import (
@@ -225,12 +226,22 @@ class StoryStateDB:
 
     # ── Connection ──
 
-    def connect(self) -> None:
+    def connect(self, threaded: bool = False, read_only: bool = False) -> None:
+        """Open the connection and bring the schema up to date.
+
+        ``threaded`` lets the connection move between worker threads (the
+        caller guarantees one thread at a time — see AsyncStoryStateDB).
+        ``read_only`` skips the schema/migrations, which the writing
+        connection has already run, and rejects writes.
+        """
         Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(self._db_path)
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=not threaded)
         self._conn.row_factory = sqlite3.Row
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA foreign_keys=ON")
+        if read_only:
+            self._conn.execute("PRAGMA query_only=ON")
+            return
         self._conn.executescript(_SCHEMA)
         # Migration: add unique_skill_json column if missing
         cols = {r[1] for r in self._conn.execute("PRAGMA table_info(players)").fetchall()}
@@ -288,6 +299,10 @@ class StoryStateDB:
             self._conn.close()
             self._conn = None
 
+    @property
+    def db_path(self) -> str:
+        return self._db_path
+
     @property
     def conn(self) -> sqlite3.Connection:
         if self._conn is None:
@@ -559,6 +574,7 @@ class StoryStateDB:
             ),
         )
         self.conn.commit()
+        self._note_player_skill(player)
         return player
 
     def get_player(self, player_id: str) -> PlayerState | None:
@@ -617,6 +633,14 @@ class StoryStateDB:
             ),
         )
         self.conn.commit()
+        self._note_player_skill(player)
+
+    def _note_player_skill(self, player: PlayerState) -> None:
+        """Keep a loaded SkillIndex in step with the saved skill name."""
+        index = loaded_skill_index(self._db_path)
+        if index is not None:
+            skill_name = player.unique_skill.name if player.unique_skill else ""
+            index.set_player_skill(player.id, skill_name)
 
     def reset_daily_turns(self, player_id: str, today: str) -> None:
         """Reset daily turn counter."""
@@ -742,7 +766,10 @@ class StoryStateDB:
     # ══════════════════════════════════════════
 
     def get_all_skill_names(self) -> list[str]:
-        """Return all existing unique skill names from players table."""
+        """Return all existing unique skill names from players table.
+
+        Scans every player — forge uses ``get_skill_index(db).names`` instead.
+        """
         rows = self.conn.execute(
             "SELECT unique_skill_json FROM players WHERE unique_skill_json IS NOT NULL"
         ).fetchall()
@@ -861,6 +888,9 @@ class StoryStateDB:
         self.conn.execute("DELETE FROM player_flags WHERE player_id = ?", (player_id,))
         self.conn.execute("DELETE FROM players WHERE id = ?", (player_id,))
         self.conn.commit()
+        index = loaded_skill_index(self._db_path)
+        if index is not None:
+            index.set_player_skill(player_id, "")
 
     # ══════════════════════════════════════════
     # Row Mappers
@@ -0,0 +1,141 @@
+"""Shared StoryStateDB connections for the synchronous stores.
+
+``ledger_store``, ``world_state_store`` and ``companion_context`` are plain
+functions called from context-loader threads and from the loop, so they
+cannot use ``AsyncStoryStateDB``. They share this pool instead of holding
+one connection per thread that is never closed:
+
+- reads borrow one of at most ``readers`` read-only connections, reused
+  by whichever thread asks next;
+- writes run on a single connection, one at a time.
+
+The writing connection opens first so it runs the schema/migrations
+before any reader. ``close_state_pool()`` closes everything at shutdown.
+
+    pool = get_state_pool()
+    ledger = pool.read(StoryStateDB.get_story_ledger, story_id)
+    pool.write(StoryStateDB.save_story_ledger, ledger)
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from app.memory.state import StoryStateDB
+
+T = TypeVar("T")
+
+
+class StoryStatePool:
+    """Bounded read-only connections plus one writer, shared across threads."""
+
+    def __init__(self, db_path: str | Path, readers: int = 4) -> None:
+        self._db_path = db_path
+        self._size = max(1, readers)
+        self._slots = threading.BoundedSemaphore(self._size)
+        self._lock = threading.Lock()           # guards the fields below
+        self._write_lock = threading.Lock()     # one write at a time
+        self._writer_db: StoryStateDB | None = None
+        self._idle: list[StoryStateDB] = []
+        self._reader_dbs: list[StoryStateDB] = []
+        self._stats = {"reads": 0, "writes": 0, "waits": 0}
+
+    def read(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn(db, *args, **kwargs)`` on a pooled read-only connection."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats["waits"] += 1
+            self._slots.acquire()
+        try:
+            reader = self._checkout()
+            try:
+                return fn(reader, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self._idle.append(reader)
+        finally:
+            self._slots.release()
+
+    def write(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``fn(db, *args, **kwargs)`` on the writing connection."""
+        with self._write_lock:
+            writer = self._writer()
+            self._stats["writes"] += 1
+            try:
+                return fn(writer, *args, **kwargs)
+            except Exception:
+                writer.conn.rollback()
+                raise
+
+    def close(self) -> None:
+        """Close every connection (waits for reads still running)."""
+        held = 0
+        try:
+            for _ in range(self._size):
+                self._slots.acquire()
+                held += 1
+            with self._write_lock, self._lock:
+                for reader in self._reader_dbs:
+                    reader.close()
+                self._reader_dbs.clear()
+                self._idle.clear()
+                if self._writer_db is not None:
+                    self._writer_db.close()
+                    self._writer_db = None
+        finally:
+            for _ in range(held):
+                self._slots.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "readers_open": len(self._reader_dbs),
+                "readers_idle": len(self._idle),
+            }
+
+    def _checkout(self) -> StoryStateDB:
+        with self._lock:
+            self._stats["reads"] += 1
+            if self._idle:
+                return self._idle.pop()
+        self._writer()  # schema first
+        reader = StoryStateDB(self._db_path)
+        reader.connect(threaded=True, read_only=True)
+        with self._lock:
+            self._reader_dbs.append(reader)
+        return reader
+
+    def _writer(self) -> StoryStateDB:
+        with self._lock:
+            if self._writer_db is None:
+                writer = StoryStateDB(self._db_path)
+                writer.connect(threaded=True)
+                self._writer_db = writer
+            return self._writer_db
+
+
+_pool: StoryStatePool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_state_pool() -> StoryStatePool:
+    """Get the process-wide pool (opened lazily on the configured database)."""
+    global _pool  # noqa: PLW0603
+    with _pool_lock:
+        if _pool is None:
+            from app.config import settings
+            _pool = StoryStatePool(settings.db_file, readers=settings.db_reader_pool_size)
+        return _pool
+
+
+def close_state_pool() -> None:
+    """Close the process-wide pool if it was opened (shutdown)."""
+    global _pool  # noqa: PLW0603
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
@@ -8,15 +8,25 @@ Uses NeuralMemory v2.8:
 
 All encode/query operations are async.
 Graceful degradation: if NeuralMemory is not installed, StoryBrain is a no-op.
+
+Open brains live in a bounded LRU pool (``BrainPool``); each holds a
+SQLite connection and its own encoder/retriever, so idle ones are closed.
+Stores go through the write-behind outbox (``brain_outbox``) when it runs.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from app.config import settings
+from app.memory.brain_outbox import OutboxEntry, get_brain_outbox
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +53,10 @@ class StoryBrain:
         await brain.store_scene(...)    # store scene content
         ctx = await brain.query_context(...)  # retrieve relevant memories
         await brain.close()             # cleanup
+
+    Brains handed out by ``get_or_create_brain`` belong to the pool: if
+    the pool evicts one while a caller still holds it, the next store or
+    query reopens it through the pool.
     """
 
     def __init__(self, story_id: str, brain_id: str = "") -> None:
@@ -53,6 +67,10 @@ class StoryBrain:
         self._retriever: "ReflexPipeline | None" = None
         self._brain: "Brain | None" = None
         self._initialized = False
+        self._pool: BrainPool | None = None
+        self._evicted = False
+        self._in_flight = 0
+        self.last_used = time.monotonic()
 
     async def initialize(self) -> None:
         """Initialize storage, brain, encoder, and retriever (async)."""
@@ -98,8 +116,27 @@ class StoryBrain:
 
     @property
     def available(self) -> bool:
+        if self._evicted:
+            return True  # reopened on next use
         return self._initialized and self._encoder is not None
 
+    @property
+    def busy(self) -> bool:
+        return self._in_flight > 0
+
+    @asynccontextmanager
+    async def _in_use(self) -> AsyncIterator[None]:
+        """Mark an operation in flight; reopen first if the pool evicted us."""
+        if self._evicted and self._pool is not None:
+            await self._pool.reopen(self)
+        self._in_flight += 1
+        self.last_used = time.monotonic()
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self.last_used = time.monotonic()
+
     # ══════════════════════════════════════
     # STORE
     # ══════════════════════════════════════
@@ -120,41 +157,36 @@ class StoryBrain:
         Encoding extracts entities (NPCs, locations), relationships,
         and temporal context → creates neurons + synapses in graph.
         """
-        if not self._encoder:
-            return
-        try:
-            parts = [f"[Chương {chapter_number} - Scene {scene_number}]"]
-            if title:
-                parts[0] += f" {title}"
-            parts.append(prose[:800])
-            if choice_text:
-                parts.append(f"→ Player chọn: {choice_text}")
-            if npcs:
-                parts.append(f"Nhân vật: {', '.join(npcs)}")
-
-            tags = {
-                "scene_memory",
-                f"chapter:{chapter_number}",
-                f"scene:{scene_number}",
-                f"type:{scene_type}",
-            }
-            if npcs:
-                for npc in npcs:
-                    tags.add(f"npc:{npc}")
-
-            await self._encoder.encode(
-                content="\n".join(parts),
-                metadata={
-                    "story_id": self.story_id,
-                    "chapter": chapter_number,
-                    "scene": scene_number,
-                    "scene_type": scene_type,
-                },
-                tags=tags,
-            )
-            logger.debug(f"StoryBrain: stored scene {chapter_number}.{scene_number}")
-        except Exception as e:
-            logger.error(f"StoryBrain store_scene failed: {e}")
+        parts = [f"[Chương {chapter_number} - Scene {scene_number}]"]
+        if title:
+            parts[0] += f" {title}"
+        parts.append(prose[:800])
+        if choice_text:
+            parts.append(f"→ Player chọn: {choice_text}")
+        if npcs:
+            parts.append(f"Nhân vật: {', '.join(npcs)}")
+
+        tags = {
+            "scene_memory",
+            f"chapter:{chapter_number}",
+            f"scene:{scene_number}",
+            f"type:{scene_type}",
+        }
+        if npcs:
+            for npc in npcs:
+                tags.add(f"npc:{npc}")
+
+        await self._remember(
+            f"scene:{chapter_number}.{scene_number}",
+            content="\n".join(parts),
+            metadata={
+                "story_id": self.story_id,
+                "chapter": chapter_number,
+                "scene": scene_number,
+                "scene_type": scene_type,
+            },
+            tags=tags,
+        )
 
     async def store_chapter_summary(
         self,
@@ -163,25 +195,65 @@ class StoryBrain:
         choice_text: str = "",
     ) -> None:
         """Store high-level chapter summary memory."""
-        if not self._encoder:
+        text = f"[Tóm tắt Chương {chapter_number}]\n{summary}"
+        if choice_text:
+            text += f"\n→ Lựa chọn: {choice_text}"
+
+        await self._remember(
+            f"chapter:{chapter_number}",
+            content=text,
+            metadata={
+                "story_id": self.story_id,
+                "chapter": chapter_number,
+                "type": "chapter_summary",
+            },
+            tags={"chapter_summary", f"chapter:{chapter_number}"},
+        )
+
+    async def _remember(self, key: str, content: str, metadata: dict, tags: set[str]) -> None:
+        """Queue a memory in the outbox if it is running, else encode it now."""
+        if not self.available:
             return
         try:
-            text = f"[Tóm tắt Chương {chapter_number}]\n{summary}"
-            if choice_text:
-                text += f"\n→ Lựa chọn: {choice_text}"
-
-            await self._encoder.encode(
-                content=text,
-                metadata={
-                    "story_id": self.story_id,
-                    "chapter": chapter_number,
-                    "type": "chapter_summary",
-                },
-                tags={"chapter_summary", f"chapter:{chapter_number}"},
-            )
-            logger.debug(f"StoryBrain: stored chapter {chapter_number} summary")
+            outbox = get_brain_outbox()
+            if outbox.running:
+                await outbox.enqueue(
+                    self.story_id, self.brain_id, key, content, metadata, tags,
+                )
+                logger.debug(f"StoryBrain: queued {key}")
+                return
+            async with self._in_use():
+                if not self._encoder:
+                    return
+                await self._encoder.encode(content=content, metadata=metadata, tags=tags)
+            logger.debug(f"StoryBrain: stored {key}")
         except Exception as e:
-            logger.error(f"StoryBrain store_chapter_summary failed: {e}")
+            logger.error(f"StoryBrain store {key} failed: {e}")
+
+    async def encode_entries(self, entries: list[OutboxEntry]) -> list[bool]:
+        """Encode outbox entries in one storage transaction; per-entry success.
+
+        Each entry runs in its own savepoint, so a failing one is rolled
+        back without losing the rest of the batch.
+        """
+        async with self._in_use():
+            if not self._encoder or not self._storage:
+                return [False] * len(entries)
+            results: list[bool] = []
+            async with self._storage.batch():
+                for entry in entries:
+                    try:
+                        async with self._storage.batch():
+                            await self._encoder.encode(
+                                content=entry.content,
+                                metadata=entry.metadata,
+                                tags=entry.tags,
+                            )
+                        results.append(True)
+                    except Exception as e:
+                        logger.error(f"StoryBrain: encoding outbox entry {entry.id} failed: {e}")
+                        results.append(False)
+            return results
 
     # ══════════════════════════════════════
     # QUERY
@@ -193,57 +265,198 @@ class StoryBrain:
         Returns formatted context string for LLM prompt injection.
         Returns empty string if no results or on error.
         """
-        if not self._retriever:
-            return ""
-        try:
-            result = await self._retriever.query(query=query, max_tokens=max_tokens)
-            if not result or result.confidence < 0.1:
+        async with self._in_use():
+            if not self._retriever:
                 return ""
-
-            # RetrievalResult.context is pre-formatted by the pipeline
-            context = result.context.strip() if result.context else ""
-
-            # Fallback to answer if context is empty
-            if not context and result.answer:
-                context = result.answer.strip()
-
-            if not context:
+            outbox = get_brain_outbox()
+            if outbox.running:
+                # Leave the recall half of its budget: a lagging outbox costs
+                # the newest stores, not the whole memory block
+                wait_s = min(settings.brain_outbox_wait_s, settings.context_recall_timeout_s / 2)
+                if not await outbox.wait_for(self.brain_id, timeout=wait_s):
+                    logger.warning(
+                        f"StoryBrain: querying {self.brain_id} before its stores finished"
+                    )
+            try:
+                result = await self._retriever.query(query=query, max_tokens=max_tokens)
+                if not result or result.confidence < 0.1:
+                    return ""
+
+                # RetrievalResult.context is pre-formatted by the pipeline
+                context = result.context.strip() if result.context else ""
+
+                # Fallback to answer if context is empty
+                if not context and result.answer:
+                    context = result.answer.strip()
+
+                if not context:
+                    return ""
+
+                formatted = (
+                    f"## Ký ức liên quan (từ các chương trước):\n{context}"
+                )
+                logger.debug(
+                    f"StoryBrain: query returned {len(result.fibers_matched)} fibers, "
+                    f"confidence={result.confidence:.2f}"
+                )
+                return formatted
+            except Exception as e:
+                logger.warning(f"StoryBrain query failed: {e}")
                 return ""
 
-            formatted = (
-                f"## Ký ức liên quan (từ các chương trước):\n{context}"
-            )
-            logger.debug(
-                f"StoryBrain: query returned {len(result.fibers_matched)} fibers, "
-                f"confidence={result.confidence:.2f}"
-            )
-            return formatted
-        except Exception as e:
-            logger.warning(f"StoryBrain query failed: {e}")
-            return ""
-
     async def close(self) -> None:
         """Close storage connection."""
-        if self._storage:
-            await self._storage.close()
+        self._evicted = False
+        await self._release()
+
+    async def _evict(self) -> None:
+        """Release resources but stay usable (see ``_in_use``).
+
+        The pool sets ``_evicted`` before closing starts, so a caller
+        arriving mid-close reopens the brain instead of using it.
+        """
+        await self._release()
+
+    async def _release(self) -> None:
+        storage = self._storage
+        if storage:
             self._storage = None
             self._encoder = None
             self._retriever = None
             self._initialized = False
+            await storage.close()
 
 
 # ──────────────────────────────────────────────
-# Brain cache (per story) — with async init
+# Brain pool (per story) — bounded LRU with async init
 # ──────────────────────────────────────────────
 
-_brain_cache: dict[str, StoryBrain] = {}
+class BrainPool:
+    """Bounded LRU pool of open StoryBrains.
+
+    - at most ``max_size`` brains stay open; the least recently used idle
+      one is closed to make room (busy brains are never closed);
+    - brains unused for ``idle_ttl_s`` are closed on the next pool access;
+    - concurrent requests for a brain that is still opening share one
+      ``initialize()`` (singleflight).
+
+    At most one StoryBrain object exists per brain id, so a caller holding
+    an evicted brain and a fresh ``get`` both end up with the same object.
+    """
+
+    def __init__(self, max_size: int, idle_ttl_s: float) -> None:
+        self.max_size = max_size
+        self.idle_ttl_s = idle_ttl_s
+        self.brains: OrderedDict[str, StoryBrain] = OrderedDict()   # open, LRU first
+        self._known: weakref.WeakValueDictionary[str, StoryBrain] = (
+            weakref.WeakValueDictionary()
+        )
+        self._opening: dict[str, asyncio.Task[StoryBrain]] = {}
+        self._stats = {
+            "hits": 0, "misses": 0, "coalesced": 0,
+            "reopened": 0, "evicted_lru": 0, "evicted_idle": 0,
+        }
+
+    async def get(self, story_id: str, brain_id: str = "") -> StoryBrain:
+        key = brain_id or story_id
+        brain = self.brains.get(key)
+        if brain is not None:
+            self._stats["hits"] += 1
+            self.brains.move_to_end(key)
+            brain.last_used = time.monotonic()
+            await self._evict(keep=key)
+            return brain
+
+        opening = self._opening.get(key)
+        if opening is not None:
+            self._stats["coalesced"] += 1
+            return await asyncio.shield(opening)
+
+        self._stats["misses"] += 1
+        brain = self._known.get(key)
+        if brain is None:
+            brain = StoryBrain(story_id, brain_id)
+            brain._pool = self
+            self._known[key] = brain
+        task = asyncio.create_task(self._open(key, brain), name=f"brain_open_{key}")
+        self._opening[key] = task
+        return await asyncio.shield(task)
+
+    async def reopen(self, brain: StoryBrain) -> None:
+        """Bring an evicted brain back (called by the brain on next use)."""
+        self._stats["reopened"] += 1
+        await self.get(brain.story_id, brain.brain_id)
+
+    async def _open(self, key: str, brain: StoryBrain) -> StoryBrain:
+        try:
+            brain._evicted = False
+            await brain.initialize()
+            brain.last_used = time.monotonic()
+            self.brains[key] = brain
+        finally:
+            self._opening.pop(key, None)
+        await self._evict(keep=key)
+        return brain
+
+    async def _evict(self, keep: str) -> None:
+        """Close idle brains, then LRU ones over ``max_size`` (never ``keep``)."""
+        now = time.monotonic()
+        victims = [
+            key for key, brain in self.brains.items()
+            if key != keep and not brain.busy and now - brain.last_used > self.idle_ttl_s
+        ]
+        self._stats["evicted_idle"] += len(victims)
+        excess = len(self.brains) - len(victims) - self.max_size
+        if excess > 0:
+            lru = [
+                key for key, brain in self.brains.items()
+                if key != keep and key not in victims and not brain.busy
+            ][:excess]
+            self._stats["evicted_lru"] += len(lru)
+            victims.extend(lru)
+        # Every victim is marked before the first await: a caller arriving
+        # while an earlier one closes reopens its brain rather than using it
+        closing = []
+        for key in victims:
+            brain = self.brains.pop(key)
+            brain._evicted = brain.available
+            closing.append((key, brain))
+        closed = 0
+        for key, brain in closing:
+            if brain.busy or key in self.brains or key in self._opening:
+                continue  # reopened meanwhile
+            await brain._evict()
+            closed += 1
+        if closed:
+            logger.info(f"BrainPool: closed {closed} brain(s), {len(self.brains)} open")
+
+    async def close_all(self) -> None:
+        """Close every open brain (shutdown)."""
+        while self.brains:
+            _, brain = self.brains.popitem()
+            await brain.close()
+
+    def stats(self) -> dict:
+        lookups = self._stats["hits"] + self._stats["misses"] + self._stats["coalesced"]
+        return {
+            **self._stats,
+            "open": len(self.brains),
+            "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+
+_pool = BrainPool(
+    max_size=settings.brain_pool_max_size,
+    idle_ttl_s=settings.brain_pool_idle_s,
+)
+_brain_cache = _pool.brains  # open brains by id
+
+
+def get_brain_pool() -> BrainPool:
+    """Get the process-wide StoryBrain pool."""
+    return _pool
 
 
 async def get_or_create_brain(story_id: str, brain_id: str = "") -> StoryBrain:
-    """Get or create a StoryBrain for a story (cached + async initialized)."""
-    cache_key = brain_id or story_id
-    if cache_key not in _brain_cache:
-        brain = StoryBrain(story_id, brain_id)
-        await brain.initialize()
-        _brain_cache[cache_key] = brain
-    return _brain_cache[cache_key]
+    """Get or create a StoryBrain for a story (pooled + async initialized)."""
+    return await _pool.get(story_id, brain_id)
@@ -1,7 +1,7 @@
 """World State Store — lazy DB singleton for WorldState CRUD.
 
 Follows the same pattern as ledger_store.py:
-- Single shared StoryStateDB instance (lazily initialized)
+- Reads and writes go through the shared StoryStatePool (state_pool.py)
 - Simple load/save API consumed by pipeline nodes
 - Best-effort: all errors are caught and logged, never raised to pipeline
 
@@ -17,24 +17,12 @@ from __future__ import annotations
 
 import logging
 
+from app.memory.state import StoryStateDB
+from app.memory.state_pool import get_state_pool
 from app.models.world_state import WorldState
 
 logger = logging.getLogger(__name__)
 
-_db = None  # lazy singleton
-
-
-def _get_db():
-    """Return a connected StoryStateDB singleton."""
-    global _db
-    if _db is None:
-        from app.config import settings
-        from app.memory.state import StoryStateDB
-
-        _db = StoryStateDB(settings.db_file)
-        _db.connect()
-    return _db
-
 
 def load_world_state(story_id: str) -> WorldState:
     """Load WorldState for a story. Returns fresh default if none exists.
@@ -42,7 +30,7 @@ def load_world_state(story_id: str) -> WorldState:
     Never raises — returns empty WorldState on any error.
     """
     try:
-        return _get_db().get_world_state(story_id)
+        return get_state_pool().read(StoryStateDB.get_world_state, story_id)
     except Exception as e:
         logger.warning(f"WorldStateStore: load failed for {story_id}: {e} — returning default")
         return WorldState()
@@ -54,6 +42,6 @@ def save_world_state(story_id: str, world_state: WorldState, chapter: int = 0) -
     Never raises — logs warning on failure.
     """
     try:
-        _get_db().save_world_state(story_id, world_state, chapter)
+        get_state_pool().write(StoryStateDB.save_world_state, story_id, world_state, chapter)
     except Exception as e:
         logger.warning(f"WorldStateStore: save failed for {story_id}: {e}")
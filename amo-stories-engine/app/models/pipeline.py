@@ -159,6 +159,7 @@ class CriticOutput(BaseModel):
     feedback: dict = Field(default_factory=dict)
     issues: list[str] = Field(default_factory=list)
     rewrite_instructions: str = ""
+    patch_paragraphs: list[int] = Field(default_factory=list)  # 1-based; empty → full rewrite
 
 
 # ──────────────────────────────────────────────
@@ -6,7 +6,7 @@ for injection into the pipeline context (context.py).
 Also provides tag/tone guidance helpers aligned with
 COMPANION_VILLAIN_GENDER_SPEC §1.1b.
 
-DB access pattern: lazy singleton (matches world_state_store.py / ledger_store.py)
+DB access: the shared StoryStatePool (as in world_state_store.py / ledger_store.py)
 so pipeline nodes can call load_companion_context() without a db argument.
 """
 
@@ -18,24 +18,6 @@ from app.models.companion import AFFINITY_TIER_DESC, CompanionProfile
 
 logger = logging.getLogger(__name__)
 
-# ──────────────────────────────────────────────
-# Lazy DB singleton (pipeline-safe, no circular import)
-# ──────────────────────────────────────────────
-
-_db = None  # module-level singleton
-
-
-def _get_db():
-    """Return a connected StoryStateDB singleton (lazy-init)."""
-    global _db
-    if _db is None:
-        from app.config import settings
-        from app.memory.state import StoryStateDB
-        _db = StoryStateDB(settings.db_file)
-        _db.connect()
-    return _db
-
-
 # ──────────────────────────────────────────────
 # Tag → companion role guidance
 # ──────────────────────────────────────────────
@@ -212,7 +194,7 @@ def load_companion_context(
 ) -> str:
     """Load active companions from DB and build context block.
 
-    Uses the module-level lazy DB singleton — no db argument needed.
+    Reads through the shared StoryStatePool — no db argument needed.
     Never raises; returns "" on any failure.
 
     Args:
@@ -225,8 +207,11 @@ def load_companion_context(
         Formatted companion context string, or "" if no companions / on failure.
     """
     try:
-        db = _get_db()
-        companions = db.get_story_companions(story_id, active_only=True)
+        from app.memory.state import StoryStateDB
+        from app.memory.state_pool import get_state_pool
+        companions = get_state_pool().read(
+            StoryStateDB.get_story_companions, story_id, active_only=True,
+        )
         if not companions:
             return ""
         ctx = build_companion_context(
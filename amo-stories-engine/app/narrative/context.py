@@ -4,18 +4,180 @@ Injects (in order):
   0.  NeuralMemory semantic recall (story_brain.py)
   0b. Story Ledger (per-story accumulated entities + facts)
   0c. World State (Phase 3: Emissary/Tower/flags/threat pressure)
+  0d. Villain context (from the World State)
+  0e. Companion context
   1-9. Simulator output + player identity + unique skill
+
+Blocks 0–0e come from providers that run concurrently: the async recall
+on the loop, the SQLite loaders in worker threads. Each has a timeout, so
+the stage takes as long as its slowest provider rather than their sum;
+a provider that fails or times out just contributes nothing.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 
+from app.config import settings
 from app.models.pipeline import NarrativeState
 
 logger = logging.getLogger(__name__)
 
 
+# ──────────────────────────────────────────────
+# Providers
+# ──────────────────────────────────────────────
+
+async def _memory_provider(state: NarrativeState, story_id: str) -> list[str]:
+    from app.memory.story_brain import get_or_create_brain
+    brain = await get_or_create_brain(story_id)
+    if not brain.available:
+        return []
+    query = _build_memory_query(state)
+    memory_ctx = await brain.query_context(query, max_tokens=800)
+    if not memory_ctx:
+        return []
+    logger.info(f"Context: NeuralMemory recalled {len(memory_ctx)} chars")
+    return [memory_ctx]
+
+
+def _ledger_provider(state: NarrativeState, story_id: str) -> list[str]:
+    # Inject per-player accumulated facts to ensure AI consistency
+    from app.memory.ledger_store import load_ledger
+    ledger = load_ledger(story_id)
+    ledger_block = ledger.to_prompt_string(max_chars=1000)
+    if not ledger_block:
+        return []
+    logger.info(
+        f"Context: Story Ledger injected "
+        f"({ledger.entity_count()} entities, {ledger.fact_count()} facts)"
+    )
+    return [ledger_block]
+
+
+def _world_provider(state: NarrativeState, story_id: str) -> list[str]:
+    # Dynamic world state: threat pressure, emissary reveals, tower, world flags
+    from app.memory.world_state_store import load_world_state
+    blocks: list[str] = []
+    world_state = load_world_state(story_id)
+    ws_block = world_state.to_prompt_string()
+    # to_prompt_string() returns "" if nothing notable (has_notable_state == False)
+    if ws_block:
+        blocks.append(ws_block)
+        logger.info(
+            f"Context: WorldState injected "
+            f"(pressure={world_state.get_threat_pressure()}, "
+            f"flags={len([k for k,v in world_state.world_flags.items() if v])})"
+        )
+
+    try:
+        from app.narrative.villain_tracker import get_villain_context
+        villain_block = get_villain_context(world_state)
+        if villain_block:
+            blocks.append(villain_block)
+            logger.info("Context: Villain context injected")
+    except Exception as ve:
+        logger.warning(f"Context: Villain context failed ({ve}) — continuing")
+    return blocks
+
+
+def _companion_provider(state: NarrativeState, story_id: str) -> list[str]:
+    # Uses module-level lazy DB access — no db argument needed.
+    from app.narrative.companion_context import load_companion_context
+    companion_block = load_companion_context(
+        story_id=story_id,
+        preference_tags=getattr(state, "preference_tags", []) or [],
+        tone=getattr(state, "tone", "") or "",
+        # Extract player_gender if available (Phase 3; default neutral)
+        player_gender=getattr(state, "player_gender", "neutral") or "neutral",
+    )
+    if not companion_block:
+        return []
+    logger.info("Context: Companion context injected")
+    return [companion_block]
+
+
+@dataclass(frozen=True)
+class _Provider:
+    name: str
+    build: Callable[[NarrativeState, str], object]
+    on_loop: bool           # async I/O; otherwise a blocking loader run in a thread
+    timeout_setting: str    # settings field holding the budget in seconds
+
+
+# Output order follows this list
+_PROVIDERS = [
+    _Provider("memory", _memory_provider, True, "context_recall_timeout_s"),
+    _Provider("ledger", _ledger_provider, False, "context_loader_timeout_s"),
+    _Provider("world_state", _world_provider, False, "context_loader_timeout_s"),
+    _Provider("companions", _companion_provider, False, "context_loader_timeout_s"),
+]
+
+# Per-provider latency: calls, timeouts, errors, last/max/total ms
+_provider_stats: dict[str, dict[str, float]] = {}
+
+
+def get_context_stats() -> dict[str, dict[str, float]]:
+    """Latency and failure counts per context provider (avg_ms included)."""
+    return {
+        name: {**stats, "avg_ms": round(stats["total_ms"] / stats["calls"], 1)}
+        for name, stats in _provider_stats.items()
+        if stats["calls"]
+    }
+
+
+async def _run_provider(
+    provider: _Provider, state: NarrativeState, story_id: str,
+) -> list[str]:
+    work: Awaitable[list[str]] = (
+        provider.build(state, story_id) if provider.on_loop  # type: ignore[assignment]
+        else asyncio.to_thread(provider.build, state, story_id)
+    )
+    stats = _provider_stats.setdefault(
+        provider.name,
+        {"calls": 0, "timeouts": 0, "errors": 0, "last_ms": 0.0, "max_ms": 0.0, "total_ms": 0.0},
+    )
+    timeout = getattr(settings, provider.timeout_setting)
+    start = time.perf_counter()
+    try:
+        # A timed-out thread loader keeps running; its result is dropped
+        return await asyncio.wait_for(work, timeout=timeout)
+    except TimeoutError:
+        stats["timeouts"] += 1
+        logger.warning(
+            f"Context: {provider.name} provider timed out after {timeout}s — continuing"
+        )
+    except Exception as e:
+        stats["errors"] += 1
+        logger.warning(f"Context: {provider.name} provider failed ({e}) — continuing")
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        stats["calls"] += 1
+        stats["last_ms"] = round(elapsed_ms, 1)
+        stats["max_ms"] = max(stats["max_ms"], round(elapsed_ms, 1))
+        stats["total_ms"] += elapsed_ms
+    return []
+
+
+async def gather_provider_blocks(state: NarrativeState, story_id: str) -> list[str]:
+    """Run every context provider concurrently; blocks in provider order."""
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        _run_provider(provider, state, story_id) for provider in _PROVIDERS
+    ))
+    timings = ", ".join(
+        f"{p.name}={_provider_stats[p.name]['last_ms']:.0f}ms" for p in _PROVIDERS
+    )
+    logger.info(
+        f"Context: providers done in {(time.perf_counter() - start) * 1000:.0f}ms ({timings})"
+    )
+    return [block for blocks in results for block in blocks]
+
+
 async def run_context(state: NarrativeState, db: object = None) -> dict:
     """Build context string from pipeline state and chapter history.
 
@@ -29,86 +191,11 @@ async def run_context(state: NarrativeState, db: object = None) -> dict:
     """
     contexts: list[str] = []
 
-    # ── 0. NeuralMemory semantic recall ──
+    # ── 0. Providers: NeuralMemory recall, Story Ledger, World State +
+    #       villain context, companions — run concurrently, in this order ──
     story_id = getattr(state, "story_id", None)
     if story_id:
-        try:
-            from app.memory.story_brain import get_or_create_brain
-            brain = await get_or_create_brain(story_id)
-            if brain.available:
-                query = _build_memory_query(state)
-                memory_ctx = await brain.query_context(query, max_tokens=800)
-                if memory_ctx:
-                    contexts.append(memory_ctx)
-                    logger.info(f"Context: NeuralMemory recalled {len(memory_ctx)} chars")
-        except Exception as e:
-            logger.warning(f"Context: NeuralMemory query failed ({e}) — continuing")
-
-    # ── 0b. Story Ledger injection ──
-    # Inject per-player accumulated facts to ensure AI consistency
-    if story_id:
-        try:
-            from app.memory.ledger_store import load_ledger
-            ledger = load_ledger(story_id)
-            ledger_block = ledger.to_prompt_string(max_chars=1000)
-            if ledger_block:
-                contexts.append(ledger_block)
-                logger.info(
-                    f"Context: Story Ledger injected "
-                    f"({ledger.entity_count()} entities, {ledger.fact_count()} facts)"
-                )
-        except Exception as e:
-            logger.warning(f"Context: Story Ledger inject failed ({e}) — continuing")
-
-    # ── 0c. World State injection ──
-    # Inject dynamic world state: threat pressure, emissary reveals, tower, world flags
-    if story_id:
-        try:
-            from app.memory.world_state_store import load_world_state
-            world_state = load_world_state(story_id)
-            ws_block = world_state.to_prompt_string()
-            # to_prompt_string() returns "" if nothing notable (has_notable_state == False)
-            if ws_block:
-                contexts.append(ws_block)
-                logger.info(
-                    f"Context: WorldState injected "
-                    f"(pressure={world_state.get_threat_pressure()}, "
-                    f"flags={len([k for k,v in world_state.world_flags.items() if v])})"
-                )
-
-            # ── 0d. Villain context injection ──
-            try:
-                from app.narrative.villain_tracker import get_villain_context
-                villain_block = get_villain_context(world_state)
-                if villain_block:
-                    contexts.append(villain_block)
-                    logger.info("Context: Villain context injected")
-            except Exception as ve:
-                logger.warning(f"Context: Villain context failed ({ve}) — continuing")
-
-        except Exception as e:
-            logger.warning(f"Context: WorldState inject failed ({e}) — continuing")
-
-    # ── 0e. Companion context injection ──
-    # Uses module-level lazy singleton — no db argument needed.
-    if story_id:
-        try:
-            from app.narrative.companion_context import load_companion_context
-            preference_tags = getattr(state, "preference_tags", []) or []
-            tone = getattr(state, "tone", "") or ""
-            # Extract player_gender if available (Phase 3; default neutral)
-            player_gender = getattr(state, "player_gender", "neutral") or "neutral"
-            companion_block = load_companion_context(
-                story_id=story_id,
-                preference_tags=preference_tags,
-                tone=tone,
-                player_gender=player_gender,
-            )
-            if companion_block:
-                contexts.append(companion_block)
-                logger.info("Context: Companion context injected")
-        except Exception as e:
-            logger.warning(f"Context: Companion context inject failed ({e}) — continuing")
+        contexts.extend(await gather_provider_blocks(state, story_id))
 
     # ── 1. Previous Summary (chapter history) ──
     if state.previous_summary:
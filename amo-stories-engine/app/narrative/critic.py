@@ -8,7 +8,9 @@ from pathlib import Path
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
+from app.config import settings
 from app.models.pipeline import CriticOutput, NarrativeState
+from app.narrative.tracing import current_span
 from app.narrative.world_context import get_world_context
 
 logger = logging.getLogger(__name__)
@@ -45,16 +47,13 @@ _USER_TEMPLATE = """## Writer Output:
 async def run_critic(state: NarrativeState, llm: object) -> dict:
     """Score the writer's output and approve or request rewrite.
 
-    Pre-LLM step: Canon Guard checks for critical world violations.
-    Critical violations → immediate reject without LLM call.
-    Non-critical violations → appended to LLM critic instructions.
+    Pre-LLM step (``critique.prescreen_chapter``): Canon Guard + structure.
+    Critical violations → immediate reject without LLM call, patching the
+    offending paragraphs. Clean draft → approved without LLM call.
+    Otherwise warnings are appended to the LLM critic instructions.
     """
-    from app.world.canon_guard import (
-        check_canon,
-        has_critical_violation,
-        format_for_rewrite,
-        format_as_warnings,
-    )
+    from app.narrative.critique import get_critique_stats, number_paragraphs, prescreen_chapter
+    from app.world.canon_guard import format_for_rewrite, format_as_warnings
 
     writer = state.writer_output
     planner = state.planner_output
@@ -69,12 +68,15 @@ async def run_critic(state: NarrativeState, llm: object) -> dict:
             )
         }
 
-    # ── Canon Guard pre-check ──
-    prose = writer.prose or ""
-    violations = check_canon(prose)
-    if has_critical_violation(violations):
+    # ── Tier 1: Canon Guard + structural pre-check ──
+    screen = prescreen_chapter(writer)
+    violations = screen.violations
+    first_pass = state.rewrite_count == 0
+    if screen.critical:
         rewrite_instructions = format_for_rewrite(violations)
-        logger.warning(f"Critic: Canon Guard CRITICAL violation — forcing rewrite")
+        logger.warning("Critic: Canon Guard CRITICAL violation — forcing rewrite")
+        _mark_tier("canon")
+        get_critique_stats().record_review("canon", approved=False, first_pass=first_pass)
         return {
             "critic_output": CriticOutput(
                 score=0,
@@ -82,11 +84,28 @@ async def run_critic(state: NarrativeState, llm: object) -> dict:
                 issues=[v.message for v in violations if v.severity == "critical"],
                 rewrite_instructions=rewrite_instructions,
                 feedback={"canon_violations": len(violations)},
+                patch_paragraphs=screen.paragraphs,
             )
         }
 
-    # Non-critical violations: append as warnings to LLM prompt
+    if screen.clean and settings.critic_auto_approve:
+        logger.info(f"Critic: prescreen clean — approved without LLM (ch.{state.chapter_number})")
+        _mark_tier("heuristic")
+        get_critique_stats().record_review("heuristic", approved=True, first_pass=first_pass)
+        return {
+            "critic_output": CriticOutput(
+                score=settings.critic_min_score,
+                approved=True,
+                feedback={"tier": "heuristic"},
+            )
+        }
+
+    # Non-critical violations and structural issues: warnings for the LLM critic
     canon_warnings = format_as_warnings(violations)
+    if screen.issues:
+        canon_warnings = "\n".join(
+            [canon_warnings, "⚠️ Structural issues:", *(f"- {i}" for i in screen.issues)]
+        ).strip()
 
     # Format choices for review
     choices_text = "\n".join(
@@ -103,7 +122,8 @@ async def run_critic(state: NarrativeState, llm: object) -> dict:
         SystemMessage(content=_FULL_SYSTEM_PROMPT),
         HumanMessage(content=_USER_TEMPLATE.format(
             chapter_title=writer.chapter_title,
-            prose_preview=writer.prose,  # Full prose — critic must evaluate complete text
+            # Full prose — critic must evaluate complete text; [¶n] for patch_paragraphs
+            prose_preview=number_paragraphs(writer.prose),
             prose_length=len(writer.prose),
             choices_text=choices_text,
             summary=writer.summary,
@@ -118,6 +138,7 @@ async def run_critic(state: NarrativeState, llm: object) -> dict:
     ]
 
     logger.info(f"Critic: reviewing chapter {state.chapter_number} (rewrite {state.rewrite_count})")
+    _mark_tier("llm")
     response = await llm.ainvoke(messages)
     content = _extract_json(response.content)
 
@@ -125,6 +146,7 @@ async def run_critic(state: NarrativeState, llm: object) -> dict:
         result = json.loads(content)
     except json.JSONDecodeError:
         logger.error(f"Critic JSON parse failed: {content[:200]}")
+        get_critique_stats().record_review("llm", approved=True, first_pass=first_pass)
         # Fallback: auto-approve if we can't parse
         return {
             "critic_output": CriticOutput(
@@ -151,11 +173,32 @@ async def run_critic(state: NarrativeState, llm: object) -> dict:
         feedback=result.get("feedback", {}),
         issues=result.get("issues", []),
         rewrite_instructions=result.get("rewrite_instructions", ""),
+        patch_paragraphs=_int_list(result.get("patch_paragraphs")),
     )
+    get_critique_stats().record_review("llm", approved=approved, first_pass=first_pass)
 
     return {"critic_output": critic_output}
 
 
+def _mark_tier(tier: str) -> None:
+    """Tag the critic node's trace span with the tier that decided."""
+    span = current_span()
+    if span is not None:
+        span.set(tier=tier)
+
+
+def _int_list(value: object) -> list[int]:
+    if not isinstance(value, list):
+        return []
+    out = []
+    for item in value:
+        try:
+            out.append(int(item))
+        except (TypeError, ValueError):
+            continue
+    return out
+
+
 def _extract_json(text: str) -> str:
     text = text.strip()
     if text.startswith("```"):
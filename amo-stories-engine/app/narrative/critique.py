@@ -0,0 +1,269 @@
+"""Tiered critique — cheap checks first, targeted rewrites after.
+
+Every critic rejection used to send the whole chapter back to the writer.
+The critic node now works in tiers:
+
+1. ``prescreen_chapter`` — Canon Guard plus structural checks, no LLM.
+   A critical canon violation rejects immediately, pointing at the
+   offending paragraphs. A clean draft is approved without an LLM call
+   (``critic_auto_approve``).
+2. The LLM critic, only for drafts with warnings. It sees the prose with
+   numbered paragraphs and names the ones to fix (``patch_paragraphs``).
+
+A rejection that names paragraphs is fixed by ``rewrite_paragraphs``: the
+writer regenerates only those paragraphs and they are spliced back into
+the draft, keeping title, summary and choices. Patches covering too much
+of the chapter, or a patch reply that does not parse, fall back to a full
+rewrite.
+
+``get_critique_stats().stats()`` reports the rewrite rate and the
+estimated output tokens saved; it is served with ``/debug/traces``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from app.config import settings
+from app.models.pipeline import CriticOutput, WriterOutput
+from app.narrative.tracing import current_span
+from app.world.canon_guard import CanonViolation, check_canon, has_critical_violation
+
+logger = logging.getLogger(__name__)
+
+# Rough output-token size of Vietnamese prose, for the savings estimate
+_CHARS_PER_TOKEN = 3.5
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+# ──────────────────────────────────────────────
+# Paragraphs
+# ──────────────────────────────────────────────
+
+def split_paragraphs(prose: str) -> list[str]:
+    return [p.strip() for p in _PARAGRAPH_BREAK.split(prose or "") if p.strip()]
+
+
+def join_paragraphs(paragraphs: list[str]) -> str:
+    return "\n\n".join(paragraphs)
+
+
+def number_paragraphs(prose: str) -> str:
+    """Prose with ``[¶n]`` markers (1-based) for the critic to refer to."""
+    return join_paragraphs(
+        [f"[¶{i}] {p}" for i, p in enumerate(split_paragraphs(prose), 1)]
+    )
+
+
+def paragraphs_containing(paragraphs: list[str], snippets: list[str]) -> list[int]:
+    """1-based indices of paragraphs containing any of ``snippets``."""
+    found: set[int] = set()
+    for snippet in snippets:
+        # Canon matches may run across a paragraph break; use their first line
+        head = snippet.strip().split("\n")[0][:40].lower()
+        if not head:
+            continue
+        for i, paragraph in enumerate(paragraphs, 1):
+            if head in paragraph.lower():
+                found.add(i)
+                break
+    return sorted(found)
+
+
+# ──────────────────────────────────────────────
+# Tier 1: prescreen (no LLM)
+# ──────────────────────────────────────────────
+
+@dataclass
+class Prescreen:
+    """Instant signals for one draft."""
+
+    violations: list[CanonViolation] = field(default_factory=list)
+    issues: list[str] = field(default_factory=list)      # structural
+    paragraphs: list[int] = field(default_factory=list)  # 1-based, canon hits
+
+    @property
+    def critical(self) -> bool:
+        return has_critical_violation(self.violations)
+
+    @property
+    def clean(self) -> bool:
+        return not self.violations and not self.issues
+
+
+def prescreen_chapter(writer: WriterOutput) -> Prescreen:
+    """Canon Guard and structural checks on a chapter draft."""
+    prose = writer.prose or ""
+    screen = Prescreen(violations=check_canon(prose))
+
+    if len(prose.strip()) < settings.critic_min_prose_chars:
+        screen.issues.append(
+            f"Prose quá ngắn ({len(prose.strip())} chars, cần ≥{settings.critic_min_prose_chars})"
+        )
+    texts = [c.text.strip().lower() for c in writer.choices if c.text.strip()]
+    if len(texts) < 3:
+        screen.issues.append(f"Chỉ có {len(texts)} choices có nội dung (cần 3)")
+    if len(texts) != len(set(texts)):
+        screen.issues.append("Có choices trùng nội dung")
+    missing_hints = sum(1 for c in writer.choices if not c.consequence_hint)
+    if missing_hints:
+        screen.issues.append(f"{missing_hints} choices thiếu consequence_hint")
+
+    if screen.violations:
+        screen.paragraphs = paragraphs_containing(
+            split_paragraphs(prose), [v.matched_text for v in screen.violations],
+        )
+    return screen
+
+
+# ──────────────────────────────────────────────
+# Patch rewrites
+# ──────────────────────────────────────────────
+
+_PATCH_SYSTEM = """Bạn là Writer đang SỬA một chương đã viết, không viết lại từ đầu.
+Chỉ viết lại các đoạn được chỉ định. Giữ nguyên giọng văn, ngôi kể, tên riêng
+và mạch truyện; đoạn mới phải nối liền với đoạn trước và sau nó.
+
+## Output (JSON thuần, không markdown):
+{"paragraphs": [{"index": 3, "text": "Đoạn văn mới..."}]}"""
+
+_PATCH_USER = """## Chương hiện tại (đoạn được đánh số):
+{numbered_prose}
+
+## Critic (score {score}/10):
+{instructions}
+Issues: {issues}
+
+## Viết lại CHỈ các đoạn: {targets}"""
+
+
+def patch_targets(critic: CriticOutput | None, writer: WriterOutput | None) -> list[int]:
+    """Paragraphs to patch, or [] when the draft needs a full rewrite."""
+    if (
+        not settings.critic_patch_rewrites
+        or critic is None or critic.approved or writer is None
+        or not critic.patch_paragraphs
+    ):
+        return []
+    count = len(split_paragraphs(writer.prose))
+    targets = sorted({i for i in critic.patch_paragraphs if 1 <= i <= count})
+    if not targets or len(targets) > count * settings.critic_patch_max_ratio:
+        return []
+    return targets
+
+
+async def rewrite_paragraphs(
+    writer: WriterOutput, critic: CriticOutput, targets: list[int], llm: Any,
+) -> WriterOutput | None:
+    """``writer`` with only ``targets`` regenerated; None if the reply is unusable."""
+    paragraphs = split_paragraphs(writer.prose)
+    messages = [
+        SystemMessage(content=_PATCH_SYSTEM),
+        HumanMessage(content=_PATCH_USER.format(
+            numbered_prose=number_paragraphs(writer.prose),
+            score=critic.score,
+            instructions=critic.rewrite_instructions or "(không có)",
+            issues=", ".join(critic.issues) or "(không có)",
+            targets=", ".join(f"¶{i}" for i in targets),
+        )),
+    ]
+    response = await llm.ainvoke(messages)
+    replacements = _parse_patch(response.content, set(targets))
+    if not replacements:
+        logger.warning(f"Critique: patch reply unusable for ¶{targets} — full rewrite")
+        return None
+
+    for index, text in replacements.items():
+        paragraphs[index - 1] = text
+    patched = writer.model_copy(update={"prose": join_paragraphs(paragraphs)})
+
+    full_chars = len(writer.prose) + sum(len(c.text) + len(c.consequence_hint) for c in writer.choices)
+    saved = max(0, round((full_chars - sum(len(t) for t in replacements.values())) / _CHARS_PER_TOKEN))
+    get_critique_stats().record_patch(saved)
+    span = current_span()
+    if span is not None:
+        span.set(patched_paragraphs=len(replacements), tokens_saved=saved)
+    logger.info(
+        f"Critique: patched ¶{sorted(replacements)} of {len(paragraphs)} "
+        f"(~{saved} output tokens saved)"
+    )
+    return patched
+
+
+def _parse_patch(content: Any, targets: set[int]) -> dict[int, str]:
+    text = content if isinstance(content, str) else str(content)
+    match = re.search(r"\{.*\}", text, re.DOTALL)
+    if not match:
+        return {}
+    try:
+        items = json.loads(match.group(0)).get("paragraphs", [])
+    except (ValueError, AttributeError):
+        return {}
+    replacements: dict[int, str] = {}
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            index = int(item.get("index"))
+        except (TypeError, ValueError):
+            continue
+        new_text = str(item.get("text") or "").strip()
+        if index in targets and new_text:
+            replacements[index] = new_text
+    return replacements
+
+
+# ──────────────────────────────────────────────
+# Stats
+# ──────────────────────────────────────────────
+
+class CritiqueStats:
+    """Per-process counters for the critic tiers and rewrites."""
+
+    def __init__(self) -> None:
+        self._counts = {
+            "chapters": 0, "reviews": 0, "auto_approved": 0, "canon_rejected": 0,
+            "llm_reviews": 0, "llm_rejected": 0,
+            "full_rewrites": 0, "patch_rewrites": 0, "tokens_saved": 0,
+        }
+
+    def record_review(self, tier: str, approved: bool, first_pass: bool) -> None:
+        self._counts["reviews"] += 1
+        self._counts["chapters"] += int(first_pass)
+        if tier == "heuristic":
+            self._counts["auto_approved"] += 1
+        elif tier == "canon":
+            self._counts["canon_rejected"] += 1
+        else:
+            self._counts["llm_reviews"] += 1
+            self._counts["llm_rejected"] += int(not approved)
+
+    def record_full_rewrite(self) -> None:
+        self._counts["full_rewrites"] += 1
+
+    def record_patch(self, tokens_saved: int) -> None:
+        self._counts["patch_rewrites"] += 1
+        self._counts["tokens_saved"] += tokens_saved
+
+    def stats(self) -> dict:
+        c = self._counts
+        rewrites = c["full_rewrites"] + c["patch_rewrites"]
+        return {
+            **c,
+            "rewrite_rate": round(rewrites / c["chapters"], 3) if c["chapters"] else 0.0,
+            "llm_review_rate": round(c["llm_reviews"] / c["reviews"], 3) if c["reviews"] else 0.0,
+        }
+
+
+_stats = CritiqueStats()
+
+
+def get_critique_stats() -> CritiqueStats:
+    return _stats
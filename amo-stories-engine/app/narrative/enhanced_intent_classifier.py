@@ -21,6 +21,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 
 from app.models.pipeline import NarrativeState
 from app.models.story import Choice
+from app.narrative.llm_cache import cached
 from app.narrative.world_context import get_world_context
 from app.security.prompt_guard import sanitize_free_input
 
@@ -207,7 +208,7 @@ async def run_enhanced_intent_classifier(state: NarrativeState, llm: object) ->
     ]
 
     try:
-        response = await llm.ainvoke(messages)
+        response = await cached(llm, "intent_classifier").ainvoke(messages)
         content = _extract_json(response.content)
         result = json.loads(content)
     except Exception as exc:
@@ -0,0 +1,206 @@
+"""Persistent prompt → response cache for deterministic LLM stages.
+
+Some stages are effectively pure functions of their prompt: intent
+classification, soul-fragment / backstory parsing, ledger extraction and
+scene critic scoring. Retries and replays of a chapter used to re-bill
+them in full. A stage opts in at its call site:
+
+    response = await cached(llm, "intent_classifier").ainvoke(messages)
+
+Responses are keyed by model, temperature and a hash of the messages
+(the gateway's request key) and stored in a local SQLite file, with a
+TTL (``llm_cache_ttl_s``) and a size cap (``llm_cache_max_mb``, least
+recently used rows go first). Only responses that pass the stage's
+``validate`` check are stored, so a malformed answer is not replayed.
+
+Handles that are not gateway LLMs (test doubles) pass through unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key         TEXT PRIMARY KEY,
+    stage       TEXT NOT NULL,
+    model       TEXT NOT NULL,
+    content     TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    created_at  REAL NOT NULL,
+    last_hit    REAL NOT NULL,
+    hits        INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_last_hit ON llm_cache(last_hit);
+"""
+
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def json_payload_ok(content: str) -> bool:
+    """Default ``validate``: the response carries a parseable JSON object."""
+    match = _JSON_OBJECT.search(content or "")
+    if not match:
+        return False
+    try:
+        json.loads(match.group(0))
+    except ValueError:
+        return False
+    return True
+
+
+class ResponseCache:
+    """SQLite-backed response store with TTL, size cap and per-stage stats."""
+
+    # Size eviction runs every this many stores
+    EVICT_EVERY = 50
+
+    def __init__(self, db_path: str | Path, ttl_s: float, max_bytes: int) -> None:
+        self._db_path = Path(db_path)
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._stores_since_evict = 0
+        self._stats: dict[str, dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "stores": 0}
+        )
+
+    # ── Public ──
+
+    async def get(self, key: str, stage: str) -> Any | None:
+        """Cached content for ``key``, or None (counted per stage)."""
+        content = await asyncio.to_thread(self._get, key)
+        self._stats[stage]["hits" if content is not None else "misses"] += 1
+        return content
+
+    async def put(self, key: str, stage: str, model: str, content: Any) -> None:
+        self._stats[stage]["stores"] += 1
+        await asyncio.to_thread(self._put, key, stage, model, content)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        out: dict[str, dict[str, float]] = {}
+        for stage, s in self._stats.items():
+            lookups = s["hits"] + s["misses"]
+            out[stage] = {
+                **s,
+                "hit_rate": round(s["hits"] / lookups, 3) if lookups else 0.0,
+            }
+        return out
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── SQLite (worker threads) ──
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT content, created_at FROM llm_cache WHERE key = ?", (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl_s:
+                with conn:
+                    conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            with conn:
+                conn.execute(
+                    "UPDATE llm_cache SET last_hit = ?, hits = hits + 1 WHERE key = ?",
+                    (now, key),
+                )
+        return json.loads(row[0])
+
+    def _put(self, key: str, stage: str, model: str, content: Any) -> None:
+        payload = json.dumps(content, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    """INSERT OR REPLACE INTO llm_cache
+                           (key, stage, model, content, size, created_at, last_hit)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    (key, stage, model, payload, len(payload.encode()), now, now),
+                )
+            self._stores_since_evict += 1
+            if self._stores_since_evict >= self.EVICT_EVERY:
+                self._stores_since_evict = 0
+                self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        with conn:
+            expired = conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_s,),
+            ).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+            evicted = 0
+            if total > self.max_bytes:
+                # Walk rows least recently used first until back under the cap
+                excess = total - self.max_bytes
+                cutoff_keys: list[str] = []
+                for key, size in conn.execute(
+                    "SELECT key, size FROM llm_cache ORDER BY last_hit"
+                ):
+                    cutoff_keys.append(key)
+                    excess -= size
+                    if excess <= 0:
+                        break
+                conn.executemany(
+                    "DELETE FROM llm_cache WHERE key = ?", [(k,) for k in cutoff_keys],
+                )
+                evicted = len(cutoff_keys)
+        if expired or evicted:
+            logger.info(f"ResponseCache: removed {expired} expired, {evicted} over size cap")
+
+
+def cached(llm: Any, stage: str, validate: Any = json_payload_ok) -> Any:
+    """``llm`` with response caching for ``stage`` (gateway LLMs only)."""
+    from app.narrative.llm_gateway import GatewayLLM
+
+    if not settings.llm_cache_enabled or not isinstance(llm, GatewayLLM):
+        return llm
+    return llm.with_cache(stage, validate)
+
+
+_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache (opens its file on first use)."""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache(
+            Path(settings.db_path).parent / "llm_cache.db",
+            ttl_s=settings.llm_cache_ttl_s,
+            max_bytes=settings.llm_cache_max_mb * 1024 * 1024,
+        )
+    return _cache
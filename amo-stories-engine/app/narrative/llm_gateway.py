@@ -0,0 +1,402 @@
+"""LLM Gateway — shared Gemini clients for every node and agent.
+
+Building a ``ChatGoogleGenerativeAI`` per call opens a fresh HTTP client
+(and TLS connection) each time, with nothing bounding how many requests a
+burst of players sends at once. ``get_llm(model, temperature)`` returns a
+handle on the process-wide gateway instead:
+
+- one client per (model, temperature), reused across calls;
+- a semaphore per model caps concurrent requests (``llm_max_concurrency``);
+- identical in-flight ``ainvoke`` calls share one request;
+- transient failures (429/5xx, timeouts, dropped connections) are retried
+  with jittered exponential backoff. The client's own retries are off so
+  the gateway is the only retry layer;
+- stages that opt in (``llm_cache.cached``) are answered from the
+  persistent response cache when the same request was made before;
+- every call is an ``llm`` span in the current trace (``tracing``), with
+  token usage, retries and cache / coalescing hits as attributes.
+
+Handles behave like the LangChain chat model (``ainvoke`` / ``astream`` /
+``invoke``), so agents that take an ``llm`` argument need no change:
+
+    llm = get_llm(settings.planner_model, 0.7)
+    result = await run_planner(state, llm)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import sqlite3
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.messages import AIMessage
+
+from app.config import settings
+from app.narrative.llm_cache import ResponseCache, get_response_cache
+from app.narrative.tracing import Span, end_span, record_usage, span, start_span
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth another attempt: timeout, rate limit, server side
+TRANSIENT_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+# A broken cache file or unserializable content only costs the cache
+_CACHE_ERRORS = (sqlite3.Error, OSError, TypeError, ValueError)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Whether ``exc`` (or an exception it was raised from) is worth retrying."""
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, (TimeoutError, ConnectionError)):
+            return True
+        for attr in ("code", "status_code"):
+            status = getattr(current, attr, None)
+            if isinstance(status, int) and status in TRANSIENT_STATUS:
+                return True
+        if type(current).__module__.startswith("httpx") and type(current).__name__ in {
+            "ConnectError", "ReadError", "WriteError", "RemoteProtocolError",
+            "ReadTimeout", "WriteTimeout", "ConnectTimeout", "PoolTimeout",
+        }:
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def _make_client(model: str, temperature: float) -> Any:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(
+        model=model,
+        temperature=temperature,
+        google_api_key=settings.google_api_key,
+        max_retries=1,  # one attempt per call; LLMGateway retries
+    )
+
+
+def _message_key(messages: Any) -> Any:
+    if isinstance(messages, str):
+        return messages
+    if isinstance(messages, (list, tuple)):
+        return [
+            (getattr(m, "type", type(m).__name__), getattr(m, "content", m))
+            for m in messages
+        ]
+    return repr(messages)
+
+
+@dataclass
+class _Inflight:
+    task: asyncio.Task
+    waiters: int = 0
+
+
+# ──────────────────────────────────────────────
+# Gateway
+# ──────────────────────────────────────────────
+
+class LLMGateway:
+    """Pooled clients, per-model concurrency, coalescing and retries."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        max_retries: int = 3,
+        retry_base_s: float = 1.0,
+        retry_max_s: float = 20.0,
+        client_factory: Callable[[str, float], Any] = _make_client,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.retry_base_s = retry_base_s
+        self.retry_max_s = retry_max_s
+        self._client_factory = client_factory
+        self._clients: dict[tuple[str, float], Any] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._active: dict[str, int] = {}        # model → requests holding a slot
+        self._inflight: dict[str, _Inflight] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.response_cache: ResponseCache | None = None   # default: get_response_cache()
+        self._stats = {
+            "calls": 0, "coalesced": 0, "cache_hits": 0, "retries": 0,
+            "failures": 0, "clients": 0,
+        }
+
+    def llm(self, model: str, temperature: float) -> GatewayLLM:
+        return GatewayLLM(self, model, temperature)
+
+    def client(self, model: str, temperature: float) -> Any:
+        """The pooled LangChain client for (model, temperature)."""
+        self._check_loop()
+        key = (model, round(float(temperature), 3))
+        client = self._clients.get(key)
+        if client is None:
+            client = self._clients[key] = self._client_factory(model, temperature)
+            self._stats["clients"] += 1
+        return client
+
+    def stats(self) -> dict:
+        return {
+            **self._stats,
+            "in_flight": len(self._inflight),
+            "active": dict(self._active),
+        }
+
+    # ── Calls ──
+
+    async def ainvoke(
+        self,
+        model: str,
+        temperature: float,
+        messages: Any,
+        *,
+        cache_stage: str = "",
+        validate: Callable[[str], bool] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """``client.ainvoke`` with coalescing, concurrency limit and retries.
+
+        With ``cache_stage`` the response cache is consulted first, and a
+        fresh response that passes ``validate`` is stored in it.
+        """
+        self._check_loop()
+        self._stats["calls"] += 1
+        with span(f"llm:{model}", kind="llm", stage=cache_stage or None) as s:
+            key = self._request_key(model, temperature, messages, kwargs)
+            if cache_stage:
+                content = await self._cache_get(key, cache_stage)
+                if content is not None:
+                    self._stats["cache_hits"] += 1
+                    s.set(cache_hit=True)
+                    return AIMessage(content=content)
+
+            response = await self._shared_request(key, model, temperature, messages, kwargs, s)
+            if cache_stage:
+                await self._cache_put(key, cache_stage, model, response, validate)
+            return response
+
+    async def _shared_request(
+        self, key: str, model: str, temperature: float, messages: Any, kwargs: dict, s: Span,
+    ) -> Any:
+        """Await the in-flight request for ``key``, starting it if there is none."""
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            task = asyncio.create_task(
+                self._invoke_with_retry(model, temperature, messages, kwargs, s),
+            )
+            inflight = self._inflight[key] = _Inflight(task)
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self._stats["coalesced"] += 1
+            s.set(coalesced=True)
+
+        inflight.waiters += 1
+        try:
+            response = await asyncio.shield(inflight.task)
+        except asyncio.CancelledError:
+            # The last caller gave up — stop paying for the request
+            if inflight.waiters == 1 and not inflight.task.done():
+                inflight.task.cancel()
+            raise
+        finally:
+            inflight.waiters -= 1
+        if not s.attrs.get("coalesced"):
+            record_usage(s, response)
+        return response
+
+    async def astream(
+        self, model: str, temperature: float, messages: Any, **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """``client.astream`` under the model's semaphore.
+
+        Retried only while nothing has been yielded yet; a stream that fails
+        midway raises, since its chunks are already with the caller.
+        """
+        self._stats["calls"] += 1
+        client = self.client(model, temperature)
+        # Not made current: a generator's context changes would leak to the caller
+        s = start_span(f"llm:{model}", kind="llm", stream=True)
+        attempt = 0
+        try:
+            while True:
+                started = False
+                try:
+                    async with self._slot(model):
+                        async for chunk in client.astream(messages, **kwargs):
+                            started = True
+                            record_usage(s, chunk)
+                            yield chunk
+                    return
+                except Exception as e:
+                    if started or not await self._backoff(model, attempt, e, s):
+                        s.set(error=type(e).__name__)
+                        raise
+                    attempt += 1
+        finally:
+            end_span(s)
+
+    def invoke(self, model: str, temperature: float, messages: Any, **kwargs: Any) -> Any:
+        """Synchronous call on the pooled client (no limits; not on the loop)."""
+        self._stats["calls"] += 1
+        return self.client(model, temperature).invoke(messages, **kwargs)
+
+    async def _invoke_with_retry(
+        self, model: str, temperature: float, messages: Any, kwargs: dict, s: Span,
+    ) -> Any:
+        client = self.client(model, temperature)
+        attempt = 0
+        while True:
+            try:
+                async with self._slot(model):
+                    return await client.ainvoke(messages, **kwargs)
+            except Exception as e:
+                if not await self._backoff(model, attempt, e, s):
+                    raise
+                attempt += 1
+
+    async def _backoff(self, model: str, attempt: int, exc: Exception, s: Span) -> bool:
+        """Sleep before retry ``attempt + 1``; False if the error is final."""
+        if attempt >= self.max_retries or not is_transient(exc):
+            self._stats["failures"] += 1
+            return False
+        self._stats["retries"] += 1
+        s.add("retries")
+        # Full jitter: spreads out retries from a burst that failed together
+        delay = random.uniform(0, min(self.retry_max_s, self.retry_base_s * 2 ** attempt))
+        logger.warning(
+            f"LLMGateway: {model} failed ({type(exc).__name__}: {exc}) — "
+            f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+        )
+        await asyncio.sleep(delay)
+        return True
+
+    # ── Response cache ──
+
+    async def _cache_get(self, key: str, stage: str) -> Any | None:
+        try:
+            return await (self.response_cache or get_response_cache()).get(key, stage)
+        except _CACHE_ERRORS as e:
+            logger.warning(f"LLMGateway: response cache read failed ({stage}): {e}")
+            return None
+
+    async def _cache_put(
+        self, key: str, stage: str, model: str, response: Any,
+        validate: Callable[[str], bool] | None,
+    ) -> None:
+        content = getattr(response, "content", None)
+        if content is None:
+            return
+        text = content if isinstance(content, str) else json.dumps(content, ensure_ascii=False)
+        if validate is not None and not validate(text):
+            return
+        try:
+            await (self.response_cache or get_response_cache()).put(key, stage, model, content)
+        except _CACHE_ERRORS as e:
+            logger.warning(f"LLMGateway: response cache write failed ({stage}): {e}")
+
+    # ── Internals ──
+
+    @asynccontextmanager
+    async def _slot(self, model: str) -> AsyncIterator[None]:
+        """Hold one of the model's ``max_concurrency`` request slots."""
+        semaphore = self._semaphores.get(model)
+        if semaphore is None:
+            semaphore = self._semaphores[model] = asyncio.Semaphore(self.max_concurrency)
+        async with semaphore:
+            self._active[model] = self._active.get(model, 0) + 1
+            try:
+                yield
+            finally:
+                self._active[model] -= 1
+
+    def _check_loop(self) -> None:
+        """Drop loop-bound state (async clients, semaphores) on a new event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._loop is not loop:
+            self._loop = loop
+            self._clients.clear()
+            self._semaphores.clear()
+            self._active.clear()
+            self._inflight.clear()
+
+    @staticmethod
+    def _request_key(model: str, temperature: float, messages: Any, kwargs: dict) -> str:
+        payload = json.dumps(
+            [model, temperature, _message_key(messages), sorted(kwargs.items())],
+            ensure_ascii=False,
+            default=repr,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class GatewayLLM:
+    """Chat-model handle bound to one (model, temperature) on the gateway."""
+
+    def __init__(
+        self,
+        gateway: LLMGateway,
+        model: str,
+        temperature: float,
+        cache_stage: str = "",
+        validate: Callable[[str], bool] | None = None,
+    ) -> None:
+        self._gateway = gateway
+        self.model = model
+        self.temperature = temperature
+        self.cache_stage = cache_stage
+        self._validate = validate
+
+    def with_cache(
+        self, stage: str, validate: Callable[[str], bool] | None = None,
+    ) -> GatewayLLM:
+        """Same model, with ``ainvoke`` answered from the response cache."""
+        return GatewayLLM(self._gateway, self.model, self.temperature, stage, validate)
+
+    async def ainvoke(self, input: Any, **kwargs: Any) -> Any:
+        return await self._gateway.ainvoke(
+            self.model, self.temperature, input,
+            cache_stage=self.cache_stage, validate=self._validate, **kwargs,
+        )
+
+    def astream(self, input: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        return self._gateway.astream(self.model, self.temperature, input, **kwargs)
+
+    def invoke(self, input: Any, **kwargs: Any) -> Any:
+        return self._gateway.invoke(self.model, self.temperature, input, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything else (with_structured_output, bind, ...) goes to the client
+        return getattr(self._gateway.client(self.model, self.temperature), name)
+
+
+_gateway: LLMGateway | None = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Get the process-wide LLM gateway."""
+    global _gateway
+    if _gateway is None:
+        _gateway = LLMGateway(
+            max_concurrency=settings.llm_max_concurrency,
+            max_retries=settings.llm_max_retries,
+            retry_base_s=settings.llm_retry_base_s,
+            retry_max_s=settings.llm_retry_max_s,
+        )
+    return _gateway
+
+
+def get_llm(model: str = "", temperature: float = 0.7) -> GatewayLLM:
+    """Chat model for ``model`` (default: writer model) routed through the gateway."""
+    return get_llm_gateway().llm(model or settings.writer_model, temperature)
@@ -20,26 +20,35 @@ Flow:
                     ┌──────────┐   │
                     │  critic  │───┘ (rewrite loop, max 3)
                     └─────┬────┘
-                          ▼
-                    ┌───────────────┐
-                    │identity_update│
-                    └───────┬───────┘
-                            ▼
-                       ┌─────────┐
-                       │  output │
-                       └─────────┘
+                 approved │ (fan-out)
+              ┌───────────┴───────────┐
+              ▼                       ▼
+        ┌──────────┐             ┌─────────┐
+        │ identity │             │  output │
+        └─────┬────┘             └────┬────┘
+              ▼                       ▼
+      ┌───────────────┐          ┌─────────┐
+      │ weapon_update │          │  ledger │ → background persistence
+      └───────────────┘          └─────────┘
+
+weapon_update reads identity's ``identity_delta`` (archon affinity), so the
+two stay in sequence; output and ledger only need the approved prose. The
+ledger node hands chapter persistence to a background task, so the chapter
+completes as soon as identity → weapon_update is done.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, TypedDict
 
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langgraph.graph import END, StateGraph
 
 from app.config import settings
 from app.models.pipeline import NarrativeState
+from app.narrative.llm_gateway import get_llm
+from app.narrative.tracing import span, traced, traced_node
 
 logger = logging.getLogger(__name__)
 
@@ -114,18 +123,6 @@ class PipelineState(TypedDict, total=False):
     writer_adaptive_context: str
 
 
-# ──────────────────────────────────────────────
-# LLM Factory
-# ──────────────────────────────────────────────
-
-def _make_llm(model: str, temperature: float = 0.8) -> ChatGoogleGenerativeAI:
-    return ChatGoogleGenerativeAI(
-        model=model,
-        temperature=temperature,
-        google_api_key=settings.google_api_key,
-    )
-
-
 # ──────────────────────────────────────────────
 # Safe state helper
 # ──────────────────────────────────────────────
@@ -164,7 +161,7 @@ async def _node_input_parser(state: dict) -> dict:
         return {}
 
     # Try Enhanced Intent Classifier (temperature 0.25 — classification task)
-    llm_classify = _make_llm(settings.planner_model, 0.25)
+    llm_classify = get_llm(settings.planner_model, 0.25)
     result = await run_enhanced_intent_classifier(ns, llm_classify)
 
     if result:
@@ -176,7 +173,7 @@ async def _node_input_parser(state: dict) -> dict:
 
     # Fallback: basic input_parser
     logger.info("Enhanced classifier returned empty — falling back to input_parser")
-    llm_basic = _make_llm(settings.planner_model, 0.3)
+    llm_basic = get_llm(settings.planner_model, 0.3)
     basic_result = await run_input_parser(ns, llm_basic)
     # Ensure intent fields are present (with defaults) when using fallback
     basic_result.setdefault("action_category", "other")
@@ -190,7 +187,7 @@ async def _node_planner(state: dict) -> dict:
     """Generate chapter outline."""
     from app.narrative.planner import run_planner
     ns = _to_narrative_state(state)
-    llm = _make_llm(settings.planner_model, 0.7)
+    llm = get_llm(settings.planner_model, 0.7)
     return await run_planner(ns, llm)
 
 
@@ -202,7 +199,7 @@ async def _node_simulator(state: dict) -> dict:
     """
     from app.narrative.consequence_router import run_consequence_router
     ns = _to_narrative_state(state)
-    llm = _make_llm(settings.simulator_model, 0.5)  # Lower temp for logic-consistent chains
+    llm = get_llm(settings.simulator_model, 0.5)  # Lower temp for logic-consistent chains
     return await run_consequence_router(ns, llm)
 
 
@@ -217,7 +214,7 @@ async def _node_writer(state: dict) -> dict:
     """Generate prose and choices."""
     from app.narrative.writer import run_writer
     ns = _to_narrative_state(state)
-    llm = _make_llm(
+    llm = get_llm(
         settings.writer_model,
         settings.writer_temperature,
     )
@@ -233,7 +230,7 @@ async def _node_critic(state: dict) -> dict:
     """Score and approve/reject."""
     from app.narrative.critic import run_critic
     ns = _to_narrative_state(state)
-    llm = _make_llm(settings.critic_model, 0.3)
+    llm = get_llm(settings.critic_model, 0.3)
     return await run_critic(ns, llm)
 
 
@@ -241,7 +238,7 @@ async def _node_identity(state: dict) -> dict:
     """Calculate identity deltas with AI context-awareness."""
     from app.narrative.context_weight_agent import run_context_weight_agent
     ns = _to_narrative_state(state)
-    llm = _make_llm(settings.identity_model, 0.3)
+    llm = get_llm(settings.identity_model, 0.3)
     return await run_context_weight_agent(ns, llm)
 
 
@@ -281,27 +278,69 @@ async def _node_weapon_update(state: dict) -> dict:
     return {"weapon_update_output": result}
 
 
-async def _node_ledger(state: dict) -> dict:
-    """Post-generation: persist chapter across all three memory layers.
+# Background chapter persistence, at most one pending chain per story
+_ledger_tasks: dict[str, asyncio.Task] = {}
 
-    1. NeuralMemory store — semantic recall for future chapters (blocking, ~50ms)
-    2. Story Ledger extraction — LLM entity/fact extraction (fire-and-forget)
-    3. World State update — absorb simulator updates + Tower detection (blocking, fast)
 
-    All operations are best-effort: failures are logged and never raise.
-    """
-    import asyncio
+async def _node_ledger(state: dict) -> dict:
+    """Post-generation: schedule ``_persist_chapter`` in the background.
 
+    Nothing in the chapter result depends on it. Chapters of one story are
+    persisted in order; the orchestrator entry points and ``run_pipeline``
+    wait for the story's pending persistence before reading its memory
+    layers.
+    """
     story_id = state.get("story_id")
-    if not story_id:
+    if not story_id or not state.get("final_prose"):
         return {}
 
-    prose = state.get("final_prose", "")
+    previous = _ledger_tasks.get(story_id)
+    task = asyncio.create_task(
+        _persist_after(previous, dict(state)),
+        name=f"ledger_ch{state.get('chapter_number', 0)}",
+    )
+    _ledger_tasks[story_id] = task
+
+    def _forget(done: asyncio.Task) -> None:
+        if _ledger_tasks.get(story_id) is done:
+            del _ledger_tasks[story_id]
+
+    task.add_done_callback(_forget)
+    return {}
+
+
+async def _persist_after(previous: asyncio.Task | None, state: dict) -> None:
+    if previous is not None and not previous.done():
+        await asyncio.gather(previous, return_exceptions=True)
+    await _persist_chapter(state)
+
+
+async def wait_for_ledger(story_id: str | None = None) -> None:
+    """Wait for pending chapter persistence of ``story_id`` (or every story)."""
+    loop = asyncio.get_running_loop()
+    tasks = [
+        task for sid, task in list(_ledger_tasks.items())
+        if (story_id is None or sid == story_id) and task.get_loop() is loop
+    ]
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@traced("persist_chapter")
+async def _persist_chapter(state: dict) -> None:
+    """Persist an approved chapter across all three memory layers.
+
+    1. NeuralMemory store — semantic recall for future chapters (queued in the brain outbox)
+    2. Story Ledger extraction — LLM entity/fact extraction (fire-and-forget)
+    3. World State update — absorb simulator updates + Tower detection (fast, pure Python)
+
+    All operations are best-effort: failures are logged and never raise.
+    """
+    story_id = state["story_id"]
+    prose = state["final_prose"]
     chapter = state.get("chapter_number", 0)
-    if not prose:
-        return {}
 
-    # ── 1. NeuralMemory store (blocking, fast ~50ms) ──
+    # ── 1. NeuralMemory store (queued in the brain outbox) ──
     try:
         from app.memory.story_brain import get_or_create_brain
         brain = await get_or_create_brain(story_id)
@@ -339,7 +378,7 @@ async def _node_ledger(state: dict) -> dict:
     except Exception as e:
         logger.warning(f"Ledger: could not schedule extraction task ({e})")
 
-    # ── 3. World State update (blocking, fast — pure Python) ──
+    # ── 3. World State update (fast — pure Python) ──
     try:
         from app.memory.world_state_store import load_world_state, save_world_state
 
@@ -468,8 +507,6 @@ async def _node_ledger(state: dict) -> dict:
     except Exception as e:
         logger.warning(f"Ledger: WorldState update failed ({e}) — continuing")
 
-    return {}
-
 
 async def _run_ledger_extraction(story_id: str, prose: str, chapter: int) -> None:
     """Background task: extract named entities/facts from prose → Story Ledger.
@@ -482,7 +519,7 @@ async def _run_ledger_extraction(story_id: str, prose: str, chapter: int) -> Non
         from app.world.ledger_extractor import extract_from_chapter
 
         ledger = load_ledger(story_id)
-        llm = _make_llm(settings.planner_model, 0.1)
+        llm = get_llm(settings.planner_model, 0.1)
         new_entities, new_facts = await extract_from_chapter(prose, chapter, ledger, llm)
 
         added = sum(1 for e in new_entities if ledger.add_entity(e))
@@ -551,6 +588,13 @@ def _should_rewrite(state: dict) -> str:
     return "rewrite"
 
 
+def _route_after_critic(state: dict) -> str | list[str]:
+    """Back to the writer, or fan out to the post-approval branches."""
+    if _should_rewrite(state) == "rewrite":
+        return "writer"
+    return ["identity", "output"]
+
+
 # ──────────────────────────────────────────────
 # Build Graph
 # ──────────────────────────────────────────────
@@ -560,17 +604,17 @@ def build_pipeline() -> StateGraph:
 
     graph = StateGraph(PipelineState)  # TypedDict for proper state accumulation
 
-    # Add nodes
-    graph.add_node("input_parser", _node_input_parser)
-    graph.add_node("planner", _node_planner)
-    graph.add_node("simulator", _node_simulator)
-    graph.add_node("context", _node_context)
-    graph.add_node("writer", _node_writer)
-    graph.add_node("critic", _node_critic)
-    graph.add_node("identity", _node_identity)
-    graph.add_node("weapon_update", _node_weapon_update)
-    graph.add_node("output", _node_output)
-    graph.add_node("ledger", _node_ledger)
+    # Add nodes (each one a span in the chapter's trace)
+    graph.add_node("input_parser", traced_node("input_parser", _node_input_parser))
+    graph.add_node("planner", traced_node("planner", _node_planner))
+    graph.add_node("simulator", traced_node("simulator", _node_simulator))
+    graph.add_node("context", traced_node("context", _node_context))
+    graph.add_node("writer", traced_node("writer", _node_writer))
+    graph.add_node("critic", traced_node("critic", _node_critic))
+    graph.add_node("identity", traced_node("identity", _node_identity))
+    graph.add_node("weapon_update", traced_node("weapon_update", _node_weapon_update))
+    graph.add_node("output", traced_node("output", _node_output))
+    graph.add_node("ledger", traced_node("ledger", _node_ledger))
 
     # Linear flow
     graph.set_entry_point("input_parser")
@@ -580,19 +624,16 @@ def build_pipeline() -> StateGraph:
     graph.add_edge("context", "writer")
     graph.add_edge("writer", "critic")
 
-    # Critic → conditional
+    # Critic → rewrite, or fan out: identity → weapon_update ∥ output → ledger
     graph.add_conditional_edges(
         "critic",
-        _should_rewrite,
-        {
-            "rewrite": "writer",
-            "approved": "identity",
-        },
+        _route_after_critic,
+        ["writer", "identity", "output"],
     )
 
     graph.add_edge("identity", "weapon_update")
-    graph.add_edge("weapon_update", "output")
     graph.add_edge("output", "ledger")
+    graph.add_edge("weapon_update", END)
     graph.add_edge("ledger", END)
 
     return graph
@@ -627,10 +668,16 @@ async def run_pipeline(initial_state: dict) -> NarrativeState:
     """
     pipeline = get_compiled_pipeline()
 
+    # The previous chapter's memory writes must land before context reads them
+    if initial_state.get("story_id"):
+        await wait_for_ledger(initial_state["story_id"])
+
     logger.info(f"Pipeline: starting chapter {initial_state.get('chapter_number', '?')}")
 
     # Run the graph
-    result = await pipeline.ainvoke(initial_state)
+    with span("pipeline", chapter=initial_state.get("chapter_number")) as s:
+        result = await pipeline.ainvoke(initial_state)
+        s.set(rewrites=result.get("rewrite_count", 0))
 
     # Parse back to NarrativeState
     final = _to_narrative_state(result)
@@ -17,6 +17,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 if TYPE_CHECKING:
     from app.models.story import Scene
 
+from app.narrative.llm_cache import cached
 from app.narrative.world_context import get_world_context
 
 logger = logging.getLogger(__name__)
@@ -194,7 +195,7 @@ async def run_scene_critic_async(
         ]
 
         logger.info(f"SceneCritic[async]: reviewing scene {scene.scene_number}")
-        response = await llm.ainvoke(messages)
+        response = await cached(llm, "scene_critic").ainvoke(messages)
         content = response.content.strip()
 
         # Strip markdown fences
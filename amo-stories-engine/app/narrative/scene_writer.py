@@ -12,11 +12,13 @@ from pathlib import Path
 from dataclasses import dataclass
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 from app.config import settings
 from app.models.pipeline import Beat, PlannerOutput
 from app.models.story import Choice, Scene
+from app.narrative.llm_gateway import get_llm
+from app.narrative.streaming import generate_prose
+from app.narrative.tracing import traced
 from app.narrative.world_context import get_world_context
 
 logger = logging.getLogger(__name__)
@@ -220,15 +222,6 @@ def _format_weapon_context(combat_brief: dict | None, weapon_ctx: str = "") -> s
     return "\n".join(parts) if parts else "Không có weapon."
 
 
-def _make_llm(model: str = "", temperature: float = 0.85) -> ChatGoogleGenerativeAI:
-    """Create LLM for scene writing."""
-    return ChatGoogleGenerativeAI(
-        model=model or settings.writer_model,
-        temperature=temperature,
-        api_key=settings.google_api_key,
-    )
-
-
 _TAG_GUIDANCE = {
     "combat": (
         "COMBAT — Joe Abercrombie (hậu quả thật, không anh hùng hoá bạo lực) + "
@@ -950,12 +943,13 @@ def _validate_scene_choices(
     return choices
 
 
+@traced("scene_writer")
 async def run_scene_writer(input: SceneWriterInput) -> Scene:
     """Generate a single scene with prose and choices.
 
     Returns a Scene object ready to be saved to DB.
     """
-    llm = _make_llm()
+    llm = get_llm(settings.writer_model, 0.85)
     identity = _extract_player_context(input.player_state)
     skill_info = _extract_skill_info(input.unique_skill)
 
@@ -1063,8 +1057,7 @@ async def run_scene_writer(input: SceneWriterInput) -> Scene:
         f"(type={input.beat.scene_type})"
     )
 
-    response = await llm.ainvoke(messages)
-    raw_content = response.content
+    raw_content = await generate_prose(llm, messages)
     result = _parse_scene_json(raw_content)
 
     logger.info(
@@ -0,0 +1,239 @@
+"""Token streaming — forwards writer prose from the LLM to SSE routes.
+
+The writers ask the model for a JSON object and only parse it once the
+response is complete (choices, title, summary). While the response is
+still arriving, ``ProseDecoder`` decodes the ``"prose"`` string value
+incrementally so the text can be shown to the player right away.
+
+Routes opt in by wrapping the orchestrator call in a ``ProseStream``:
+
+    stream = ProseStream(lambda: orch.generate_chapter(...))
+    async for event in stream:
+        ...                       # ProseEvent — text delta or reset
+    result = stream.result
+
+Writers called outside a ``ProseStream`` keep using ``ainvoke``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_PROSE_KEY = re.compile(r'"prose"\s*:\s*"')
+_ESCAPES = {
+    '"': '"', "\\": "\\", "/": "/",
+    "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t",
+}
+
+_active_stream: ContextVar[ProseStream[Any] | None] = ContextVar(
+    "prose_stream", default=None,
+)
+
+
+# ──────────────────────────────────────────────
+# Incremental prose decoding
+# ──────────────────────────────────────────────
+
+class ProseDecoder:
+    """Decode the ``"prose"`` JSON string value from a partial response.
+
+    Feed raw model output chunk by chunk; ``feed`` returns the prose text
+    that became available. Unescaped newlines (a common LLM slip, see
+    ``_fix_json_newlines``) pass through as-is.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos = -1          # index into _buffer; -1 until "prose": " is seen
+        self.done = False
+
+    def feed(self, chunk: str) -> str:
+        if self.done:
+            return ""
+        self._buffer += chunk
+
+        if self._pos < 0:
+            match = _PROSE_KEY.search(self._buffer)
+            if not match:
+                return ""
+            self._pos = match.end()
+
+        out: list[str] = []
+        buf = self._buffer
+        i = self._pos
+        while i < len(buf):
+            char = buf[i]
+            if char == '"':
+                self.done = True
+                i += 1
+                break
+            if char != "\\":
+                out.append(char)
+                i += 1
+                continue
+            # Escape sequence — wait for the rest if it is split across chunks
+            if i + 1 >= len(buf):
+                break
+            code = buf[i + 1]
+            if code == "u":
+                if i + 6 > len(buf):
+                    break
+                try:
+                    out.append(chr(int(buf[i + 2:i + 6], 16)))
+                except ValueError:
+                    out.append(buf[i:i + 6])
+                i += 6
+                continue
+            out.append(_ESCAPES.get(code, code))
+            i += 2
+
+        self._pos = i
+        return "".join(out)
+
+
+# ──────────────────────────────────────────────
+# Stream plumbing
+# ──────────────────────────────────────────────
+
+@dataclass
+class ProseEvent:
+    """A change to the streamed prose.
+
+    ``text`` is appended at ``offset``. A ``reset`` event (empty text)
+    tells the client to drop everything from ``offset`` on — sent when the
+    critic rejects a draft and the writer starts over.
+    """
+
+    text: str
+    offset: int
+    reset: bool = False
+
+
+_DONE = object()
+
+
+class ProseStream(Generic[T]):
+    """Run ``work`` and yield the prose its writers stream, as it arrives.
+
+    Each writer call opens a segment. A new segment is joined to the
+    previous one with ``separator``; a replacing segment (critic rewrite)
+    discards the previous one. ``result`` holds the return value of
+    ``work`` once iteration ends; exceptions from ``work`` are re-raised
+    from the iterator.
+    """
+
+    def __init__(
+        self,
+        work: Callable[[], Awaitable[T]],
+        separator: str = "\n\n",
+    ) -> None:
+        self._work = work
+        self._separator = separator
+        self._queue: asyncio.Queue[ProseEvent | object] = asyncio.Queue()
+        self._segment_start = 0
+        self.text = ""
+        self.result: T | None = None
+
+    def begin_segment(self, replace: bool = False) -> None:
+        if replace:
+            self.text = self.text[:self._segment_start]
+            self._queue.put_nowait(ProseEvent("", self._segment_start, reset=True))
+            return
+        if self.text:
+            self.write(self._separator)
+        self._segment_start = len(self.text)
+
+    def write(self, text: str) -> None:
+        if not text:
+            return
+        self._queue.put_nowait(ProseEvent(text, len(self.text)))
+        self.text += text
+
+    async def _run(self) -> None:
+        _active_stream.set(self)
+        try:
+            self.result = await self._work()
+        finally:
+            self._queue.put_nowait(_DONE)
+
+    async def __aiter__(self) -> AsyncIterator[ProseEvent]:
+        task = asyncio.create_task(self._run())
+        try:
+            while (event := await self._queue.get()) is not _DONE:
+                yield event  # type: ignore[misc]
+            await task
+        finally:
+            if not task.done():
+                task.cancel()
+
+
+@contextmanager
+def prose_muted() -> Iterator[None]:
+    """Keep writer calls in this block out of the active stream.
+
+    For pipeline runs whose prose is not shown (e.g. scene mode runs the
+    full pipeline only for the planner's beats).
+    """
+    token = _active_stream.set(None)
+    try:
+        yield
+    finally:
+        _active_stream.reset(token)
+
+
+async def generate_prose(llm: Any, messages: list, replace: bool = False) -> str:
+    """Call a writer LLM and return its raw text output.
+
+    Inside a ``ProseStream`` the response is streamed and its prose is
+    forwarded as it decodes; otherwise this is a plain ``ainvoke``.
+    ``replace`` marks a rewrite of the previous segment.
+    """
+    stream = _active_stream.get()
+    if stream is None:
+        response = await llm.ainvoke(messages)
+        return response.content
+
+    stream.begin_segment(replace=replace)
+    decoder = ProseDecoder()
+    parts: list[str] = []
+    async for chunk in llm.astream(messages):
+        content = _chunk_text(chunk.content)
+        parts.append(content)
+        stream.write(decoder.feed(content))
+
+    raw = "".join(parts)
+    if not decoder.done:
+        logger.warning(f"ProseStream: prose field not closed in {len(raw)}-char response")
+    return raw
+
+
+def replace_prose(text: str) -> None:
+    """Swap the active stream's current segment for ``text`` (patched rewrite)."""
+    stream = _active_stream.get()
+    if stream is not None:
+        stream.begin_segment(replace=True)
+        stream.write(text)
+
+
+def _chunk_text(content: Any) -> str:
+    """Flatten a message chunk's content (str or list of parts) to text."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            part if isinstance(part, str) else part.get("text", "")
+            for part in content
+            if isinstance(part, (str, dict))
+        )
+    return ""
@@ -0,0 +1,394 @@
+"""Stage-level latency tracing for the narrative pipeline.
+
+Spans nest through a context variable, so every graph node, LLM call and
+orchestrator stage started while another span is open becomes its child:
+
+    with span("scene", kind="stage", scene=3) as s:
+        ...
+        s.set(chars=len(prose))
+
+    @traced("writer", kind="node")
+    async def _node_writer(state): ...
+
+A span opened with no parent is the root of a new trace. When the root
+ends, the whole trace is handed to ``TraceStore``, which writes it to a
+local SQLite file (``data/traces.db``) off the event loop; spans of
+background tasks that finish after their root are written on their own. Spans carry
+free-form attributes; the ones the stage report aggregates are
+``tokens_in``, ``tokens_out``, ``retries``, ``cache_hit``, ``rewrites``
+and ``error``.
+
+``TraceStore.stage_stats`` is what ``GET /debug/traces`` serves: count and
+p50/p95 latency per (kind, name) over a time window.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# ──────────────────────────────────────────────
+# Spans
+# ──────────────────────────────────────────────
+
+@dataclass
+class _Trace:
+    """Spans finished so far in one trace."""
+
+    spans: list[Span] = field(default_factory=list)
+    submitted: bool = False
+
+
+@dataclass
+class Span:
+    """One timed operation inside a trace."""
+
+    name: str
+    kind: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    started_at: float                     # wall clock, for the time window
+    attrs: dict[str, Any] = field(default_factory=dict)
+    duration_ms: float = 0.0
+    _t0: float = field(default_factory=time.perf_counter, repr=False)
+    _trace: _Trace = field(default_factory=_Trace, repr=False)
+
+    @property
+    def is_root(self) -> bool:
+        return self.parent_id is None
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    def add(self, key: str, amount: float = 1) -> None:
+        self.attrs[key] = self.attrs.get(key, 0) + amount
+
+
+_current: ContextVar[Span | None] = ContextVar("trace_span", default=None)
+
+
+def current_span() -> Span | None:
+    return _current.get()
+
+
+def start_span(name: str, kind: str = "stage", **attrs: Any) -> Span:
+    """Begin a span under the current one without making it current.
+
+    For work that outlives the caller's frame (e.g. async generators);
+    close it with ``end_span``.
+    """
+    parent = _current.get()
+    span_id = uuid.uuid4().hex[:16]
+    return Span(
+        name=name,
+        kind=kind,
+        trace_id=parent.trace_id if parent else span_id,
+        span_id=span_id,
+        parent_id=parent.span_id if parent else None,
+        started_at=time.time(),
+        attrs={k: v for k, v in attrs.items() if v is not None},
+        _trace=parent._trace if parent else _Trace(),
+    )
+
+
+def end_span(s: Span) -> None:
+    s.duration_ms = (time.perf_counter() - s._t0) * 1000
+    trace = s._trace
+    if trace.submitted:
+        # Outlived its root (e.g. a background critic task)
+        if settings.tracing_enabled:
+            get_trace_store().submit([s])
+        return
+    trace.spans.append(s)
+    if s.is_root:
+        trace.submitted = True
+        if settings.tracing_enabled:
+            get_trace_store().submit(trace.spans)
+
+
+@contextmanager
+def span(name: str, kind: str = "stage", **attrs: Any) -> Iterator[Span]:
+    """Time the block as a child of the current span (or a new trace)."""
+    s = start_span(name, kind, **attrs)
+    token = _current.set(s)
+    try:
+        yield s
+    except asyncio.CancelledError:
+        s.set(error="cancelled")
+        raise
+    except Exception as e:
+        s.set(error=type(e).__name__)
+        raise
+    finally:
+        _current.reset(token)
+        end_span(s)
+
+
+def traced(
+    name: str, kind: str = "stage",
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Decorator: run an async function inside ``span(name, kind)``."""
+
+    def decorate(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            with span(name, kind):
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def traced_node(
+    name: str, fn: Callable[[dict], Awaitable[dict]],
+) -> Callable[[dict], Awaitable[dict]]:
+    """Wrap a LangGraph node; spans in a rewrite pass carry its number."""
+
+    @functools.wraps(fn)
+    async def node(state: dict) -> dict:
+        with span(name, kind="node") as s:
+            update = await fn(state)
+            rewrite = (update or {}).get("rewrite_count", state.get("rewrite_count")) or 0
+            if rewrite:
+                s.set(rewrite=rewrite)
+            return update
+
+    return node
+
+
+def record_usage(s: Span, message: Any) -> None:
+    """Add a LangChain message's token usage to ``s``."""
+    usage = getattr(message, "usage_metadata", None) or {}
+    if usage:
+        s.add("tokens_in", usage.get("input_tokens", 0) or 0)
+        s.add("tokens_out", usage.get("output_tokens", 0) or 0)
+
+
+# ──────────────────────────────────────────────
+# Store
+# ──────────────────────────────────────────────
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trace_spans (
+    span_id      TEXT PRIMARY KEY,
+    trace_id     TEXT NOT NULL,
+    parent_id    TEXT,
+    name         TEXT NOT NULL,
+    kind         TEXT NOT NULL,
+    started_at   REAL NOT NULL,
+    duration_ms  REAL NOT NULL,
+    attrs_json   TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_trace_spans_started ON trace_spans(started_at);
+CREATE INDEX IF NOT EXISTS idx_trace_spans_trace ON trace_spans(trace_id);
+"""
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(-(-pct * len(sorted_values) // 100)))  # ceil
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class TraceStore:
+    """SQLite trace sink; spans are buffered and written in batches."""
+
+    # Old spans are pruned every this many batch writes
+    PRUNE_EVERY = 100
+
+    def __init__(self, db_path: str | Path, retention_s: float) -> None:
+        self._db_path = Path(db_path)
+        self.retention_s = retention_s
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._buffer: list[Span] = []
+        self._flush_task: asyncio.Task | None = None
+        self._writes = 0
+
+    def submit(self, spans: list[Span]) -> None:
+        """Queue a finished trace; written by a background flush."""
+        self._buffer.extend(spans)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write(self._take())
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self.flush(), name="trace_store_flush")
+
+    async def flush(self) -> None:
+        while self._buffer:
+            batch = self._take()
+            try:
+                await asyncio.to_thread(self._write, batch)
+            except sqlite3.Error as e:
+                logger.warning(f"TraceStore: dropped {len(batch)} spans ({e})")
+
+    async def stage_stats(self, window_s: float) -> list[dict]:
+        return await asyncio.to_thread(self._stage_stats, time.time() - window_s)
+
+    async def recent_traces(self, limit: int = 20) -> list[dict]:
+        return await asyncio.to_thread(self._recent_traces, limit)
+
+    async def get_trace(self, trace_id: str) -> list[dict]:
+        return await asyncio.to_thread(self._get_trace, trace_id)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── SQLite (worker threads) ──
+
+    def _take(self) -> list[Span]:
+        batch, self._buffer = self._buffer, []
+        return batch
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _write(self, batch: list[Span]) -> None:
+        rows = [
+            (
+                s.span_id, s.trace_id, s.parent_id, s.name, s.kind,
+                s.started_at, round(s.duration_ms, 3),
+                json.dumps(s.attrs, ensure_ascii=False, default=str),
+            )
+            for s in batch
+        ]
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO trace_spans VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows,
+                )
+                self._writes += 1
+                if self._writes % self.PRUNE_EVERY == 0:
+                    conn.execute(
+                        "DELETE FROM trace_spans WHERE started_at < ?",
+                        (time.time() - self.retention_s,),
+                    )
+
+    def _stage_stats(self, since: float) -> list[dict]:
+        with self._lock:
+            rows = self._connection().execute(
+                """SELECT kind, name, duration_ms,
+                          json_extract(attrs_json, '$.tokens_in')  AS tokens_in,
+                          json_extract(attrs_json, '$.tokens_out') AS tokens_out,
+                          json_extract(attrs_json, '$.retries')    AS retries,
+                          json_extract(attrs_json, '$.cache_hit')  AS cache_hit,
+                          json_extract(attrs_json, '$.rewrites')   AS rewrites,
+                          json_extract(attrs_json, '$.error')      AS error
+                   FROM trace_spans WHERE started_at >= ?""",
+                (since,),
+            ).fetchall()
+
+        groups: dict[tuple[str, str], list[sqlite3.Row]] = {}
+        for row in rows:
+            groups.setdefault((row["kind"], row["name"]), []).append(row)
+
+        stats = []
+        for (kind, name), group in groups.items():
+            durations = sorted(r["duration_ms"] for r in group)
+            stats.append({
+                "kind": kind,
+                "name": name,
+                "count": len(group),
+                "p50_ms": round(_percentile(durations, 50), 1),
+                "p95_ms": round(_percentile(durations, 95), 1),
+                "max_ms": round(durations[-1], 1),
+                "total_ms": round(sum(durations), 1),
+                "tokens_in": int(sum(r["tokens_in"] or 0 for r in group)),
+                "tokens_out": int(sum(r["tokens_out"] or 0 for r in group)),
+                "retries": int(sum(r["retries"] or 0 for r in group)),
+                "cache_hits": sum(1 for r in group if r["cache_hit"]),
+                "rewrites": int(sum(r["rewrites"] or 0 for r in group)),
+                "errors": sum(1 for r in group if r["error"]),
+            })
+        # Where the time goes: biggest total first
+        stats.sort(key=lambda s: s["total_ms"], reverse=True)
+        return stats
+
+    def _recent_traces(self, limit: int) -> list[dict]:
+        with self._lock:
+            rows = self._connection().execute(
+                """SELECT trace_id, name, started_at, duration_ms, attrs_json
+                   FROM trace_spans WHERE parent_id IS NULL
+                   ORDER BY started_at DESC LIMIT ?""",
+                (limit,),
+            ).fetchall()
+        return [
+            {
+                "trace_id": r["trace_id"],
+                "name": r["name"],
+                "started_at": r["started_at"],
+                "duration_ms": r["duration_ms"],
+                "attrs": json.loads(r["attrs_json"]),
+            }
+            for r in rows
+        ]
+
+    def _get_trace(self, trace_id: str) -> list[dict]:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT * FROM trace_spans WHERE trace_id = ? ORDER BY started_at",
+                (trace_id,),
+            ).fetchall()
+        return [
+            {
+                "span_id": r["span_id"],
+                "parent_id": r["parent_id"],
+                "name": r["name"],
+                "kind": r["kind"],
+                "started_at": r["started_at"],
+                "duration_ms": r["duration_ms"],
+                "attrs": json.loads(r["attrs_json"]),
+            }
+            for r in rows
+        ]
+
+
+_store: TraceStore | None = None
+
+
+def get_trace_store() -> TraceStore:
+    """Get the process-wide trace store (opens its file on first write)."""
+    global _store
+    if _store is None:
+        _store = TraceStore(
+            Path(settings.db_path).parent / "traces.db",
+            retention_s=settings.trace_retention_hours * 3600,
+        )
+    return _store
@@ -10,6 +10,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 
 from app.models.pipeline import NarrativeState, WriterOutput
 from app.models.story import Choice
+from app.narrative.streaming import generate_prose, replace_prose
 from app.narrative.world_context import get_world_context
 
 logger = logging.getLogger(__name__)
@@ -87,7 +88,19 @@ def _build_tag_guidance(tags: list[str] | None) -> str:
 
 
 async def run_writer(state: NarrativeState, llm: object) -> dict:
-    """Generate chapter prose and 3 choices."""
+    """Generate chapter prose and 3 choices.
+
+    A rejection that names paragraphs is fixed in place (patch rewrite);
+    otherwise the whole chapter is regenerated.
+    """
+    from app.narrative.critique import get_critique_stats, patch_targets, rewrite_paragraphs
+
+    targets = patch_targets(state.critic_output, state.writer_output)
+    if targets:
+        patched = await rewrite_paragraphs(state.writer_output, state.critic_output, targets, llm)
+        if patched is not None:
+            replace_prose(patched.prose)
+            return {"writer_output": patched, "rewrite_count": state.rewrite_count + 1}
 
     player = state.player_state
     planner = state.planner_output
@@ -340,8 +353,10 @@ async def run_writer(state: NarrativeState, llm: object) -> dict:
     ]
 
     logger.info(f"Writer: generating prose for chapter {state.chapter_number} (rewrite: {state.rewrite_count})")
-    response = await llm.ainvoke(messages)
-    raw_content = response.content
+    is_rewrite = bool(state.critic_output and not state.critic_output.approved)
+    if is_rewrite:
+        get_critique_stats().record_full_rewrite()
+    raw_content = await generate_prose(llm, messages, replace=is_rewrite)
     result = _parse_writer_json(raw_content, state.chapter_number)
 
     # Parse choices
@@ -372,7 +387,7 @@ async def run_writer(state: NarrativeState, llm: object) -> dict:
 
     return {
         "writer_output": writer_output,
-        "rewrite_count": state.rewrite_count + (1 if state.critic_output and not state.critic_output.approved else 0),
+        "rewrite_count": state.rewrite_count + (1 if is_rewrite else 0),
     }
 
 
@@ -0,0 +1,50 @@
+"""Debug routes — pipeline latency from the local trace store.
+
+Mounted outside production only (or with ``DEBUG_ENDPOINTS=true``).
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.memory.state_pool import get_state_pool
+from app.memory.story_brain import get_brain_pool
+from app.narrative.context import get_context_stats
+from app.narrative.critique import get_critique_stats
+from app.narrative.llm_cache import get_response_cache
+from app.narrative.llm_gateway import get_llm_gateway
+from app.narrative.tracing import get_trace_store
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+@router.get("/traces")
+async def trace_summary(
+    window_minutes: int = Query(60, ge=1, le=7 * 24 * 60),
+    recent: int = Query(20, ge=0, le=200),
+):
+    """Per-stage p50/p95 latency, tokens, retries, cache hits and rewrite rate."""
+    store = get_trace_store()
+    await store.flush()
+    return {
+        "window_minutes": window_minutes,
+        "stages": await store.stage_stats(window_minutes * 60),
+        "recent_traces": await store.recent_traces(recent) if recent else [],
+        "llm_gateway": get_llm_gateway().stats(),
+        "response_cache": get_response_cache().stats(),
+        "critique": get_critique_stats().stats(),
+        "brain_pool": get_brain_pool().stats(),
+        "context_providers": get_context_stats(),
+        "state_pool": get_state_pool().stats(),
+    }
+
+
+@router.get("/traces/{trace_id}")
+async def trace_detail(trace_id: str):
+    """Every span of one trace, in start order."""
+    store = get_trace_store()
+    await store.flush()
+    spans = await store.get_trace(trace_id)
+    if not spans:
+        raise HTTPException(status_code=404, detail="Trace not found")
+    return {"trace_id": trace_id, "spans": spans}
@@ -52,13 +52,9 @@ async def onboard_player(req: OnboardingRequest, current_user: str = Depends(get
 
     # Generate seed identity
     try:
-        from langchain_google_genai import ChatGoogleGenerativeAI
+        from app.narrative.llm_gateway import get_llm
 
-        llm = ChatGoogleGenerativeAI(
-            model=settings.onboarding_model,
-            temperature=0.8,
-            google_api_key=settings.google_api_key,
-        )
+        llm = get_llm(settings.onboarding_model, 0.8)
         seed, archetype, dna, skill = await create_seed_from_quiz(
             req.quiz_answers, llm, backstory=req.backstory,
         )
@@ -161,10 +161,10 @@ async def create_story(
     Used by Phase B interactive flow: create story → scene-first → scene-next.
     """
     assert_owns_user(user_id, current_user)
-    from app.main import get_db
+    from app.main import get_async_db
     from app.models.story import Story
 
-    db = get_db()
+    db = get_async_db()
     tags_list = [t.strip() for t in preference_tags.split(",") if t.strip()] if preference_tags else []
 
     story = Story(
@@ -174,7 +174,7 @@ async def create_story(
         tone=tone,
         protagonist_name=protagonist_name or "Nhân vật chính",
     )
-    db.create_story(story)
+    await db.create_story(story)
     logger.info(f"Story created: {story.id} for user {user_id}")
 
     return {
@@ -205,10 +205,10 @@ async def stream_scene_start(
     assert_owns_user(user_id, current_user)
 
     async def event_generator():
-        from app.main import get_db
+        from app.main import get_async_db
         from app.engine.orchestrator import StoryOrchestrator
 
-        db = get_db()
+        db = get_async_db()
 
         try:
             yield _sse("status", {"stage": "init", "message": "Đang khởi tạo câu chuyện..."})
@@ -226,7 +226,7 @@ async def stream_scene_start(
                 tone=tone,
                 protagonist_name=protagonist_name or "Nhân vật chính",
             )
-            db.create_story(story)
+            await db.create_story(story)
 
             yield _sse("status", {"stage": "planning", "message": "Đang lập dàn ý chương 1..."})
 
@@ -272,11 +272,7 @@ async def stream_scene_start(
             # Update story title from chapter
             if result.chapter.title:
                 story.title = result.chapter.title
-                db.conn.execute(
-                    "UPDATE stories SET title = ? WHERE id = ?",
-                    (story.title, story.id)
-                )
-                db.conn.commit()
+                await db.update_story(story.id, title=story.title)
 
             # Stream each scene with typewriter
             logger.info(f"Streaming {len(result.scenes)} scenes to client")
@@ -334,21 +330,21 @@ async def stream_scene_continue(
     Generates the next chapter scene-by-scene, streaming each
     scene as it completes.
     """
-    from app.main import get_db as _get_db
+    from app.main import get_async_db as _get_db
     _db = _get_db()
-    _story = _db.get_story(story_id)
+    _story = await _db.get_story(story_id)
     if not _story:
         raise HTTPException(status_code=404, detail="Story not found")
     assert_owns_story(_story.user_id, current_user)
 
     async def event_generator():
-        from app.main import get_db
+        from app.main import get_async_db
         from app.engine.orchestrator import StoryOrchestrator
 
-        db = get_db()
+        db = get_async_db()
 
         try:
-            story = db.get_story(story_id)
+            story = await db.get_story(story_id)
             if not story:
                 yield _sse("error", {"message": "Story not found"})
                 return
@@ -358,7 +354,7 @@ async def stream_scene_continue(
             chosen_choice = None
 
             if choice_id:
-                chapters = db.get_story_chapters(story_id)
+                chapters = await db.get_story_chapters(story_id)
                 if chapters:
                     last_chapter = chapters[-1]
                     for c in last_chapter.choices:
@@ -367,7 +363,7 @@ async def stream_scene_continue(
                             break
 
                     if not chosen_choice:
-                        scenes = db.get_chapter_scenes(last_chapter.id)
+                        scenes = await db.get_chapter_scenes(last_chapter.id)
                         if scenes:
                             for c in scenes[-1].choices:
                                 if c.id == choice_id:
@@ -485,21 +481,21 @@ async def stream_scene_first(
     """
     assert_owns_user(user_id, current_user)
     # Also verify story_id belongs to current_user (user_id check alone is not enough)
-    from app.main import get_db as _get_db
+    from app.main import get_async_db as _get_db
     _db = _get_db()
-    _story = _db.get_story(story_id)
+    _story = await _db.get_story(story_id)
     if not _story:
         raise HTTPException(status_code=404, detail="Story not found")
     assert_owns_story(_story.user_id, current_user)
 
     async def event_generator():
-        from app.main import get_db
+        from app.main import get_async_db
         from app.engine.orchestrator import StoryOrchestrator
 
-        db = get_db()
+        db = get_async_db()
 
         try:
-            story = db.get_story(story_id)
+            story = await db.get_story(story_id)
             if not story:
                 yield _sse("error", {"message": "Story not found"})
                 return
@@ -509,7 +505,7 @@ async def stream_scene_first(
             chosen_choice = None
 
             if choice_id:
-                chapters = db.get_story_chapters(story_id)
+                chapters = await db.get_story_chapters(story_id)
                 if chapters:
                     last_chapter = chapters[-1]
                     # Check chapter-level choices
@@ -519,7 +515,7 @@ async def stream_scene_first(
                             break
                     # Check scene-level choices
                     if not chosen_choice:
-                        scenes = db.get_chapter_scenes(last_chapter.id)
+                        scenes = await db.get_chapter_scenes(last_chapter.id)
                         if scenes:
                             for c in scenes[-1].choices:
                                 if c.id == choice_id:
@@ -664,18 +660,18 @@ async def stream_scene_next(
     which feeds into the SceneWriter prompt to ensure narrative
     continuity and skill usage consequences.
     """
-    from app.main import get_db as _get_db
+    from app.main import get_async_db as _get_db
     _db = _get_db()
-    _story = _db.get_story(story_id)
+    _story = await _db.get_story(story_id)
     if not _story:
         raise HTTPException(status_code=404, detail="Story not found")
     assert_owns_story(_story.user_id, current_user)
 
     async def event_generator():
-        from app.main import get_db
+        from app.main import get_async_db
         from app.engine.orchestrator import StoryOrchestrator
 
-        db = get_db()
+        db = get_async_db()
 
         try:
             # Resolve choice from previous scene
@@ -683,7 +679,7 @@ async def stream_scene_next(
             chosen_choice = None
 
             if choice_id:
-                scenes = db.get_chapter_scenes(chapter_id)
+                scenes = await db.get_chapter_scenes(chapter_id)
                 if scenes:
                     for s in scenes:
                         for c in s.choices:
@@ -695,7 +691,7 @@ async def stream_scene_next(
 
                 # Also check chapter-level choices
                 if not chosen_choice:
-                    chapter = db.get_chapter(chapter_id)
+                    chapter = await db.get_chapter(chapter_id)
                     if chapter:
                         for c in chapter.choices:
                             if c.id == choice_id:
@@ -781,37 +777,37 @@ async def stream_scene_next(
 @router.get("/{story_id}/scenes/{chapter_id}", response_model=SceneChapterResponse)
 async def get_chapter_scenes(story_id: str, chapter_id: str, current_user: str = Depends(get_guest_or_user)):
     """Get all scenes for a specific chapter."""
-    from app.main import get_db
+    from app.main import get_async_db
 
-    db = get_db()
-    story = db.get_story(story_id)
+    db = get_async_db()
+    story = await db.get_story(story_id)
     if not story:
         raise HTTPException(status_code=404, detail="Story not found")
     assert_owns_story(story.user_id, current_user)
 
-    chapter = db.get_chapter(chapter_id)
+    chapter = await db.get_chapter(chapter_id)
     if not chapter or chapter.story_id != story_id:
         raise HTTPException(status_code=404, detail="Chapter not found")
 
-    scenes = db.get_chapter_scenes(chapter_id)
+    scenes = await db.get_chapter_scenes(chapter_id)
     return _build_scene_chapter_response(chapter, scenes)
 
 
 @router.get("/{story_id}/all-scenes")
 async def get_all_story_scenes(story_id: str, current_user: str = Depends(get_guest_or_user)):
     """Get all chapters with their scenes for a story."""
-    from app.main import get_db
+    from app.main import get_async_db
 
-    db = get_db()
-    story = db.get_story(story_id)
+    db = get_async_db()
+    story = await db.get_story(story_id)
     if not story:
         raise HTTPException(status_code=404, detail="Story not found")
     assert_owns_story(story.user_id, current_user)
 
-    chapters = db.get_story_chapters(story_id)
+    chapters = await db.get_story_chapters(story_id)
     result = []
     for chapter in chapters:
-        scenes = db.get_chapter_scenes(chapter.id)
+        scenes = await db.get_chapter_scenes(chapter.id)
         result.append(_build_scene_chapter_response(chapter, scenes))
 
     return {"story_id": story_id, "chapters": result}
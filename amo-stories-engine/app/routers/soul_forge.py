@@ -263,14 +263,11 @@ async def forge(req: SoulForgeForgeRequest, current_user: str = Depends(get_gues
 
     # Generate skill
     try:
-        from langchain_google_genai import ChatGoogleGenerativeAI
+        from app.narrative.llm_gateway import get_llm
 
-        llm = ChatGoogleGenerativeAI(
-            model=settings.onboarding_model,
-            temperature=0.9,  # Higher creativity for unique skills
-            google_api_key=settings.google_api_key,
-        )
-        existing_names = db.get_all_skill_names()
+        llm = get_llm(settings.onboarding_model, 0.9)  # Higher creativity for unique skills
+        from app.memory.skill_index import get_skill_index
+        existing_names = get_skill_index(db).names
         skill = await forge_skill(session, llm, existing_names=existing_names, db=db)
     except Exception as e:
         logger.warning(f"AI forge failed, using sync fallback: {e}")
@@ -63,14 +63,14 @@ async def start_story(req: StartRequest, current_user: str = Depends(get_guest_o
     Optionally accepts quiz_answers to onboard a new player simultaneously.
     """
     assert_owns_user(req.user_id, current_user)
-    from app.main import get_db
+    from app.main import get_async_db
     from app.engine.orchestrator import StoryOrchestrator
 
-    db = get_db()
+    db = get_async_db()
 
     # Optional: onboard player if quiz_answers provided
     if req.quiz_answers:
-        existing = db.get_player_by_user(req.user_id)
+        existing = await db.get_player_by_user(req.user_id)
         if not existing:
             from app.engine.onboarding import (
                 create_initial_player,
@@ -88,8 +88,8 @@ async def start_story(req: StartRequest, current_user: str = Depends(get_guest_o
                 dna=dna,
                 skill=skill,
             )
-            db.create_player(player)
-            db.log_identity_event(create_seed_event(player))
+            await db.create_player(player)
+            await db.log_identity_event(create_seed_event(player))
             logger.info(f"Auto-onboarded player {player.id} during story start")
 
     try:
@@ -115,13 +115,13 @@ async def start_story(req: StartRequest, current_user: str = Depends(get_guest_o
 @router.post("/continue", response_model=ContinueResponse)
 async def continue_story(req: ContinueRequest, current_user: str = Depends(get_guest_or_user)):
     """Choose an option (or free input) and generate the next chapter."""
-    from app.main import get_db
+    from app.main import get_async_db
     from app.engine.orchestrator import StoryOrchestrator
 
-    db = get_db()
+    db = get_async_db()
 
     # Validate story exists and caller owns it
-    story = db.get_story(req.story_id)
+    story = await db.get_story(req.story_id)
     if not story:
         raise HTTPException(status_code=404, detail="Story not found")
     assert_owns_story(story.user_id, current_user)
@@ -132,7 +132,7 @@ async def continue_story(req: ContinueRequest, current_user: str = Depends(get_g
 
     if req.choice_id:
         # Find the choice from the latest chapter
-        chapters = db.get_story_chapters(req.story_id)
+        chapters = await db.get_story_chapters(req.story_id)
         if chapters:
             last_chapter = chapters[-1]
             for c in last_chapter.choices:
@@ -173,15 +173,15 @@ async def continue_story(req: ContinueRequest, current_user: str = Depends(get_g
 @router.get("/{story_id}/state", response_model=StoryStateResponse)
 async def get_story_state(story_id: str, current_user: str = Depends(get_guest_or_user)):
     """Get story + all chapters."""
-    from app.main import get_db
+    from app.main import get_async_db
 
-    db = get_db()
-    story = db.get_story(story_id)
+    db = get_async_db()
+    story = await db.get_story(story_id)
     if not story:
         raise HTTPException(status_code=404, detail="Story not found")
     assert_owns_story(story.user_id, current_user)
 
-    chapters = db.get_story_chapters(story_id)
+    chapters = await db.get_story_chapters(story_id)
     return StoryStateResponse(
         story=story,
         chapters=[_chapter_to_response(c) for c in chapters],
@@ -192,23 +192,23 @@ async def get_story_state(story_id: str, current_user: str = Depends(get_guest_o
 async def list_user_stories(user_id: str, current_user: str = Depends(get_guest_or_user)):
     """List all active stories for a user."""
     assert_owns_user(user_id, current_user)
-    from app.main import get_db
+    from app.main import get_async_db
 
-    db = get_db()
-    stories = db.get_user_stories(user_id)
+    db = get_async_db()
+    stories = await db.get_user_stories(user_id)
     return {"stories": [s.model_dump() for s in stories]}
 
 
 @router.delete("/{story_id}")
 async def delete_story(story_id: str, current_user: str = Depends(get_guest_or_user)):
     """Delete a story and all its chapters."""
-    from app.main import get_db
+    from app.main import get_async_db
 
-    db = get_db()
-    story = db.get_story(story_id)
+    db = get_async_db()
+    story = await db.get_story(story_id)
     if not story:
         raise HTTPException(status_code=404, detail="Story not found")
     assert_owns_story(story.user_id, current_user)
 
-    db.delete_story(story_id)
+    await db.delete_story(story_id)
     return {"ok": True, "deleted": story_id}
@@ -2,7 +2,8 @@
 
 Streams pipeline progress via Server-Sent Events:
   - status:   Pipeline stage updates ("Planning...", "Writing...")
-  - prose:    Incremental prose chunks
+  - prose:    Prose tokens as the writer generates them
+  - prose_reset: Drop prose from an offset on (critic rejected the draft)
   - choices:  Final choices array
   - identity: Identity delta summary
   - metadata: Critic score, rewrite count
@@ -19,6 +20,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sse_starlette.sse import EventSourceResponse
 
 from app.config import settings
+from app.narrative.streaming import ProseStream
 from app.security import assert_owns_story, assert_owns_user, get_guest_or_user_sse
 
 logger = logging.getLogger(__name__)
@@ -43,10 +45,10 @@ async def stream_start_story(
     assert_owns_user(user_id, current_user)
 
     async def event_generator():
-        from app.main import get_db
+        from app.main import get_async_db
         from app.engine.orchestrator import StoryOrchestrator
 
-        db = get_db()
+        db = get_async_db()
 
         try:
             yield _sse("status", {"stage": "init", "message": "Đang khởi tạo câu chuyện..."})
@@ -58,21 +60,24 @@ async def stream_start_story(
 
             tags_list = [t.strip() for t in preference_tags.split(",") if t.strip()] if preference_tags else []
 
-            story, result = await orch.start_new_story(
-                user_id=user_id,
-                preference_tags=tags_list,
-                backstory=backstory,
-                protagonist_name=protagonist_name,
-                tone=tone,
+            stream = ProseStream(
+                lambda: orch.start_new_story(
+                    user_id=user_id,
+                    preference_tags=tags_list,
+                    backstory=backstory,
+                    protagonist_name=protagonist_name,
+                    tone=tone,
+                ),
+                separator=_SCENE_SEPARATOR,
             )
+            async for event in _stream_prose(stream):
+                yield event
+            story, result = stream.result
 
-            # Stream prose in chunks for typewriter effect
-            prose = result.chapter.prose
-            chunk_size = 50  # ~50 chars per chunk
-            for i in range(0, len(prose), chunk_size):
-                chunk = prose[i:i + chunk_size]
-                yield _sse("prose", {"text": chunk, "offset": i})
-                await asyncio.sleep(0.03)  # 30ms delay for smooth typing
+            # Critic and choice parsing ran after the draft streamed —
+            # make sure the client ends up with the saved prose
+            for event in _reconcile_prose(stream, result.chapter.prose):
+                yield event
 
             # Send choices
             yield _sse("choices", {
@@ -124,21 +129,21 @@ async def stream_continue_story(
     Streams pipeline progress as the next chapter is generated.
     """
     # Ownership check before streaming starts
-    from app.main import get_db as _get_db
+    from app.main import get_async_db as _get_db
     _db = _get_db()
-    _story = _db.get_story(story_id)
+    _story = await _db.get_story(story_id)
     if not _story:
         raise HTTPException(status_code=404, detail="Story not found")
     assert_owns_story(_story.user_id, current_user)
 
     async def event_generator():
-        from app.main import get_db
+        from app.main import get_async_db
         from app.engine.orchestrator import StoryOrchestrator
 
-        db = get_db()
+        db = get_async_db()
 
         try:
-            story = db.get_story(story_id)
+            story = await db.get_story(story_id)
             if not story:
                 yield _sse("error", {"message": "Story not found"})
                 return
@@ -148,7 +153,7 @@ async def stream_continue_story(
             chosen_choice = None
 
             if choice_id:
-                chapters = db.get_story_chapters(story_id)
+                chapters = await db.get_story_chapters(story_id)
                 if chapters:
                     for c in chapters[-1].choices:
                         if c.id == choice_id:
@@ -169,20 +174,20 @@ async def stream_continue_story(
             yield _sse("status", {"stage": "pipeline", "message": "Đang tạo chương mới..."})
 
             orch = StoryOrchestrator(db)
-            result = await orch.generate_chapter(
-                story_id=story_id,
-                user_id=story.user_id,
-                choice=chosen_choice,
-                free_input=free_input,
+            stream = ProseStream(
+                lambda: orch.generate_chapter(
+                    story_id=story_id,
+                    user_id=story.user_id,
+                    choice=chosen_choice,
+                    free_input=free_input,
+                ),
             )
+            async for event in _stream_prose(stream):
+                yield event
+            result = stream.result
 
-            # Stream prose in chunks
-            prose = result.chapter.prose
-            chunk_size = 50
-            for i in range(0, len(prose), chunk_size):
-                chunk = prose[i:i + chunk_size]
-                yield _sse("prose", {"text": chunk, "offset": i})
-                await asyncio.sleep(0.03)
+            for event in _reconcile_prose(stream, result.chapter.prose):
+                yield event
 
             # Send choices
             yield _sse("choices", {
@@ -228,6 +233,36 @@ async def stream_continue_story(
     return EventSourceResponse(event_generator())
 
 
+# Scene chapters join their scenes with this (see generate_scene_chapter)
+_SCENE_SEPARATOR = "\n\n---\n\n"
+
+
+async def _stream_prose(stream: ProseStream):
+    """Relay writer tokens from a ProseStream as prose / prose_reset events."""
+    async for event in stream:
+        if event.reset:
+            yield _sse("prose_reset", {"offset": event.offset})
+        else:
+            yield _sse("prose", {"text": event.text, "offset": event.offset})
+
+
+def _reconcile_prose(stream: ProseStream, prose: str):
+    """Replace the streamed text if it differs from the final prose.
+
+    Covers responses the incremental decoder could not follow (e.g. the
+    regex fallback parse) and writers that ran without streaming.
+    """
+    if stream.text == prose:
+        return
+    if stream.text:
+        logger.info(
+            f"Streamed prose differs from final ({len(stream.text)} vs "
+            f"{len(prose)} chars) — resending"
+        )
+        yield _sse("prose_reset", {"offset": 0})
+    yield _sse("prose", {"text": prose, "offset": 0})
+
+
 def _sse(event: str, data: dict) -> dict:
     """Format an SSE event."""
     return {
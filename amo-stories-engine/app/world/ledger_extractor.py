@@ -17,6 +17,7 @@ import logging
 import re
 
 from app.models.story_ledger import EstablishedFact, IntroducedEntity, StoryLedger
+from app.narrative.llm_cache import cached
 
 logger = logging.getLogger(__name__)
 
@@ -158,7 +159,7 @@ async def extract_from_chapter(
             HumanMessage(content=user_content),
         ]
 
-        response = await llm.ainvoke(messages)
+        response = await cached(llm, "ledger_extractor").ainvoke(messages)
         raw = response.content if hasattr(response, "content") else str(response)
 
         # Parse JSON
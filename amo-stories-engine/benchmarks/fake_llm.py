@@ -0,0 +1,119 @@
+"""Deterministic stand-in for ``ChatGoogleGenerativeAI``.
+
+``FakeChatModel`` answers from recorded fixture responses instead of the
+network. Each fixture stage has a ``marker`` — a phrase from that agent's
+system prompt — and one or more responses:
+
+    {"planner": {"marker": "Bạn là Planner Agent", "responses": [{...}]}}
+
+A call is matched to the first stage whose marker appears in its system
+message; when a stage has several responses, the prompt's hash picks one,
+so a replay gives the same answers regardless of how players interleave.
+Calls that match no stage get ``{}`` (agents take their fallback path) and
+are counted under ``unmatched``.
+
+The model is installed behind the real ``LLMGateway`` through its
+``client_factory``, so pooling, coalescing, caching and tracing all run as
+in production:
+
+    model = FakeChatModel.from_file(FIXTURES)
+    gateway = LLMGateway(client_factory=model.client)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from collections import Counter
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+FIXTURES = Path(__file__).parent / "fixtures" / "responses.json"
+
+# Rough prompt/response size in tokens, for the usage metadata
+_CHARS_PER_TOKEN = 4
+_STREAM_CHUNK_CHARS = 256
+
+
+class FakeChatModel:
+    """Replays fixture responses; one instance serves every (model, temperature)."""
+
+    def __init__(self, stages: dict[str, dict], latency_s: float = 0.0) -> None:
+        self.stages = {
+            name: (stage["marker"], [_as_text(r) for r in stage["responses"]])
+            for name, stage in stages.items()
+        }
+        self.latency_s = latency_s
+        self.calls: Counter[str] = Counter()
+
+    @classmethod
+    def from_file(cls, path: str | Path = FIXTURES, latency_s: float = 0.0) -> FakeChatModel:
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")), latency_s=latency_s)
+
+    def client(self, model: str, temperature: float) -> FakeChatModel:
+        """``LLMGateway`` client factory."""
+        return self
+
+    def respond(self, messages: Any) -> tuple[str, str]:
+        """(stage, response text) for ``messages``."""
+        system, prompt = _split(messages)
+        for name, (marker, responses) in self.stages.items():
+            if marker in system:
+                digest = hashlib.sha256(prompt.encode("utf-8")).digest()
+                return name, responses[int.from_bytes(digest[:8], "big") % len(responses)]
+        return "unmatched", "{}"
+
+    def invoke(self, messages: Any, **kwargs: Any) -> AIMessage:
+        stage, text = self.respond(messages)
+        self.calls[stage] += 1
+        return AIMessage(content=text, usage_metadata=_usage(messages, text))
+
+    async def ainvoke(self, messages: Any, **kwargs: Any) -> AIMessage:
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        return self.invoke(messages)
+
+    async def astream(self, messages: Any, **kwargs: Any) -> AsyncIterator[AIMessageChunk]:
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        stage, text = self.respond(messages)
+        self.calls[stage] += 1
+        for start in range(0, len(text), _STREAM_CHUNK_CHARS):
+            await asyncio.sleep(0)
+            yield AIMessageChunk(content=text[start:start + _STREAM_CHUNK_CHARS])
+        yield AIMessageChunk(content="", usage_metadata=_usage(messages, text))
+
+    def stats(self) -> dict[str, int]:
+        return dict(sorted(self.calls.items()))
+
+
+def _as_text(response: Any) -> str:
+    return response if isinstance(response, str) else json.dumps(response, ensure_ascii=False)
+
+
+def _split(messages: Any) -> tuple[str, str]:
+    """(system prompt, whole prompt) text of a LangChain input."""
+    if isinstance(messages, str):
+        return "", messages
+    system: list[str] = []
+    prompt: list[str] = []
+    for message in messages:
+        content = str(getattr(message, "content", message))
+        prompt.append(content)
+        if getattr(message, "type", "") == "system":
+            system.append(content)
+    return "\n".join(system), "\n".join(prompt)
+
+
+def _usage(messages: Any, text: str) -> dict[str, int]:
+    tokens_in = len(_split(messages)[1]) // _CHARS_PER_TOKEN
+    tokens_out = len(text) // _CHARS_PER_TOKEN
+    return {
+        "input_tokens": tokens_in,
+        "output_tokens": tokens_out,
+        "total_tokens": tokens_in + tokens_out,
+    }
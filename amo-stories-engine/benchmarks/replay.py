@@ -0,0 +1,420 @@
+"""Offline replay benchmark — the story engine end to end, no network.
+
+Drives ``StoryOrchestrator`` the way the scene routers do (plan a chapter,
+then generate its scenes one by one, picking a choice after each) for M
+synthetic players concurrently, with every LLM call answered by
+``FakeChatModel`` from recorded fixtures. Everything else is real: the
+LangGraph pipeline, context building, combat resolution, the story DB,
+StoryBrains and the brain outbox, ledger persistence and tracing.
+
+Reported per run:
+
+- per-stage wall time (count, p50/p95/max, total) from the pipeline
+  traces, plus token and retry counts for the ``llm`` spans;
+- event-loop blocking: how late a 5 ms heartbeat wakes up, summed, with
+  the worst single stall;
+- story DB operations by method (reads / writes through
+  ``AsyncStoryStateDB``);
+- memory growth (RSS, and the Python heap with ``--tracemalloc``).
+
+Run it in its own process — it points ``settings.db_path`` at a scratch
+directory before anything opens a database:
+
+    python -m benchmarks.replay --players 8 --chapters 2
+    python -m benchmarks.replay --json report.json
+    python -m benchmarks.replay --baseline report.json --tolerance 0.3
+
+With ``--baseline`` the exit status is 1 when a stage's p95, the loop
+blocking time, the DB op count or the memory growth regressed by more
+than ``--tolerance`` (plus a small absolute floor against timer noise).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from app.config import settings
+from app.memory.async_state import AsyncStoryStateDB
+from benchmarks.fake_llm import FIXTURES, FakeChatModel
+
+_PREFERENCE_TAGS = (["combat", "mystery"], ["cultivation"], ["politics", "romance"], ["horror"])
+
+# Absolute slack added to every relative threshold in ``compare``
+_FLOOR_MS = 5.0
+_FLOOR_BLOCKED_MS = 25.0
+_FLOOR_MB = 5.0
+
+
+@dataclass
+class ReplayConfig:
+    players: int = 4
+    chapters: int = 2
+    scenes: int = 0                 # scenes per chapter; 0 = every planned beat
+    llm_latency_ms: float = 0.0     # simulated per-call LLM latency
+    fixtures: Path = FIXTURES
+    tracemalloc: bool = False
+
+
+# ──────────────────────────────────────────────
+# Probes
+# ──────────────────────────────────────────────
+
+class CountingStoryStateDB(AsyncStoryStateDB):
+    """``AsyncStoryStateDB`` that counts operations by method name."""
+
+    def __init__(self, db_path: str | Path, readers: int = 4) -> None:
+        super().__init__(db_path, readers=readers)
+        self.reads: Counter[str] = Counter()
+        self.writes: Counter[str] = Counter()
+
+    async def read(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        self.reads[fn.__name__] += 1
+        return await super().read(fn, *args, **kwargs)
+
+    async def write(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        self.writes[fn.__name__] += 1
+        return await super().write(fn, *args, **kwargs)
+
+    def stats(self) -> dict:
+        return {
+            "reads": sum(self.reads.values()),
+            "writes": sum(self.writes.values()),
+            "ops": dict(sorted((self.reads + self.writes).items())),
+        }
+
+
+class LoopMonitor:
+    """Measures how long the event loop was unable to run a heartbeat."""
+
+    def __init__(self, interval_s: float = 0.005, stall_ms: float = 50.0) -> None:
+        self.interval_s = interval_s
+        self.stall_ms = stall_ms
+        self.blocked_s = 0.0
+        self.max_lag_s = 0.0
+        self.stalls = 0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="loop-monitor")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval_s)
+            lag = loop.time() - started - self.interval_s
+            if lag <= 0:
+                continue
+            self.blocked_s += lag
+            self.max_lag_s = max(self.max_lag_s, lag)
+            self.stalls += int(lag * 1000 >= self.stall_ms)
+
+    def stats(self) -> dict:
+        return {
+            "blocked_ms": round(self.blocked_s * 1000, 1),
+            "max_lag_ms": round(self.max_lag_s * 1000, 1),
+            "stalls": self.stalls,
+        }
+
+
+def _rss_mb() -> float | None:
+    """Current resident set size (Linux); None where /proc is unavailable."""
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+# ──────────────────────────────────────────────
+# Replay
+# ──────────────────────────────────────────────
+
+async def _onboard(db: AsyncStoryStateDB, index: int) -> tuple[str, str]:
+    """Create player ``index`` and their story; returns (user_id, story_id)."""
+    from app.engine.onboarding import _ARCHETYPE_SCORES as scores
+    from app.engine.onboarding import (
+        create_initial_player,
+        create_seed_event,
+        create_seed_from_quiz_sync,
+    )
+    from app.models.story import Story
+
+    user_id = f"bench-user-{index}"
+    answers = {
+        question: list(options)[(index + n) % len(options)]
+        for n, (question, options) in enumerate(scores.items())
+    }
+    seed, archetype, dna, skill = create_seed_from_quiz_sync(answers)
+    player = create_initial_player(
+        user_id=user_id, name=f"Lữ khách {index}", seed=seed,
+        archetype=archetype, dna=dna, skill=skill,
+    )
+    await db.create_player(player)
+    await db.log_identity_event(create_seed_event(player))
+
+    story = Story(
+        user_id=user_id,
+        preference_tags=_PREFERENCE_TAGS[index % len(_PREFERENCE_TAGS)],
+        protagonist_name=player.name,
+    )
+    await db.create_story(story)
+    return user_id, story.id
+
+
+async def _play(orch: Any, db: AsyncStoryStateDB, index: int, config: ReplayConfig) -> dict:
+    """One player: plan each chapter, then read it scene by scene."""
+    user_id, story_id = await _onboard(db, index)
+    choice = None
+    chapters = scenes = 0
+    for _ in range(config.chapters):
+        plan = await orch.generate_chapter_plan(story_id, user_id, choice)
+        chapters += 1
+        total = plan.total_scenes
+        if config.scenes:
+            total = min(total, config.scenes)
+        for number in range(1, total + 1):
+            result = await orch.generate_single_scene(story_id, plan.chapter.id, number, choice)
+            scenes += 1
+            options = result.scene.choices
+            choice = options[(index + number) % len(options)] if options else None
+    return {"chapters": chapters, "scenes": scenes}
+
+
+async def _drain(ignore: set[asyncio.Task]) -> None:
+    """Wait for background work started by the replay (critics, speculation)."""
+    from app.memory.brain_outbox import get_brain_outbox
+    from app.narrative.pipeline import wait_for_ledger
+
+    while True:
+        await wait_for_ledger()
+        pending = asyncio.all_tasks() - ignore - {asyncio.current_task()}
+        if not pending:
+            break
+        await asyncio.wait(pending)
+    outbox = get_brain_outbox()
+    while outbox.stats()["pending"]:
+        await asyncio.sleep(0.05)
+
+
+async def run_replay(config: ReplayConfig) -> dict:
+    """Run the replay in a scratch data directory and return the report."""
+    with tempfile.TemporaryDirectory(prefix="amo-replay-") as workdir:
+        settings.db_path = str(Path(workdir) / "stories.db")
+        settings.tracing_enabled = True
+        return await _run(config)
+
+
+async def _run(config: ReplayConfig) -> dict:
+    from app.engine.orchestrator import StoryOrchestrator
+    from app.memory.brain_outbox import get_brain_outbox
+    from app.memory.story_brain import get_brain_pool
+    from app.narrative import llm_gateway
+    from app.narrative.critique import get_critique_stats
+    from app.narrative.tracing import get_trace_store
+
+    model = FakeChatModel.from_file(config.fixtures, latency_s=config.llm_latency_ms / 1000)
+    gateway = llm_gateway._gateway = llm_gateway.LLMGateway(
+        max_concurrency=settings.llm_max_concurrency,
+        max_retries=settings.llm_max_retries,
+        retry_base_s=settings.llm_retry_base_s,
+        retry_max_s=settings.llm_retry_max_s,
+        client_factory=model.client,
+    )
+    db = CountingStoryStateDB(settings.db_file, readers=settings.db_reader_pool_size)
+    await db.connect()
+    outbox = get_brain_outbox()
+    await outbox.start()
+    monitor = LoopMonitor()
+    orch = StoryOrchestrator(db)
+
+    gc.collect()
+    if config.tracemalloc:
+        tracemalloc.start()
+    rss_start = _rss_mb()
+    background = asyncio.all_tasks()
+    monitor.start()
+    started = time.perf_counter()
+
+    played = await asyncio.gather(*(_play(orch, db, i, config) for i in range(config.players)))
+    await _drain(background | {monitor._task})
+    wall_s = time.perf_counter() - started
+    await monitor.stop()
+
+    gc.collect()
+    rss_end = _rss_mb()
+    memory: dict[str, float | None] = {
+        "rss_start_mb": _round(rss_start),
+        "rss_end_mb": _round(rss_end),
+        "rss_growth_mb": _round(rss_end - rss_start) if rss_start and rss_end else None,
+    }
+    if config.tracemalloc:
+        heap, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory.update(py_heap_mb=_round(heap / 2**20), py_heap_peak_mb=_round(peak / 2**20))
+
+    store = get_trace_store()
+    await store.flush()
+    stages = await store.stage_stats(window_s=wall_s + 60)
+
+    chapters = sum(p["chapters"] for p in played)
+    scenes = sum(p["scenes"] for p in played)
+    report = {
+        "config": {**asdict(config), "fixtures": str(config.fixtures)},
+        "wall_s": round(wall_s, 3),
+        "chapters": chapters,
+        "scenes": scenes,
+        "scenes_per_s": round(scenes / wall_s, 2) if wall_s else 0.0,
+        "stages": stages,
+        "event_loop": monitor.stats(),
+        "db": db.stats(),
+        "memory": memory,
+        "llm": {"calls": model.stats(), "gateway": gateway.stats()},
+        "brains": {"pool": get_brain_pool().stats(), "outbox": outbox.stats()},
+        "critique": get_critique_stats().stats(),
+    }
+
+    await outbox.close()
+    await get_brain_pool().close_all()
+    store.close()
+    await db.close()
+    return report
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 1)
+
+
+# ──────────────────────────────────────────────
+# Baseline comparison
+# ──────────────────────────────────────────────
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Regressions of ``report`` against ``baseline``, as readable lines."""
+    limit = 1 + tolerance
+    regressions: list[str] = []
+
+    def check(label: str, now: float | None, before: float | None, floor: float) -> None:
+        if now is None or before is None:
+            return
+        if now > before * limit + floor:
+            regressions.append(f"{label}: {before:g} → {now:g}")
+
+    current = {(s["kind"], s["name"]): s for s in report["stages"]}
+    for stage in baseline["stages"]:
+        now = current.get((stage["kind"], stage["name"]))
+        if now is not None:
+            check(f"{stage['name']} p95_ms", now["p95_ms"], stage["p95_ms"], _FLOOR_MS)
+    check(
+        "event loop blocked_ms",
+        report["event_loop"]["blocked_ms"], baseline["event_loop"]["blocked_ms"], _FLOOR_BLOCKED_MS,
+    )
+    for kind in ("reads", "writes"):
+        # Per scene, so runs of a different size still compare
+        check(
+            f"db {kind} per scene",
+            round(report["db"][kind] / max(report["scenes"], 1), 2),
+            round(baseline["db"][kind] / max(baseline["scenes"], 1), 2),
+            0.5,
+        )
+    check(
+        "rss_growth_mb",
+        report["memory"]["rss_growth_mb"], baseline["memory"]["rss_growth_mb"], _FLOOR_MB,
+    )
+    return regressions
+
+
+# ──────────────────────────────────────────────
+# CLI
+# ──────────────────────────────────────────────
+
+def format_report(report: dict) -> str:
+    config, loop, db, memory = (
+        report["config"], report["event_loop"], report["db"], report["memory"],
+    )
+    row = "{:<28}{:<7}{:>7}{:>10}{:>10}{:>10}{:>12}"
+    summary = (
+        f"{config['players']} players × {config['chapters']} chapters: {report['chapters']} "
+        f"chapters, {report['scenes']} scenes in {report['wall_s']}s "
+        f"({report['scenes_per_s']} scenes/s)\n"
+    )
+    lines = [summary, row.format("stage", "kind", "count", "p50 ms", "p95 ms", "max ms", "total ms")]
+    for s in report["stages"]:
+        lines.append(row.format(
+            s["name"][:27], s["kind"], s["count"],
+            *(f"{s[k]:.1f}" for k in ("p50_ms", "p95_ms", "max_ms", "total_ms")),
+        ))
+    heap = memory.get("py_heap_peak_mb")
+    lines.append(
+        f"\nevent loop: blocked {loop['blocked_ms']} ms, worst stall {loop['max_lag_ms']} ms, "
+        f"{loop['stalls']} stalls"
+    )
+    lines.append(f"story db:   {db['reads']} reads, {db['writes']} writes")
+    lines.append(
+        f"memory:     rss {memory['rss_start_mb']} → {memory['rss_end_mb']} MB"
+        + (f", python heap peak {heap} MB" if heap is not None else "")
+    )
+    lines.append(f"llm calls:  {report['llm']['calls']}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--players", type=int, default=ReplayConfig.players)
+    parser.add_argument("--chapters", type=int, default=ReplayConfig.chapters)
+    parser.add_argument("--scenes", type=int, default=ReplayConfig.scenes,
+                        help="scenes per chapter (default: every planned beat)")
+    parser.add_argument("--llm-latency-ms", type=float, default=ReplayConfig.llm_latency_ms)
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES)
+    parser.add_argument("--tracemalloc", action="store_true", help="also track the Python heap")
+    parser.add_argument("--json", type=Path, help="write the full report here")
+    parser.add_argument("--baseline", type=Path, help="report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+    config = ReplayConfig(
+        players=args.players,
+        chapters=args.chapters,
+        scenes=args.scenes,
+        llm_latency_ms=args.llm_latency_ms,
+        fixtures=args.fixtures,
+        tracemalloc=args.tracemalloc,
+    )
+    report = asyncio.run(run_replay(config))
+    print(format_report(report))
+    if args.json:
+        args.json.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressions vs baseline:", *regressions, sep="\n  ")
+            return 1
+        print("\nNo regressions vs baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
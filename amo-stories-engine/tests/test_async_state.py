@@ -0,0 +1,159 @@
+"""Tests for AsyncStoryStateDB (pooled readers + serialized writer)."""
+
+import asyncio
+import inspect
+import sqlite3
+import threading
+
+import pytest
+
+from app.memory.async_state import READ_METHODS, WRITE_METHODS, AsyncStoryStateDB
+from app.memory.state import StoryStateDB
+from app.models.story import Chapter, Choice, Scene, Story
+
+
+@pytest.fixture
+async def db(tmp_path):
+    db = AsyncStoryStateDB(tmp_path / "test.db", readers=3)
+    await db.connect()
+    yield db
+    await db.close()
+
+
+def test_every_public_method_is_dispatched():
+    public = {
+        name for name, member in inspect.getmembers(StoryStateDB, inspect.isfunction)
+        if not name.startswith("_") and name not in {"connect", "close"}
+    }
+    assert set(READ_METHODS) | set(WRITE_METHODS) == public
+    assert not set(READ_METHODS) & set(WRITE_METHODS)
+    for name in public:
+        assert inspect.iscoroutinefunction(getattr(AsyncStoryStateDB, name))
+
+
+async def test_round_trip(db):
+    story = Story(user_id="user1", title="Test Story")
+    await db.create_story(story)
+    chapter = await db.save_chapter(Chapter(story_id=story.id, number=1))
+    scene = Scene(
+        chapter_id=chapter.id,
+        scene_number=1,
+        prose="Devold mở mắt.",
+        choices=[Choice(id="c1", text="Đi", risk_level=2)],
+    )
+    await db.save_scene(scene)
+    await db.update_story(story.id, title="Renamed")
+
+    assert (await db.get_story(story.id)).title == "Renamed"
+    scenes = await db.get_chapter_scenes(chapter.id)
+    assert [s.prose for s in scenes] == ["Devold mở mắt."]
+    assert (await db.get_latest_scene(chapter.id)).choices[0].id == "c1"
+
+
+async def test_lazy_connect(tmp_path):
+    db = AsyncStoryStateDB(tmp_path / "lazy.db")
+    try:
+        assert await db.get_story("missing") is None
+    finally:
+        await db.close()
+
+
+async def test_readers_reject_writes(db):
+    def sneaky_write(conn_db):
+        conn_db.conn.execute("DELETE FROM stories")
+
+    with pytest.raises(sqlite3.OperationalError):
+        await db.read(sneaky_write)
+
+
+async def test_writes_are_serialized_in_order(db):
+    order = []
+
+    def record(conn_db, i):
+        order.append(i)
+        conn_db.conn.execute(
+            "INSERT INTO stories (id, user_id, title) VALUES (?, 'u', ?)", (f"s{i}", str(i)),
+        )
+        conn_db.conn.commit()
+
+    await asyncio.gather(*(db.write(record, i) for i in range(20)))
+
+    assert order == list(range(20))
+    assert len(await db.get_user_stories("u")) == 20
+
+
+async def test_failed_write_rolls_back_and_writer_survives(db):
+    def half_then_fail(conn_db):
+        conn_db.conn.execute("INSERT INTO stories (id, user_id) VALUES ('bad', 'u')")
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await db.write(half_then_fail)
+
+    assert await db.get_story("bad") is None
+    await db.create_story(Story(id="good", user_id="u"))
+    assert await db.get_story("good") is not None
+
+
+async def test_reads_do_not_wait_for_slow_write(db):
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_write(conn_db):
+        started.set()
+        release.wait(timeout=5)
+
+    write = asyncio.create_task(db.write(slow_write))
+    await asyncio.to_thread(started.wait, 5)
+
+    # Loop is free and the reader pool answers while the writer is busy
+    assert await db.get_story("nothing") is None
+    assert not write.done()
+
+    release.set()
+    await write
+
+
+async def test_close_flushes_queued_writes(tmp_path):
+    path = tmp_path / "flush.db"
+    db = AsyncStoryStateDB(path)
+    await db.connect()
+    pending = [
+        asyncio.create_task(db.create_story(Story(id=f"s{i}", user_id="u"))) for i in range(5)
+    ]
+    await asyncio.sleep(0)
+    await db.close()
+    await asyncio.gather(*pending)
+
+    sync_db = StoryStateDB(path)
+    sync_db.connect()
+    try:
+        assert len(sync_db.get_user_stories("u")) == 5
+    finally:
+        sync_db.close()
+
+
+async def test_cancelled_read_keeps_connection_until_query_ends(tmp_path):
+    db = AsyncStoryStateDB(tmp_path / "cancel.db", readers=1)
+    await db.connect()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_read(conn_db):
+        started.set()
+        release.wait(timeout=5)
+        return conn_db.get_story("x")
+
+    read = asyncio.create_task(db.read(slow_read))
+    await asyncio.to_thread(started.wait, 5)
+    read.cancel()
+    await asyncio.sleep(0)
+
+    # The only reader is still busy, so the next read has to wait for it
+    follow_up = asyncio.create_task(db.get_story("x"))
+    await asyncio.sleep(0.05)
+    assert not follow_up.done()
+
+    release.set()
+    assert await follow_up is None
+    await db.close()
@@ -0,0 +1,66 @@
+"""Smoke test for the offline replay benchmark (benchmarks/replay.py)."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from benchmarks.fake_llm import FakeChatModel
+from benchmarks.replay import compare
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_fake_model_is_deterministic_per_prompt():
+    model = FakeChatModel({
+        "writer": {"marker": "Writer Agent", "responses": [{"prose": "a"}, {"prose": "b"}]},
+    })
+    prompt = [SystemMessage(content="Bạn là Writer Agent"), HumanMessage(content="chương 3")]
+
+    first = model.invoke(prompt)
+    assert model.invoke(prompt).content == first.content
+    assert json.loads(first.content)["prose"] in {"a", "b"}
+    assert first.usage_metadata["output_tokens"] > 0
+    assert model.invoke([HumanMessage(content="?")]).content == "{}"
+    assert model.stats() == {"unmatched": 1, "writer": 2}
+
+
+def test_replay_runs_offline(tmp_path):
+    out = tmp_path / "report.json"
+    # Own process: the replay points settings.db_path at a scratch directory
+    subprocess.run(
+        [sys.executable, "-m", "benchmarks.replay",
+         "--players", "2", "--chapters", "2", "--scenes", "2", "--json", str(out)],
+        cwd=_ROOT, check=True, capture_output=True, timeout=300,
+    )
+    report = json.loads(out.read_text(encoding="utf-8"))
+
+    assert (report["chapters"], report["scenes"]) == (4, 8)
+    stages = {s["name"] for s in report["stages"]}
+    assert {"pipeline", "chapter_plan", "single_scene", "context", "persist_chapter"} <= stages
+    assert "unmatched" not in report["llm"]["calls"]
+    assert report["llm"]["calls"]["scene_writer"] >= 8
+    assert report["db"]["writes"] > 0 and report["db"]["ops"]["save_scene"] >= 8
+    assert report["event_loop"]["blocked_ms"] >= 0
+    assert compare(report, report, tolerance=0.0) == []
+
+
+def test_compare_flags_regressions():
+    def report(p95: float, blocked: float, writes: int) -> dict:
+        return {
+            "scenes": 10,
+            "stages": [{"kind": "node", "name": "context", "p95_ms": p95}],
+            "event_loop": {"blocked_ms": blocked},
+            "db": {"reads": 50, "writes": writes},
+            "memory": {"rss_growth_mb": 20.0},
+        }
+
+    baseline = report(p95=40.0, blocked=100.0, writes=30)
+    assert compare(report(45.0, 110.0, 30), baseline, tolerance=0.25) == []
+    assert compare(report(80.0, 400.0, 60), baseline, tolerance=0.25) == [
+        "context p95_ms: 40 → 80",
+        "event loop blocked_ms: 100 → 400",
+        "db writes per scene: 3 → 6",
+    ]
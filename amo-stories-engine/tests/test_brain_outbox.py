@@ -0,0 +1,247 @@
+"""Tests for the StoryBrain write-behind outbox."""
+
+import asyncio
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+import app.memory.story_brain as story_brain_module
+from app.memory.brain_outbox import BrainOutbox, OutboxEntry
+from app.memory.story_brain import StoryBrain
+
+
+class _FakeBrain:
+    """Records encoded entries; ``gate`` holds the worker until set."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.encoded: list[str] = []
+        self.batches: list[int] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fail = fail
+
+    async def encode_entries(self, entries):
+        await self.gate.wait()
+        self.batches.append(len(entries))
+        if self.fail:
+            return [False] * len(entries)
+        self.encoded.extend(entry.content for entry in entries)
+        return [True] * len(entries)
+
+
+@pytest.fixture
+def brains(monkeypatch):
+    brains: dict[str, _FakeBrain] = {}
+
+    async def fake_get(story_id, brain_id=""):
+        return brains.setdefault(brain_id or story_id, _FakeBrain())
+
+    monkeypatch.setattr(story_brain_module, "get_or_create_brain", fake_get)
+    return brains
+
+
+@pytest.fixture
+async def outbox(tmp_path):
+    outbox = BrainOutbox(tmp_path / "outbox.db", batch_size=8, max_attempts=2, retry_base_s=0.01)
+    await outbox.start()
+    yield outbox
+    await outbox.close()
+
+
+def _rows(path) -> int:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM brain_outbox").fetchone()[0]
+    finally:
+        conn.close()
+
+
+async def test_enqueued_entries_are_encoded_in_batches(outbox, brains, tmp_path):
+    brains["b1"] = _FakeBrain()
+    brains["b1"].gate.clear()
+    for i in range(5):
+        await outbox.enqueue("s1", "b1", f"scene:1.{i}", f"scene {i}")
+    brains["b1"].gate.set()
+
+    assert await outbox.wait_for("b1", timeout=2)
+    assert brains["b1"].encoded == [f"scene {i}" for i in range(5)]
+    assert len(brains["b1"].batches) <= 2  # first row alone at most, then the rest together
+    assert _rows(tmp_path / "outbox.db") == 0
+    assert outbox.stats()["encoded"] == 5
+
+
+async def test_restoring_pending_entry_coalesces(outbox, brains):
+    brains["b1"] = _FakeBrain()
+    brains["b1"].gate.clear()
+    await outbox.enqueue("s1", "b1", "scene:1.0", "blocker")
+    await asyncio.sleep(0.05)  # worker is now holding "blocker"
+    first = await outbox.enqueue("s1", "b1", "scene:1.1", "draft")
+    second = await outbox.enqueue("s1", "b1", "scene:1.1", "final")
+    brains["b1"].gate.set()
+
+    assert first == second
+    assert await outbox.wait_for("b1", timeout=2)
+    assert brains["b1"].encoded == ["blocker", "final"]
+    assert outbox.stats()["coalesced"] == 1
+
+
+async def test_entry_replaced_mid_encode_is_encoded_again(outbox, brains):
+    brains["b1"] = _FakeBrain()
+    brains["b1"].gate.clear()
+    await outbox.enqueue("s1", "b1", "chapter:1", "draft")
+    await asyncio.sleep(0.05)  # worker is encoding "draft"
+    await outbox.enqueue("s1", "b1", "chapter:1", "final")
+    brains["b1"].gate.set()
+
+    assert await outbox.wait_for("b1", timeout=2)
+    assert brains["b1"].encoded == ["draft", "final"]
+
+
+async def test_wait_for_only_waits_on_own_brain(outbox, brains):
+    brains["slow"] = _FakeBrain()
+    brains["slow"].gate.clear()
+    await outbox.enqueue("s1", "slow", "scene:1.1", "slow scene")
+    await outbox.enqueue("s2", "fast", "scene:1.1", "fast scene")
+
+    assert await outbox.wait_for("unrelated", timeout=0.01)
+    assert not await outbox.wait_for("slow", timeout=0.05)
+
+    brains["slow"].gate.set()
+    assert await outbox.wait_for("slow", timeout=2)
+    assert await outbox.wait_for("fast", timeout=2)
+
+
+async def test_pending_entries_survive_restart(tmp_path, brains):
+    path = tmp_path / "outbox.db"
+    brains["b1"] = _FakeBrain()
+    brains["b1"].gate.clear()
+    first = BrainOutbox(path)
+    await first.start()
+    await first.enqueue("s1", "b1", "scene:1.1", "kept")
+    await asyncio.sleep(0.05)
+    await first.close()  # worker cancelled mid-encode
+    assert brains["b1"].encoded == []
+    assert _rows(path) == 1
+
+    brains["b1"] = _FakeBrain()
+    second = BrainOutbox(path)
+    await second.start()
+    try:
+        assert await second.wait_for("b1", timeout=2)
+        assert brains["b1"].encoded == ["kept"]
+    finally:
+        await second.close()
+
+
+async def test_failing_entry_is_dropped_after_max_attempts(outbox, brains, tmp_path):
+    brains["b1"] = _FakeBrain(fail=True)
+    await outbox.enqueue("s1", "b1", "scene:1.1", "broken")
+
+    assert await outbox.wait_for("b1", timeout=2)
+    stats = outbox.stats()
+    assert (stats["retried"], stats["dropped"], stats["pending"]) == (1, 1, 0)
+    assert _rows(tmp_path / "outbox.db") == 0
+
+
+async def test_failed_entry_waits_for_backoff(tmp_path, brains):
+    outbox = BrainOutbox(tmp_path / "outbox.db", max_attempts=3, retry_base_s=0.3)
+    await outbox.start()
+    try:
+        brains["b1"] = _FakeBrain(fail=True)
+        await outbox.enqueue("s1", "b1", "scene:1.1", "flaky")
+        await asyncio.sleep(0.1)
+        assert brains["b1"].batches == [1]  # not retried straight away
+
+        brains["b1"].fail = False
+        assert await outbox.wait_for("b1", timeout=2)
+        assert brains["b1"].batches == [1, 1]
+        assert brains["b1"].encoded == ["flaky"]
+    finally:
+        await outbox.close()
+
+
+async def test_outbox_without_backoff_column_is_migrated(tmp_path, brains):
+    path = tmp_path / "outbox.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        """CREATE TABLE brain_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, brain_id TEXT NOT NULL,
+            story_id TEXT NOT NULL, dedupe_key TEXT NOT NULL, content TEXT NOT NULL,
+            metadata_json TEXT NOT NULL DEFAULT '{}', tags_json TEXT NOT NULL DEFAULT '[]',
+            version INTEGER NOT NULL DEFAULT 1, attempts INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT, UNIQUE (brain_id, dedupe_key))"""
+    )
+    conn.execute(
+        "INSERT INTO brain_outbox (brain_id, story_id, dedupe_key, content) "
+        "VALUES ('b1', 's1', 'scene:1.1', 'old')"
+    )
+    conn.commit()
+    conn.close()
+
+    outbox = BrainOutbox(path)
+    await outbox.start()
+    try:
+        assert await outbox.wait_for("b1", timeout=2)
+        assert brains["b1"].encoded == ["old"]
+    finally:
+        await outbox.close()
+
+
+async def test_story_brain_queues_when_outbox_runs(outbox, brains, monkeypatch):
+    monkeypatch.setattr(story_brain_module, "get_brain_outbox", lambda: outbox)
+    brain = StoryBrain("s1")
+    brain._evicted = True  # available without opening a real store
+    brains["s1"] = _FakeBrain()
+
+    await brain.store_scene(2, 3, "Devold bước vào tháp.", npcs=["Lyra"])
+    await brain.store_chapter_summary(3, "Tóm tắt")
+
+    assert await outbox.wait_for("s1", timeout=2)
+    assert brains["s1"].encoded[0].startswith("[Chương 3 - Scene 2]")
+    assert "Nhân vật: Lyra" in brains["s1"].encoded[0]
+    assert brains["s1"].encoded[1].startswith("[Tóm tắt Chương 3]")
+
+
+async def test_query_recalls_within_budget_when_outbox_lags(outbox, brains, monkeypatch):
+    monkeypatch.setattr(story_brain_module, "get_brain_outbox", lambda: outbox)
+    monkeypatch.setattr(story_brain_module.settings, "brain_outbox_wait_s", 10.0)
+    monkeypatch.setattr(story_brain_module.settings, "context_recall_timeout_s", 0.5)
+    brains["s1"] = _FakeBrain()
+    brains["s1"].gate.clear()  # the outbox never catches up
+    await outbox.enqueue("s1", "s1", "scene:1.1", "pending scene")
+
+    class _Retriever:
+        async def query(self, query, max_tokens):
+            return SimpleNamespace(
+                confidence=0.9, context="Devold gặp Lyra.", answer="", fibers_matched=[],
+            )
+
+    brain = StoryBrain("s1")
+    brain._retriever = _Retriever()
+
+    context = await asyncio.wait_for(brain.query_context("Devold gặp ai?"), timeout=0.5)
+
+    assert "Devold gặp Lyra." in context
+    assert brains["s1"].encoded == []
+    brains["s1"].gate.set()
+
+
+@pytest.mark.skipif(
+    not story_brain_module._NEURAL_MEMORY_AVAILABLE, reason="NeuralMemory not installed",
+)
+async def test_encode_entries_against_real_brain(tmp_path, monkeypatch):
+    monkeypatch.setattr(story_brain_module.settings, "db_path", str(tmp_path / "stories.db"))
+    brain = StoryBrain("real")
+    await brain.initialize()
+    try:
+        entries = [
+            OutboxEntry(1, "real", "real", "[Chương 1 - Scene 1]\nDevold gặp Lyra ở cổng thành.",
+                        {"chapter": 1}, {"scene_memory"}),
+            OutboxEntry(2, "real", "real", "[Tóm tắt Chương 1]\nDevold rời làng Mộc Hà.",
+                        {"chapter": 1}, {"chapter_summary"}),
+        ]
+        assert await brain.encode_entries(entries) == [True, True]
+        assert "Devold" in await brain.query_context("Devold gặp ai?")
+    finally:
+        await brain.close()
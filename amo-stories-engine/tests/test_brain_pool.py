@@ -0,0 +1,146 @@
+"""Tests for the bounded StoryBrain pool."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.memory.story_brain import BrainPool, StoryBrain
+
+
+class _FakeStorage:
+    def __init__(self, opened: list[str], brain_id: str) -> None:
+        self.closed = False
+        self._opened = opened
+        self._brain_id = brain_id
+
+    async def close(self) -> None:
+        await asyncio.sleep(0)
+        self.closed = True
+        self._opened.remove(self._brain_id)
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """(open brain ids, initialize calls); initialize opens a fake storage."""
+    opened: list[str] = []
+    inits: list[str] = []  # every initialize() call
+
+    async def fake_initialize(self):
+        if self._initialized:
+            return
+        inits.append(self.brain_id)
+        await asyncio.sleep(0.01)
+        self._storage = _FakeStorage(opened, self.brain_id)
+        opened.append(self.brain_id)
+
+        async def encode(**kwargs):
+            self.stored.append(kwargs["content"])
+
+        self.stored = getattr(self, "stored", [])
+        self._encoder = SimpleNamespace(encode=encode)
+        self._retriever = SimpleNamespace()
+        self._initialized = True
+
+    monkeypatch.setattr(StoryBrain, "initialize", fake_initialize)
+    return opened, inits
+
+
+async def test_hit_returns_same_brain_and_counts(opened):
+    pool = BrainPool(max_size=4, idle_ttl_s=60)
+    first = await pool.get("s1")
+    second = await pool.get("s1")
+
+    assert first is second
+    stats = pool.stats()
+    assert (stats["hits"], stats["misses"], stats["open"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+async def test_concurrent_gets_initialize_once(opened):
+    _, inits = opened
+    pool = BrainPool(max_size=4, idle_ttl_s=60)
+    brains = await asyncio.gather(*(pool.get("s1") for _ in range(10)))
+
+    assert all(brain is brains[0] for brain in brains)
+    assert inits == ["s1"]
+    assert pool.stats()["coalesced"] == 9
+
+
+async def test_lru_eviction_closes_least_recent(opened):
+    opened, _ = opened
+    pool = BrainPool(max_size=2, idle_ttl_s=60)
+    await pool.get("a")
+    await pool.get("b")
+    await pool.get("a")  # b is now least recent
+    await pool.get("c")
+
+    assert sorted(opened) == ["a", "c"]
+    assert list(pool.brains) == ["a", "c"]
+    assert pool.stats()["evicted_lru"] == 1
+
+
+async def test_busy_brain_is_not_evicted(opened):
+    opened, _ = opened
+    pool = BrainPool(max_size=1, idle_ttl_s=60)
+    a = await pool.get("a")
+    async with a._in_use():
+        await pool.get("b")
+        assert sorted(opened) == ["a", "b"]  # over budget rather than close a live brain
+    await pool.get("b")
+    assert opened == ["b"]
+
+
+async def test_idle_brains_are_closed(opened):
+    opened, _ = opened
+    pool = BrainPool(max_size=4, idle_ttl_s=60)
+    a = await pool.get("a")
+    a.last_used -= 120
+    await pool.get("b")
+
+    assert opened == ["b"]
+    assert pool.stats()["evicted_idle"] == 1
+
+
+async def test_brain_used_during_eviction_stays_open(opened):
+    opened, _ = opened
+    pool = BrainPool(max_size=4, idle_ttl_s=60)
+    a = await pool.get("a")
+    b = await pool.get("b")
+    a.last_used -= 120
+    b.last_used -= 120
+
+    evicting = asyncio.create_task(pool._evict(keep=""))
+    await asyncio.sleep(0)  # closing a
+    async with b._in_use():
+        await evicting
+        assert opened == ["b"]
+        assert not b._storage.closed
+    assert list(pool.brains) == ["b"]
+
+
+async def test_evicted_brain_reopens_on_use(opened):
+    opened, _ = opened
+    pool = BrainPool(max_size=1, idle_ttl_s=60)
+    a = await pool.get("a")
+    await pool.get("b")
+    assert opened == ["b"]
+    assert a.available
+
+    await a.store_scene(1, 1, "prose")
+
+    assert a.stored and "prose" in a.stored[0]
+    assert opened == ["a"]
+    assert await pool.get("a") is a
+    assert pool.stats()["reopened"] == 1
+
+
+async def test_close_all(opened):
+    opened, _ = opened
+    pool = BrainPool(max_size=4, idle_ttl_s=60)
+    await pool.get("a")
+    await pool.get("b")
+    await pool.close_all()
+
+    assert opened == []
+    assert pool.stats()["open"] == 0
@@ -0,0 +1,119 @@
+"""Tests for concurrent context providers in the context node."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import app.narrative.context as context_module
+from app.config import settings
+from app.models.pipeline import NarrativeState
+from app.narrative.context import _Provider, gather_provider_blocks, get_context_stats, run_context
+
+
+def _blocking(name: str, delay: float):
+    def build(state, story_id):
+        time.sleep(delay)
+        return [f"{name} block"]
+    return build
+
+
+def _async(name: str, delay: float):
+    async def build(state, story_id):
+        await asyncio.sleep(delay)
+        return [f"{name} block"]
+    return build
+
+
+@pytest.fixture
+def providers(monkeypatch):
+    monkeypatch.setattr(context_module, "_provider_stats", {})
+    monkeypatch.setattr(settings, "context_recall_timeout_s", 2.0)
+    monkeypatch.setattr(settings, "context_loader_timeout_s", 2.0)
+
+    def install(*entries):
+        monkeypatch.setattr(context_module, "_PROVIDERS", list(entries))
+
+    return install
+
+
+async def test_providers_run_concurrently_in_order(providers):
+    providers(
+        _Provider("memory", _async("memory", 0.2), True, "context_recall_timeout_s"),
+        _Provider("ledger", _blocking("ledger", 0.2), False, "context_loader_timeout_s"),
+        _Provider("world_state", _blocking("world", 0.2), False, "context_loader_timeout_s"),
+    )
+
+    start = time.perf_counter()
+    blocks = await gather_provider_blocks(NarrativeState(story_id="s1"), "s1")
+    elapsed = time.perf_counter() - start
+
+    assert blocks == ["memory block", "ledger block", "world block"]
+    assert elapsed < 0.5  # bounded by the slowest, not the 0.6s sum
+
+
+async def test_blocking_loaders_leave_loop_free(providers):
+    providers(_Provider("ledger", _blocking("ledger", 0.2), False, "context_loader_timeout_s"))
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    await gather_provider_blocks(NarrativeState(story_id="s1"), "s1")
+    task.cancel()
+    assert ticks >= 5
+
+
+async def test_timeout_and_error_drop_only_that_provider(providers, monkeypatch):
+    monkeypatch.setattr(settings, "context_loader_timeout_s", 0.05)
+
+    def broken(state, story_id):
+        raise RuntimeError("db locked")
+
+    providers(
+        _Provider("memory", _async("memory", 0), True, "context_recall_timeout_s"),
+        _Provider("ledger", _blocking("ledger", 0.3), False, "context_loader_timeout_s"),
+        _Provider("companions", broken, False, "context_loader_timeout_s"),
+    )
+
+    blocks = await gather_provider_blocks(NarrativeState(story_id="s1"), "s1")
+
+    assert blocks == ["memory block"]
+    stats = get_context_stats()
+    assert stats["ledger"]["timeouts"] == 1
+    assert stats["ledger"]["last_ms"] < 250
+    assert stats["companions"]["errors"] == 1
+    assert stats["memory"]["calls"] == 1
+
+
+async def test_run_context_uses_real_providers(monkeypatch):
+    monkeypatch.setattr(context_module, "_provider_stats", {})
+
+    async def no_brain(story_id):
+        return SimpleNamespace(available=False)
+
+    ledger = SimpleNamespace(
+        to_prompt_string=lambda max_chars: "## Ledger", entity_count=lambda: 1, fact_count=lambda: 0,
+    )
+    world = SimpleNamespace(to_prompt_string=lambda: "")
+    monkeypatch.setattr("app.memory.story_brain.get_or_create_brain", no_brain)
+    monkeypatch.setattr("app.memory.ledger_store.load_ledger", lambda story_id: ledger)
+    monkeypatch.setattr("app.memory.world_state_store.load_world_state", lambda story_id: world)
+    monkeypatch.setattr(
+        "app.narrative.villain_tracker.get_villain_context", lambda ws: "## Villain",
+    )
+    monkeypatch.setattr(
+        "app.narrative.companion_context.load_companion_context", lambda **kwargs: "## Companions",
+    )
+
+    result = await run_context(NarrativeState(story_id="s1", previous_summary="Earlier"))
+
+    context = result["context"]
+    assert context.index("## Ledger") < context.index("## Villain") < context.index("## Companions")
+    assert context.index("## Companions") < context.index("Earlier")
+    assert set(get_context_stats()) == {"memory", "ledger", "world_state", "companions"}
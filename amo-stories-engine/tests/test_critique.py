@@ -0,0 +1,162 @@
+"""Tests for the tiered critic: prescreen, auto-approve and patch rewrites."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import app.narrative.critique as critique_module
+from app.models.pipeline import CriticOutput, NarrativeState, WriterOutput
+from app.models.story import Choice
+from app.narrative.critic import run_critic
+from app.narrative.critique import (
+    CritiqueStats,
+    number_paragraphs,
+    patch_targets,
+    prescreen_chapter,
+    split_paragraphs,
+)
+from app.narrative.writer import run_writer
+
+_PARAGRAPHS = [
+    f"Đoạn {i}: gió lùa qua khe đá, mùi sắt gỉ và tro nguội bám trên áo bạn. " * 6
+    for i in range(1, 7)
+]
+
+
+class FakeLLM:
+    def __init__(self, *responses: str) -> None:
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        return SimpleNamespace(content=self.responses.pop(0))
+
+
+@pytest.fixture(autouse=True)
+def stats(monkeypatch):
+    fresh = CritiqueStats()
+    monkeypatch.setattr(critique_module, "_stats", fresh)
+    return fresh
+
+
+def _choices() -> list[Choice]:
+    return [
+        Choice(id=f"c{i}", text=f"Lựa chọn {i}", risk_level=i, consequence_hint=f"Hệ quả {i}")
+        for i in range(1, 4)
+    ]
+
+
+def _state(paragraphs=None, critic=None, rewrite_count=0) -> NarrativeState:
+    writer = WriterOutput(
+        chapter_title="Tro Tàn",
+        prose="\n\n".join(paragraphs or _PARAGRAPHS),
+        summary="Bạn rời hang.",
+        choices=_choices(),
+    )
+    return NarrativeState(
+        chapter_number=4, writer_output=writer, critic_output=critic, rewrite_count=rewrite_count,
+    )
+
+
+async def test_clean_draft_is_approved_without_llm(stats):
+    llm = FakeLLM()
+    result = await run_critic(_state(), llm)
+
+    assert result["critic_output"].approved
+    assert result["critic_output"].feedback == {"tier": "heuristic"}
+    assert llm.calls == 0
+    assert stats.stats()["auto_approved"] == 1
+
+
+async def test_critical_canon_violation_targets_its_paragraph(stats):
+    paragraphs = list(_PARAGRAPHS)
+    paragraphs[3] = "Aethis xuất hiện trước mặt bạn, ánh sáng chói lòa. " + paragraphs[3]
+    llm = FakeLLM()
+
+    output = (await run_critic(_state(paragraphs), llm))["critic_output"]
+
+    assert not output.approved
+    assert output.patch_paragraphs == [4]
+    assert llm.calls == 0
+    assert stats.stats()["canon_rejected"] == 1
+
+
+async def test_warnings_go_to_llm_critic_with_numbered_paragraphs(stats):
+    paragraphs = list(_PARAGRAPHS)
+    paragraphs[1] += " Bạn nhận được 50 XP."            # medium canon warning
+    reply = {"score": 6.0, "approved": False, "issues": ["lộ số liệu"],
+             "rewrite_instructions": "Bỏ XP", "patch_paragraphs": [2, "x", 99]}
+    llm = FakeLLM(json.dumps(reply))
+
+    output = (await run_critic(_state(paragraphs), llm))["critic_output"]
+
+    assert llm.calls == 1
+    assert not output.approved
+    assert output.patch_paragraphs == [2, 99]          # range is checked by patch_targets
+    assert stats.stats()["llm_rejected"] == 1
+
+
+async def test_patch_rewrite_replaces_only_named_paragraphs(stats):
+    critic = CriticOutput(score=6.0, approved=False, patch_paragraphs=[2, 5])
+    reply = {"paragraphs": [
+        {"index": 2, "text": "Đoạn hai mới."},
+        {"index": 5, "text": "Đoạn năm mới."},
+        {"index": 1, "text": "không được yêu cầu"},
+    ]}
+    llm = FakeLLM(json.dumps(reply, ensure_ascii=False))
+    state = _state(critic=critic)
+
+    result = await run_writer(state, llm)
+
+    patched = split_paragraphs(result["writer_output"].prose)
+    assert patched[1] == "Đoạn hai mới." and patched[4] == "Đoạn năm mới."
+    assert patched[0] == _PARAGRAPHS[0].strip()
+    assert result["writer_output"].choices == state.writer_output.choices
+    assert result["rewrite_count"] == 1
+    assert stats.stats()["patch_rewrites"] == 1
+    assert stats.stats()["tokens_saved"] > 0
+
+
+async def test_unusable_patch_falls_back_to_full_rewrite(stats):
+    critic = CriticOutput(score=5.0, approved=False, patch_paragraphs=[3])
+    full = {"chapter_title": "Mới", "prose": "Viết lại toàn bộ.", "summary": "", "choices": []}
+    llm = FakeLLM("Xin lỗi.", json.dumps(full, ensure_ascii=False))
+
+    result = await run_writer(_state(critic=critic), llm)
+
+    assert result["writer_output"].prose == "Viết lại toàn bộ."
+    assert llm.calls == 2
+    assert stats.stats()["full_rewrites"] == 1
+
+
+def test_patch_targets_need_a_small_valid_subset():
+    writer = _state().writer_output
+    reject = lambda paras: CriticOutput(approved=False, patch_paragraphs=paras)
+
+    assert patch_targets(reject([2, 99]), writer) == [2]
+    assert patch_targets(reject([1, 2, 3, 4]), writer) == []      # > half the chapter
+    assert patch_targets(reject([]), writer) == []
+    assert patch_targets(CriticOutput(approved=True, patch_paragraphs=[2]), writer) == []
+
+
+def test_prescreen_flags_structure_and_numbering():
+    writer = WriterOutput(prose="Ngắn.", choices=_choices()[:2])
+    screen = prescreen_chapter(writer)
+
+    assert not screen.clean and not screen.critical
+    assert len(screen.issues) == 2
+    assert number_paragraphs("a\n\n\nb") == "[¶1] a\n\n[¶2] b"
+
+
+def test_rewrite_rate(stats):
+    stats.record_review("heuristic", approved=True, first_pass=True)
+    stats.record_review("llm", approved=False, first_pass=True)
+    stats.record_patch(400)
+    stats.record_review("heuristic", approved=True, first_pass=False)
+
+    s = stats.stats()
+    assert s["chapters"] == 2
+    assert s["rewrite_rate"] == 0.5
+    assert s["tokens_saved"] == 400
@@ -0,0 +1,116 @@
+"""Tests for the persistent LLM response cache."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import app.narrative.llm_cache as llm_cache_module
+from app.narrative.llm_cache import ResponseCache, cached, json_payload_ok
+from app.narrative.llm_gateway import LLMGateway
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.reply = '{"score": 8}'
+
+    async def ainvoke(self, messages, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return SimpleNamespace(content=self.reply)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(tmp_path / "llm_cache.db", ttl_s=3600, max_bytes=1 << 20)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def gateway(cache):
+    client = _FakeClient()
+    gateway = LLMGateway(client_factory=lambda model, temperature: client)
+    gateway.response_cache = cache
+    gateway.fake = client
+    return gateway
+
+
+async def test_repeat_request_is_served_from_cache(gateway, cache):
+    llm = cached(gateway.llm("flash", 0.25), "intent_classifier")
+
+    first = await llm.ainvoke("classify this")
+    second = await llm.ainvoke("classify this")
+
+    assert first.content == second.content == '{"score": 8}'
+    assert gateway.fake.calls == 1
+    assert cache.stats()["intent_classifier"] == {
+        "hits": 1, "misses": 1, "stores": 1, "hit_rate": 0.5,
+    }
+
+
+async def test_key_covers_model_temperature_and_messages(gateway):
+    await cached(gateway.llm("flash", 0.25), "s").ainvoke("a")
+    await cached(gateway.llm("flash", 0.3), "s").ainvoke("a")
+    await cached(gateway.llm("pro", 0.25), "s").ainvoke("a")
+    await cached(gateway.llm("flash", 0.25), "s").ainvoke("b")
+
+    assert gateway.fake.calls == 4
+
+
+async def test_uncached_handles_and_invalid_replies_skip_the_cache(gateway, cache):
+    plain = gateway.llm("pro", 0.9)
+    await plain.ainvoke("forge")
+    await plain.ainvoke("forge")
+    assert gateway.fake.calls == 2
+
+    gateway.fake.reply = "Xin lỗi, tôi không thể trả lời."
+    llm = cached(gateway.llm("flash", 0.25), "critic")
+    await llm.ainvoke("score")
+    await llm.ainvoke("score")
+    assert gateway.fake.calls == 4
+    assert cache.stats()["critic"]["stores"] == 0
+
+
+async def test_entries_persist_and_expire(tmp_path, monkeypatch):
+    path = tmp_path / "llm_cache.db"
+    first = ResponseCache(path, ttl_s=60, max_bytes=1 << 20)
+    await first.put("k", "stage", "flash", {"a": 1})
+    first.close()
+
+    second = ResponseCache(path, ttl_s=60, max_bytes=1 << 20)
+    assert await second.get("k", "stage") == {"a": 1}
+
+    now = llm_cache_module.time.time()
+    monkeypatch.setattr(llm_cache_module.time, "time", lambda: now + 120)
+    assert await second.get("k", "stage") is None
+    second.close()
+
+
+async def test_size_cap_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(ResponseCache, "EVICT_EVERY", 1)
+    cache = ResponseCache(tmp_path / "llm_cache.db", ttl_s=3600, max_bytes=250)
+    clock = iter(range(1000, 2000))
+    monkeypatch.setattr(llm_cache_module.time, "time", lambda: next(clock))
+
+    await cache.put("old", "s", "m", "x" * 100)
+    await cache.put("used", "s", "m", "y" * 100)
+    assert await cache.get("old", "s")          # "old" is now the most recent
+    await cache.put("new", "s", "m", "z" * 100)  # over 250 bytes → drop LRU ("used")
+
+    assert await cache.get("used", "s") is None
+    assert await cache.get("old", "s") is not None
+    assert await cache.get("new", "s") is not None
+    cache.close()
+
+
+def test_non_gateway_llm_passes_through():
+    fake = SimpleNamespace(ainvoke=None)
+    assert cached(fake, "intent_classifier") is fake
+
+
+def test_json_payload_ok():
+    assert json_payload_ok('```json\n{"themes": ["truth"]}\n```')
+    assert not json_payload_ok("{broken")
+    assert not json_payload_ok("")
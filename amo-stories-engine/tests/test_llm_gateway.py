@@ -0,0 +1,155 @@
+"""Tests for the shared LLM gateway."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.narrative.llm_gateway import LLMGateway, is_transient
+
+
+class _ApiError(Exception):
+    def __init__(self, code: int) -> None:
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+class _FakeClient:
+    """Chat model stand-in: echoes the prompt, optionally failing first."""
+
+    def __init__(self, model: str, temperature: float, delay: float = 0.02) -> None:
+        self.model = model
+        self.temperature = temperature
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self.failures: list[Exception] = []
+
+    async def ainvoke(self, messages, **kwargs):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                raise self.failures.pop(0)
+            return SimpleNamespace(content=f"{self.model}:{messages}")
+        finally:
+            self.active -= 1
+
+    async def astream(self, messages, **kwargs):
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        for part in ("a", "b", "c"):
+            yield SimpleNamespace(content=part)
+
+
+@pytest.fixture
+def gateway():
+    clients: list[_FakeClient] = []
+
+    def factory(model, temperature):
+        client = _FakeClient(model, temperature)
+        clients.append(client)
+        return client
+
+    gateway = LLMGateway(max_concurrency=2, max_retries=2, retry_base_s=0, client_factory=factory)
+    gateway.created = clients
+    return gateway
+
+
+async def test_clients_are_pooled_per_model_and_temperature(gateway):
+    await gateway.llm("flash", 0.3).ainvoke("a")
+    await gateway.llm("flash", 0.3).ainvoke("b")
+    await gateway.llm("flash", 0.7).ainvoke("c")
+
+    assert [(c.model, c.temperature, c.calls) for c in gateway.created] == [
+        ("flash", 0.3, 2), ("flash", 0.7, 1),
+    ]
+
+
+async def test_concurrency_is_capped_per_model(gateway):
+    llm = gateway.llm("pro", 0.8)
+    other = gateway.llm("flash", 0.8)
+    await asyncio.gather(
+        *(llm.ainvoke(f"p{i}") for i in range(6)),
+        *(other.ainvoke(f"f{i}") for i in range(2)),
+    )
+
+    pro, flash = gateway.created
+    assert pro.calls == 6 and pro.peak == 2
+    assert flash.peak == 2  # its own slots, not waiting behind "pro"
+
+
+async def test_identical_in_flight_prompts_share_one_request(gateway):
+    llm = gateway.llm("flash", 0.25)
+    results = await asyncio.gather(*(llm.ainvoke("same prompt") for _ in range(5)))
+
+    assert gateway.created[0].calls == 1
+    assert all(r is results[0] for r in results)
+    assert gateway.stats()["coalesced"] == 4
+
+
+async def test_transient_errors_are_retried(gateway):
+    llm = gateway.llm("flash", 0.3)
+    client = gateway.client("flash", 0.3)
+    client.failures = [_ApiError(429), _ApiError(503)]
+
+    response = await llm.ainvoke("prompt")
+
+    assert response.content == "flash:prompt"
+    assert client.calls == 3
+    assert gateway.stats()["retries"] == 2
+
+
+async def test_permanent_errors_and_exhausted_retries_raise(gateway):
+    llm = gateway.llm("flash", 0.3)
+    client = gateway.client("flash", 0.3)
+
+    client.failures = [_ApiError(400)]
+    with pytest.raises(_ApiError):
+        await llm.ainvoke("bad request")
+    assert client.calls == 1
+
+    client.failures = [_ApiError(500)] * 3
+    with pytest.raises(_ApiError):
+        await llm.ainvoke("still down")
+    assert client.calls == 4  # 1 + max_retries
+
+
+async def test_cancelling_last_waiter_cancels_request(gateway):
+    llm = gateway.llm("flash", 0.3)
+    gateway.client("flash", 0.3).delay = 5
+    call = asyncio.create_task(llm.ainvoke("slow"))
+    await asyncio.sleep(0.01)
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    await asyncio.sleep(0)
+
+    assert gateway.stats()["in_flight"] == 0
+    assert gateway.stats()["active"] == {"flash": 0}
+
+
+async def test_stream_retries_only_before_first_chunk(gateway):
+    llm = gateway.llm("pro", 0.85)
+    gateway.client("pro", 0.85).failures = [ConnectionError("reset")]
+
+    chunks = [chunk.content async for chunk in llm.astream("prompt")]
+
+    assert chunks == ["a", "b", "c"]
+    assert gateway.stats()["retries"] == 1
+
+
+def test_is_transient_follows_cause_chain():
+    try:
+        try:
+            raise _ApiError(429)
+        except _ApiError as inner:
+            raise RuntimeError("wrapped") from inner
+    except RuntimeError as outer:
+        assert is_transient(outer)
+    assert is_transient(TimeoutError())
+    assert not is_transient(ValueError("bad json"))
@@ -0,0 +1,161 @@
+"""Tests for the narrative graph's post-approval fan-out.
+
+The pipeline is run with scripted nodes (no LLM) and compared against the
+previous strictly sequential wiring
+(identity → weapon_update → output → ledger).
+"""
+
+import asyncio
+import time
+
+import pytest
+from langgraph.graph import END, StateGraph
+
+import app.narrative.pipeline as pipeline_module
+from app.narrative.pipeline import (
+    PipelineState,
+    _to_narrative_state,
+    run_pipeline,
+    wait_for_ledger,
+)
+
+
+class _Script:
+    """Deterministic node stand-ins; ``verdicts`` drives the critic."""
+
+    def __init__(
+        self, verdicts: list[bool], identity_delay: float = 0.0, persist_delay: float = 0.02,
+    ) -> None:
+        self.verdicts = verdicts
+        self.identity_delay = identity_delay
+        self.persist_delay = persist_delay
+        self.events: list[str] = []
+        self.persisted: list[int] = []
+
+    async def input_parser(self, state):
+        return {"action_category": "social"}
+
+    async def planner(self, state):
+        return {"planner_output": {"beats": [], "chapter": state["chapter_number"]}}
+
+    async def simulator(self, state):
+        return {"simulator_output": {"world_state_updates": []}}
+
+    async def context(self, state):
+        self.events.append(f"context:{state['chapter_number']}")
+        return {"context": "ctx"}
+
+    async def writer(self, state):
+        critic = state.get("critic_output")
+        is_rewrite = bool(critic and not critic["approved"])
+        n = state.get("rewrite_count", 0) + (1 if is_rewrite else 0)
+        return {
+            "writer_output": {"prose": f"draft {n}", "choices": [{"id": "c1", "text": "go"}]},
+            "rewrite_count": n,
+        }
+
+    async def critic(self, state):
+        approved = self.verdicts[min(state.get("rewrite_count", 0), len(self.verdicts) - 1)]
+        return {"critic_output": {"approved": approved, "score": 8.0 if approved else 4.0}}
+
+    async def identity(self, state):
+        await asyncio.sleep(self.identity_delay)
+        return {"identity_delta": {"alignment_change": 1.5, "drift_detected": ""}}
+
+    async def weapon_update(self, state):
+        # Reads the identity agent's output, as the real node does
+        return {"weapon_update_output": {"saw_delta": state.get("identity_delta")}}
+
+    async def persist(self, state):
+        await asyncio.sleep(self.persist_delay)
+        self.events.append(f"persisted:{state['chapter_number']}")
+        self.persisted.append(state["chapter_number"])
+
+
+@pytest.fixture
+def scripted(monkeypatch):
+    def install(script: _Script) -> _Script:
+        for name in (
+            "input_parser", "planner", "simulator", "context",
+            "writer", "critic", "identity", "weapon_update",
+        ):
+            monkeypatch.setattr(pipeline_module, f"_node_{name}", getattr(script, name))
+        monkeypatch.setattr(pipeline_module, "_persist_chapter", script.persist)
+        monkeypatch.setattr(pipeline_module, "_compiled", None)
+        monkeypatch.setattr(pipeline_module.settings, "tracing_enabled", False)
+        return script
+
+    return install
+
+
+def _sequential_pipeline():
+    """The graph as wired before the fan-out, with the ledger run inline."""
+    pm = pipeline_module
+
+    async def ledger_inline(state):
+        await pm._persist_chapter(dict(state))
+        return {}
+
+    graph = StateGraph(PipelineState)
+    for name in ("input_parser", "planner", "simulator", "context", "writer", "critic",
+                 "identity", "weapon_update", "output"):
+        graph.add_node(name, getattr(pm, f"_node_{name}"))
+    graph.add_node("ledger", ledger_inline)
+    graph.set_entry_point("input_parser")
+    for a, b in (("input_parser", "planner"), ("planner", "simulator"),
+                 ("simulator", "context"), ("context", "writer"), ("writer", "critic")):
+        graph.add_edge(a, b)
+    graph.add_conditional_edges(
+        "critic", pm._should_rewrite, {"rewrite": "writer", "approved": "identity"},
+    )
+    for a, b in (("identity", "weapon_update"), ("weapon_update", "output"),
+                 ("output", "ledger"), ("ledger", END)):
+        graph.add_edge(a, b)
+    return graph.compile()
+
+
+def _initial(chapter: int = 1) -> dict:
+    return {"story_id": "s1", "chapter_number": chapter, "free_input": "", "rewrite_count": 0}
+
+
+@pytest.mark.parametrize("verdicts", [
+    [True],                       # approved first time
+    [False, True],                # one rewrite
+    [False, False, False, False],  # forced approval at max rewrites
+])
+async def test_final_state_matches_sequential_graph(scripted, verdicts):
+    scripted(_Script(verdicts))
+    expected = await _sequential_pipeline().ainvoke(_initial())
+
+    scripted(_Script(verdicts))
+    raw = await pipeline_module.get_compiled_pipeline().ainvoke(_initial())
+    actual = await run_pipeline(_initial())
+    await wait_for_ledger()
+
+    assert raw == expected
+    assert raw["weapon_update_output"] == {"saw_delta": raw["identity_delta"]}
+    assert actual.__dict__ == _to_narrative_state(expected).__dict__
+    assert actual.final_prose == expected["final_prose"] != ""
+
+
+async def test_chapter_does_not_wait_for_persistence(scripted):
+    script = scripted(_Script([True], identity_delay=0.02, persist_delay=0.5))
+
+    started = time.perf_counter()
+    await run_pipeline(_initial())
+    elapsed = time.perf_counter() - started
+
+    assert script.persisted == []      # still running in the background
+    assert elapsed < 0.25              # persistence alone takes 0.5s
+    await wait_for_ledger("s1")
+    assert script.persisted == [1]
+
+
+async def test_next_chapter_waits_for_previous_persistence(scripted):
+    script = scripted(_Script([True]))
+
+    await run_pipeline(_initial(1))
+    await run_pipeline(_initial(2))
+    await wait_for_ledger()
+
+    assert script.events == ["context:1", "persisted:1", "context:2", "persisted:2"]
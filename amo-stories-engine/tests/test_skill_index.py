@@ -0,0 +1,175 @@
+"""Tests for the Soul Forge skill uniqueness index."""
+
+import json
+import random
+
+import pytest
+
+import app.memory.skill_index as skill_index_module
+from app.engine.skill_uniqueness import (
+    _hash_embedding,
+    check_skill_uniqueness,
+    cosine_similarity,
+    get_all_skill_embeddings,
+    save_skill_embedding,
+)
+from app.memory.skill_index import SkillNameIndex, SkillVectorIndex, get_skill_index
+from app.memory.state import StoryStateDB
+from app.models.player import PlayerState, UniqueSkill
+
+
+def _scan_is_similar(name: str, existing: set[str]) -> bool:
+    """The original O(N) scan that SkillNameIndex replaces."""
+    name_lower = name.lower().strip()
+    for ex in existing:
+        ex_lower = ex.lower().strip()
+        if name_lower == ex_lower:
+            return True
+        if len(name_lower) > 3 and len(ex_lower) > 3:
+            if name_lower in ex_lower or ex_lower in name_lower:
+                return True
+        name_words, ex_words = set(name_lower.split()), set(ex_lower.split())
+        if name_words and ex_words:
+            if len(name_words & ex_words) / max(len(name_words), len(ex_words)) > 0.6:
+                return True
+    return False
+
+
+_SYLLABLES = ["Bão", "Trí", "Tuệ", "Lửa", "Trời", "Xanh", "Đỏ", "Sợi", "Dây", "Hư", "Vô", "Âm"]
+
+
+def _random_name(rng: random.Random) -> str:
+    return " ".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 5)))
+
+
+# ── Names ──
+
+
+class TestSkillNameIndex:
+    def test_matches_linear_scan(self):
+        rng = random.Random(7)
+        existing = {_random_name(rng) for _ in range(40)}
+        index = SkillNameIndex(existing)
+        outcomes = set()
+        for _ in range(500):
+            name = _random_name(rng)
+            expected = _scan_is_similar(name, existing)
+            assert index.collides(name) == expected, name
+            outcomes.add(expected)
+        assert outcomes == {True, False}
+
+    def test_remove_respects_shared_names(self):
+        index = SkillNameIndex(["Bão Trí Tuệ", "bão trí tuệ"])
+        index.remove("Bão Trí Tuệ")
+        assert index.collides("Bão Trí Tuệ Cuồng Nộ")
+        index.remove("Bão Trí Tuệ")
+        assert not index.collides("Bão Trí Tuệ Cuồng Nộ")
+        assert len(index) == 0
+
+
+# ── Vectors ──
+
+
+class TestSkillVectorIndex:
+    def test_matches_cosine_loop(self):
+        rng = random.Random(3)
+        index = SkillVectorIndex()
+        stored = {}
+        for i in range(100):  # past the initial capacity
+            vec = [rng.uniform(-1, 1) for _ in range(16)]
+            stored[f"skill{i}"] = vec
+            index.upsert(f"p{i}", f"skill{i}", vec)
+
+        query = [rng.uniform(-1, 1) for _ in range(16)]
+        expected_name = max(stored, key=lambda n: cosine_similarity(query, stored[n]))
+        score, name = index.most_similar(query)
+        assert name == expected_name
+        assert score == pytest.approx(cosine_similarity(query, stored[expected_name]), abs=1e-5)
+
+    def test_upsert_replaces_player_row(self):
+        index = SkillVectorIndex()
+        index.upsert("p1", "Old", [1.0, 0.0])
+        index.upsert("p1", "New", [0.0, 1.0])
+        assert len(index) == 1
+        assert index.most_similar([0.0, 1.0]) == (pytest.approx(1.0), "New")
+
+    def test_rejects_mismatched_dims(self):
+        index = SkillVectorIndex()
+        index.upsert("p1", "A", [1.0, 0.0])
+        index.upsert("p2", "B", [1.0, 0.0, 0.0])
+        assert len(index) == 1
+        assert index.most_similar([1.0, 0.0, 0.0]) == (0.0, None)
+
+
+# ── Database integration ──
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(skill_index_module, "_indexes", {})
+    db = StoryStateDB(tmp_path / "test.db")
+    db.connect()
+    yield db
+    db.close()
+
+
+def _player(skill_name: str, user_id: str = "u") -> PlayerState:
+    return PlayerState(user_id=user_id, unique_skill=UniqueSkill(name=skill_name))
+
+
+def test_loads_names_and_legacy_json_embeddings(db):
+    db.create_player(_player("Bão Trí Tuệ", user_id="u1"))
+    player = _player("Lửa Trời", user_id="u2")
+    db.create_player(player)
+    # A row written before the BLOB column existed
+    db.conn.execute(
+        """CREATE TABLE skill_embeddings (
+               player_id TEXT PRIMARY KEY, skill_name TEXT NOT NULL DEFAULT '',
+               skill_text TEXT NOT NULL DEFAULT '', embedding_json TEXT NOT NULL DEFAULT '[]',
+               created_at TEXT DEFAULT (datetime('now')))"""
+    )
+    db.conn.execute(
+        "INSERT INTO skill_embeddings (player_id, skill_name, embedding_json) VALUES (?, ?, ?)",
+        (player.id, "Lửa Trời", json.dumps([0.0, 2.0])),
+    )
+    db.conn.commit()
+
+    index = get_skill_index(db)
+    assert index.names.collides("bão trí tuệ")
+    assert index.vectors.most_similar([0.0, 1.0]) == (pytest.approx(1.0), "Lửa Trời")
+    assert get_all_skill_embeddings(db) == [("Lửa Trời", "", [0.0, 2.0])]
+
+
+def test_player_writes_update_loaded_index(db):
+    index = get_skill_index(db)
+    player = _player("Bão Trí Tuệ")
+    db.create_player(player)
+    assert index.names.collides("Bão Trí Tuệ")
+
+    player.unique_skill.name = "Vọng Âm"
+    db.update_player(player)
+    assert not index.names.collides("Bão Trí Tuệ")
+    assert index.names.collides("Vọng Âm")
+
+    db.delete_player(player.id)
+    assert not index.names.collides("Vọng Âm")
+
+
+async def test_check_uniqueness_uses_saved_embeddings(db, monkeypatch):
+    async def fake_embed(text):
+        return _hash_embedding(text)
+
+    monkeypatch.setattr("app.engine.skill_uniqueness.embed_text", fake_embed)
+
+    assert await check_skill_uniqueness("A", "m", "d", db=db) == (1.0, None)
+
+    text = "Bão Trí Tuệ: d. m"
+    save_skill_embedding(db, "p1", "Bão Trí Tuệ", text, _hash_embedding(text))
+    score, similar = await check_skill_uniqueness("Bão Trí Tuệ", "m", "d", db=db)
+    assert score == pytest.approx(0.0, abs=1e-5)
+    assert similar == "Bão Trí Tuệ"
+
+    # Persisted as float32 and reloaded identically
+    skill_index_module._indexes.clear()
+    reloaded, _ = get_skill_index(db).vectors.most_similar(_hash_embedding(text))
+    assert reloaded == pytest.approx(1.0, abs=1e-5)
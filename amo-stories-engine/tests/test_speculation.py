@@ -0,0 +1,263 @@
+"""Tests for speculative next-scene generation."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import app.engine.orchestrator as orchestrator_module
+import app.narrative.pipeline as pipeline_module
+from app.engine.orchestrator import StoryOrchestrator
+from app.engine.play_style_engine import preferred_risk_level, rank_choices
+from app.engine.speculation import SpeculationScheduler, TokenBudget, scene_input_key
+from app.memory.async_state import AsyncStoryStateDB
+from app.models.adaptive import PlayStyleState
+from app.models.pipeline import Beat, PlannerOutput
+from app.models.story import Chapter, Choice, Scene, Story
+from app.narrative.scene_writer import SceneWriterInput
+
+
+def _writer_input(**overrides) -> SceneWriterInput:
+    beat = Beat(description="Hang tối", scene_type="exploration")
+    values = dict(
+        chapter_number=1,
+        scene_number=2,
+        total_scenes=3,
+        beat=beat,
+        all_beats=[beat],
+        protagonist_name="Thiên Vũ",
+        previous_scene_prose="Scene 1",
+        previous_scene_prose_2="",
+        chosen_choice=Choice(id="c1", text="Tiến lên", risk_level=3),
+        is_chapter_end=False,
+    )
+    values.update(overrides)
+    return SceneWriterInput(**values)
+
+
+def _scheduler(budget: int = 100_000) -> SpeculationScheduler:
+    return SpeculationScheduler(TokenBudget(budget, window_s=3600), max_entries=4, ttl_s=60)
+
+
+# ── Cache key ──
+
+
+class TestSceneInputKey:
+    def test_same_input_same_key(self):
+        assert scene_input_key("s1", _writer_input()) == scene_input_key("s1", _writer_input())
+
+    def test_diverged_state_changes_key(self):
+        base = scene_input_key("s1", _writer_input())
+        assert scene_input_key("s1", _writer_input(critic_feedback="Too slow")) != base
+        assert scene_input_key("s1", _writer_input(player_state={"hp": 1})) != base
+        assert scene_input_key("s2", _writer_input()) != base
+        other = Choice(id="c2", text="Lùi lại", risk_level=1)
+        assert scene_input_key("s1", _writer_input(chosen_choice=other)) != base
+
+    def test_semantic_context_not_keyed(self):
+        assert scene_input_key("s1", _writer_input(semantic_context="recall")) == (
+            scene_input_key("s1", _writer_input())
+        )
+
+
+# ── Scheduler ──
+
+
+class TestScheduler:
+    async def test_claim_hit_and_miss(self):
+        scheduler = _scheduler()
+
+        async def run():
+            return "scene"
+
+        assert scheduler.schedule("s1", "u1", "k1", run, estimated_tokens=10)
+        assert await scheduler.claim("s1", "other") is None
+        assert await scheduler.claim("s1", "k1") == "scene"
+        # Single use
+        assert await scheduler.claim("s1", "k1") is None
+
+        stats = scheduler.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 2
+
+    async def test_claim_waits_for_running_speculation(self):
+        scheduler = _scheduler()
+        release = asyncio.Event()
+
+        async def run():
+            await release.wait()
+            return "late scene"
+
+        scheduler.schedule("s1", "u1", "k1", run, estimated_tokens=10)
+        claim = asyncio.create_task(scheduler.claim("s1", "k1"))
+        await asyncio.sleep(0)
+        assert not claim.done()
+        release.set()
+        assert await claim == "late scene"
+
+    async def test_budget_is_per_user(self):
+        scheduler = _scheduler(budget=25)
+
+        async def run():
+            return None
+
+        assert scheduler.schedule("s1", "u1", "a", run, estimated_tokens=10)
+        assert scheduler.schedule("s1", "u1", "b", run, estimated_tokens=10)
+        assert not scheduler.schedule("s1", "u1", "c", run, estimated_tokens=10)
+        assert scheduler.schedule("s2", "u2", "d", run, estimated_tokens=10)
+        assert scheduler.stats()["budget_denied"] == 1
+
+    async def test_invalidate_cancels_story_entries(self):
+        scheduler = _scheduler()
+
+        async def run():
+            await asyncio.sleep(10)
+
+        scheduler.schedule("s1", "u1", "a", run, estimated_tokens=1)
+        scheduler.schedule("s2", "u1", "b", run, estimated_tokens=1)
+        scheduler.invalidate("s1")
+
+        assert scheduler.stats()["cached"] == 1
+        assert await scheduler.claim("s1", "a") is None
+        scheduler.invalidate("s2")
+
+    async def test_evicts_oldest_when_full(self):
+        scheduler = _scheduler()
+
+        async def run():
+            return None
+
+        for key in "abcde":
+            scheduler.schedule("s1", "u1", key, run, estimated_tokens=1)
+        assert scheduler.stats()["cached"] == 4
+        assert await scheduler.claim("s1", "a") is None
+
+
+# ── Choice ranking ──
+
+
+class TestRankChoices:
+    def test_cautious_player_prefers_low_risk(self):
+        choices = [Choice(id="hi", risk_level=5), Choice(id="lo", risk_level=1)]
+        ranked = rank_choices(choices, PlayStyleState(risk_appetite=0))
+        assert [c.id for c in ranked] == ["lo", "hi"]
+
+    def test_recent_choices_outweigh_axis(self):
+        style = PlayStyleState(risk_appetite=0)
+        assert preferred_risk_level(style) == 1
+        assert preferred_risk_level(style, [5, 5]) > 3
+
+
+# ── Orchestrator integration ──
+
+
+@pytest.fixture
+async def db(tmp_path):
+    db = AsyncStoryStateDB(tmp_path / "test.db", readers=2)
+    await db.connect()
+    yield db
+    await db.close()
+
+
+async def test_next_scene_served_from_speculation(db, monkeypatch):
+    beats = [Beat(description=f"Beat {i}", scene_type="exploration") for i in (1, 2, 3)]
+    story = Story(user_id="user1", title="T")
+    await db.create_story(story)
+    chapter = await db.save_chapter(Chapter(
+        story_id=story.id,
+        number=1,
+        chapter_number=1,
+        planner_output_json=PlannerOutput(beats=beats).model_dump_json(),
+        total_scenes=3,
+    ))
+    first = Scene(
+        chapter_id=chapter.id,
+        scene_number=1,
+        prose="Scene one",
+        choices=[
+            Choice(id="c1", text="A", risk_level=1),
+            Choice(id="c2", text="B", risk_level=3),
+            Choice(id="c3", text="C", risk_level=5),
+        ],
+    )
+    await db.save_scene(first)
+
+    writer_calls = []
+
+    async def fake_writer(writer_input):
+        writer_calls.append(writer_input.chosen_choice.id)
+        return Scene(
+            scene_number=writer_input.scene_number,
+            prose=f"after {writer_input.chosen_choice.id}",
+            choices=[Choice(id="n1", text="N", risk_level=2)],
+        )
+
+    async def no_brain(*args, **kwargs):
+        return SimpleNamespace(available=False)
+
+    async def no_critic(self, **kwargs):
+        return None
+
+    scheduler = _scheduler()
+    monkeypatch.setattr(orchestrator_module, "run_scene_writer", fake_writer)
+    monkeypatch.setattr(orchestrator_module, "get_or_create_brain", no_brain)
+    monkeypatch.setattr(orchestrator_module, "get_speculation_scheduler", lambda: scheduler)
+    monkeypatch.setattr(StoryOrchestrator, "_run_async_scene_critic", no_critic)
+
+    orch = StoryOrchestrator(db)
+    await orch._speculate_next_scene(story.id, first)
+    await asyncio.sleep(0)
+    assert sorted(writer_calls) == ["c1", "c2"]  # no player → writer order, top 2
+
+    result = await orch.generate_single_scene(
+        story_id=story.id,
+        chapter_id=chapter.id,
+        scene_number=2,
+        choice=first.choices[1],
+    )
+
+    assert result.scene.prose == "after c2"
+    assert sorted(writer_calls) == ["c1", "c2"]  # served from cache, no new call
+    assert scheduler.stats()["hits"] == 1
+    assert scheduler.stats()["cached"] == 0  # sibling for c1 discarded
+
+
+async def test_scene_waits_for_pending_chapter_persistence(db, monkeypatch):
+    beats = [Beat(description="Beat 1", scene_type="exploration")]
+    story = Story(user_id="user1", title="T")
+    await db.create_story(story)
+    chapter = await db.save_chapter(Chapter(
+        story_id=story.id,
+        number=2,
+        chapter_number=2,
+        planner_output_json=PlannerOutput(beats=beats).model_dump_json(),
+        total_scenes=1,
+    ))
+    events = []
+
+    async def persist_previous_chapter():
+        await asyncio.sleep(0.05)
+        events.append("persisted")
+
+    async def fake_writer(writer_input):
+        events.append("writer")
+        return Scene(scene_number=1, prose="p", choices=[])
+
+    async def no_brain(*args, **kwargs):
+        return SimpleNamespace(available=False)
+
+    async def no_critic(self, **kwargs):
+        return None
+
+    monkeypatch.setattr(orchestrator_module, "run_scene_writer", fake_writer)
+    monkeypatch.setattr(orchestrator_module, "get_or_create_brain", no_brain)
+    monkeypatch.setattr(orchestrator_module, "get_speculation_scheduler", _scheduler)
+    monkeypatch.setattr(StoryOrchestrator, "_run_async_scene_critic", no_critic)
+    monkeypatch.setitem(
+        pipeline_module._ledger_tasks, story.id, asyncio.create_task(persist_previous_chapter()),
+    )
+
+    await StoryOrchestrator(db).generate_single_scene(
+        story_id=story.id, chapter_id=chapter.id, scene_number=1,
+    )
+
+    assert events == ["persisted", "writer"]
@@ -0,0 +1,56 @@
+"""Tests for StoryStatePool (shared connections for the sync stores)."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.memory.state import StoryStateDB
+from app.memory.state_pool import StoryStatePool
+from app.models.story_ledger import StoryLedger
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = StoryStatePool(tmp_path / "test.db", readers=2)
+    yield pool
+    pool.close()
+
+
+def test_write_then_read(pool):
+    pool.write(StoryStateDB.save_story_ledger, StoryLedger(story_id="s1", last_updated_chapter=3))
+
+    ledger = pool.read(StoryStateDB.get_story_ledger, "s1")
+
+    assert ledger.last_updated_chapter == 3
+    assert pool.stats()["readers_open"] == 1
+
+
+def test_readers_are_bounded_and_shared_across_threads(pool):
+    started = threading.Barrier(2)
+
+    def slow_read(db, story_id):
+        started.wait(timeout=5)
+        return db.get_story_ledger(story_id)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # Two readers run concurrently, every later thread reuses them
+        list(executor.map(lambda _: pool.read(slow_read, "s1"), range(2)))
+        list(executor.map(lambda _: pool.read(StoryStateDB.get_story_ledger, "s1"), range(20)))
+
+    stats = pool.stats()
+    assert stats["readers_open"] == 2
+    assert stats["reads"] == 22
+
+
+def test_readers_reject_writes(pool):
+    with pytest.raises(Exception, match="readonly"):
+        pool.read(StoryStateDB.save_story_ledger, StoryLedger(story_id="s1"))
+
+
+def test_close_closes_every_connection(pool):
+    pool.write(StoryStateDB.save_story_ledger, StoryLedger(story_id="s1"))
+    pool.read(StoryStateDB.get_story_ledger, "s1")
+    pool.close()
+
+    assert pool.stats()["readers_open"] == 0
@@ -0,0 +1,148 @@
+"""Tests for writer token streaming (ProseDecoder, ProseStream, generate_prose)."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.narrative.streaming import ProseDecoder, ProseStream, generate_prose, prose_muted
+
+
+class FakeLLM:
+    """Returns a canned response via ainvoke or in small astream chunks."""
+
+    def __init__(self, *responses: str, chunk_size: int = 3):
+        self.responses = list(responses)
+        self.chunk_size = chunk_size
+        self.streamed = 0
+
+    async def ainvoke(self, messages):
+        return SimpleNamespace(content=self.responses.pop(0))
+
+    async def astream(self, messages):
+        self.streamed += 1
+        raw = self.responses.pop(0)
+        for i in range(0, len(raw), self.chunk_size):
+            await asyncio.sleep(0)  # network round-trip
+            yield SimpleNamespace(content=raw[i:i + self.chunk_size])
+
+
+def _response(prose: str) -> str:
+    body = json.dumps(
+        {"scene_title": "T", "prose": prose, "choices": [{"id": "c1"}]},
+        ensure_ascii=False,
+    )
+    return f"```json\n{body}\n```"
+
+
+# ── ProseDecoder ──
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1000])
+def test_decoder_handles_any_chunking(chunk_size):
+    prose = 'Devold mở mắt.\n"Ai đó?" — hắn hỏi \\ é\t.'
+    raw = json.dumps({"scene_title": "X", "prose": prose}, ensure_ascii=True)
+
+    decoder = ProseDecoder()
+    out = "".join(
+        decoder.feed(raw[i:i + chunk_size]) for i in range(0, len(raw), chunk_size)
+    )
+    assert out == prose
+    assert decoder.done
+
+
+def test_decoder_ignores_fields_after_prose():
+    decoder = ProseDecoder()
+    assert decoder.feed('{"prose": "abc", "summary": "xyz"}') == "abc"
+    assert decoder.feed('"more"') == ""
+
+
+def test_decoder_passes_raw_newlines():
+    decoder = ProseDecoder()
+    assert decoder.feed('{"prose": "Dòng 1\nDòng 2"') == "Dòng 1\nDòng 2"
+
+
+# ── generate_prose / ProseStream ──
+
+
+async def test_without_stream_uses_ainvoke():
+    llm = FakeLLM(_response("Hello"))
+    raw = await generate_prose(llm, [])
+    assert raw == _response("Hello")
+    assert llm.streamed == 0
+
+
+async def test_stream_yields_prose_before_work_finishes():
+    llm = FakeLLM(_response("Một hai ba bốn năm"))
+    finished = []
+
+    async def work():
+        raw = await generate_prose(llm, [])
+        finished.append(True)
+        return raw
+
+    stream = ProseStream(work)
+    events = []
+    async for event in stream:
+        if not events:
+            assert not finished
+        events.append(event)
+
+    assert len(events) > 1
+    assert "".join(e.text for e in events) == "Một hai ba bốn năm"
+    assert [e.offset for e in events] == [
+        sum(len(p.text) for p in events[:i]) for i in range(len(events))
+    ]
+    assert stream.text == "Một hai ba bốn năm"
+    assert stream.result.startswith("```json")
+
+
+async def test_rewrite_resets_segment():
+    llm = FakeLLM(_response("Draft one"), _response("Final"))
+
+    async def work():
+        await generate_prose(llm, [])
+        return await generate_prose(llm, [], replace=True)
+
+    stream = ProseStream(work)
+    events = [e async for e in stream]
+
+    resets = [e for e in events if e.reset]
+    assert len(resets) == 1 and resets[0].offset == 0
+    assert stream.text == "Final"
+
+
+async def test_segments_joined_with_separator():
+    llm = FakeLLM(_response("Scene 1"), _response("Scene 2"))
+
+    async def work():
+        await generate_prose(llm, [])
+        await generate_prose(llm, [])
+
+    stream = ProseStream(work, separator="\n\n---\n\n")
+    [e async for e in stream]
+    assert stream.text == "Scene 1\n\n---\n\nScene 2"
+
+
+async def test_muted_block_is_not_streamed():
+    llm = FakeLLM(_response("Planner-only draft"), _response("Scene 1"))
+
+    async def work():
+        with prose_muted():
+            await generate_prose(llm, [])
+        await generate_prose(llm, [])
+
+    stream = ProseStream(work)
+    [e async for e in stream]
+    assert stream.text == "Scene 1"
+    assert llm.streamed == 1
+
+
+async def test_work_errors_propagate():
+    async def work():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async for _ in ProseStream(work):
+            pass
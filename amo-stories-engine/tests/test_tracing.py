@@ -0,0 +1,131 @@
+"""Tests for pipeline stage tracing and the trace store."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import app.narrative.tracing as tracing_module
+from app.narrative.llm_gateway import LLMGateway
+from app.narrative.tracing import Span, TraceStore, span, traced, traced_node
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = TraceStore(tmp_path / "traces.db", retention_s=3600)
+    monkeypatch.setattr(tracing_module, "_store", store)
+    yield store
+    store.close()
+
+
+async def _spans(store: TraceStore) -> dict[str, dict]:
+    await store.flush()
+    trace_id = (await store.recent_traces(1))[0]["trace_id"]
+    return {s["name"]: s for s in await store.get_trace(trace_id)}
+
+
+async def test_spans_nest_into_one_trace(store):
+    @traced("writer", kind="node")
+    async def writer():
+        with span("save_scene"):
+            await asyncio.sleep(0)
+
+    with span("scene", scene=2) as root:
+        await writer()
+
+    spans = await _spans(store)
+    assert set(spans) == {"scene", "writer", "save_scene"}
+    assert spans["scene"]["parent_id"] is None
+    assert spans["writer"]["parent_id"] == root.span_id
+    assert spans["save_scene"]["parent_id"] == spans["writer"]["span_id"]
+    assert spans["scene"]["attrs"] == {"scene": 2}
+
+
+async def test_errors_are_recorded_and_reraised(store):
+    with pytest.raises(ValueError), span("pipeline"), span("critic", kind="node"):
+        raise ValueError("bad json")
+
+    spans = await _spans(store)
+    assert spans["critic"]["attrs"]["error"] == "ValueError"
+    assert spans["pipeline"]["attrs"]["error"] == "ValueError"
+
+
+async def test_traced_node_tags_rewrite_passes(store):
+    async def writer(state):
+        return {"rewrite_count": state["rewrite_count"] + 1}
+
+    node = traced_node("writer", writer)
+    with span("pipeline"):
+        assert await node({"rewrite_count": 0}) == {"rewrite_count": 1}
+
+    assert (await _spans(store))["writer"]["attrs"] == {"rewrite": 1}
+
+
+async def test_gateway_calls_record_tokens_retries_and_hits(store):
+    class _Client:
+        def __init__(self) -> None:
+            self.failures = [ConnectionError("reset")]
+
+        async def ainvoke(self, messages, **kwargs):
+            await asyncio.sleep(0.01)
+            if self.failures:
+                raise self.failures.pop(0)
+            return SimpleNamespace(
+                content="ok", usage_metadata={"input_tokens": 12, "output_tokens": 5},
+            )
+
+    client = _Client()
+    gateway = LLMGateway(retry_base_s=0, client_factory=lambda model, temperature: client)
+    llm = gateway.llm("flash", 0.3)
+
+    with span("pipeline"):
+        await asyncio.gather(llm.ainvoke("prompt"), llm.ainvoke("prompt"))
+
+    await store.flush()
+    trace_id = (await store.recent_traces(1))[0]["trace_id"]
+    calls = [s for s in await store.get_trace(trace_id) if s["kind"] == "llm"]
+    owner = next(s for s in calls if not s["attrs"].get("coalesced"))
+    assert owner["name"] == "llm:flash"
+    assert owner["attrs"] == {"tokens_in": 12, "tokens_out": 5, "retries": 1}
+    assert sum(1 for s in calls if s["attrs"].get("coalesced")) == 1
+
+
+async def test_background_span_outliving_root_is_kept(store):
+    release = asyncio.Event()
+
+    async def critic():
+        with span("scene_critic"):
+            await release.wait()
+
+    with span("single_scene"):
+        task = asyncio.create_task(critic())
+        await asyncio.sleep(0)
+    release.set()
+    await task
+
+    spans = await _spans(store)
+    assert set(spans) == {"single_scene", "scene_critic"}
+    assert spans["scene_critic"]["parent_id"] == spans["single_scene"]["span_id"]
+
+
+async def test_stage_stats_percentiles(store):
+    for i, ms in enumerate(range(10, 210, 10)):   # 20 writer spans: 10..200 ms
+        s = Span("writer", "node", f"t{i}", f"w{i}", None, started_at=1e12)
+        s.duration_ms = ms
+        s.set(tokens_out=100)
+        store.submit([s])
+    await store.flush()
+
+    (writer,) = await store.stage_stats(window_s=3600)
+    assert writer["count"] == 20
+    assert writer["p50_ms"] == 100
+    assert writer["p95_ms"] == 190
+    assert writer["max_ms"] == 200
+    assert writer["tokens_out"] == 2000
+
+
+def test_disabled_tracing_writes_nothing(store, monkeypatch):
+    monkeypatch.setattr(tracing_module.settings, "tracing_enabled", False)
+    with span("pipeline"):
+        pass
+    assert store._buffer == []
@@ -239,6 +239,11 @@ function _connectSSE(url, handlers, sceneMode = false) {
         handlers.onProse?.(data);
     });
 
+    source.addEventListener('prose_reset', (e) => {
+        const data = JSON.parse(e.data);
+        handlers.onProseReset?.(data);
+    });
+
     source.addEventListener('choices', (e) => {
         const data = JSON.parse(e.data);
         handlers.onChoices?.(data);
@@ -1498,6 +1498,7 @@ async function handleStartStory() {
                 {
                     onStatus: (d) => setLoadingStatus(d.message),
                     onProse: (d) => appendProse(d.text),
+                    onProseReset: (d) => resetProse(d.offset),
                     onChoices: (d) => renderChoices(d.choices),
                     onMetadata: (d) => handleMetadata(d),
                     onIdentity: (d) => showIdentityToast(d),
@@ -2004,6 +2005,7 @@ function getLegacyHandlers() {
     return {
         onStatus: (d) => setLoadingStatus(d.message),
         onProse: (d) => appendProse(d.text),
+        onProseReset: (d) => resetProse(d.offset),
         onChoices: (d) => renderChoices(d.choices),
         onMetadata: (d) => handleMetadata(d),
         onIdentity: (d) => showIdentityToast(d),
@@ -2046,6 +2048,13 @@ function appendProse(text) {
     // No auto-scroll during streaming
 }
 
+function resetProse(offset) {
+    // Critic rejected the streamed draft — drop it, the rewrite follows
+    const el = $('#prose-text');
+    el.querySelector('.cursor-blink')?.remove();
+    el.textContent = el.textContent.slice(0, offset);
+}
+
 function renderChoices(choices) {
     const grid = $('#choices-grid');
     grid.innerHTML = '';
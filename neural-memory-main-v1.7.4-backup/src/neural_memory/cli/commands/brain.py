@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Annotated, Any
 
@@ -17,6 +18,13 @@ from neural_memory.cli._helpers import (
 )
 from neural_memory.safety.freshness import analyze_freshness
 from neural_memory.safety.sensitive import check_sensitive_content
+from neural_memory.storage.brain_stream import (
+    compression_for_path,
+    decode_stream,
+    is_stream_path,
+    read_file_chunks,
+    write_stream_file,
+)
 
 brain_app = typer.Typer(help="Brain management commands")
 
@@ -120,9 +128,13 @@ def brain_export(
 ) -> None:
     """Export brain to JSON file.
 
+    An ``.ndjson`` output (optionally ``.ndjson.gz`` / ``.ndjson.zst``) is
+    streamed record by record, so memory stays flat for large brains.
+
     Examples:
         nmem brain export
         nmem brain export -o backup.json
+        nmem brain export -o backup.ndjson.gz
         nmem brain export --exclude-sensitive -o safe.json
     """
 
@@ -136,6 +148,25 @@ def brain_export(
             raise typer.Exit(1)
 
         storage = await get_storage(config, brain_name=brain_name)
+
+        if output and is_stream_path(output):
+            excluded: set[str] = set()
+            records = storage.export_brain_stream(storage._current_brain_id or "")
+            if exclude_sensitive:
+                records = _without_sensitive(records, excluded)
+            counts = await write_stream_file(records, output, compression_for_path(output))
+            typer.secho(f"Exported to: {output}", fg=typer.colors.GREEN)
+            typer.echo(
+                f"  Neurons: {counts['neuron']}, synapses: {counts['synapse']}, "
+                f"fibers: {counts['fiber']}"
+            )
+            if excluded:
+                typer.secho(
+                    f"Excluded {len(excluded)} neurons with sensitive content",
+                    fg=typer.colors.YELLOW,
+                )
+            return
+
         snapshot = await storage.export_brain(storage._current_brain_id or "")
 
         # Filter sensitive content if requested
@@ -215,14 +246,22 @@ def brain_import(
 ) -> None:
     """Import brain from JSON file.
 
+    ``.ndjson`` files (optionally gzip/zstd-compressed) from
+    ``nmem brain export`` are streamed in with bounded memory.
+
     Examples:
         nmem brain import backup.json
+        nmem brain import backup.ndjson.gz
         nmem brain import shared-brain.json --name shared
         nmem brain import untrusted.json --scan
     """
     from neural_memory.core.brain import BrainSnapshot
 
     async def _import() -> None:
+        if is_stream_path(file):
+            await _import_stream(file, name, use=use, scan_sensitive=scan_sensitive)
+            return
+
         with open(file, encoding="utf-8") as f:
             data = json.load(f)
 
@@ -283,6 +322,84 @@ def brain_import(
     run_async(_import())
 
 
+async def _without_sensitive(
+    records: AsyncIterator[dict[str, Any]], excluded: set[str]
+) -> AsyncIterator[dict[str, Any]]:
+    """Drop sensitive neurons, and synapses/fibers touching them, from a brain stream.
+
+    Neurons precede synapses and fibers in a stream, so ``excluded`` is
+    complete by the time they are checked.
+    """
+    async for record in records:
+        kind, data = record["kind"], record.get("data", {})
+        if kind == "neuron" and check_sensitive_content(data.get("content", ""), min_severity=2):
+            excluded.add(data["id"])
+            continue
+        if kind == "synapse" and (data["source_id"] in excluded or data["target_id"] in excluded):
+            continue
+        if kind == "fiber" and excluded.intersection(data.get("neuron_ids", [])):
+            continue
+        yield record
+
+
+async def _import_stream(file: str, name: str | None, *, use: bool, scan_sensitive: bool) -> None:
+    """Import a brain stream file (see ``nmem brain import``)."""
+    header: dict[str, Any] = {}
+    sensitive_count = 0
+    try:
+        async for record in decode_stream(read_file_chunks(file)):
+            if record["kind"] == "header":
+                header = record
+                if not scan_sensitive:
+                    break
+            elif record["kind"] == "neuron" and check_sensitive_content(
+                record["data"].get("content", ""), min_severity=2
+            ):
+                sensitive_count += 1
+    except ValueError as e:
+        typer.secho(f"Invalid brain stream: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if sensitive_count > 0:
+        typer.secho(
+            f"[!] Found {sensitive_count} neurons with potentially sensitive content",
+            fg=typer.colors.YELLOW,
+        )
+        if not typer.confirm("Continue importing?"):
+            raise typer.Exit(0)
+
+    brain_name = name or header.get("brain_name", "imported")
+    config = get_config()
+    if brain_name in config.list_brains():
+        typer.secho(
+            f"Brain '{brain_name}' already exists. Use --name to specify different name.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    async def renamed() -> AsyncIterator[dict[str, Any]]:
+        async for record in decode_stream(read_file_chunks(file)):
+            yield {**record, "brain_name": brain_name} if record["kind"] == "header" else record
+
+    storage = await get_storage(config, brain_name=brain_name)
+    try:
+        brain_id = await storage.import_brain_stream(renamed(), storage._current_brain_id)
+    except ValueError as e:
+        typer.secho(f"Import failed: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    await storage.batch_save()
+
+    if use:
+        config.current_brain = brain_name
+        config.save()
+
+    stats = await storage.get_stats(brain_id)
+    typer.secho(f"Imported brain: {brain_name}", fg=typer.colors.GREEN)
+    typer.echo(f"  Neurons: {stats['neuron_count']}")
+    typer.echo(f"  Synapses: {stats['synapse_count']}")
+    typer.echo(f"  Fibers: {stats['fiber_count']}")
+
+
 @brain_app.command("delete")
 def brain_delete(
     name: Annotated[str, typer.Argument(help="Brain name to delete")],
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any
 
 import typer
 
@@ -264,14 +265,31 @@ def export_brain_cmd(
     Examples:
         nmem export backup.json           # Export current brain
         nmem export work.json -b work     # Export specific brain
+        nmem export backup.ndjson.gz      # Stream (bounded memory), gzip-compressed
     """
     from pathlib import Path
 
+    from neural_memory.storage.brain_stream import (
+        compression_for_path,
+        export_brain_to_file,
+        is_stream_path,
+    )
+
     async def _export() -> None:
         config = get_config()
         brain_name = brain or config.current_brain
         storage = await get_storage(config, brain_name=brain_name)
 
+        if is_stream_path(output):
+            counts = await export_brain_to_file(
+                storage, brain_name, output, compression_for_path(output)
+            )
+            typer.echo(f"Exported brain '{brain_name}' to {output}")
+            typer.echo(f"  Neurons: {counts['neuron']}")
+            typer.echo(f"  Synapses: {counts['synapse']}")
+            typer.echo(f"  Fibers: {counts['fiber']}")
+            return
+
         snapshot = await storage.export_brain(brain_name)
 
         output_path = Path(output)
@@ -318,10 +336,18 @@ def import_brain_cmd(
         nmem import backup.json -b new                   # Import as 'new' brain
         nmem import backup.json --merge                  # Merge into existing brain
         nmem import backup.json --merge --strategy prefer_recent
+        nmem import backup.ndjson.gz                     # Stream in (bounded memory)
     """
     from pathlib import Path
 
     from neural_memory.core.brain import BrainSnapshot
+    from neural_memory.storage.brain_stream import (
+        decode_stream,
+        import_brain_from_file,
+        is_stream_path,
+        read_file_chunks,
+        read_header,
+    )
 
     async def _import() -> None:
         input_path = Path(input_file)
@@ -329,6 +355,26 @@ def import_brain_cmd(
             typer.echo(f"Error: File not found: {input_path}", err=True)
             raise typer.Exit(1)
 
+        if is_stream_path(input_path):
+            if merge:
+                typer.echo("Error: --merge needs a JSON snapshot, not a stream", err=True)
+                raise typer.Exit(1)
+            try:
+                header = await read_header(decode_stream(read_file_chunks(input_path)))
+                brain_name = brain or header["brain_name"]
+                storage = await get_storage(config=get_config(), brain_name=brain_name)
+                brain_id = await import_brain_from_file(storage, input_path, brain_name)
+            except ValueError as e:
+                typer.echo(f"Error: {e}", err=True)
+                raise typer.Exit(1)
+            await storage.batch_save()
+            stats = await storage.get_stats(brain_id)
+            typer.echo(f"Imported brain '{brain_name}' from {input_path}")
+            typer.echo(f"  Neurons: {stats['neuron_count']}")
+            typer.echo(f"  Synapses: {stats['synapse_count']}")
+            typer.echo(f"  Fibers: {stats['fiber_count']}")
+            return
+
         data = json.loads(input_path.read_text())
 
         brain_name = brain or data.get("brain_name", "imported")
@@ -347,12 +393,10 @@ def import_brain_cmd(
         )
 
         if merge:
-            # Try to export existing brain for merge
-            from neural_memory.engine.merge import ConflictStrategy, merge_snapshots
+            from neural_memory.engine.merge import ConflictStrategy
+            from neural_memory.storage.brain_stream import snapshot_records
 
-            try:
-                local_snapshot = await storage.export_brain(brain_name)
-            except (ValueError, Exception):
+            if await storage.get_brain(brain_name) is None:
                 # No existing brain, just import directly
                 await storage.import_brain(incoming_snapshot, brain_name)
                 typer.echo(
@@ -360,16 +404,13 @@ def import_brain_cmd(
                 )
                 return
 
-            conflict_strategy = ConflictStrategy(strategy)
-            merged_snapshot, merge_report = merge_snapshots(
-                local=local_snapshot,
-                incoming=incoming_snapshot,
-                strategy=conflict_strategy,
-            )
+            async def incoming_records() -> AsyncIterator[dict[str, Any]]:
+                for record in snapshot_records(incoming_snapshot):
+                    yield record
 
-            # Clear and reimport merged
-            await storage.clear(brain_name)
-            await storage.import_brain(merged_snapshot, brain_name)
+            merge_report = await storage.merge_brain_stream(
+                brain_name, incoming_records(), ConflictStrategy(strategy)
+            )
 
             typer.echo(f"Merged brain '{brain_name}' from {input_path}")
             typer.echo(f"  Strategy: {strategy}")
@@ -314,7 +314,10 @@ def decay(
 def consolidate(
     brain: Annotated[str | None, typer.Option("--brain", "-b", help="Brain to consolidate")] = None,
     strategy: Annotated[
-        str, typer.Option("--strategy", "-s", help="Strategy: prune, merge, summarize, all")
+        str,
+        typer.Option(
+            "--strategy", "-s", help="Strategy: prune, merge, summarize, incremental, all"
+        ),
     ] = "all",
     dry_run: Annotated[
         bool, typer.Option("--dry-run", "-n", help="Preview changes without applying")
@@ -332,14 +335,16 @@ def consolidate(
     """Consolidate brain memories by pruning, merging, or summarizing.
 
     Strategies:
-        prune      - Remove weak synapses and orphan neurons
-        merge      - Combine overlapping fibers
-        summarize  - Create concept neurons for topic clusters
-        all        - Run all strategies in order
+        prune        - Remove weak synapses and orphan neurons
+        merge        - Combine overlapping fibers
+        summarize    - Create concept neurons for topic clusters
+        incremental  - Prune/merge/mature/infer only what changed since last run
+        all          - Run all strategies in order
 
     Examples:
         nmem consolidate                    # Run all strategies
         nmem consolidate -s prune           # Only prune
+        nmem consolidate -s incremental     # Only recently changed memories
         nmem consolidate --dry-run          # Preview without changes
         nmem consolidate -s merge --merge-overlap 0.3
     """
@@ -366,8 +371,15 @@ def consolidate(
             merge_overlap_threshold=merge_overlap,
         )
 
+        def _progress(stage: str, done: int, total: int) -> None:
+            typer.echo(f"\r  {stage}: {done}/{total}", nl=False)
+            if done >= total:
+                typer.echo("")
+
         engine = ConsolidationEngine(storage, cons_config)
-        report = await engine.run(strategies=strategies, dry_run=dry_run)
+        report = await engine.run(
+            strategies=strategies, dry_run=dry_run, progress_callback=_progress
+        )
 
         typer.echo("")
         typer.echo(report.summary())
@@ -28,13 +28,17 @@ def train(
         bool,
         typer.Option("--no-consolidate", help="Skip ENRICH consolidation"),
     ] = False,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-w", help="Extraction processes (0 = one per CPU)"),
+    ] = 0,
     json_output: Annotated[
         bool,
         typer.Option("--json", "-j", help="Output as JSON"),
     ] = False,
 ) -> None:
     """Train a brain from documentation files (markdown)."""
-    run_async(_train_async(path, domain, brain, extensions, no_consolidate, json_output))
+    run_async(_train_async(path, domain, brain, extensions, no_consolidate, workers, json_output))
 
 
 async def _train_async(
@@ -43,6 +47,7 @@ async def _train_async(
     brain: str,
     extensions: list[str] | None,
     no_consolidate: bool,
+    workers: int,
     json_output: bool,
 ) -> None:
     """Async implementation of the train command."""
@@ -66,6 +71,7 @@ async def _train_async(
         brain_name=brain,
         extensions=tuple(extensions) if extensions else (".md",),
         consolidate=not no_consolidate,
+        workers=max(0, workers),
     )
 
     trainer = DocTrainer(storage, brain_data.config)
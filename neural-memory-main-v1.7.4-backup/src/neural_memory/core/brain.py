@@ -22,6 +22,9 @@ class BrainConfig:
         max_spread_hops: Maximum hops in spreading activation
         max_context_tokens: Maximum tokens to include in context injection
         default_synapse_weight: Default weight for new synapses
+        activation_backend: How classic spreading activation reads the graph:
+            "storage" (per-hop queries), "snapshot" (in-memory CSR) or
+            "vectorized" (NumPy over the snapshot; requires numpy)
     """
 
     decay_rate: float = 0.1
@@ -61,6 +64,7 @@ class BrainConfig:
     embedding_model: str = "all-MiniLM-L6-v2"
     embedding_similarity_threshold: float = 0.7
     embedding_activation_boost: float = 0.15
+    activation_backend: str = "storage"
 
     def with_updates(self, **kwargs: Any) -> BrainConfig:
         """Create a new config with updated values."""
@@ -140,6 +144,7 @@ class BrainConfig:
             embedding_activation_boost=kwargs.get(
                 "embedding_activation_boost", self.embedding_activation_boost
             ),
+            activation_backend=kwargs.get("activation_backend", self.activation_backend),
         )
 
 
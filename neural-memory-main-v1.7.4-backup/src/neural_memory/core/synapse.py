@@ -78,6 +78,16 @@ INVERSE_TYPES: dict[SynapseType, SynapseType] = {
 }
 
 
+def time_decay_factor(hours_since: float) -> float:
+    """Sigmoid weight multiplier for a synapse idle for ``hours_since`` hours.
+
+    Centered at 1440h (60 days) with a 720h spread, floored at 0.3.
+    """
+    exponent = (max(0.0, hours_since) - 1440) / 720
+    exponent = max(-100.0, min(100.0, exponent))
+    return max(0.3, 1.0 / (1.0 + math.exp(exponent)))
+
+
 @dataclass
 class Synapse:
     """
@@ -257,15 +267,7 @@ class Synapse:
         else:
             hours_since = (reference_time - self.created_at).total_seconds() / 3600
 
-        hours_since = max(0, hours_since)
-
-        # Sigmoid decay: center at 1440h (60 days), spread 720h
-        exponent = (hours_since - 1440) / 720
-        exponent = max(-100.0, min(100.0, exponent))
-        factor = 1.0 / (1.0 + math.exp(exponent))
-        factor = max(0.3, factor)  # Floor: never decay below 30% of original
-
-        new_weight = self.weight * factor
+        new_weight = self.weight * time_decay_factor(hours_since)
         return Synapse(
             id=self.id,
             source_id=self.source_id,
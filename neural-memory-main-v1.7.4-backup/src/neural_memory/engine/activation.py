@@ -9,13 +9,28 @@ from collections import defaultdict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from neural_memory.utils.timeutils import utcnow
+
 if TYPE_CHECKING:
     from neural_memory.core.brain import BrainConfig
+    from neural_memory.engine.frontier_activation import FrontierActivation
     from neural_memory.storage.base import NeuralStorage
+    from neural_memory.storage.graph_snapshot import GraphSnapshot
 
 # Safety cap: maximum queue entries to prevent memory exhaustion on dense graphs
 _MAX_QUEUE_SIZE = 50_000
 
+# Synapses weaker than this do not conduct activation
+_MIN_CONDUCTING_WEIGHT = 0.1
+
+# Per-hop activation decay used when callers don't pass one
+_DEFAULT_DECAY_FACTOR = 0.5
+
+
+def _freq_factor(freq: int) -> float:
+    """Myelination boost: frequently accessed neurons conduct stronger."""
+    return 1.0 + min(0.15, 0.05 * math.log1p(freq))
+
 
 @dataclass
 class ActivationResult:
@@ -65,6 +80,8 @@ class SpreadingActivation:
         self,
         storage: NeuralStorage,
         config: BrainConfig,
+        use_snapshot: bool = False,
+        vectorized: bool = False,
     ) -> None:
         """
         Initialize the activation system.
@@ -72,15 +89,25 @@ class SpreadingActivation:
         Args:
             storage: Storage backend to read graph from
             config: Brain configuration for parameters
+            use_snapshot: If True, spread over the storage's in-memory
+                graph snapshot (no I/O per hop) when the backend provides one
+            vectorized: If True, spread level-synchronously with NumPy over
+                the snapshot (implies use_snapshot; requires numpy)
         """
         self._storage = storage
         self._config = config
+        self._use_snapshot = use_snapshot or vectorized
+        self._frontier: FrontierActivation | None = None
+        if vectorized:
+            from neural_memory.engine.frontier_activation import FrontierActivation
+
+            self._frontier = FrontierActivation(min_weight=_MIN_CONDUCTING_WEIGHT)
 
     async def activate(
         self,
         anchor_neurons: list[str],
         max_hops: int | None = None,
-        decay_factor: float = 0.5,
+        decay_factor: float = _DEFAULT_DECAY_FACTOR,
         min_activation: float | None = None,
     ) -> dict[str, ActivationResult]:
         """
@@ -105,6 +132,22 @@ class SpreadingActivation:
         if min_activation is None:
             min_activation = self._config.activation_threshold
 
+        if self._use_snapshot:
+            snapshot = await self._storage.get_graph_snapshot()
+            if snapshot is not None and self._frontier is not None:
+                return self._frontier.activate_batch(
+                    snapshot,
+                    [anchor_neurons],
+                    max_hops,
+                    decay_factor,
+                    min_activation,
+                    now=utcnow().timestamp(),
+                )[0]
+            if snapshot is not None:
+                return self._activate_snapshot(
+                    snapshot, anchor_neurons, max_hops, decay_factor, min_activation
+                )
+
         # Track best activation for each neuron
         results: dict[str, ActivationResult] = {}
 
@@ -161,7 +204,7 @@ class SpreadingActivation:
             neighbors = await self._storage.get_neighbors(
                 current.neuron_id,
                 direction="both",
-                min_weight=0.1,
+                min_weight=_MIN_CONDUCTING_WEIGHT,
             )
 
             # Batch-prefetch neuron states for uncached neighbors
@@ -186,8 +229,7 @@ class SpreadingActivation:
                     continue
                 # Frequency boost: frequently accessed neurons conduct stronger
                 # (myelination metaphor — well-used pathways transmit faster)
-                freq = freq_cache.get(neighbor_neuron.id, 0)
-                freq_factor = 1.0 + min(0.15, 0.05 * math.log1p(freq))
+                freq_factor = _freq_factor(freq_cache.get(neighbor_neuron.id, 0))
 
                 # Calculate new activation with frequency boost
                 new_level = current.level * decay_factor * synapse.weight * freq_factor
@@ -221,6 +263,87 @@ class SpreadingActivation:
 
         return results
 
+    def _activate_snapshot(
+        self,
+        snapshot: GraphSnapshot,
+        anchor_neurons: list[str],
+        max_hops: int,
+        decay_factor: float,
+        min_activation: float,
+    ) -> dict[str, ActivationResult]:
+        """Same spread as ``activate`` but over int indices of a CSR snapshot.
+
+        Queue entries are plain tuples ordered by descending level; the
+        counter keeps ties in insertion order like the dataclass heap.
+        """
+        results: dict[str, ActivationResult] = {}
+        now = utcnow().timestamp()
+        freq_factors: dict[int, float] = {}
+        best: dict[int, float] = {}
+        queue: list[tuple[float, int, int, int, tuple[int, ...], int]] = []
+        counter = 0
+
+        for anchor_id in anchor_neurons:
+            idx = snapshot.index_of(anchor_id)
+            if idx is None:
+                continue
+            heapq.heappush(queue, (-1.0, counter, idx, 0, (idx,), idx))
+            counter += 1
+            best[idx] = 1.0
+            results[anchor_id] = ActivationResult(
+                neuron_id=anchor_id,
+                activation_level=1.0,
+                hop_distance=0,
+                path=[anchor_id],
+                source_anchor=anchor_id,
+            )
+
+        visited: set[tuple[int, int]] = set()
+
+        while queue:
+            if len(queue) > _MAX_QUEUE_SIZE:
+                break
+            neg_level, _, idx, hops, path, source = heapq.heappop(queue)
+
+            visit_key = (idx, source)
+            if visit_key in visited:
+                continue
+            visited.add(visit_key)
+
+            if hops >= max_hops:
+                continue
+
+            level = -neg_level
+            for neighbor, weight in snapshot.neighbors(idx, _MIN_CONDUCTING_WEIGHT):
+                if snapshot.refractory_until(neighbor) > now:
+                    continue
+
+                factor = freq_factors.get(neighbor)
+                if factor is None:
+                    factor = _freq_factor(snapshot.access_frequency(neighbor))
+                    freq_factors[neighbor] = factor
+
+                new_level = level * decay_factor * weight * factor
+                if new_level < min_activation:
+                    continue
+
+                new_path = (*path, neighbor)
+                if new_level > best.get(neighbor, 0.0):
+                    best[neighbor] = new_level
+                    neighbor_id = snapshot.neuron_id(neighbor)
+                    results[neighbor_id] = ActivationResult(
+                        neuron_id=neighbor_id,
+                        activation_level=new_level,
+                        hop_distance=hops + 1,
+                        path=[snapshot.neuron_id(i) for i in new_path],
+                        source_anchor=snapshot.neuron_id(source),
+                    )
+
+                heapq.heappush(queue, (-new_level, counter, neighbor, hops + 1, new_path, source))
+                counter += 1
+
+        return results
+
     async def activate_from_multiple(
         self,
         anchor_sets: list[list[str]],
@@ -243,9 +366,9 @@ class SpreadingActivation:
         if not anchor_sets:
             return {}, []
 
-        # Activate from each set in parallel
-        tasks = [self.activate(anchors, max_hops) for anchors in anchor_sets if anchors]
-        activation_results = list(await asyncio.gather(*tasks)) if tasks else []
+        activation_results = await self._activate_sets(
+            [anchors for anchors in anchor_sets if anchors], max_hops
+        )
 
         if not activation_results:
             return {}, []
@@ -287,6 +410,31 @@ class SpreadingActivation:
 
         return combined, intersection
 
+    async def _activate_sets(
+        self,
+        anchor_sets: list[list[str]],
+        max_hops: int | None,
+    ) -> list[dict[str, ActivationResult]]:
+        """Activate every anchor set; one batched pass in vectorized mode."""
+        if not anchor_sets:
+            return []
+
+        if self._frontier is not None:
+            snapshot = await self._storage.get_graph_snapshot()
+            if snapshot is not None:
+                return self._frontier.activate_batch(
+                    snapshot,
+                    anchor_sets,
+                    self._config.max_spread_hops if max_hops is None else max_hops,
+                    _DEFAULT_DECAY_FACTOR,
+                    self._config.activation_threshold,
+                    now=utcnow().timestamp(),
+                )
+
+        # Activate from each set in parallel
+        tasks = [self.activate(anchors, max_hops) for anchors in anchor_sets]
+        return list(await asyncio.gather(*tasks))
+
     def _find_intersection(
         self,
         activation_sets: list[dict[str, ActivationResult]],
@@ -1,14 +1,23 @@
-"""Brain versioning engine — snapshot-based version control for brains.
-
-Creates point-in-time snapshots of brain state, supports rollback
-and diffing between versions. Snapshots are JSON blobs stored in
-SQLite, reusing the existing export_brain()/import_brain() machinery.
+"""Brain versioning engine — content-addressed version control for brains.
+
+Creates point-in-time versions of brain state, supports rollback and
+diffing between versions. A version is a *manifest*: the hash of every
+neuron, synapse, fiber, project and typed memory row, keyed by
+``(kind, entity_id)``. Row payloads are stored once per hash, and a
+version only records the manifest entries that changed since its parent
+version, so creating a version writes work proportional to churn rather
+than brain size. Diffs compare manifests and load only the payloads of
+rows whose hash changed.
+
+Versions saved by older releases as whole-snapshot JSON blobs remain
+readable; storage backends convert them to manifests on first use.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
@@ -20,6 +29,28 @@ if TYPE_CHECKING:
     from neural_memory.core.brain import BrainSnapshot
     from neural_memory.storage.base import NeuralStorage
 
+# Row hash by (kind, entity_id) for every entity in a version
+VersionManifest = dict[tuple[str, str], str]
+
+# The field identifying an entity of each stream record kind
+ENTITY_KEYS = {
+    "neuron": "id",
+    "synapse": "id",
+    "fiber": "id",
+    "project": "id",
+    "typed_memory": "fiber_id",
+}
+
+# Set-valued fields, sorted before hashing so export order is not churn
+_SET_FIELDS = {
+    "fiber": ("neuron_ids", "synapse_ids", "tags"),
+    "project": ("tags",),
+    "typed_memory": ("tags",),
+}
+
+# Row payloads fetched per storage call when restoring a version
+_ROW_FETCH_SIZE = 500
+
 
 # ── Data structures ──────────────────────────────────────────────
 
@@ -100,61 +131,159 @@ def _compute_hash(snapshot_json: str) -> str:
     return hashlib.sha256(snapshot_json.encode("utf-8")).hexdigest()
 
 
+def canonical_row(kind: str, data: dict[str, Any]) -> dict[str, Any]:
+    """Copy of a stream record's data with set-valued fields sorted."""
+    fields = [f for f in _SET_FIELDS.get(kind, ()) if isinstance(data.get(f), list)]
+    if not fields:
+        return data
+    return {**data, **{f: sorted(data[f]) for f in fields}}
+
+
+def row_hash(kind: str, data: dict[str, Any]) -> str:
+    """Content address of one entity row (pass it through ``canonical_row`` first)."""
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(f"{kind}\n{payload}".encode()).hexdigest()
+
+
+def manifest_hash(manifest: VersionManifest, config: dict[str, Any]) -> str:
+    """Hash identifying a brain state: its config plus every row hash."""
+    digest = hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode("utf-8"))
+    for (kind, entity_id), digest_hex in sorted(manifest.items()):
+        digest.update(f"\n{kind}\t{entity_id}\t{digest_hex}".encode())
+    return digest.hexdigest()
+
+
+def snapshot_manifest(
+    snapshot_json: str,
+) -> tuple[dict[str, Any], VersionManifest, dict[str, tuple[str, dict[str, Any]]]]:
+    """Split a legacy whole-snapshot version into header, manifest and rows.
+
+    Returns:
+        Tuple of (stream header record, manifest, ``{row_hash: (kind, data)}``)
+    """
+    from neural_memory.storage.brain_stream import snapshot_records
+
+    records = snapshot_records(_json_to_snapshot(snapshot_json))
+    header = next(records)
+    manifest: VersionManifest = {}
+    rows: dict[str, tuple[str, dict[str, Any]]] = {}
+    for record in records:
+        kind = record["kind"]
+        data = canonical_row(kind, record["data"])
+        digest_hex = row_hash(kind, data)
+        manifest[(kind, str(data[ENTITY_KEYS[kind]]))] = digest_hex
+        rows[digest_hex] = (kind, data)
+    return header, manifest, rows
+
+
+def manifest_snapshot(
+    header: dict[str, Any],
+    manifest: VersionManifest,
+    rows: dict[str, dict[str, Any]],
+) -> BrainSnapshot:
+    """Assemble a BrainSnapshot from a version's header, manifest and row payloads."""
+    from neural_memory.core.brain import BrainSnapshot
+
+    entities: dict[str, list[dict[str, Any]]] = {kind: [] for kind in ENTITY_KEYS}
+    for (kind, _), digest_hex in sorted(manifest.items()):
+        entities[kind].append(rows[digest_hex])
+    return BrainSnapshot(
+        brain_id=header["brain_id"],
+        brain_name=header["brain_name"],
+        exported_at=datetime.fromisoformat(header["exported_at"]),
+        version=header["version"],
+        neurons=entities["neuron"],
+        synapses=entities["synapse"],
+        fibers=entities["fiber"],
+        config=header.get("config", {}),
+        metadata={
+            "projects": entities["project"],
+            "typed_memories": entities["typed_memory"],
+        },
+    )
+
+
+def _changed_hashes(
+    from_manifest: VersionManifest,
+    to_manifest: VersionManifest,
+    kinds: Iterable[str],
+) -> set[str]:
+    """Row hashes of entities of ``kinds`` present in both manifests with different rows."""
+    wanted = set(kinds)
+    hashes: set[str] = set()
+    for key, old_hash in from_manifest.items():
+        new_hash = to_manifest.get(key)
+        if key[0] in wanted and new_hash is not None and new_hash != old_hash:
+            hashes.update((old_hash, new_hash))
+    return hashes
+
+
 def _compute_diff(
-    from_snapshot: BrainSnapshot,
-    to_snapshot: BrainSnapshot,
+    from_manifest: VersionManifest,
+    to_manifest: VersionManifest,
+    rows: dict[str, dict[str, Any]],
     from_version_id: str = "",
     to_version_id: str = "",
 ) -> VersionDiff:
-    """Compute diff between two snapshots.
+    """Compute diff between two version manifests.
 
-    Compares neurons by ID, synapses by ID, fibers by ID.
+    Entities are matched by ID. A neuron or synapse whose row hash is
+    unchanged is unchanged; for those whose hash differs, ``rows`` must
+    hold both payloads so the neuron content/type and synapse weight can
+    be compared.
 
     Args:
-        from_snapshot: Source snapshot to compare from.
-        to_snapshot: Target snapshot to compare to.
-        from_version_id: Version ID for the source snapshot.
-        to_version_id: Version ID for the target snapshot.
+        from_manifest: Source manifest to compare from.
+        to_manifest: Target manifest to compare to.
+        rows: Payloads by row hash for the changed neurons and synapses.
+        from_version_id: Version ID for the source manifest.
+        to_version_id: Version ID for the target manifest.
     """
-    # Neuron diff
-    from_neurons = {n["id"]: n for n in from_snapshot.neurons}
-    to_neurons = {n["id"]: n for n in to_snapshot.neurons}
 
-    from_neuron_ids = set(from_neurons.keys())
-    to_neuron_ids = set(to_neurons.keys())
+    def ids(manifest: VersionManifest, kind: str) -> set[str]:
+        return {entity_id for k, entity_id in manifest if k == kind}
+
+    def changed(kind: str) -> list[tuple[str, dict[str, Any], dict[str, Any]]]:
+        pairs = []
+        for entity_id in ids(from_manifest, kind) & ids(to_manifest, kind):
+            old_hash = from_manifest[(kind, entity_id)]
+            new_hash = to_manifest[(kind, entity_id)]
+            if old_hash != new_hash:
+                pairs.append((entity_id, rows[old_hash], rows[new_hash]))
+        return pairs
+
+    # Neuron diff
+    from_neuron_ids = ids(from_manifest, "neuron")
+    to_neuron_ids = ids(to_manifest, "neuron")
 
     neurons_added = tuple(sorted(to_neuron_ids - from_neuron_ids))
     neurons_removed = tuple(sorted(from_neuron_ids - to_neuron_ids))
-
-    neurons_modified: list[str] = []
-    for nid in from_neuron_ids & to_neuron_ids:
-        if from_neurons[nid].get("content") != to_neurons[nid].get("content") or from_neurons[
+    neurons_modified = tuple(
+        sorted(
             nid
-        ].get("type") != to_neurons[nid].get("type"):
-            neurons_modified.append(nid)
-    neurons_modified_tuple = tuple(sorted(neurons_modified))
+            for nid, old, new in changed("neuron")
+            if old.get("content") != new.get("content") or old.get("type") != new.get("type")
+        )
+    )
 
     # Synapse diff
-    from_synapses = {s["id"]: s for s in from_snapshot.synapses}
-    to_synapses = {s["id"]: s for s in to_snapshot.synapses}
-
-    from_synapse_ids = set(from_synapses.keys())
-    to_synapse_ids = set(to_synapses.keys())
+    from_synapse_ids = ids(from_manifest, "synapse")
+    to_synapse_ids = ids(to_manifest, "synapse")
 
     synapses_added = tuple(sorted(to_synapse_ids - from_synapse_ids))
     synapses_removed = tuple(sorted(from_synapse_ids - to_synapse_ids))
 
     weight_changes: list[tuple[str, float, float]] = []
-    for sid in from_synapse_ids & to_synapse_ids:
-        old_w = from_synapses[sid].get("weight", 0.0)
-        new_w = to_synapses[sid].get("weight", 0.0)
+    for sid, old, new in changed("synapse"):
+        old_w = old.get("weight", 0.0)
+        new_w = new.get("weight", 0.0)
         if abs(old_w - new_w) > 1e-6:
             weight_changes.append((sid, old_w, new_w))
     synapses_weight_changed = tuple(sorted(weight_changes, key=lambda x: x[0]))
 
     # Fiber diff
-    from_fibers = {f["id"] for f in from_snapshot.fibers}
-    to_fibers = {f["id"] for f in to_snapshot.fibers}
+    from_fibers = ids(from_manifest, "fiber")
+    to_fibers = ids(to_manifest, "fiber")
 
     fibers_added = tuple(sorted(to_fibers - from_fibers))
     fibers_removed = tuple(sorted(from_fibers - to_fibers))
@@ -165,8 +294,8 @@ def _compute_diff(
         parts.append(f"+{len(neurons_added)} neurons")
     if neurons_removed:
         parts.append(f"-{len(neurons_removed)} neurons")
-    if neurons_modified_tuple:
-        parts.append(f"~{len(neurons_modified_tuple)} neurons modified")
+    if neurons_modified:
+        parts.append(f"~{len(neurons_modified)} neurons modified")
     if synapses_added:
         parts.append(f"+{len(synapses_added)} synapses")
     if synapses_removed:
@@ -184,7 +313,7 @@ def _compute_diff(
         to_version=to_version_id,
         neurons_added=neurons_added,
         neurons_removed=neurons_removed,
-        neurons_modified=neurons_modified_tuple,
+        neurons_modified=neurons_modified,
         synapses_added=synapses_added,
         synapses_removed=synapses_removed,
         synapses_weight_changed=synapses_weight_changed,
@@ -200,7 +329,7 @@ def _compute_diff(
 class VersioningEngine:
     """Brain version control engine.
 
-    Creates snapshots of brain state, supports rollback and diff.
+    Records versions of brain state as manifests, supports rollback and diff.
     Delegates storage to the underlying NeuralStorage implementation.
     """
 
@@ -213,10 +342,12 @@ class VersioningEngine:
         version_name: str,
         description: str = "",
     ) -> BrainVersion:
-        """Create a new version snapshot of the current brain state.
+        """Create a new version of the current brain state.
+
+        Only rows that differ from the most recent version are written.
 
         Args:
-            brain_id: ID of the brain to snapshot
+            brain_id: ID of the brain to version
             version_name: User-provided name (must be unique per brain)
             description: Optional description
 
@@ -234,28 +365,63 @@ class VersioningEngine:
                     f"Version name '{version_name}' already exists for brain {brain_id}"
                 )
 
-        # Export current state
-        snapshot = await self._storage.export_brain(brain_id)
-        snapshot_json = _snapshot_to_json(snapshot)
-        snapshot_hash = _compute_hash(snapshot_json)
+        return await self._record_version(brain_id, version_name, description)
 
-        # Get next version number
-        version_number = await self._storage.get_next_version_number(brain_id)
+    async def _record_version(
+        self,
+        brain_id: str,
+        version_name: str,
+        description: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> BrainVersion:
+        """Save the current brain state as a delta against the latest version."""
+        from neural_memory.storage.brain_stream import read_header
+
+        latest = await self._storage.list_versions(brain_id, limit=1)
+        parent_id: str | None = latest[0].id if latest else None
+        parent: VersionManifest | None = None
+        if parent_id is not None:
+            parent = await self._storage.get_version_manifest(brain_id, parent_id)
+        if parent is None:
+            parent_id, parent = None, {}
+
+        # Hash the current state row by row; keep payloads only for changed rows
+        records = aiter(self._storage.export_brain_stream(brain_id))
+        header = await read_header(records)
+        manifest: VersionManifest = {}
+        changes: dict[tuple[str, str], str | None] = {}
+        rows: dict[str, tuple[str, dict[str, Any]]] = {}
+        async for record in records:
+            kind = record["kind"]
+            data = canonical_row(kind, record["data"])
+            key = (kind, str(data[ENTITY_KEYS[kind]]))
+            digest_hex = row_hash(kind, data)
+            manifest[key] = digest_hex
+            if parent.get(key) != digest_hex:
+                changes[key] = digest_hex
+                rows[digest_hex] = (kind, data)
+        for key in parent.keys() - manifest.keys():
+            changes[key] = None
+
+        counts = dict.fromkeys(ENTITY_KEYS, 0)
+        for kind, _ in manifest:
+            counts[kind] += 1
 
         version = BrainVersion(
             id=str(uuid4()),
             brain_id=brain_id,
             version_name=version_name,
-            version_number=version_number,
+            version_number=await self._storage.get_next_version_number(brain_id),
             description=description,
-            neuron_count=len(snapshot.neurons),
-            synapse_count=len(snapshot.synapses),
-            fiber_count=len(snapshot.fibers),
-            snapshot_hash=snapshot_hash,
+            neuron_count=counts["neuron"],
+            synapse_count=counts["synapse"],
+            fiber_count=counts["fiber"],
+            snapshot_hash=manifest_hash(manifest, header.get("config", {})),
             created_at=utcnow(),
+            metadata=metadata or {},
         )
 
-        await self._storage.save_version(brain_id, version, snapshot_json)
+        await self._storage.save_version_delta(brain_id, version, header, parent_id, changes, rows)
         return version
 
     async def list_versions(
@@ -288,7 +454,7 @@ class VersioningEngine:
         Returns:
             BrainVersion if found, None otherwise
         """
-        result = await self._storage.get_version(brain_id, version_id)
+        result = await self._storage.get_version_header(brain_id, version_id)
         if result is None:
             return None
         return result[0]
@@ -301,7 +467,7 @@ class VersioningEngine:
         """Rollback brain to a previous version.
 
         Creates a new version entry named 'rollback-to-{original_name}'
-        before restoring the old state.
+        after restoring the old state.
 
         Args:
             brain_id: Brain ID
@@ -313,14 +479,15 @@ class VersioningEngine:
         Raises:
             ValueError: If version_id not found
         """
-        result = await self._storage.get_version(brain_id, version_id)
-        if result is None:
+        result = await self._storage.get_version_header(brain_id, version_id)
+        manifest = await self._storage.get_version_manifest(brain_id, version_id)
+        if result is None or manifest is None:
             raise ValueError(f"Version {version_id} not found for brain {brain_id}")
 
-        target_version, snapshot_json = result
-        snapshot = _json_to_snapshot(snapshot_json)
+        target_version, header = result
+        # Read the target rows before clear(), which may drop version storage
+        records = [header] + [record async for record in self._version_records(brain_id, manifest)]
 
-        # Create a rollback version entry for the current state first
         rollback_name = f"rollback-to-{target_version.version_name}"
         # Ensure unique name — fetch ALL versions, not just the default page
         existing_names = {
@@ -332,41 +499,34 @@ class VersioningEngine:
                 suffix += 1
             rollback_name = f"{rollback_name}-{suffix}"
 
-        # Clear and reimport the target state
-        await self._storage.clear(brain_id)
-        # Re-create the brain entry
-        brain_data = snapshot.config
-        from neural_memory.core.brain import Brain, BrainConfig
-
-        config = BrainConfig(**brain_data) if brain_data else BrainConfig()
-        brain = Brain.create(
-            name=snapshot.brain_name,
-            config=config,
-            brain_id=brain_id,
-        )
-        await self._storage.save_brain(brain)
-        await self._storage.import_brain(snapshot, brain_id)
+        async def replay() -> AsyncIterator[dict[str, Any]]:
+            for record in records:
+                yield record
 
-        # Now create the rollback version
-        version_number = await self._storage.get_next_version_number(brain_id)
-        snapshot_hash = _compute_hash(snapshot_json)
+        # Clear and reimport the target state (the header re-creates the brain)
+        await self._storage.clear(brain_id)
+        await self._storage.import_brain_stream(replay(), brain_id)
 
-        rollback_version = BrainVersion(
-            id=str(uuid4()),
-            brain_id=brain_id,
-            version_name=rollback_name,
-            version_number=version_number,
-            description=f"Rollback to version '{target_version.version_name}'",
-            neuron_count=len(snapshot.neurons),
-            synapse_count=len(snapshot.synapses),
-            fiber_count=len(snapshot.fibers),
-            snapshot_hash=snapshot_hash,
-            created_at=utcnow(),
+        return await self._record_version(
+            brain_id,
+            rollback_name,
+            f"Rollback to version '{target_version.version_name}'",
             metadata={"rollback_from": version_id},
         )
 
-        await self._storage.save_version(brain_id, rollback_version, snapshot_json)
-        return rollback_version
+    async def _version_records(
+        self,
+        brain_id: str,
+        manifest: VersionManifest,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream records for a manifest's rows, in import dependency order."""
+        for kind in ENTITY_KEYS:
+            hashes = [h for (k, _), h in sorted(manifest.items()) if k == kind]
+            for start in range(0, len(hashes), _ROW_FETCH_SIZE):
+                batch = hashes[start : start + _ROW_FETCH_SIZE]
+                rows = await self._storage.get_version_rows(brain_id, batch)
+                for digest_hex in batch:
+                    yield {"kind": kind, "data": rows[digest_hex]}
 
     async def diff(
         self,
@@ -376,6 +536,8 @@ class VersioningEngine:
     ) -> VersionDiff:
         """Compute diff between two versions.
 
+        Compares manifests; only rows whose hash changed are loaded.
+
         Args:
             brain_id: Brain ID
             from_version_id: Source version ID
@@ -387,23 +549,21 @@ class VersioningEngine:
         Raises:
             ValueError: If either version not found
         """
-        from_result = await self._storage.get_version(brain_id, from_version_id)
-        if from_result is None:
+        from_manifest = await self._storage.get_version_manifest(brain_id, from_version_id)
+        if from_manifest is None:
             raise ValueError(f"Version {from_version_id} not found")
 
-        to_result = await self._storage.get_version(brain_id, to_version_id)
-        if to_result is None:
+        to_manifest = await self._storage.get_version_manifest(brain_id, to_version_id)
+        if to_manifest is None:
             raise ValueError(f"Version {to_version_id} not found")
 
-        from_version, from_json = from_result
-        to_version, to_json = to_result
-
-        from_snapshot = _json_to_snapshot(from_json)
-        to_snapshot = _json_to_snapshot(to_json)
+        changed = _changed_hashes(from_manifest, to_manifest, ("neuron", "synapse"))
+        rows = await self._storage.get_version_rows(brain_id, sorted(changed)) if changed else {}
 
         return _compute_diff(
-            from_snapshot,
-            to_snapshot,
+            from_manifest,
+            to_manifest,
+            rows,
             from_version_id=from_version_id,
             to_version_id=to_version_id,
         )
@@ -4,11 +4,13 @@ Provides automated memory maintenance:
 - Prune: Remove dead synapses and orphan neurons
 - Merge: Combine overlapping fibers
 - Summarize: Create concept neurons for topic clusters
+- Incremental: Prune/merge/mature/infer only around recently changed entities
 """
 
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
@@ -17,12 +19,19 @@ from uuid import uuid4
 
 from neural_memory.core.fiber import Fiber
 from neural_memory.core.neuron import Neuron, NeuronType
-from neural_memory.core.synapse import Synapse, SynapseType
+from neural_memory.core.synapse import Synapse, SynapseType, time_decay_factor
 from neural_memory.utils.timeutils import utcnow
 
 if TYPE_CHECKING:
+    from neural_memory.engine.memory_stages import MaturationRecord
     from neural_memory.storage.base import NeuralStorage
 
+# Callback type: (stage, items_done, items_total)
+ProgressCallback = Callable[[str, int, int], None]
+
+# Max neuron IDs per scoped storage query
+_SCOPE_CHUNK_SIZE = 500
+
 
 class ConsolidationStrategy(StrEnum):
     """Available consolidation strategies."""
@@ -35,6 +44,7 @@ class ConsolidationStrategy(StrEnum):
     ENRICH = "enrich"
     DREAM = "dream"
     LEARN_HABITS = "learn_habits"
+    INCREMENTAL = "incremental"
     ALL = "all"
 
 
@@ -54,6 +64,68 @@ class ConsolidationConfig:
     infer_max_per_run: int = 50
 
 
+@dataclass(frozen=True)
+class PrunePolicy:
+    """Decay and protection rules handed to a storage-level bulk prune.
+
+    Mirrors the per-synapse checks in ``ConsolidationEngine._prune`` so
+    both paths prune the same synapses.
+    """
+
+    weight_threshold: float
+    min_inactive_days: float
+    dream_decay_multiplier: float = 10.0
+    prune_isolated_neurons: bool = True
+    salience_threshold: float = 0.8
+    bridge_min_weight: float = 0.02
+
+    def decayed_weight(
+        self,
+        weight: float,
+        hours_since: float,
+        inferred: bool,
+        dream: bool,
+        reinforced_count: int,
+    ) -> float:
+        """Weight after time decay and the inferred/dream penalties."""
+        decayed = weight * time_decay_factor(hours_since)
+        if reinforced_count < 2:
+            # Inferred synapses with low reinforcement decay 2x faster,
+            # dream synapses Nx faster
+            if inferred:
+                decayed *= 0.5
+            if dream:
+                decayed *= max(0.0, min(1.0, 1.0 / self.dream_decay_multiplier))
+        return decayed
+
+
+@dataclass(frozen=True)
+class PruneResult:
+    """Counts returned by a storage-level bulk prune."""
+
+    synapses_pruned: int
+    neurons_pruned: int
+
+
+@dataclass(frozen=True)
+class DirtySet:
+    """Entities changed since the last consolidation checkpoint.
+
+    ``neuron_ids`` is the dirty neighbourhood: changed neurons plus the
+    endpoints of changed synapses and the members of changed fibers.
+    """
+
+    neuron_ids: frozenset[str]
+    synapse_ids: frozenset[str]
+    fiber_ids: frozenset[str]
+    checkpoint: int
+
+    @property
+    def is_empty(self) -> bool:
+        """True if nothing changed since the last checkpoint."""
+        return not (self.neuron_ids or self.synapse_ids or self.fiber_ids)
+
+
 @dataclass(frozen=True)
 class MergeDetail:
     """Details of a single fiber merge operation."""
@@ -139,6 +211,7 @@ class ConsolidationEngine:
         strategies: list[ConsolidationStrategy] | None = None,
         dry_run: bool = False,
         reference_time: datetime | None = None,
+        progress_callback: ProgressCallback | None = None,
     ) -> ConsolidationReport:
         """Run consolidation with specified strategies.
 
@@ -146,6 +219,7 @@ class ConsolidationEngine:
             strategies: List of strategies to run (default: all)
             dry_run: If True, calculate but don't apply changes
             reference_time: Reference time for age calculations
+            progress_callback: Optional progress callback for the prune stage
 
         Returns:
             ConsolidationReport with operation statistics
@@ -159,8 +233,16 @@ class ConsolidationEngine:
 
         run_all = ConsolidationStrategy.ALL in strategies
 
+        # A full run consolidates everything changed so far
+        checkpoint: DirtySet | None = None
+        if run_all and not dry_run:
+            checkpoint = await self._storage.get_dirty_set()
+
+        if ConsolidationStrategy.INCREMENTAL in strategies and not run_all:
+            await self._incremental(report, reference_time, dry_run, progress_callback)
+
         if run_all or ConsolidationStrategy.PRUNE in strategies:
-            await self._prune(report, reference_time, dry_run)
+            await self._prune(report, reference_time, dry_run, progress_callback)
 
         if run_all or ConsolidationStrategy.MERGE in strategies:
             await self._merge(report, dry_run)
@@ -183,19 +265,84 @@ class ConsolidationEngine:
         if run_all or ConsolidationStrategy.LEARN_HABITS in strategies:
             await self._learn_habits(report, reference_time, dry_run)
 
+        if checkpoint is not None:
+            await self._storage.clear_dirty_set(checkpoint.checkpoint)
+
         report.duration_ms = (time.perf_counter() - start) * 1000
         return report
 
+    async def _incremental(
+        self,
+        report: ConsolidationReport,
+        reference_time: datetime,
+        dry_run: bool,
+        progress_callback: ProgressCallback | None = None,
+    ) -> None:
+        """Prune, merge, mature and infer around entities changed since the last checkpoint.
+
+        Cost follows the size of the dirty neighbourhood, not the brain.
+        Time-driven work on untouched entities (decay of idle synapses,
+        stage transitions of idle fibers) is left to full runs. Writes made
+        by the run itself land after the checkpoint and are revisited once
+        by the next run. Backends without change tracking get the full
+        strategies instead.
+        """
+        dirty = await self._storage.get_dirty_set()
+        if dirty is None:
+            await self._prune(report, reference_time, dry_run, progress_callback)
+            await self._merge(report, dry_run)
+            await self._mature(report, reference_time, dry_run)
+            await self._infer(report, reference_time, dry_run)
+            return
+        if dirty.is_empty:
+            return
+
+        scope = set(dirty.neuron_ids)
+        await self._prune(report, reference_time, dry_run, progress_callback, scope=scope)
+        await self._merge(report, dry_run, fibers=await self._fibers_containing(scope))
+        # Re-select: merging replaced some of the fibers
+        await self._mature(
+            report, reference_time, dry_run, fibers=await self._fibers_containing(scope)
+        )
+        await self._infer(report, reference_time, dry_run, scope=scope)
+
+        if not dry_run:
+            await self._storage.clear_dirty_set(dirty.checkpoint)
+
     async def _prune(
         self,
         report: ConsolidationReport,
         reference_time: datetime,
         dry_run: bool,
+        progress_callback: ProgressCallback | None = None,
+        scope: set[str] | None = None,
     ) -> None:
-        """Prune weak synapses and orphan neurons."""
+        """Prune weak synapses and orphan neurons.
+
+        ``scope`` restricts a bulk-capable backend to synapses touching
+        those neurons; the per-synapse fallback always covers the whole brain.
+        """
         # Ensure brain context is set (validates state)
         self._storage._get_brain_id()  # type: ignore[attr-defined]
 
+        policy = PrunePolicy(
+            weight_threshold=self._config.prune_weight_threshold,
+            min_inactive_days=self._config.prune_min_inactive_days,
+            dream_decay_multiplier=self._dream_decay_multiplier,
+            prune_isolated_neurons=self._config.prune_isolated_neurons,
+        )
+        result = await self._storage.prune_bulk(
+            policy,
+            reference_time,
+            dry_run=dry_run,
+            progress_callback=progress_callback,
+            neuron_ids=scope,
+        )
+        if result is not None:
+            report.synapses_pruned += result.synapses_pruned
+            report.neurons_pruned += result.neurons_pruned
+            return
+
         # Get all synapses
         all_synapses = await self._storage.get_synapses()
         pruned_synapse_ids: set[str] = set()
@@ -302,13 +449,16 @@ class ConsolidationEngine:
         self,
         report: ConsolidationReport,
         dry_run: bool,
+        fibers: list[Fiber] | None = None,
     ) -> None:
         """Merge overlapping fibers using inverted index for O(n*m) performance.
 
         Instead of O(n²) pairwise comparison, builds a neuron→fiber inverted
-        index to find only fibers that actually share neurons.
+        index to find only fibers that actually share neurons. ``fibers``
+        limits the merge to a pre-selected neighbourhood.
         """
-        fibers = await self._storage.get_fibers(limit=10000)
+        if fibers is None:
+            fibers = await self._storage.get_fibers(limit=10000)
         if len(fibers) < 2:
             return
 
@@ -564,19 +714,21 @@ class ConsolidationEngine:
         report: ConsolidationReport,
         reference_time: datetime,
         dry_run: bool,
+        fibers: list[Fiber] | None = None,
     ) -> None:
         """Advance memory maturation stages and extract semantic patterns.
 
         1. Advance all maturation records through stage transitions
         2. Extract patterns from episodic memories ready for semantic promotion
+
+        ``fibers`` limits both steps to those fibers' records.
         """
         from neural_memory.engine.memory_stages import (
             compute_stage_transition,
         )
         from neural_memory.engine.pattern_extraction import extract_patterns
 
-        # Get all maturation records
-        all_maturations = await self._storage.find_maturations()
+        all_maturations = await self._find_maturations(fibers)
 
         # Phase 1: Advance stages
         for record in all_maturations:
@@ -591,10 +743,11 @@ class ConsolidationEngine:
             return
 
         # Re-fetch after stage updates
-        maturations = await self._storage.find_maturations()
+        maturations = await self._find_maturations(fibers)
         maturation_map = {m.fiber_id: m for m in maturations}
 
-        fibers = await self._storage.get_fibers(limit=10000)
+        if fibers is None:
+            fibers = await self._storage.get_fibers(limit=10000)
         patterns, extraction_report = extract_patterns(
             fibers=fibers,
             maturations=maturation_map,
@@ -614,6 +767,7 @@ class ConsolidationEngine:
         report: ConsolidationReport,
         reference_time: datetime,
         dry_run: bool,
+        scope: set[str] | None = None,
     ) -> None:
         """Run associative inference from co-activation data.
 
@@ -623,6 +777,9 @@ class ConsolidationEngine:
         4. Reinforce existing synapses for reinforce candidates
         5. Generate + apply associative tags
         6. Prune old co-activation events
+
+        ``scope`` keeps only pairs touching those neurons and loads
+        synapses and fibers for the involved neurons instead of the brain.
         """
         import logging
 
@@ -649,13 +806,17 @@ class ConsolidationEngine:
         counts = await self._storage.get_co_activation_counts(
             since=window_start,
             min_count=config.co_activation_threshold,
+            neuron_ids=scope,
         )
 
         if not counts:
             return
 
         # 2. Build existing synapse pairs set + lookup for reinforcement
-        all_synapses = await self._storage.get_synapses()
+        if scope is None:
+            all_synapses = await self._storage.get_synapses()
+        else:
+            all_synapses = await self._synapses_touching({n for c in counts for n in c[:2]})
         existing_pairs: set[tuple[str, str]] = set()
         synapse_by_pair: dict[tuple[str, str], Synapse] = {}
         for syn in all_synapses:
@@ -703,7 +864,10 @@ class ConsolidationEngine:
             neurons = await self._storage.get_neurons_batch(list(neuron_ids))
             content_map = {nid: n.content for nid, n in neurons.items()}
 
-            fibers = await self._storage.get_fibers(limit=10000)
+            if scope is None:
+                fibers = await self._storage.get_fibers(limit=10000)
+            else:
+                fibers = await self._fibers_containing(neuron_ids)
             existing_tags: set[str] = set()
             for f in fibers:
                 existing_tags |= f.tags
@@ -832,3 +996,44 @@ class ConsolidationEngine:
             report.action_events_pruned = habit_report.action_events_pruned
         except Exception:
             logger.debug("Habit learning failed (non-critical)", exc_info=True)
+
+    # ========== Scoped lookups ==========
+
+    async def _fibers_containing(self, neuron_ids: set[str]) -> list[Fiber]:
+        """Fibers containing any of the neurons, deduplicated."""
+        ids = sorted(neuron_ids)
+        seen: set[str] = set()
+        fibers: list[Fiber] = []
+        for i in range(0, len(ids), _SCOPE_CHUNK_SIZE):
+            batch = await self._storage.find_fibers_batch(
+                ids[i : i + _SCOPE_CHUNK_SIZE], limit_per_neuron=50
+            )
+            for fiber in batch:
+                if fiber.id not in seen:
+                    seen.add(fiber.id)
+                    fibers.append(fiber)
+        return fibers
+
+    async def _synapses_touching(self, neuron_ids: set[str]) -> list[Synapse]:
+        """Synapses with either endpoint in the neurons, deduplicated."""
+        ids = sorted(neuron_ids)
+        by_id: dict[str, Synapse] = {}
+        for i in range(0, len(ids), _SCOPE_CHUNK_SIZE):
+            chunk = ids[i : i + _SCOPE_CHUNK_SIZE]
+            for direction in ("out", "in"):
+                found = await self._storage.get_synapses_for_neurons(chunk, direction=direction)
+                for synapses in found.values():
+                    for synapse in synapses:
+                        by_id[synapse.id] = synapse
+        return list(by_id.values())
+
+    async def _find_maturations(self, fibers: list[Fiber] | None) -> list[MaturationRecord]:
+        """All maturation records, or only those of the given fibers."""
+        if fibers is None:
+            return await self._storage.find_maturations()
+        records: list[MaturationRecord] = []
+        for fiber in fibers:
+            record = await self._storage.get_maturation(fiber.id)
+            if record is not None:
+                records.append(record)
+        return records
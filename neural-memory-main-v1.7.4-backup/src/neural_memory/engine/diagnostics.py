@@ -3,24 +3,33 @@
 Computes composite purity score, individual metrics, and
 actionable warnings from the neural graph structure.
 Supports both MCP and CLI exposure.
+
+Metrics are derived from storage aggregates (``get_enhanced_stats`` and
+``get_health_stats``) rather than from loading the graph. Frequent
+callers (dashboard, MCP health tool) go through ``analyze_cached``,
+which serves a cached report within a staleness budget.
 """
 
 from __future__ import annotations
 
+import logging
 import math
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
 from neural_memory.core.synapse import SynapseType
-from neural_memory.engine.memory_stages import MemoryStage
+from neural_memory.storage.health_cache import health_cache_for
 from neural_memory.utils.tag_normalizer import TagNormalizer
 from neural_memory.utils.timeutils import utcnow
 
 if TYPE_CHECKING:
     from neural_memory.storage.base import NeuralStorage
 
+logger = logging.getLogger(__name__)
+
 
 # ── Data structures ──────────────────────────────────────────────
 
@@ -143,16 +152,14 @@ class DiagnosticsEngine:
 
         # Compute individual metrics
         synapse_stats = enhanced.get("synapse_stats", {})
-
-        # Fetch fibers once for freshness + diagnostics
-        fibers = await self._storage.get_fibers(limit=10000)
+        health = await self._storage.get_health_stats(brain_id, fresh_days=7)
 
         connectivity = self._compute_connectivity(synapse_count, neuron_count)
         diversity = self._compute_diversity(synapse_stats)
-        freshness = self._compute_freshness(fibers)
-        consolidation_ratio = await self._compute_consolidation_ratio(fiber_count)
-        orphan_rate = await self._compute_orphan_rate(neuron_count)
-        activation_efficiency = await self._compute_activation_efficiency(neuron_count)
+        freshness = self._ratio(health["fresh_fibers"], fiber_count)
+        consolidation_ratio = self._ratio(health["semantic_fibers"], fiber_count)
+        orphan_rate = self._ratio(health["orphan_neurons"], neuron_count)
+        activation_efficiency = self._ratio(health["activated_neurons"], neuron_count)
         recall_confidence = self._compute_recall_confidence(synapse_stats)
 
         # Compute purity score
@@ -195,7 +202,7 @@ class DiagnosticsEngine:
             orphan_rate=orphan_rate,
             consolidation_ratio=consolidation_ratio,
             freshness=freshness,
-            fibers=fibers,
+            fiber_tags=health["fiber_tags"],
             contradicts_count=contradicts_count,
         )
 
@@ -216,6 +223,22 @@ class DiagnosticsEngine:
             recommendations=tuple(recommendations),
         )
 
+    async def analyze_cached(self, brain_id: str) -> BrainHealthReport:
+        """Brain diagnostics served from the per-storage report cache.
+
+        Returns the cached report while it is within the staleness budget,
+        and the stale report (refreshing it in the background) after that.
+        Only the first call for a brain waits for ``analyze``.
+
+        Args:
+            brain_id: ID of the brain to analyze
+
+        Returns:
+            BrainHealthReport, at most ``HealthReportCache.max_age`` seconds
+            old plus the time of one refresh
+        """
+        return await health_cache_for(self._storage).get(brain_id, lambda: self.analyze(brain_id))
+
     # ── Metric computations ──────────────────────────────────────
 
     @staticmethod
@@ -264,51 +287,11 @@ class DiagnosticsEngine:
         return min(1.0, entropy / max_entropy)
 
     @staticmethod
-    def _compute_freshness(fibers: list[Any]) -> float:
-        """Compute fraction of fibers accessed/created in last 7 days."""
-        if not fibers:
-            return 0.0
-
-        now = utcnow()
-        cutoff = now - timedelta(days=7)
-        fresh_count = sum(1 for f in fibers if (f.last_conducted or f.created_at) >= cutoff)
-        return fresh_count / len(fibers)
-
-    async def _compute_consolidation_ratio(self, fiber_count: int) -> float:
-        """Compute fraction of fibers that reached SEMANTIC stage."""
-        if fiber_count == 0:
+    def _ratio(count: int, total: int) -> float:
+        """Fraction of ``total`` (freshness, consolidation, orphan, activation rates)."""
+        if total <= 0:
             return 0.0
-        semantic_records = await self._storage.find_maturations(
-            stage=MemoryStage.SEMANTIC,
-        )
-        return len(semantic_records) / fiber_count
-
-    async def _compute_orphan_rate(self, neuron_count: int) -> float:
-        """Compute fraction of neurons with zero synapses."""
-        if neuron_count == 0:
-            return 0.0
-
-        all_synapses = await self._storage.get_all_synapses()
-        connected: set[str] = set()
-        for s in all_synapses:
-            connected.add(s.source_id)
-            connected.add(s.target_id)
-
-        orphan_count = max(0, neuron_count - len(connected))
-        return orphan_count / neuron_count
-
-    async def _compute_activation_efficiency(self, neuron_count: int) -> float:
-        """Compute fraction of neurons that have been activated at least once.
-
-        Proxy metric: neurons with access_frequency > 0 indicate the brain
-        is actively utilizing its neural graph during retrieval.
-        """
-        if neuron_count == 0:
-            return 0.0
-
-        states = await self._storage.get_all_neuron_states()
-        activated_count = sum(1 for s in states if s.access_frequency > 0)
-        return activated_count / max(neuron_count, 1)
+        return min(1.0, count / total)
 
     @staticmethod
     def _compute_recall_confidence(synapse_stats: dict[str, Any]) -> float:
@@ -332,7 +315,8 @@ class DiagnosticsEngine:
         orphan_rate: float,
         consolidation_ratio: float,
         freshness: float,
-        fibers: list[Any],
+        fibers: Iterable[Any] = (),
+        fiber_tags: Iterable[str] = (),
         contradicts_count: int = 0,
     ) -> tuple[list[DiagnosticWarning], list[str]]:
         """Generate warnings and recommendations from metrics."""
@@ -405,7 +389,7 @@ class DiagnosticsEngine:
             )
 
         # Tag drift detection
-        all_tags: set[str] = set()
+        all_tags: set[str] = set(fiber_tags)
         for fiber in fibers:
             all_tags |= fiber.tags
         if all_tags:
@@ -2,14 +2,23 @@
 
 Processes markdown files into a neural memory brain by:
 1. Discovering and chunking documentation files
-2. Encoding each chunk through MemoryEncoder (full NLP pipeline)
+2. Encoding chunks through MemoryEncoder as a staged bulk pipeline:
+   extraction in a process pool, entity dedup across the run, and one
+   write transaction per chunk batch
 3. Building heading hierarchy as CONTAINS synapses
 4. Optionally running ENRICH consolidation for cross-linking
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+import multiprocessing
+import os
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -17,7 +26,7 @@ from typing import TYPE_CHECKING
 from neural_memory.core.neuron import Neuron, NeuronType
 from neural_memory.core.synapse import Synapse, SynapseType
 from neural_memory.engine.doc_chunker import DocChunk, chunk_markdown, discover_files
-from neural_memory.engine.encoder import MemoryEncoder
+from neural_memory.engine.encoder import ExtractedFeatures, MemoryEncoder, extract_features
 from neural_memory.utils.timeutils import utcnow
 
 if TYPE_CHECKING:
@@ -27,6 +36,22 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _extract_chunk_features(contents: list[str]) -> list[ExtractedFeatures | None]:
+    """Run extraction over a slice of chunk texts (executed in worker processes).
+
+    A chunk whose extraction raises yields None; the encoder then retries
+    extraction inline, keeping per-chunk error isolation.
+    """
+    results: list[ExtractedFeatures | None] = []
+    for content in contents:
+        try:
+            results.append(extract_features(content))
+        except Exception:
+            logger.debug("Feature extraction failed for chunk", exc_info=True)
+            results.append(None)
+    return results
+
+
 @dataclass(frozen=True)
 class TrainingConfig:
     """Configuration for doc-to-brain training.
@@ -43,6 +68,8 @@ class TrainingConfig:
             STM/WORKING stages since book-knowledge is not real-time memory).
         salience_ceiling: Cap initial fiber salience so doc chunks start weaker
             than organic memories and must earn salience through retrieval.
+        workers: Extraction worker processes (0 = one per CPU, 1 = inline).
+        batch_size: Chunks per extraction batch and per write transaction.
     """
 
     domain_tag: str = ""
@@ -54,6 +81,8 @@ class TrainingConfig:
     extensions: tuple[str, ...] = (".md",)
     initial_stage: str = "episodic"
     salience_ceiling: float = 0.5
+    workers: int = 0
+    batch_size: int = 64
 
 
 @dataclass(frozen=True)
@@ -113,12 +142,16 @@ class DocTrainer:
     - salience_ceiling=0.5: Doc chunks start weaker than organic memories
     - Per-chunk error isolation: One chunk failure doesn't abort the batch
     - Heading neuron deduplication: Checks storage before creating heading neurons
+    - Staged ingestion: extraction of the next chunk batch runs in a process
+      pool while the current batch is written in one transaction; repeated
+      entities are resolved against storage once per run
     """
 
     def __init__(self, storage: NeuralStorage, config: BrainConfig) -> None:
         self._storage = storage
         self._config = config
         self._encoder = MemoryEncoder(storage, config)
+        self._pool_failed = False
 
     async def train_directory(
         self,
@@ -221,7 +254,9 @@ class DocTrainer:
 
         This is the core pipeline:
         1. Create session-level TIME neuron (one per training run, not per chunk)
-        2. Encode each chunk via MemoryEncoder.encode() (skip conflicts + time neurons)
+        2. Encode chunks in batches via MemoryEncoder.encode() (skip conflicts +
+           time neurons): extraction for the next batch runs in worker
+           processes while the current batch is written in one transaction
         3. Build heading hierarchy as CONCEPT neurons + CONTAINS synapses
         4. Connect top-level headings to session TIME via HAPPENED_AT
         5. Create BEFORE synapses between sibling chunks for document order
@@ -251,60 +286,87 @@ class DocTrainer:
         heading_neuron_ids: dict[tuple[str, ...], str] = {}
         # Track chunk anchor neuron IDs for linking to heading neurons
         chunk_anchors: list[tuple[tuple[str, ...], str]] = []
-
-        for chunk in chunks:
-            tags: set[str] = {"doc_train"}
-            if tc.domain_tag:
-                tags.add(tc.domain_tag)
-
-            metadata: dict[str, object] = {
-                "type": tc.memory_type,
-                "source_file": chunk.source_file,
-                "heading": chunk.heading,
-                "heading_path": "|".join(chunk.heading_path),
-                "doc_train": True,
-            }
-
-            # Per-chunk error isolation: one failure doesn't abort the batch
-            try:
-                result = await self._encoder.encode(
-                    content=chunk.content,
-                    tags=tags,
-                    metadata=metadata,
-                    skip_conflicts=True,
-                    skip_time_neurons=True,
-                    initial_stage=tc.initial_stage,
-                    salience_ceiling=tc.salience_ceiling,
+        # Entity text → neuron, shared by every chunk of the run
+        entity_cache: dict[str, Neuron] = {}
+
+        tags: set[str] = {"doc_train"}
+        if tc.domain_tag:
+            tags.add(tc.domain_tag)
+
+        batch_size = max(1, tc.batch_size)
+        batches = [chunks[i : i + batch_size] for i in range(0, len(chunks), batch_size)]
+        workers = tc.workers or os.cpu_count() or 1
+
+        with self._extraction_pool(workers, len(batches)) as pool:
+            self._pool_failed = False
+            pending: asyncio.Task[list[ExtractedFeatures | None]] | None = None
+            for index, batch in enumerate(batches):
+                current = pending or asyncio.ensure_future(
+                    self._extract_batch(batch, pool, workers)
                 )
-            except Exception:
-                logger.warning(
-                    "Failed to encode chunk from %s heading=%s",
-                    chunk.source_file,
-                    chunk.heading,
-                    exc_info=True,
+                # Stage 1 for the next batch overlaps the writes of this one
+                pending = (
+                    asyncio.ensure_future(self._extract_batch(batches[index + 1], pool, workers))
+                    if index + 1 < len(batches)
+                    else None
                 )
-                chunks_failed += 1
-                continue
-
-            total_neurons += len(result.neurons_created)
-            total_synapses += len(result.synapses_created)
-            chunks_encoded += 1
-
-            # Record anchor for hierarchy linking
-            if chunk.heading_path:
-                chunk_anchors.append((chunk.heading_path, result.fiber.anchor_neuron_id))
+                features = await current
+
+                async with self._storage.batch():
+                    for chunk, chunk_features in zip(batch, features, strict=True):
+                        metadata: dict[str, object] = {
+                            "type": tc.memory_type,
+                            "source_file": chunk.source_file,
+                            "heading": chunk.heading,
+                            "heading_path": "|".join(chunk.heading_path),
+                            "doc_train": True,
+                        }
+
+                        # Per-chunk error isolation: one failure doesn't abort the batch
+                        try:
+                            result = await self._encoder.encode(
+                                content=chunk.content,
+                                tags=tags,
+                                metadata=metadata,
+                                skip_conflicts=True,
+                                skip_time_neurons=True,
+                                initial_stage=tc.initial_stage,
+                                salience_ceiling=tc.salience_ceiling,
+                                features=chunk_features,
+                                entity_cache=entity_cache,
+                            )
+                        except Exception:
+                            logger.warning(
+                                "Failed to encode chunk from %s heading=%s",
+                                chunk.source_file,
+                                chunk.heading,
+                                exc_info=True,
+                            )
+                            chunks_failed += 1
+                            continue
+
+                        total_neurons += len(result.neurons_created)
+                        total_synapses += len(result.synapses_created)
+                        chunks_encoded += 1
+
+                        # Record anchor for hierarchy linking
+                        if chunk.heading_path:
+                            chunk_anchors.append(
+                                (chunk.heading_path, result.fiber.anchor_neuron_id)
+                            )
 
         # Build heading hierarchy + temporal topology
-        hierarchy_synapses = await self._build_heading_hierarchy(
-            chunks=chunks,
-            heading_neuron_ids=heading_neuron_ids,
-            chunk_anchors=chunk_anchors,
-        )
-        session_synapses = await self._build_temporal_topology(
-            session_time_neuron_id=session_time_neuron.id,
-            heading_neuron_ids=heading_neuron_ids,
-            chunk_anchors=chunk_anchors,
-        )
+        async with self._storage.batch():
+            hierarchy_synapses = await self._build_heading_hierarchy(
+                chunks=chunks,
+                heading_neuron_ids=heading_neuron_ids,
+                chunk_anchors=chunk_anchors,
+            )
+            session_synapses = await self._build_temporal_topology(
+                session_time_neuron_id=session_time_neuron.id,
+                heading_neuron_ids=heading_neuron_ids,
+                chunk_anchors=chunk_anchors,
+            )
 
         # Run ENRICH consolidation if requested
         enrichment_synapses = 0
@@ -324,6 +386,56 @@ class DocTrainer:
             brain_name=tc.brain_name or "current",
         )
 
+    @contextmanager
+    def _extraction_pool(self, workers: int, batch_count: int) -> Iterator[Executor | None]:
+        """Process pool for stage-1 extraction, or None to extract inline.
+
+        Single-batch runs stay inline: spawning workers costs more than
+        the extraction it would offload.
+        """
+        if workers <= 1 or batch_count <= 1:
+            yield None
+            return
+        try:
+            pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        except (OSError, NotImplementedError, ValueError):
+            logger.debug("Process pool unavailable, extracting inline", exc_info=True)
+            yield None
+            return
+        try:
+            yield pool
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    async def _extract_batch(
+        self, batch: list[DocChunk], pool: Executor | None, workers: int
+    ) -> list[ExtractedFeatures | None]:
+        """Run stage-1 extraction for one chunk batch, split across the pool.
+
+        Without a usable pool every entry is None and the encoder extracts
+        inline. A pool that breaks once is not retried for the rest of the run.
+        """
+        contents = [chunk.content for chunk in batch]
+        if pool is None or self._pool_failed:
+            return [None] * len(contents)
+
+        loop = asyncio.get_running_loop()
+        step = max(1, math.ceil(len(contents) / workers))
+        try:
+            parts = await asyncio.gather(
+                *(
+                    loop.run_in_executor(pool, _extract_chunk_features, contents[i : i + step])
+                    for i in range(0, len(contents), step)
+                )
+            )
+        except Exception:
+            logger.warning("Extraction workers failed, extracting inline", exc_info=True)
+            self._pool_failed = True
+            return [None] * len(contents)
+        return [features for part in parts for features in part]
+
     async def _build_heading_hierarchy(
         self,
         *,
@@ -339,7 +451,8 @@ class DocTrainer:
 
         Returns the number of hierarchy synapses created.
         """
-        synapse_count = 0
+        new_headings: list[Neuron] = []
+        synapses: list[Synapse] = []
 
         # Collect all unique heading paths from chunks
         all_paths: set[tuple[str, ...]] = set()
@@ -377,9 +490,11 @@ class DocTrainer:
                         "doc_heading": True,
                     },
                 )
-                await self._storage.add_neuron(neuron)
+                new_headings.append(neuron)
                 heading_neuron_ids[path] = neuron.id
 
+        await self._storage.add_neurons_bulk(new_headings)
+
         # Create CONTAINS synapses: parent heading → child heading
         for path in sorted(all_paths, key=len):
             if len(path) > 1:
@@ -393,8 +508,7 @@ class DocTrainer:
                         type=SynapseType.CONTAINS,
                         weight=0.9,
                     )
-                    await self._storage.add_synapse(synapse)
-                    synapse_count += 1
+                    synapses.append(synapse)
 
         # Create CONTAINS synapses: leaf heading → chunk anchor
         for heading_path, anchor_id in chunk_anchors:
@@ -406,10 +520,10 @@ class DocTrainer:
                     type=SynapseType.CONTAINS,
                     weight=0.8,
                 )
-                await self._storage.add_synapse(synapse)
-                synapse_count += 1
+                synapses.append(synapse)
 
-        return synapse_count
+        await self._storage.add_synapses_bulk(synapses)
+        return len(synapses)
 
     async def _build_temporal_topology(
         self,
@@ -429,7 +543,7 @@ class DocTrainer:
         """
         # Weight just above activation_threshold (0.2) to be traversable
         doc_sequence_weight = 0.25
-        synapse_count = 0
+        synapses: list[Synapse] = []
 
         # Connect top-level heading neurons to session TIME neuron
         for path, neuron_id in heading_neuron_ids.items():
@@ -440,8 +554,7 @@ class DocTrainer:
                     type=SynapseType.HAPPENED_AT,
                     weight=0.3,
                 )
-                await self._storage.add_synapse(synapse)
-                synapse_count += 1
+                synapses.append(synapse)
 
         # Create BEFORE synapses between sibling chunks under same heading
         # (preserves local document order without runaway activation chains)
@@ -458,10 +571,10 @@ class DocTrainer:
                     weight=doc_sequence_weight,
                     metadata={"doc_sequence": True},
                 )
-                await self._storage.add_synapse(synapse)
-                synapse_count += 1
+                synapses.append(synapse)
 
-        return synapse_count
+        await self._storage.add_synapses_bulk(synapses)
+        return len(synapses)
 
     async def _run_enrichment(self) -> int:
         """Run ENRICH consolidation to create cross-cluster links."""
@@ -5,6 +5,7 @@ Enable via BrainConfig(embedding_enabled=True).
 """
 
 from neural_memory.engine.embedding.config import EmbeddingConfig
+from neural_memory.engine.embedding.factory import create_embedding_provider
 from neural_memory.engine.embedding.provider import EmbeddingProvider
 
-__all__ = ["EmbeddingConfig", "EmbeddingProvider"]
+__all__ = ["EmbeddingConfig", "EmbeddingProvider", "create_embedding_provider"]
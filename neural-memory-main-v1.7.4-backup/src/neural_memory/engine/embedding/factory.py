@@ -0,0 +1,51 @@
+"""Embedding provider selection from brain configuration."""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from neural_memory.core.brain import BrainConfig
+    from neural_memory.engine.embedding.provider import EmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+
+def create_embedding_provider(config: BrainConfig) -> EmbeddingProvider | None:
+    """Return the embedding provider a brain is configured for.
+
+    Providers are shared per (provider, model), so a model is loaded once
+    per process rather than once per request.
+
+    Args:
+        config: Brain configuration
+
+    Returns:
+        The provider, or None when embedding is disabled or the provider
+        cannot be set up (the embedding layer is optional)
+    """
+    if not config.embedding_enabled or not config.embedding_provider:
+        return None
+    return _shared_provider(config.embedding_provider, config.embedding_model)
+
+
+@lru_cache(maxsize=8)
+def _shared_provider(provider: str, model: str) -> EmbeddingProvider | None:
+    try:
+        if provider == "sentence_transformer":
+            from neural_memory.engine.embedding.sentence_transformer import (
+                SentenceTransformerEmbedding,
+            )
+
+            return SentenceTransformerEmbedding(model)
+        if provider == "openai":
+            from neural_memory.engine.embedding.openai_embedding import OpenAIEmbedding
+
+            return OpenAIEmbedding(model)
+    except ValueError:
+        logger.warning("Embedding provider %s unavailable", provider, exc_info=True)
+        return None
+    logger.warning("Unknown embedding provider %r", provider)
+    return None
@@ -0,0 +1,563 @@
+"""Persistent float32 vector index for embedding anchor lookup.
+
+Vectors live in a memory-mapped ``<name>.vec`` file (row-major float32,
+L2-normalized) next to the SQLite database; row ownership is recorded in an
+append-only ``<name>.ids`` log (``row<TAB>id`` to assign, ``row<TAB>`` to
+free) that is replayed on open and compacted when it grows stale.
+
+Small indexes are searched exhaustively with one mat-vec. Past
+``_IVF_MIN_VECTORS`` rows an IVF (inverted file) coarse quantizer is
+trained with a few k-means rounds and only the ``nprobe`` closest lists
+are scanned. New vectors are assigned to their nearest list incrementally;
+the quantizer is retrained once the index has doubled since training.
+Training runs in a worker thread (``asyncio.to_thread``) while searches
+keep using the previous quantizer or the exhaustive scan; the centroids
+(``<name>.centroids.npy``) and list assignments (``<name>.ivf``, a
+memory-mapped int32 per row) are saved so reopening does not retrain.
+
+Memories stored before a brain had an index (or with a provider that was
+not wired in) are added by ``backfill_vector_index``; until it has run,
+``VectorIndex.backfilled`` is False and callers keep their legacy scan.
+
+Requires ``numpy`` (``pip install neural-memory[fast]``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - exercised only without numpy
+    raise ImportError(
+        "numpy is required for the persistent vector index. "
+        "Install it with: pip install neural-memory[fast]"
+    ) from exc
+
+if TYPE_CHECKING:
+    from neural_memory.core.neuron import Neuron
+    from neural_memory.engine.embedding.provider import EmbeddingProvider
+    from neural_memory.storage.base import NeuralStorage
+
+logger = logging.getLogger(__name__)
+
+_INITIAL_CAPACITY = 1024
+_IVF_MIN_VECTORS = 4096
+_IVF_TRAIN_SAMPLE = 50_000
+_IVF_ITERATIONS = 8
+_DEFAULT_NPROBE = 8
+_ASSIGN_CHUNK = 8192
+_BACKFILL_BATCH = 64
+_BACKFILL_PAGE = 500
+
+
+class VectorIndex:
+    """Memory-mapped top-k cosine index keyed by string IDs."""
+
+    def __init__(self, directory: Path, name: str, dimension: int) -> None:
+        """
+        Open (or create) an index.
+
+        If the stored dimension differs from ``dimension`` (the embedding
+        model changed), the old index is discarded.
+
+        Args:
+            directory: Directory holding the index files
+            name: File stem, typically the brain ID
+            dimension: Embedding dimensionality
+        """
+        if dimension <= 0:
+            raise ValueError(f"dimension must be positive, got {dimension}")
+
+        self._dir = directory
+        self._name = name
+        self._dim = dimension
+        self._vec_path = directory / f"{name}.vec"
+        self._ids_path = directory / f"{name}.ids"
+        self._meta_path = directory / f"{name}.json"
+        self._centroids_path = directory / f"{name}.centroids.npy"
+        self._assign_path = directory / f"{name}.ivf"
+
+        self._row_ids: list[str | None] = []
+        self._rows: dict[str, int] = {}
+        self._free: list[int] = []
+        self._log_entries = 0
+
+        self._centroids: Any = None
+        self._assign: Any = None
+        self._trained_count = 0
+        self._training: asyncio.Task[None] | None = None
+        # Rows added or removed while a training run is in progress
+        self._pending: set[int] | None = None
+        self._backfilled = False
+
+        directory.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    # ========== Public API ==========
+
+    @property
+    def dimension(self) -> int:
+        """Vector dimensionality."""
+        return self._dim
+
+    @property
+    def backfilled(self) -> bool:
+        """Whether existing memories have been added (see ``backfill_vector_index``)."""
+        return self._backfilled
+
+    @backfilled.setter
+    def backfilled(self, value: bool) -> None:
+        self._backfilled = value
+        self._write_meta()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._rows
+
+    def add(self, item_id: str, vector: list[float]) -> None:
+        """Insert or replace the vector for ``item_id``."""
+        vec = self._normalize(vector)
+        row = self._rows.get(item_id)
+        if row is None:
+            row = self._allocate_row()
+            self._rows[item_id] = row
+            self._row_ids[row] = item_id
+            self._append_log(f"{row}\t{item_id}\n")
+        self._matrix[row] = vec
+
+        if self._pending is not None:
+            self._pending.add(row)
+        if self._centroids is not None:
+            self._assign[row] = int(np.argmax(self._centroids @ vec))
+        self._maybe_train()
+
+    def remove(self, item_id: str) -> bool:
+        """Remove the vector for ``item_id``; returns False if absent."""
+        row = self._rows.pop(item_id, None)
+        if row is None:
+            return False
+        self._row_ids[row] = None
+        self._free.append(row)
+        self._matrix[row] = 0.0
+        if self._pending is not None:
+            self._pending.add(row)
+        if self._assign is not None:
+            self._assign[row] = -1
+        self._append_log(f"{row}\t\n")
+        return True
+
+    def search(
+        self,
+        query: list[float],
+        k: int = 10,
+        min_similarity: float = 0.0,
+        nprobe: int = _DEFAULT_NPROBE,
+    ) -> list[tuple[str, float]]:
+        """
+        Find the ``k`` most similar vectors.
+
+        Args:
+            query: Query embedding
+            k: Number of results
+            min_similarity: Drop results below this cosine similarity
+            nprobe: IVF lists to scan (ignored for exhaustive search)
+
+        Returns:
+            (item_id, similarity) pairs, most similar first
+        """
+        if not self._rows or k <= 0:
+            return []
+        q = self._normalize(query)
+        used = len(self._row_ids)
+
+        if self._centroids is not None:
+            probes = np.argsort(self._centroids @ q)[::-1][:nprobe]
+            candidates = np.nonzero(np.isin(self._assign[:used], probes))[0]
+            scores = self._matrix[candidates] @ q
+        else:
+            candidates = np.arange(used)
+            scores = self._matrix[:used] @ q
+
+        if scores.size == 0:
+            return []
+        top = min(k, scores.size)
+        best = np.argpartition(-scores, top - 1)[:top]
+        best = best[np.argsort(-scores[best])]
+
+        results: list[tuple[str, float]] = []
+        for pos in best.tolist():
+            score = float(scores[pos])
+            if score < min_similarity:
+                break
+            item_id = self._row_ids[int(candidates[pos])]
+            if item_id is not None:
+                results.append((item_id, score))
+        return results
+
+    async def wait_trained(self) -> None:
+        """Wait for a background quantizer training run, if one is in progress."""
+        if self._training is not None:
+            await asyncio.shield(self._training)
+
+    def clear(self) -> None:
+        """Drop every vector and reset the files."""
+        self._cancel_training()
+        self._row_ids = []
+        self._rows = {}
+        self._free = []
+        self._drop_ivf()
+        self._backfilled = False
+        self._open_matrix(_INITIAL_CAPACITY, reset=True)
+        self._ids_path.write_text("", encoding="utf-8")
+        self._log_entries = 0
+
+    def flush(self) -> None:
+        """Flush vectors to disk and compact the ID log if it is mostly stale."""
+        self._matrix.flush()
+        if self._assign is not None:
+            self._assign.flush()
+        if self._log_entries > 2 * max(len(self._rows), _INITIAL_CAPACITY):
+            self._rewrite_log()
+
+    def close(self) -> None:
+        """Flush and release the memory maps."""
+        self._cancel_training()
+        self.flush()
+        del self._matrix
+        self._assign = None
+
+    # ========== Persistence ==========
+
+    def _load(self) -> None:
+        capacity = _INITIAL_CAPACITY
+        stored_dim = None
+        trained_count = 0
+        if self._meta_path.exists():
+            meta = json.loads(self._meta_path.read_text(encoding="utf-8"))
+            stored_dim = meta.get("dimension")
+            capacity = int(meta.get("capacity", _INITIAL_CAPACITY))
+            trained_count = int(meta.get("trained_count", 0))
+            self._backfilled = bool(meta.get("backfilled", False))
+
+        if stored_dim is not None and stored_dim != self._dim:
+            logger.warning(
+                "Vector index %s has dimension %s, expected %s; rebuilding",
+                self._name,
+                stored_dim,
+                self._dim,
+            )
+            self._backfilled = False
+            self._drop_ivf()
+            self._open_matrix(_INITIAL_CAPACITY, reset=True)
+            self._ids_path.write_text("", encoding="utf-8")
+            return
+
+        reset = not self._vec_path.exists()
+        if reset:
+            self._backfilled = False
+            self._drop_ivf()
+        self._open_matrix(capacity, reset=reset)
+        if reset or not self._ids_path.exists():
+            self._ids_path.write_text("", encoding="utf-8")
+            return
+
+        with self._ids_path.open(encoding="utf-8") as fh:
+            for line in fh:
+                row_str, _, item_id = line.rstrip("\n").partition("\t")
+                if not row_str:
+                    continue
+                row = int(row_str)
+                self._log_entries += 1
+                while len(self._row_ids) <= row:
+                    self._row_ids.append(None)
+                previous = self._row_ids[row]
+                if previous is not None:
+                    self._rows.pop(previous, None)
+                self._row_ids[row] = item_id or None
+                if item_id:
+                    self._rows[item_id] = row
+
+        self._free = [row for row, item_id in enumerate(self._row_ids) if item_id is None]
+        self._load_ivf(trained_count)
+        self._maybe_train()
+
+    def _load_ivf(self, trained_count: int) -> None:
+        """Reopen the saved quantizer, if it matches the current files."""
+        if not trained_count or not self._centroids_path.exists():
+            return
+        if not self._assign_path.exists():
+            return
+        if self._assign_path.stat().st_size != self._capacity * 4:
+            return
+        centroids = np.load(self._centroids_path)
+        if centroids.ndim != 2 or centroids.shape[1] != self._dim:
+            return
+        self._centroids = centroids.astype(np.float32)
+        self._assign = np.memmap(
+            self._assign_path, dtype=np.int32, mode="r+", shape=(self._capacity,)
+        )
+        self._trained_count = trained_count
+        self._write_meta()
+
+        # Rows whose assignment was not flushed before the last shutdown
+        live = self._live_rows()
+        missing = live[self._assign[live] < 0]
+        if missing.size:
+            self._assign[missing] = self._nearest_rows(missing, self._centroids)
+
+    def _open_matrix(self, capacity: int, reset: bool = False) -> None:
+        mode: Literal["w+", "r+"] = "w+" if reset else "r+"
+        self._matrix: Any = np.memmap(
+            self._vec_path, dtype=np.float32, mode=mode, shape=(capacity, self._dim)
+        )
+        self._capacity = capacity
+        self._write_meta()
+
+    def _open_assign(self, capacity: int, reset: bool = False) -> None:
+        """(Re)map the per-row list assignments; new rows start unassigned (-1)."""
+        kept = 0
+        if self._assign is not None and not reset:
+            kept = len(self._assign)
+            self._assign.flush()
+        self._assign = None
+        if not reset:
+            with self._assign_path.open("r+b") as fh:
+                fh.truncate(capacity * 4)
+        mode: Literal["w+", "r+"] = "w+" if reset else "r+"
+        self._assign = np.memmap(self._assign_path, dtype=np.int32, mode=mode, shape=(capacity,))
+        self._assign[kept:] = -1
+
+    def _drop_ivf(self) -> None:
+        self._centroids = None
+        self._assign = None
+        self._trained_count = 0
+        self._centroids_path.unlink(missing_ok=True)
+        self._assign_path.unlink(missing_ok=True)
+
+    def _write_meta(self) -> None:
+        meta = {
+            "dimension": self._dim,
+            "capacity": self._capacity,
+            "backfilled": self._backfilled,
+            "trained_count": self._trained_count,
+        }
+        self._meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+    def _allocate_row(self) -> int:
+        if self._free:
+            return self._free.pop()
+        row = len(self._row_ids)
+        if row >= self._capacity:
+            self._grow(self._capacity * 2)
+        self._row_ids.append(None)
+        return row
+
+    def _grow(self, capacity: int) -> None:
+        self._matrix.flush()
+        del self._matrix
+        with self._vec_path.open("r+b") as fh:
+            fh.truncate(capacity * self._dim * 4)
+        self._open_matrix(capacity)
+        if self._assign is not None:
+            self._open_assign(capacity)
+
+    def _append_log(self, line: str) -> None:
+        with self._ids_path.open("a", encoding="utf-8") as fh:
+            fh.write(line)
+        self._log_entries += 1
+
+    def _rewrite_log(self) -> None:
+        tmp = self._ids_path.with_suffix(".ids.tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            for item_id, row in self._rows.items():
+                fh.write(f"{row}\t{item_id}\n")
+        tmp.replace(self._ids_path)
+        self._log_entries = len(self._rows)
+
+    # ========== IVF ==========
+
+    def _maybe_train(self) -> None:
+        """Start (re)training once the index is big enough or has doubled.
+
+        With a running event loop the work is handed to a worker thread and
+        ``add()`` returns immediately; without one (scripts, sync callers)
+        there is no loop to block, so it trains inline.
+        """
+        count = len(self._rows)
+        if count < _IVF_MIN_VECTORS or self._training is not None:
+            return
+        if self._centroids is not None and count < 2 * self._trained_count:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            live = self._live_rows()
+            centroids = self._fit(self._training_sample(live), self._list_count(live))
+            self._install(centroids, live, self._nearest_rows(live, centroids))
+            return
+        self._pending = set()
+        self._training = loop.create_task(self._train_in_background())
+
+    async def _train_in_background(self) -> None:
+        live = self._live_rows()
+        try:
+            centroids = await asyncio.to_thread(
+                self._fit, self._training_sample(live), self._list_count(live)
+            )
+            labels = np.empty(live.size, dtype=np.int32)
+            for start in range(0, live.size, _ASSIGN_CHUNK):
+                # Copy each block on the loop: the map may be regrown meanwhile
+                block = np.asarray(self._matrix[live[start : start + _ASSIGN_CHUNK]])
+                labels[start : start + block.shape[0]] = await asyncio.to_thread(
+                    self._nearest, block, centroids
+                )
+            self._install(centroids, live, labels)
+        except Exception:
+            logger.warning("Vector index %s: quantizer training failed", self._name, exc_info=True)
+        finally:
+            if self._training is asyncio.current_task():
+                self._training = None
+                self._pending = None
+
+    def _cancel_training(self) -> None:
+        if self._training is not None:
+            self._training.cancel()
+        self._training = None
+        self._pending = None
+
+    def _install(self, centroids: Any, live: Any, labels: Any) -> None:
+        """Swap in a trained quantizer and save it next to the matrix."""
+        # Invalidate the saved quantizer until the new one is fully written
+        self._trained_count = 0
+        self._write_meta()
+        tmp = self._centroids_path.with_name(f"{self._name}.centroids.tmp.npy")
+        np.save(tmp, centroids)
+        tmp.replace(self._centroids_path)
+
+        self._open_assign(self._capacity, reset=True)
+        self._assign[live] = labels
+        self._centroids = centroids
+        if self._pending:
+            changed = np.fromiter(self._pending, dtype=np.int64)
+            self._assign[changed] = -1
+            written = np.array(
+                [row for row in changed.tolist() if self._row_ids[row] is not None],
+                dtype=np.int64,
+            )
+            if written.size:
+                self._assign[written] = self._nearest_rows(written, centroids)
+            self._pending = set()
+        self._assign.flush()
+        self._trained_count = live.size
+        self._write_meta()
+
+    def _training_sample(self, live: Any) -> Any:
+        """Copy the rows k-means is fitted on, so the worker never reads the map."""
+        sample = live
+        if sample.size > _IVF_TRAIN_SAMPLE:
+            sample = np.random.default_rng(0).choice(live, _IVF_TRAIN_SAMPLE, replace=False)
+        return np.asarray(self._matrix[sample])
+
+    @staticmethod
+    def _list_count(live: Any) -> int:
+        return max(1, int(math.sqrt(live.size)))
+
+    @staticmethod
+    def _fit(data: Any, n_lists: int) -> Any:
+        """Spherical k-means over a copied sample (safe to run in a thread)."""
+        rng = np.random.default_rng(0)
+        centroids = data[rng.choice(data.shape[0], n_lists, replace=False)].copy()
+        for _ in range(_IVF_ITERATIONS):
+            labels = np.argmax(data @ centroids.T, axis=1)
+            for c in range(n_lists):
+                members = data[labels == c]
+                if members.size:
+                    centroids[c] = members.sum(axis=0)
+            norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+            centroids /= np.where(norms == 0, 1.0, norms)
+        return centroids.astype(np.float32)
+
+    @staticmethod
+    def _nearest(block: Any, centroids: Any) -> Any:
+        return np.argmax(block @ centroids.T, axis=1).astype(np.int32)
+
+    def _nearest_rows(self, rows: Any, centroids: Any) -> Any:
+        labels = np.empty(rows.size, dtype=np.int32)
+        for start in range(0, rows.size, _ASSIGN_CHUNK):
+            chunk = rows[start : start + _ASSIGN_CHUNK]
+            labels[start : start + chunk.size] = self._nearest(self._matrix[chunk], centroids)
+        return labels
+
+    def _live_rows(self) -> Any:
+        return np.fromiter(self._rows.values(), dtype=np.int64, count=len(self._rows))
+
+    # ========== Helpers ==========
+
+    def _normalize(self, vector: list[float]) -> Any:
+        vec = np.asarray(vector, dtype=np.float32)
+        if vec.shape != (self._dim,):
+            raise ValueError(f"Expected vector of dimension {self._dim}, got {vec.shape}")
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm > 0 else vec
+
+
+async def backfill_vector_index(
+    index: VectorIndex,
+    storage: NeuralStorage,
+    provider: EmbeddingProvider,
+    brain_id: str,
+) -> int:
+    """Add a brain's existing memories to its index.
+
+    Neurons are read a page at a time from ``brain_id`` (not whichever
+    brain the storage has selected when this runs). Neurons carrying a
+    legacy ``_embedding`` of the index dimension are added as is; other
+    memory anchors not yet indexed are embedded in batches, as the encoder
+    would have. Marks the index backfilled.
+
+    Args:
+        index: The brain's vector index
+        storage: Storage holding the brain
+        provider: Embedding provider matching the index dimension
+        brain_id: The brain the index belongs to
+
+    Returns:
+        Number of vectors added
+    """
+    added = 0
+    after_id: str | None = None
+    while True:
+        page = await storage.get_neurons_page(brain_id, after_id, _BACKFILL_PAGE)
+        if not page:
+            break
+        after_id = page[-1].id
+
+        to_embed: list[Neuron] = []
+        for neuron in page:
+            if neuron.id in index:
+                continue
+            stored = neuron.metadata.get("_embedding")
+            if isinstance(stored, list) and len(stored) == index.dimension:
+                index.add(neuron.id, stored)
+                added += 1
+            elif neuron.metadata.get("is_anchor"):
+                to_embed.append(neuron)
+
+        for start in range(0, len(to_embed), _BACKFILL_BATCH):
+            batch = to_embed[start : start + _BACKFILL_BATCH]
+            vectors = await provider.embed_batch([neuron.content for neuron in batch])
+            for neuron, vector in zip(batch, vectors, strict=True):
+                index.add(neuron.id, vector)
+            added += len(batch)
+
+    index.flush()
+    index.backfilled = True
+    return added
@@ -3,19 +3,26 @@
 from __future__ import annotations
 
 import logging
+from collections import ChainMap
+from collections.abc import MutableMapping
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from neural_memory.core.fiber import Fiber
 from neural_memory.core.memory_types import suggest_memory_type
 from neural_memory.core.neuron import Neuron, NeuronType
 from neural_memory.core.synapse import Synapse, SynapseType
-from neural_memory.extraction.entities import EntityExtractor, EntityType
-from neural_memory.extraction.keywords import extract_keywords, extract_weighted_keywords
-from neural_memory.extraction.relations import RelationExtractor
-from neural_memory.extraction.sentiment import SentimentExtractor, Valence
-from neural_memory.extraction.temporal import TemporalExtractor
+from neural_memory.extraction.entities import Entity, EntityExtractor, EntityType
+from neural_memory.extraction.keywords import (
+    WeightedKeyword,
+    extract_keywords,
+    extract_weighted_keywords,
+)
+from neural_memory.extraction.relations import RelationCandidate, RelationExtractor
+from neural_memory.extraction.sentiment import SentimentExtractor, SentimentResult, Valence
+from neural_memory.extraction.temporal import TemporalExtractor, TimeHint
 from neural_memory.utils.simhash import is_near_duplicate, simhash
 from neural_memory.utils.tag_normalizer import TagNormalizer
 from neural_memory.utils.timeutils import utcnow
@@ -24,6 +31,7 @@ logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from neural_memory.core.brain import BrainConfig
+    from neural_memory.engine.embedding.provider import EmbeddingProvider
     from neural_memory.storage.base import NeuralStorage
 
 
@@ -46,6 +54,86 @@ class EncodingResult:
     conflicts_detected: int = 0
 
 
+@dataclass(frozen=True)
+class ExtractedFeatures:
+    """
+    Output of the CPU-bound extraction stage for one piece of content.
+
+    Plain picklable data, so it can be produced in a worker process by
+    ``extract_features`` and handed to ``MemoryEncoder.encode(features=...)``.
+
+    Attributes:
+        entities: Named entities, in extraction order
+        keywords: Keywords, most important first
+        weighted_keywords: Keywords with importance weights
+        relations: Causal/comparative/sequential relation candidates
+        sentiment: Valence and emotion tags
+        time_hints: Temporal expressions (empty when no reference time was given)
+        content_hash: SimHash of the content
+        memory_type: Suggested memory type value
+    """
+
+    entities: list[Entity]
+    keywords: list[str]
+    weighted_keywords: list[WeightedKeyword]
+    relations: list[RelationCandidate]
+    sentiment: SentimentResult
+    time_hints: list[TimeHint]
+    content_hash: int
+    memory_type: str
+
+
+def _run_extractors(
+    content: str,
+    language: str,
+    reference_time: datetime | None,
+    temporal: TemporalExtractor,
+    entity: EntityExtractor,
+    relation: RelationExtractor,
+    sentiment: SentimentExtractor,
+) -> ExtractedFeatures:
+    return ExtractedFeatures(
+        entities=entity.extract(content, language=language),
+        keywords=extract_keywords(content, language=language),
+        weighted_keywords=extract_weighted_keywords(content, language=language),
+        relations=relation.extract(content, language=language),
+        sentiment=sentiment.extract(content, language=language),
+        time_hints=temporal.extract(content, reference_time) if reference_time else [],
+        content_hash=simhash(content),
+        memory_type=suggest_memory_type(content).value,
+    )
+
+
+@lru_cache(maxsize=1)
+def _default_extractors() -> tuple[
+    TemporalExtractor, EntityExtractor, RelationExtractor, SentimentExtractor
+]:
+    return TemporalExtractor(), EntityExtractor(), RelationExtractor(), SentimentExtractor()
+
+
+def extract_features(
+    content: str,
+    language: str = "auto",
+    reference_time: datetime | None = None,
+) -> ExtractedFeatures:
+    """
+    Run the default extractors over content without touching storage.
+
+    Module-level and side-effect free so it can be mapped over a process
+    pool; extractor instances are built once per process.
+
+    Args:
+        content: The text content to analyze
+        language: Language hint ("vi", "en", or "auto")
+        reference_time: Anchor for relative time expressions; None skips
+            temporal extraction
+
+    Returns:
+        ExtractedFeatures for the content
+    """
+    return _run_extractors(content, language, reference_time, *_default_extractors())
+
+
 class MemoryEncoder:
     """
     Encoder for converting experiences into neural structures.
@@ -65,6 +153,7 @@ class MemoryEncoder:
         temporal_extractor: TemporalExtractor | None = None,
         entity_extractor: EntityExtractor | None = None,
         relation_extractor: RelationExtractor | None = None,
+        embedding_provider: EmbeddingProvider | None = None,
     ) -> None:
         """
         Initialize the encoder.
@@ -75,6 +164,8 @@ class MemoryEncoder:
             temporal_extractor: Custom temporal extractor
             entity_extractor: Custom entity extractor
             relation_extractor: Custom relation extractor
+            embedding_provider: Optional provider; anchor embeddings are
+                added to the storage's vector index when one is available
         """
         self._storage = storage
         self._config = config
@@ -83,6 +174,7 @@ class MemoryEncoder:
         self._relation = relation_extractor or RelationExtractor()
         self._sentiment = SentimentExtractor()
         self._tag_normalizer = TagNormalizer()
+        self._embedding_provider = embedding_provider
 
     async def encode(
         self,
@@ -96,6 +188,8 @@ class MemoryEncoder:
         skip_time_neurons: bool = False,
         initial_stage: str = "",
         salience_ceiling: float = 0.0,
+        features: ExtractedFeatures | None = None,
+        entity_cache: dict[str, Neuron] | None = None,
     ) -> EncodingResult:
         """
         Encode content into neural structures.
@@ -110,6 +204,12 @@ class MemoryEncoder:
             skip_time_neurons: Skip TIME neuron creation (for bulk doc training).
             initial_stage: Override maturation stage (e.g. "episodic" for doc training).
             salience_ceiling: Cap initial fiber salience (0 = no cap).
+            features: Pre-computed extraction results (e.g. from a worker
+                process); extracted here when omitted.
+            entity_cache: Entity text -> neuron map shared across calls, so
+                bulk ingestion resolves each repeated entity against
+                storage only once. Entries from this call are added only
+                after its transaction commits.
 
         Returns:
             EncodingResult with created structures
@@ -117,6 +217,62 @@ class MemoryEncoder:
         if timestamp is None:
             timestamp = utcnow()
 
+        # New entries wait here until the memory commits; a rolled back
+        # entity neuron must not be handed to later calls
+        staged: dict[str, Neuron] = {}
+        cache = ChainMap(staged, entity_cache) if entity_cache is not None else None
+
+        # One transaction per memory instead of one commit per neuron/synapse
+        async with self._storage.batch():
+            result = await self._encode(
+                content,
+                timestamp,
+                metadata,
+                tags,
+                language,
+                skip_conflicts=skip_conflicts,
+                skip_time_neurons=skip_time_neurons,
+                initial_stage=initial_stage,
+                salience_ceiling=salience_ceiling,
+                features=features,
+                entity_cache=cache,
+            )
+        if entity_cache is not None:
+            entity_cache.update(staged)
+
+        # Embedding may call out to a remote provider — keep it outside the write lock
+        anchor_id = result.fiber.anchor_neuron_id
+        anchor = next(n for n in result.neurons_created if n.id == anchor_id)
+        await self._index_embedding(anchor)
+        return result
+
+    async def _encode(
+        self,
+        content: str,
+        timestamp: datetime,
+        metadata: dict[str, Any] | None,
+        tags: set[str] | None,
+        language: str,
+        *,
+        skip_conflicts: bool,
+        skip_time_neurons: bool,
+        initial_stage: str,
+        salience_ceiling: float,
+        features: ExtractedFeatures | None,
+        entity_cache: MutableMapping[str, Neuron] | None,
+    ) -> EncodingResult:
+        """Build and store the neural structures for ``encode``."""
+        if features is None:
+            features = _run_extractors(
+                content,
+                language,
+                None if skip_time_neurons else timestamp,
+                self._temporal,
+                self._entity,
+                self._relation,
+                self._sentiment,
+            )
+
         neurons_created: list[Neuron] = []
         neurons_linked: list[str] = []
         synapses_created: list[Synapse] = []
@@ -125,15 +281,15 @@ class MemoryEncoder:
         if skip_time_neurons:
             time_neurons: list[Neuron] = []
         else:
-            time_neurons = await self._extract_time_neurons(content, timestamp)
+            time_neurons = await self._extract_time_neurons(features.time_hints, timestamp)
         neurons_created.extend(time_neurons)
 
         # 2. Extract entity neurons
-        entity_neurons = await self._extract_entity_neurons(content, language)
+        entity_neurons = await self._extract_entity_neurons(features.entities, entity_cache)
         neurons_created.extend(entity_neurons)
 
         # 3. Extract concept/keyword neurons
-        concept_neurons = await self._extract_concept_neurons(content, language)
+        concept_neurons = await self._extract_concept_neurons(content, features.keywords)
         neurons_created.extend(concept_neurons)
 
         # 4. Generate auto-tags from extracted neurons
@@ -142,6 +298,7 @@ class MemoryEncoder:
             concept_neurons=concept_neurons,
             content=content,
             language=language,
+            weighted_keywords=features.weighted_keywords,
         )
         agent_tags = self._tag_normalizer.normalize_set(tags) if tags else set()
         merged_tags = auto_tags | agent_tags
@@ -149,7 +306,7 @@ class MemoryEncoder:
         # 4b. Auto-infer memory type if not provided
         effective_metadata = dict(metadata or {})
         if "type" not in effective_metadata or not effective_metadata["type"]:
-            effective_metadata["type"] = suggest_memory_type(content).value
+            effective_metadata["type"] = features.memory_type
 
         # 5. Create the anchor neuron (main content)
         anchor_neuron = Neuron.create(
@@ -160,7 +317,7 @@ class MemoryEncoder:
                 "timestamp": timestamp.isoformat(),
                 **effective_metadata,
             },
-            content_hash=simhash(content),
+            content_hash=features.content_hash,
         )
         await self._storage.add_neuron(anchor_neuron)
         neurons_created.append(anchor_neuron)
@@ -168,6 +325,8 @@ class MemoryEncoder:
         # 6. Create synapses between neurons
         all_neurons = neurons_created
 
+        anchor_synapses: list[Synapse] = []
+
         # Connect anchor to time neurons
         for time_neuron in time_neurons:
             synapse = Synapse.create(
@@ -176,8 +335,7 @@ class MemoryEncoder:
                 type=SynapseType.HAPPENED_AT,
                 weight=0.9,
             )
-            await self._storage.add_synapse(synapse)
-            synapses_created.append(synapse)
+            anchor_synapses.append(synapse)
 
         # Connect anchor to entity neurons (weight by mention frequency)
         content_lower = content.lower()
@@ -190,13 +348,10 @@ class MemoryEncoder:
                 type=SynapseType.INVOLVES,
                 weight=entity_weight,
             )
-            await self._storage.add_synapse(synapse)
-            synapses_created.append(synapse)
+            anchor_synapses.append(synapse)
 
         # Connect anchor to concept neurons (weight by keyword importance)
-        kw_weight_map = {
-            kw.text: kw.weight for kw in extract_weighted_keywords(content, language=language)
-        }
+        kw_weight_map = {kw.text: kw.weight for kw in features.weighted_keywords}
         for concept_neuron in concept_neurons:
             kw_weight = kw_weight_map.get(concept_neuron.content.lower(), 0.5)
             concept_weight = min(0.8, 0.4 + 0.3 * kw_weight)
@@ -206,8 +361,7 @@ class MemoryEncoder:
                 type=SynapseType.RELATED_TO,
                 weight=concept_weight,
             )
-            await self._storage.add_synapse(synapse)
-            synapses_created.append(synapse)
+            anchor_synapses.append(synapse)
 
         # Connect entities that co-occur
         for i, neuron_a in enumerate(entity_neurons):
@@ -218,14 +372,15 @@ class MemoryEncoder:
                     type=SynapseType.CO_OCCURS,
                     weight=0.5,
                 )
-                await self._storage.add_synapse(synapse)
-                synapses_created.append(synapse)
+                anchor_synapses.append(synapse)
+
+        await self._storage.add_synapses_bulk(anchor_synapses)
+        synapses_created.extend(anchor_synapses)
 
         # 6a. Extract sentiment and create emotional synapses
         emotion_synapses, emotion_neurons = await self._extract_emotion_synapses(
-            content=content,
+            sentiment=features.sentiment,
             anchor_neuron=anchor_neuron,
-            language=language,
             metadata=effective_metadata,
         )
         synapses_created.extend(emotion_synapses)
@@ -233,11 +388,9 @@ class MemoryEncoder:
 
         # 6b. Extract relation-based synapses (causal, comparative, sequential)
         relation_synapses = await self._extract_relation_synapses(
-            content=content,
-            anchor_neuron=anchor_neuron,
+            relations=features.relations,
             entity_neurons=entity_neurons,
             concept_neurons=concept_neurons,
-            language=language,
         )
         synapses_created.extend(relation_synapses)
 
@@ -383,6 +536,7 @@ class MemoryEncoder:
         concept_neurons: list[Neuron],
         content: str,
         language: str = "auto",
+        weighted_keywords: list[WeightedKeyword] | None = None,
     ) -> set[str]:
         """
         Generate tags from extracted entities and top keywords.
@@ -396,6 +550,8 @@ class MemoryEncoder:
             concept_neurons: Extracted concept neurons
             content: Original content text
             language: Language hint
+            weighted_keywords: Pre-computed keywords (extracted from
+                content when omitted)
 
         Returns:
             Set of normalized tag strings
@@ -409,8 +565,9 @@ class MemoryEncoder:
                 auto_tags.add(tag)
 
         # Top-5 keywords as tags
-        weighted = extract_weighted_keywords(content, language=language)
-        for kw in weighted[:5]:
+        if weighted_keywords is None:
+            weighted_keywords = extract_weighted_keywords(content, language=language)
+        for kw in weighted_keywords[:5]:
             tag = kw.text.lower().strip()
             if len(tag) >= 2:
                 auto_tags.add(tag)
@@ -419,11 +576,9 @@ class MemoryEncoder:
 
     async def _extract_relation_synapses(
         self,
-        content: str,
-        anchor_neuron: Neuron,
+        relations: list[RelationCandidate],
         entity_neurons: list[Neuron],
         concept_neurons: list[Neuron],
-        language: str = "auto",
     ) -> list[Synapse]:
         """Create synapses from extracted relations between entities/concepts.
 
@@ -431,17 +586,14 @@ class MemoryEncoder:
         typed synapses (CAUSED_BY, LEADS_TO, BEFORE, AFTER, etc.).
 
         Args:
-            content: Original content text
-            anchor_neuron: The anchor neuron for this memory
+            relations: Relation candidates extracted from the content
             entity_neurons: Extracted entity neurons
             concept_neurons: Extracted concept neurons
-            language: Language hint
 
         Returns:
             List of created relation synapses
         """
         synapses: list[Synapse] = []
-        relations = self._relation.extract(content, language=language)
 
         all_extracted = entity_neurons + concept_neurons
         if len(all_extracted) < 2:
@@ -565,17 +717,15 @@ class MemoryEncoder:
 
     async def _extract_emotion_synapses(
         self,
-        content: str,
+        sentiment: SentimentResult,
         anchor_neuron: Neuron,
-        language: str = "auto",
         metadata: dict[str, Any] | None = None,
     ) -> tuple[list[Synapse], list[Neuron]]:
-        """Extract sentiment and create FELT synapses to emotion STATE neurons.
+        """Create FELT synapses from extracted sentiment to emotion STATE neurons.
 
         Args:
-            content: Original content text
+            sentiment: Sentiment extracted from the content
             anchor_neuron: The anchor neuron for this memory
-            language: Language hint
             metadata: Mutable metadata dict to annotate with valence
 
         Returns:
@@ -584,7 +734,7 @@ class MemoryEncoder:
         synapses: list[Synapse] = []
         neurons: list[Neuron] = []
 
-        result = self._sentiment.extract(content, language=language)
+        result = sentiment
         if result.valence == Valence.NEUTRAL or not result.emotion_tags:
             return synapses, neurons
 
@@ -633,17 +783,27 @@ class MemoryEncoder:
 
         return synapses, neurons
 
+    async def _index_embedding(self, anchor_neuron: Neuron) -> None:
+        """Embed the anchor content into the brain's vector index (non-critical)."""
+        if self._embedding_provider is None:
+            return
+        try:
+            index = await self._storage.get_vector_index(self._embedding_provider.dimension)
+            if index is None:
+                return
+            vector = await self._embedding_provider.embed(anchor_neuron.content)
+            index.add(anchor_neuron.id, vector)
+        except Exception:
+            logger.debug("Embedding indexing failed (non-critical)", exc_info=True)
+
     async def _extract_time_neurons(
         self,
-        content: str,
+        time_hints: list[TimeHint],
         reference_time: datetime,
     ) -> list[Neuron]:
-        """Extract and create time neurons from content."""
+        """Create time neurons for extracted time hints and the reference time."""
         neurons: list[Neuron] = []
 
-        # Extract time hints from content
-        time_hints = self._temporal.extract(content, reference_time)
-
         for hint in time_hints:
             # Check for existing similar time neuron
             existing = await self._find_similar_time_neuron(hint.midpoint)
@@ -699,21 +859,23 @@ class MemoryEncoder:
 
     async def _extract_entity_neurons(
         self,
-        content: str,
-        language: str = "auto",
+        entities: list[Entity],
+        entity_cache: MutableMapping[str, Neuron] | None = None,
     ) -> list[Neuron]:
-        """Extract and create entity neurons from content."""
+        """Create neurons for extracted entities not already in storage."""
         neurons: list[Neuron] = []
 
-        entities = self._entity.extract(content, language=language)
-
         for entity in entities:
             # Map entity type to neuron type
             neuron_type = self._entity_type_to_neuron_type(entity.type)
 
             # Check for existing similar entity
-            existing = await self._find_similar_entity(entity.text)
+            existing = entity_cache.get(entity.text) if entity_cache is not None else None
+            if existing is None:
+                existing = await self._find_similar_entity(entity.text)
             if existing:
+                if entity_cache is not None:
+                    entity_cache[entity.text] = existing
                 continue
 
             neuron = Neuron.create(
@@ -727,6 +889,8 @@ class MemoryEncoder:
             )
             await self._storage.add_neuron(neuron)
             neurons.append(neuron)
+            if entity_cache is not None:
+                entity_cache[entity.text] = neuron
 
         return neurons
 
@@ -788,12 +952,11 @@ class MemoryEncoder:
     async def _extract_concept_neurons(
         self,
         content: str,
-        language: str = "auto",
+        keywords: list[str],
     ) -> list[Neuron]:
-        """Extract and create concept neurons from keywords."""
+        """Create concept neurons for extracted keywords not already in storage."""
         neurons: list[Neuron] = []
-
-        keywords = extract_keywords(content, language=language)
+        pending: set[str] = set()
 
         # Dynamic limit based on content length
         concept_limit = min(20, max(5, len(content) // 100))
@@ -801,7 +964,9 @@ class MemoryEncoder:
             if len(keyword) < 3:
                 continue
 
-            # Check for existing
+            # Check for existing (including keywords queued in this call)
+            if keyword in pending:
+                continue
             existing = await self._storage.find_neurons(
                 type=NeuronType.CONCEPT,
                 content_exact=keyword,
@@ -814,9 +979,10 @@ class MemoryEncoder:
                 type=NeuronType.CONCEPT,
                 content=keyword,
             )
-            await self._storage.add_neuron(neuron)
+            pending.add(keyword)
             neurons.append(neuron)
 
+        await self._storage.add_neurons_bulk(neurons)
         return neurons
 
     async def _link_temporal_neighbors(
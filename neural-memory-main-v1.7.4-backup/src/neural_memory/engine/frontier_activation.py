@@ -0,0 +1,249 @@
+"""Level-synchronous (frontier) spreading activation over a graph snapshot.
+
+Instead of popping one queue entry at a time, every hop relaxes the whole
+frontier at once with NumPy array operations — a sparse mat-vec in the
+(max, x) semiring:
+
+    next[j] = max_i( level[i] * decay * weight[i, j] * freq_factor[j] )
+
+Each anchor set is one column, so ``activate_from_multiple`` spreads all
+sets in a single pass. Paths are kept as immutable (neuron, previous record)
+entries appended at relaxation time instead of being copied per queue
+entry, so a later improvement of a parent cannot rewrite a child's path.
+Edges written since the snapshot was last packed are read from its overlay
+alongside the CSR rows.
+
+Requires ``numpy`` (``pip install neural-memory[fast]``).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from neural_memory.engine.activation import ActivationResult
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - exercised only without numpy
+    raise ImportError(
+        "numpy is required for frontier spreading activation. "
+        "Install it with: pip install neural-memory[fast]"
+    ) from exc
+
+if TYPE_CHECKING:
+    from neural_memory.storage.graph_snapshot import GraphSnapshot
+
+
+class FrontierActivation:
+    """Vectorized spread over a ``GraphSnapshot``.
+
+    Derived arrays (zero-copy views of the CSR buffers and the overlay) are
+    cached per snapshot version. The refractory and frequency-factor vectors
+    are copied once and then patched in place from the snapshot's
+    state-change log, so per-recall state writes do not force an O(n) copy.
+    """
+
+    def __init__(self, min_weight: float) -> None:
+        """
+        Args:
+            min_weight: Synapses weaker than this do not conduct
+        """
+        self._min_weight = min_weight
+        self._cache_key: tuple[int, int] | None = None
+        self._arrays: dict[str, Any] = {}
+        self._state_snapshot: GraphSnapshot | None = None
+        self._state_cursor: tuple[int, int] = (-1, 0)
+
+    def activate_batch(
+        self,
+        snapshot: GraphSnapshot,
+        anchor_sets: list[list[str]],
+        max_hops: int,
+        decay_factor: float,
+        min_activation: float,
+        now: float,
+    ) -> list[dict[str, ActivationResult]]:
+        """
+        Spread from every anchor set at once.
+
+        Args:
+            snapshot: Graph snapshot to spread over
+            anchor_sets: One list of anchor IDs per column
+            max_hops: Maximum number of hops
+            decay_factor: Activation decay per hop
+            min_activation: Minimum activation to keep spreading
+            now: Current timestamp for the refractory check
+
+        Returns:
+            One result dict per anchor set, in input order
+        """
+        arrays = self._load(snapshot)
+        indptr = arrays["indptr"]
+        indices = arrays["indices"]
+        weights = arrays["weights"]
+        overlay_rows = arrays["overlay_rows"]
+        conducting = arrays["alive"] & (arrays["refractory"] <= now)
+        freq_factor = arrays["freq_factor"]
+        n = len(arrays["alive"])
+        k = len(anchor_sets)
+
+        # Dense (column, neuron) state; flat index = column * n + neuron.
+        # record[flat] points into the append-only path records below.
+        best = np.zeros(k * n, dtype=np.float32)
+        origin = np.full(k * n, -1, dtype=np.int64)
+        record = np.full(k * n, -1, dtype=np.int64)
+        hops = np.zeros(k * n, dtype=np.int32)
+
+        frontier_list: list[int] = []
+        for col, anchors in enumerate(anchor_sets):
+            for anchor_id in anchors:
+                idx = snapshot.index_of(anchor_id)
+                if idx is not None:
+                    frontier_list.append(col * n + idx)
+        frontier = np.unique(np.asarray(frontier_list, dtype=np.int64))
+        best[frontier] = 1.0
+        origin[frontier] = frontier % n
+        record[frontier] = np.arange(frontier.size)
+        rec_nodes = [frontier % n]
+        rec_prev = [np.full(frontier.size, -1, dtype=np.int64)]
+        rec_count = frontier.size
+
+        for hop in range(1, max_hops + 1):
+            if frontier.size == 0:
+                break
+            cols, nodes = np.divmod(frontier, n)
+
+            # Gather every outgoing slot of every frontier entry
+            starts = indptr[nodes]
+            owner, slots = self._expand(starts, indptr[nodes + 1] - starts)
+            targets = indices[slots].astype(np.int64)
+            edge_w = weights[slots]
+            if overlay_rows.size:
+                # Overlay entries are sorted by row: each node's run is a slice
+                starts = np.searchsorted(overlay_rows, nodes, side="left")
+                ends = np.searchsorted(overlay_rows, nodes, side="right")
+                extra_owner, extra = self._expand(starts, ends - starts)
+                owner = np.concatenate([owner, extra_owner])
+                targets = np.concatenate(
+                    [targets, arrays["overlay_indices"][extra].astype(np.int64)]
+                )
+                edge_w = np.concatenate([edge_w, arrays["overlay_weights"][extra]])
+            if targets.size == 0:
+                break
+
+            keep = (edge_w >= self._min_weight) & conducting[targets]
+            owner, targets, edge_w = owner[keep], targets[keep], edge_w[keep]
+
+            levels = best[frontier[owner]] * decay_factor * edge_w * freq_factor[targets]
+            flat = cols[owner] * n + targets
+            improve = (levels >= min_activation) & (levels > best[flat])
+            if not improve.any():
+                break
+            levels, flat, owner = levels[improve], flat[improve], owner[improve]
+
+            # Max-combine: sorted ascending, so the last write per slot wins
+            order = np.argsort(levels, kind="stable")
+            flat, levels, owner = flat[order], levels[order], owner[order]
+            # Read the sources' origin/record before this hop overwrites them
+            sources = frontier[owner]
+            source_origin = origin[sources]
+            rec_nodes.append(flat % n)
+            rec_prev.append(record[sources])
+            best[flat] = levels
+            origin[flat] = source_origin
+            record[flat] = rec_count + np.arange(flat.size)
+            rec_count += flat.size
+            hops[flat] = hop
+            frontier = np.unique(flat)
+
+        paths = (np.concatenate(rec_nodes).tolist(), np.concatenate(rec_prev).tolist())
+        return [
+            self._collect(snapshot, best, origin, record, hops, paths, col, n) for col in range(k)
+        ]
+
+    def _load(self, snapshot: GraphSnapshot) -> dict[str, Any]:
+        key = (id(snapshot), snapshot.version)
+        csr = None
+        if key != self._cache_key:
+            csr = snapshot.csr()
+            indptr = np.frombuffer(csr.indptr, dtype=np.int64)
+            if len(indptr) < len(csr.alive) + 1:
+                # Neurons added since the last compaction: empty CSR rows
+                padding = np.full(len(csr.alive) + 1 - len(indptr), indptr[-1])
+                indptr = np.concatenate([indptr, padding])
+            self._arrays.update(
+                indptr=indptr,
+                indices=np.frombuffer(csr.indices, dtype=np.int32),
+                weights=np.frombuffer(csr.weights, dtype=np.float32),
+                alive=np.frombuffer(bytes(csr.alive), dtype=np.bool_),
+                overlay_rows=np.array(csr.overlay_rows, dtype=np.int64),
+                overlay_indices=np.array(csr.overlay_indices, dtype=np.int32),
+                overlay_weights=np.array(csr.overlay_weights, dtype=np.float32),
+            )
+            self._cache_key = key
+
+        changed = None
+        if self._state_snapshot is snapshot:
+            changed = snapshot.state_changes(self._state_cursor)
+        if changed is None:
+            # Per-neuron buffers grow on add_neuron, so they must not be
+            # pinned by a buffer export — copy them instead of viewing.
+            csr = csr or snapshot.csr()
+            freq = np.array(csr.access_frequency, dtype=np.float64)
+            self._arrays["refractory"] = np.array(csr.refractory_until, dtype=np.float64)
+            self._arrays["freq_factor"] = self._freq_factor(freq)
+            self._state_snapshot = snapshot
+        elif changed:
+            rows = np.unique(np.asarray(changed, dtype=np.int64))
+            freq = np.array([snapshot.access_frequency(i) for i in rows.tolist()], dtype=np.float64)
+            self._arrays["refractory"][rows] = [snapshot.refractory_until(i) for i in rows.tolist()]
+            self._arrays["freq_factor"][rows] = self._freq_factor(freq)
+        self._state_cursor = snapshot.state_cursor
+        return self._arrays
+
+    @staticmethod
+    def _freq_factor(freq: Any) -> Any:
+        return (1.0 + np.minimum(0.15, 0.05 * np.log1p(freq))).astype(np.float32)
+
+    @staticmethod
+    def _expand(starts: Any, counts: Any) -> tuple[Any, Any]:
+        """Flatten per-entry slot ranges into (owner entry, slot) pairs."""
+        total = int(counts.sum())
+        owner = np.repeat(np.arange(starts.size), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        return owner, starts[owner] + offsets
+
+    @staticmethod
+    def _collect(
+        snapshot: GraphSnapshot,
+        best: Any,
+        origin: Any,
+        record: Any,
+        hops: Any,
+        paths: tuple[list[int], list[int]],
+        col: int,
+        n: int,
+    ) -> dict[str, ActivationResult]:
+        """Turn one column of the dense state into ActivationResults."""
+        base = col * n
+        reached = np.nonzero(best[base : base + n])[0]
+        rec_nodes, rec_prev = paths
+        results: dict[str, ActivationResult] = {}
+
+        for idx in reached.tolist():
+            flat = base + idx
+            path: list[int] = []
+            cursor = int(record[flat])
+            while cursor >= 0:
+                path.append(rec_nodes[cursor])
+                cursor = rec_prev[cursor]
+            path.reverse()
+            neuron_id = snapshot.neuron_id(idx)
+            results[neuron_id] = ActivationResult(
+                neuron_id=neuron_id,
+                activation_level=float(best[flat]),
+                hop_distance=int(hops[flat]),
+                path=[snapshot.neuron_id(i) for i in path],
+                source_anchor=snapshot.neuron_id(int(origin[flat])),
+            )
+        return results
@@ -307,6 +307,9 @@ def merge_snapshots(
             # Use strategy to pick winner
             resolution = _resolve_neuron_conflict(local_fiber, remapped_fiber, strategy)
 
+            # Typed memories of the incoming fiber follow it to the local one
+            id_remap[incoming_fiber["id"]] = local_fiber["id"]
+
             if resolution == "kept_incoming":
                 updated = {**remapped_fiber, "id": local_fiber["id"]}
                 updated = _add_provenance(updated, incoming.brain_id, resolution)
@@ -7,6 +7,7 @@ import heapq
 import logging
 import math
 import time
+import weakref
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -42,8 +43,21 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from neural_memory.core.brain import BrainConfig
     from neural_memory.engine.embedding.provider import EmbeddingProvider
+    from neural_memory.engine.embedding.vector_index import VectorIndex
     from neural_memory.storage.base import NeuralStorage
 
+# Running backfill per vector index, shared by all pipelines
+_backfills: weakref.WeakKeyDictionary[VectorIndex, asyncio.Task[int]] = weakref.WeakKeyDictionary()
+
+
+def _backfill_done(task: asyncio.Task[int]) -> None:
+    if task.cancelled():
+        return
+    if task.exception() is not None:
+        logger.warning("Vector index backfill failed", exc_info=task.exception())
+    else:
+        logger.info("Vector index backfill added %d vectors", task.result())
+
 
 def _fiber_valid_at(fiber: Fiber, dt: datetime) -> bool:
     """Check if a fiber is temporally valid at the given datetime.
@@ -81,6 +95,8 @@ class ReflexPipeline:
         parser: QueryParser | None = None,
         use_reflex: bool = True,
         embedding_provider: EmbeddingProvider | None = None,
+        use_graph_snapshot: bool | None = None,
+        vectorized_activation: bool | None = None,
     ) -> None:
         """
         Initialize the retrieval pipeline.
@@ -91,13 +107,29 @@ class ReflexPipeline:
             parser: Custom query parser (creates default if None)
             use_reflex: If True, use ReflexActivation; else use SpreadingActivation
             embedding_provider: Optional embedding provider for semantic fallback
+            use_graph_snapshot: If True, classic spreading activation runs over
+                the storage's in-memory CSR snapshot instead of per-hop queries
+                (default: from ``config.activation_backend``)
+            vectorized_activation: If True, classic spreading activation runs
+                level-synchronously with NumPy over the snapshot
+                (default: from ``config.activation_backend``)
         """
+        backend = config.activation_backend
+        if vectorized_activation is None:
+            vectorized_activation = backend == "vectorized"
+        if use_graph_snapshot is None:
+            use_graph_snapshot = backend in ("snapshot", "vectorized")
         self._storage = storage
         self._config = config
         self._parser = parser or QueryParser()
         self._use_reflex = use_reflex
         self._embedding_provider = embedding_provider
-        self._activator = SpreadingActivation(storage, config)
+        self._activator = SpreadingActivation(
+            storage,
+            config,
+            use_snapshot=use_graph_snapshot,
+            vectorized=vectorized_activation,
+        )
         self._reflex_activator = ReflexActivation(storage, config)
         self._reinforcer = ReinforcementManager(
             reinforcement_delta=config.reinforcement_delta,
@@ -790,8 +822,11 @@ class ReflexPipeline:
     async def _find_embedding_anchors(self, query: str, top_k: int = 10) -> list[str]:
         """Find anchor neurons via embedding similarity.
 
-        Embeds the query, then finds neurons whose stored embeddings
-        (in metadata['_embedding']) are above the similarity threshold.
+        Embeds the query, then runs one top-k query over the brain's
+        vector index. Until the index has been backfilled with the brain's
+        existing memories (started here in the background), falls back to
+        scanning neurons whose stored embeddings (in metadata['_embedding'])
+        are above the similarity threshold.
         """
         if self._embedding_provider is None:
             return []
@@ -802,6 +837,19 @@ class ReflexPipeline:
             logger.debug("Embedding query failed (non-critical)", exc_info=True)
             return []
 
+        # Fast path: one top-k query over the brain's vector index
+        brain_id = self._storage.current_brain_id
+        try:
+            index = await self._storage.get_vector_index(self._embedding_provider.dimension)
+        except Exception:
+            logger.debug("Vector index unavailable (non-critical)", exc_info=True)
+            index = None
+        if index is not None:
+            if index.backfilled:
+                return await self._search_vector_index(index, query_vec, top_k)
+            if brain_id is not None:
+                self._start_backfill(index, self._embedding_provider, brain_id)
+
         # Get all anchor neurons (with embeddings) - limit search scope
         candidates = await self._storage.find_neurons(limit=500)
 
@@ -821,6 +869,41 @@ class ReflexPipeline:
         scored.sort(key=lambda x: x[1], reverse=True)
         return [nid for nid, _ in scored[:top_k]]
 
+    def _start_backfill(
+        self, index: VectorIndex, provider: EmbeddingProvider, brain_id: str
+    ) -> None:
+        """Backfill the index of ``brain_id`` in the background, once at a time per index."""
+        task = _backfills.get(index)
+        if task is not None and not task.done():
+            return
+        from neural_memory.engine.embedding.vector_index import backfill_vector_index
+
+        task = asyncio.get_running_loop().create_task(
+            backfill_vector_index(index, self._storage, provider, brain_id)
+        )
+        _backfills[index] = task
+        task.add_done_callback(_backfill_done)
+
+    async def _search_vector_index(
+        self,
+        index: VectorIndex,
+        query_vec: list[float],
+        top_k: int,
+    ) -> list[str]:
+        """Top-k index lookup, dropping (and evicting) IDs of deleted neurons."""
+        hits = index.search(
+            query_vec,
+            k=top_k,
+            min_similarity=self._config.embedding_similarity_threshold,
+        )
+        if not hits:
+            return []
+        existing = await self._storage.get_neurons_batch([nid for nid, _ in hits])
+        for nid, _ in hits:
+            if nid not in existing:
+                index.remove(nid)
+        return [nid for nid, _ in hits if nid in existing]
+
     async def _find_anchors_time_first(self, stimulus: Stimulus) -> list[list[str]]:
         """
         Find anchor neurons with time as primary signal.
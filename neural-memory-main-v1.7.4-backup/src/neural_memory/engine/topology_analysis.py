@@ -4,13 +4,16 @@ Computes structural metrics from the neuron-synapse graph:
 clustering coefficient, connected component ratio, density,
 knowledge density, and enrichment coverage. All metrics use
 existing storage API — no new tables or infrastructure needed.
+Clustering and component size are estimated from a node sample
+whose neighborhoods are read from storage, so the cost is bounded
+by the sample rather than the synapse count.
 """
 
 from __future__ import annotations
 
 import random
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
@@ -60,14 +63,15 @@ async def compute_topology(
     """Compute graph topology metrics for a brain.
 
     Uses only existing storage methods — no new infrastructure.
-    Samples neurons for clustering coefficient to keep cost O(n)
-    for large brains.
+    Samples ``_MAX_SAMPLE_NODES`` neurons from storage and reads only
+    their neighborhoods (and, for the largest component, bounded walks
+    from them), so the synapse table is never loaded.
 
     Args:
         storage: Neural storage instance.
         brain_id: Brain identifier.
-        _preloaded_synapses: Optional pre-fetched synapse list to avoid
-            redundant storage calls when called from EvolutionEngine.
+        _preloaded_synapses: Optional pre-fetched synapse list, used
+            in place of storage reads when called from EvolutionEngine.
     """
     stats = await storage.get_stats(brain_id)
     neuron_count = stats.get("neuron_count", 0)
@@ -82,10 +86,6 @@ async def compute_topology(
             enriched_synapse_ratio=0.0,
         )
 
-    all_synapses: Sequence[SynapseLike] = (
-        _preloaded_synapses if _preloaded_synapses is not None else await storage.get_all_synapses()
-    )
-
     # ── Density (undirected: n*(n-1)/2) ────────────────────────
     max_edges = neuron_count * (neuron_count - 1) // 2
     density = synapse_count / max_edges if max_edges > 0 else 0.0
@@ -93,17 +93,32 @@ async def compute_topology(
     # ── Knowledge density ────────────────────────────────────
     knowledge_density = synapse_count / max(1, neuron_count)
 
-    # ── Enriched synapse ratio ───────────────────────────────
-    enriched_count = sum(
-        1 for s in all_synapses if getattr(s, "metadata", None) and s.metadata.get("_enriched")
-    )
-    enriched_ratio = enriched_count / max(1, len(all_synapses))
-
-    # ── Largest connected component ──────────────────────────
-    lcc_ratio = _largest_component_ratio(all_synapses, neuron_count)
-
-    # ── Clustering coefficient ───────────────────────────────
-    clustering = _clustering_coefficient(all_synapses)
+    if _preloaded_synapses is not None:
+        # Already in memory: the exact computation costs nothing extra to load
+        enriched_count = sum(
+            1
+            for s in _preloaded_synapses
+            if getattr(s, "metadata", None) and s.metadata.get("_enriched")
+        )
+        enriched_ratio = enriched_count / max(1, len(_preloaded_synapses))
+        adj = _undirected_adjacency(_preloaded_synapses)
+        lcc_ratio = _component_ratio_from_adjacency(adj, neuron_count)
+        clustering = _clustering_from_adjacency(adj)
+    elif synapse_count == 0:
+        enriched_ratio = lcc_ratio = clustering = 0.0
+    else:
+        # ── Enriched synapse ratio ───────────────────────────
+        enriched_count = await storage.count_synapses_with_metadata("_enriched")
+        enriched_ratio = enriched_count / synapse_count
+
+        neighbors = _NeighborCache(storage)
+        sample = await storage.sample_neuron_ids(_MAX_SAMPLE_NODES)
+
+        # ── Largest connected component ──────────────────────
+        lcc_ratio = await _sampled_component_ratio_from_storage(neighbors, sample, neuron_count)
+
+        # ── Clustering coefficient ───────────────────────────
+        clustering = await _sampled_clustering_from_storage(neighbors, sample)
 
     return TopologyMetrics(
         clustering_coefficient=clustering,
@@ -120,6 +135,20 @@ async def compute_topology(
 _MAX_SAMPLE_NODES = 200
 _MAX_SAMPLE_NEIGHBORS = 200
 
+# Graphs with more connected nodes than this get a sampled component estimate
+_MAX_EXACT_COMPONENT_NODES = 50_000
+# Nodes a sampled component walk visits before calling the component large
+_MAX_COMPONENT_WALK = 2_000
+
+
+def _undirected_adjacency(synapses: Sequence[SynapseLike]) -> dict[str, set[str]]:
+    """Build the undirected neighbor sets of the synapse graph."""
+    adj: dict[str, set[str]] = defaultdict(set)
+    for s in synapses:
+        adj[s.source_id].add(s.target_id)
+        adj[s.target_id].add(s.source_id)
+    return adj
+
 
 def _largest_component_ratio(
     synapses: Sequence[SynapseLike],
@@ -128,26 +157,26 @@ def _largest_component_ratio(
     """Compute ratio of neurons in the largest connected component.
 
     Treats the graph as undirected for connectivity analysis.
-    Uses union-find for O(n + e) performance.
+    Exact (union-find, O(n + e)) up to ``_MAX_EXACT_COMPONENT_NODES``
+    connected neurons, sampled above that.
     """
     if neuron_count == 0:
         return 0.0
+    return _component_ratio_from_adjacency(_undirected_adjacency(synapses), neuron_count)
 
-    # Collect all neuron IDs from synapses
-    all_nodes: set[str] = set()
-    edges: list[tuple[str, str]] = []
-    for s in synapses:
-        all_nodes.add(s.source_id)
-        all_nodes.add(s.target_id)
-        edges.append((s.source_id, s.target_id))
 
-    if not all_nodes:
+def _component_ratio_from_adjacency(adj: dict[str, set[str]], neuron_count: int) -> float:
+    if neuron_count == 0 or not adj:
         return 0.0
+    # Use neuron_count from stats (includes isolated neurons)
+    total = max(neuron_count, len(adj))
+    if len(adj) > _MAX_EXACT_COMPONENT_NODES:
+        return _sampled_component_ratio(adj, total)
 
     # Union-Find (path compression + union-by-rank mutates local dicts
     # intentionally for near-constant amortized performance)
-    parent: dict[str, str] = {n: n for n in all_nodes}
-    rank: dict[str, int] = dict.fromkeys(all_nodes, 0)
+    parent: dict[str, str] = {n: n for n in adj}
+    rank: dict[str, int] = dict.fromkeys(adj, 0)
 
     def find(x: str) -> str:
         while parent[x] != x:
@@ -165,20 +194,59 @@ def _largest_component_ratio(
         if rank[ra] == rank[rb]:
             rank[ra] += 1
 
-    for a, b in edges:
-        union(a, b)
+    for node, neighbors in adj.items():
+        for other in neighbors:
+            union(node, other)
 
     # Count component sizes
     component_sizes: dict[str, int] = defaultdict(int)
-    for n in all_nodes:
+    for n in adj:
         component_sizes[find(n)] += 1
 
     largest = max(component_sizes.values()) if component_sizes else 0
-    # Use neuron_count from stats (includes isolated neurons)
-    total = max(neuron_count, len(all_nodes))
     return largest / total
 
 
+def _sampled_component_ratio(adj: dict[str, set[str]], total: int) -> float:
+    """Estimate the largest component ratio from a node sample.
+
+    Walks the component of each sampled node for at most
+    ``_MAX_COMPONENT_WALK`` nodes. A walk that runs out of nodes gives an
+    exact small component; one that does not lands in a large component,
+    assumed to be the single giant component, whose share of the
+    connected nodes is the share of samples that landed in it.
+    """
+    rng = random.Random(42)  # deterministic sampling
+    nodes = list(adj.keys())
+    sample = rng.sample(nodes, min(_MAX_SAMPLE_NODES, len(nodes)))
+
+    # Component size of nodes already walked (None: a large component)
+    walked: dict[str, int | None] = {}
+    in_giant = 0
+    largest_small = 0
+    for start in sample:
+        if start not in walked:
+            seen = {start}
+            frontier = [start]
+            while frontier and len(seen) <= _MAX_COMPONENT_WALK:
+                node = frontier.pop()
+                for other in adj[node]:
+                    if other not in seen:
+                        seen.add(other)
+                        frontier.append(other)
+            size = len(seen) if not frontier else None
+            for node in seen:
+                walked[node] = size
+        size = walked[start]
+        if size is None:
+            in_giant += 1
+        else:
+            largest_small = max(largest_small, size)
+
+    giant = in_giant / len(sample) * len(nodes)
+    return max(giant, largest_small) / total
+
+
 def _clustering_coefficient(synapses: Sequence[SynapseLike]) -> float:
     """Compute global clustering coefficient.
 
@@ -189,33 +257,45 @@ def _clustering_coefficient(synapses: Sequence[SynapseLike]) -> float:
     Samples max 200 nodes and caps neighbors at 200 per node
     for bounded O(n) performance.
     """
-    # Build undirected adjacency
-    adj: dict[str, set[str]] = defaultdict(set)
-    for s in synapses:
-        adj[s.source_id].add(s.target_id)
-        adj[s.target_id].add(s.source_id)
+    return _clustering_from_adjacency(_undirected_adjacency(synapses))
 
+
+def _clustering_from_adjacency(adj: dict[str, set[str]]) -> float:
     if not adj:
         return 0.0
 
-    # Build edge set for O(1) lookup
-    edge_set: set[frozenset[str]] = set()
-    for s in synapses:
-        edge_set.add(frozenset((s.source_id, s.target_id)))
-
     # Sample nodes if too many
     nodes = list(adj.keys())
     if len(nodes) > _MAX_SAMPLE_NODES:
         rng = random.Random(42)  # deterministic sampling
         nodes = rng.sample(nodes, _MAX_SAMPLE_NODES)
 
-    coefficients: list[float] = []
     rng_neighbors = random.Random(42)
-    for node in nodes:
-        neighbors = list(adj[node])
-        # Cap neighbors for hub nodes to avoid O(k²) blowup
-        if len(neighbors) > _MAX_SAMPLE_NEIGHBORS:
-            neighbors = rng_neighbors.sample(neighbors, _MAX_SAMPLE_NEIGHBORS)
+    return _mean_local_clustering(
+        {node: _capped_neighbors(adj[node], rng_neighbors) for node in nodes}, adj
+    )
+
+
+def _capped_neighbors(neighbors: Iterable[str], rng: random.Random) -> list[str]:
+    """Cap neighbors for hub nodes to avoid O(k²) blowup."""
+    capped = list(neighbors)
+    if len(capped) > _MAX_SAMPLE_NEIGHBORS:
+        capped = rng.sample(capped, _MAX_SAMPLE_NEIGHBORS)
+    return capped
+
+
+def _mean_local_clustering(
+    sampled: Mapping[str, list[str]],
+    adj: Mapping[str, set[str]],
+) -> float:
+    """Average the local clustering of sampled nodes with 2+ neighbors.
+
+    Args:
+        sampled: Sampled node -> its (capped) neighbor list.
+        adj: Neighbor sets covering every node in those lists.
+    """
+    coefficients: list[float] = []
+    for neighbors in sampled.values():
         k = len(neighbors)
         if k < 2:
             continue
@@ -224,10 +304,94 @@ def _clustering_coefficient(synapses: Sequence[SynapseLike]) -> float:
         triangles = 0
         possible = k * (k - 1) // 2
         for i in range(k):
+            linked = adj[neighbors[i]]
             for j in range(i + 1, k):
-                if frozenset((neighbors[i], neighbors[j])) in edge_set:
+                if neighbors[j] in linked:
                     triangles += 1
 
         coefficients.append(triangles / possible if possible > 0 else 0.0)
 
     return sum(coefficients) / len(coefficients) if coefficients else 0.0
+
+
+# ── Storage-sampled estimates ────────────────────────────────────
+
+
+class _NeighborCache:
+    """Neighbor sets read from storage on demand, batched per call."""
+
+    def __init__(self, storage: NeuralStorage) -> None:
+        self._storage = storage
+        self.adj: dict[str, set[str]] = {}
+
+    async def load(self, neuron_ids: Iterable[str]) -> None:
+        missing = [nid for nid in dict.fromkeys(neuron_ids) if nid not in self.adj]
+        if missing:
+            self.adj.update(await self._storage.get_neighbor_ids(missing))
+
+
+async def _sampled_clustering_from_storage(
+    neighbors: _NeighborCache,
+    sample: Sequence[str],
+) -> float:
+    """Estimate clustering from sampled nodes and their neighborhoods.
+
+    Loads the sample's neighbors, then the (capped) neighbors' own
+    neighbor sets, so at most two batched reads per sample.
+    """
+    await neighbors.load(sample)
+    rng_neighbors = random.Random(42)
+    sampled = {node: _capped_neighbors(neighbors.adj[node], rng_neighbors) for node in sample}
+    await neighbors.load(other for capped in sampled.values() for other in capped)
+    return _mean_local_clustering(sampled, neighbors.adj)
+
+
+async def _sampled_component_ratio_from_storage(
+    neighbors: _NeighborCache,
+    sample: Sequence[str],
+    neuron_count: int,
+) -> float:
+    """Estimate the largest component ratio with walks read from storage.
+
+    Same estimate as ``_sampled_component_ratio``, over a sample of all
+    neurons (isolated ones included), so the giant component's share of
+    the sample is its share of ``neuron_count``. Each walk expands one
+    breadth-first layer per batched read.
+    """
+    if not sample:
+        return 0.0
+
+    # Component size of nodes already walked (None: a large component)
+    walked: dict[str, int | None] = {}
+    in_giant = 0
+    largest_small = 0
+    for start in sample:
+        if start not in walked:
+            seen = {start}
+            frontier = [start]
+            large = False
+            while frontier:
+                if len(seen) > _MAX_COMPONENT_WALK or any(
+                    walked.get(n, 0) is None for n in frontier
+                ):
+                    large = True
+                    break
+                await neighbors.load(frontier)
+                layer: list[str] = []
+                for node in frontier:
+                    for other in neighbors.adj[node]:
+                        if other not in seen:
+                            seen.add(other)
+                            layer.append(other)
+                frontier = layer
+            size = None if large else len(seen)
+            for node in seen:
+                walked[node] = size
+        size = walked[start]
+        if size is None:
+            in_giant += 1
+        else:
+            largest_small = max(largest_small, size)
+
+    giant = in_giant / len(sample) * neuron_count
+    return min(1.0, max(giant, largest_small) / neuron_count)
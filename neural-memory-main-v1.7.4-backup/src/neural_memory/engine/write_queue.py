@@ -105,12 +105,12 @@ class DeferredWriteQueue:
             except Exception:
                 logger.debug("Deferred state update failed", exc_info=True)
 
-        for neuron_a, neuron_b, strength, anchor in self._co_activation_records:
+        if self._co_activation_records:
             try:
-                await storage.record_co_activation(neuron_a, neuron_b, strength, anchor)
-                count += 1
+                ids = await storage.record_co_activations_bulk(self._co_activation_records)
+                count += len(ids)
             except Exception:
-                logger.debug("Deferred co-activation record failed", exc_info=True)
+                logger.debug("Deferred co-activation records failed", exc_info=True)
 
         self.clear()
         return count
@@ -353,7 +353,7 @@ class NMHealthTool(BaseNMTool):
         from neural_memory.engine.diagnostics import DiagnosticsEngine
 
         engine = DiagnosticsEngine(self._ctx.storage)
-        report = await engine.analyze(self._ctx.brain.id)
+        report = await engine.analyze_cached(self._ctx.brain.id)
 
         return self._json(
             {
@@ -40,6 +40,7 @@ from neural_memory.core.memory_types import (
     get_decay_rate,
     suggest_memory_type,
 )
+from neural_memory.engine.embedding.factory import create_embedding_provider
 from neural_memory.engine.encoder import MemoryEncoder
 from neural_memory.engine.retrieval import DepthLevel, ReflexPipeline
 from neural_memory.mcp.auto_handler import AutoHandler
@@ -198,7 +199,9 @@ class MCPServer(
 
         priority = Priority.from_int(args.get("priority", 5))
 
-        encoder = MemoryEncoder(storage, brain.config)
+        encoder = MemoryEncoder(
+            storage, brain.config, embedding_provider=create_embedding_provider(brain.config)
+        )
         storage.disable_auto_save()
 
         try:
@@ -392,7 +395,9 @@ class MCPServer(
             except (ValueError, TypeError):
                 return {"error": f"Invalid valid_at datetime: {args['valid_at']}"}
 
-        pipeline = ReflexPipeline(storage, brain.config)
+        pipeline = ReflexPipeline(
+            storage, brain.config, embedding_provider=create_embedding_provider(brain.config)
+        )
         result = await pipeline.query(
             query=effective_query,
             depth=depth,
@@ -558,7 +563,7 @@ class MCPServer(
         from neural_memory.engine.diagnostics import DiagnosticsEngine
 
         engine = DiagnosticsEngine(storage)
-        report = await engine.analyze(brain.id)
+        report = await engine.analyze_cached(brain.id)
 
         return {
             "brain": brain.name,
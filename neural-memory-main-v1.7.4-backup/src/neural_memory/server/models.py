@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -58,6 +58,7 @@ class BrainConfigModel(BaseModel):
     activation_threshold: float = Field(0.2, ge=0, le=1)
     max_spread_hops: int = Field(4, ge=1, le=10)
     max_context_tokens: int = Field(1500, ge=100, le=10000)
+    activation_backend: Literal["storage", "snapshot", "vectorized"] = "storage"
 
 
 # ============ Response Models ============
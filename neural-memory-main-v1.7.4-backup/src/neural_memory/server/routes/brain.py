@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import tempfile
+from collections.abc import AsyncIterator
+from pathlib import Path
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
 from neural_memory.core.brain import Brain, BrainConfig
 from neural_memory.server.dependencies import get_storage
@@ -19,6 +23,13 @@ from neural_memory.server.models import (
     StatsResponse,
 )
 from neural_memory.storage.base import NeuralStorage
+from neural_memory.storage.brain_stream import (
+    MEDIA_TYPES,
+    check_compression,
+    encode_stream,
+    import_brain_from_file,
+    snapshot_records,
+)
 
 router = APIRouter(prefix="/brain", tags=["brain"])
 
@@ -43,6 +54,7 @@ async def create_brain(
             activation_threshold=request.config.activation_threshold,
             max_spread_hops=request.config.max_spread_hops,
             max_context_tokens=request.config.max_context_tokens,
+            activation_backend=request.config.activation_backend,
         )
 
     brain = Brain.create(
@@ -174,6 +186,39 @@ async def export_brain(
     }
 
 
+@router.get(
+    "/{brain_id}/export/stream",
+    responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
+    summary="Stream brain export",
+    description=(
+        "Export a brain as NDJSON records (header, neurons, synapses, fibers, projects, "
+        "typed memories, end), optionally gzip- or zstd-compressed. Memory use does not "
+        "grow with brain size."
+    ),
+)
+async def export_brain_stream(
+    brain_id: str,
+    storage: Annotated[NeuralStorage, Depends(get_storage)],
+    compression: Annotated[str | None, Query(pattern="^(gzip|zstd)$")] = None,
+) -> StreamingResponse:
+    """Stream brain export."""
+    brain = await storage.get_brain(brain_id)
+    if brain is None:
+        raise HTTPException(status_code=404, detail=f"Brain {brain_id} not found")
+    try:
+        check_compression(compression)
+    except ImportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    extension = {None: "ndjson", "gzip": "ndjson.gz", "zstd": "ndjson.zst"}[compression]
+    filename = "".join(c if c.isalnum() or c in "-_." else "_" for c in brain.name)
+    return StreamingResponse(
+        encode_stream(storage.export_brain_stream(brain_id), compression),
+        media_type=MEDIA_TYPES[compression],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{extension}"'},
+    )
+
+
 @router.post(
     "/{brain_id}/import",
     response_model=BrainResponse,
@@ -221,10 +266,57 @@ async def import_brain(
     )
 
 
+@router.post(
+    "/{brain_id}/import/stream",
+    response_model=BrainResponse,
+    responses={400: {"model": ErrorResponse}},
+    summary="Import brain stream",
+    description=(
+        "Import a brain from an NDJSON stream produced by /export/stream "
+        "(compression is detected). The body is spooled to a temporary file, "
+        "then imported incrementally."
+    ),
+)
+async def import_brain_stream(
+    brain_id: str,
+    request: Request,
+    storage: Annotated[NeuralStorage, Depends(get_storage)],
+) -> BrainResponse:
+    """Import brain from a streamed body."""
+    # Receive the whole body first so a slow client never holds the import transaction open
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "import.ndjson"
+        with open(path, "wb") as f:
+            async for chunk in request.stream():
+                f.write(chunk)
+        try:
+            imported_id = await import_brain_from_file(storage, path, brain_id)
+        except (ValueError, ImportError) as e:
+            raise HTTPException(status_code=400, detail=f"Invalid brain stream: {e}")
+
+    brain = await storage.get_brain(imported_id)
+    if brain is None:
+        raise HTTPException(status_code=500, detail="Import failed")
+
+    stats = await storage.get_stats(imported_id)
+
+    return BrainResponse(
+        id=brain.id,
+        name=brain.name,
+        owner_id=brain.owner_id,
+        is_public=brain.is_public,
+        neuron_count=stats["neuron_count"],
+        synapse_count=stats["synapse_count"],
+        fiber_count=stats["fiber_count"],
+        created_at=brain.created_at,
+        updated_at=brain.updated_at,
+    )
+
+
 @router.post(
     "/{brain_id}/merge",
     response_model=MergeReportResponse,
-    responses={404: {"model": ErrorResponse}},
+    responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
     summary="Merge snapshot into brain",
     description="Merge an incoming brain snapshot into an existing brain with conflict resolution.",
 )
@@ -233,16 +325,18 @@ async def merge_brain(
     request: MergeBrainRequest,
     storage: Annotated[NeuralStorage, Depends(get_storage)],
 ) -> MergeReportResponse:
-    """Merge a snapshot into an existing brain."""
+    """Merge a snapshot into an existing brain, in place."""
     from neural_memory.core.brain import BrainSnapshot
-    from neural_memory.engine.merge import ConflictStrategy, merge_snapshots
+    from neural_memory.engine.merge import ConflictStrategy
 
     brain = await storage.get_brain(brain_id)
     if brain is None:
         raise HTTPException(status_code=404, detail=f"Brain {brain_id} not found")
 
-    # Export current brain as local snapshot
-    local_snapshot = await storage.export_brain(brain_id)
+    try:
+        conflict_strategy = ConflictStrategy(request.strategy)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid strategy: {request.strategy}")
 
     # Build incoming snapshot from request
     incoming_snapshot = BrainSnapshot(
@@ -257,20 +351,16 @@ async def merge_brain(
         metadata=request.snapshot.metadata,
     )
 
-    # Merge
-    try:
-        conflict_strategy = ConflictStrategy(request.strategy)
-    except ValueError:
-        raise HTTPException(status_code=400, detail=f"Invalid strategy: {request.strategy}")
-    merged_snapshot, merge_report = merge_snapshots(
-        local=local_snapshot,
-        incoming=incoming_snapshot,
-        strategy=conflict_strategy,
-    )
+    async def incoming_records() -> AsyncIterator[dict[str, Any]]:
+        for record in snapshot_records(incoming_snapshot):
+            yield record
 
-    # Reset brain data then reimport merged snapshot
-    await storage.clear(brain_id)
-    await storage.import_brain(merged_snapshot, brain_id)
+    try:
+        merge_report = await storage.merge_brain_stream(
+            brain_id, incoming_records(), conflict_strategy
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid brain snapshot: {e}")
 
     return MergeReportResponse(
         neurons_added=merge_report.neurons_added,
@@ -19,7 +19,7 @@ class ConsolidateRequest(BaseModel):
 
     strategies: list[str] = Field(
         default=["all"],
-        description="Strategies: prune, merge, summarize, all",
+        description="Strategies: prune, merge, summarize, incremental, all",
     )
     dry_run: bool = Field(False, description="Preview changes without applying")
     prune_weight_threshold: float = Field(0.05, ge=0, le=1)
@@ -97,7 +97,7 @@ async def get_stats(
                 from neural_memory.engine.diagnostics import DiagnosticsEngine
 
                 diag = DiagnosticsEngine(storage)
-                report = await diag.analyze(name)
+                report = await diag.analyze_cached(name)
                 grade = report.grade
                 purity = report.purity_score
             except Exception:
@@ -204,7 +204,7 @@ async def switch_brain(request: SwitchBrainRequest) -> dict[str, str]:
 async def get_health(
     storage: Annotated[NeuralStorage, Depends(get_storage)],
 ) -> HealthReport:
-    """Run full diagnostics on the active brain."""
+    """Diagnostics for the active brain, served from the health report cache."""
     from neural_memory.engine.diagnostics import DiagnosticsEngine
     from neural_memory.unified_config import get_config
 
@@ -212,7 +212,7 @@ async def get_health(
 
     try:
         diag = DiagnosticsEngine(storage)
-        report = await diag.analyze(brain_name)
+        report = await diag.analyze_cached(brain_name)
     except Exception as exc:
         logger.warning("Diagnostics failed for brain %s: %s", brain_name, exc)
         return HealthReport(grade="F", purity_score=0.0)
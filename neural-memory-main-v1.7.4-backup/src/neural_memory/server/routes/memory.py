@@ -8,6 +8,7 @@ from typing import Annotated, Any
 from fastapi import APIRouter, Depends, HTTPException
 
 from neural_memory.core.brain import Brain
+from neural_memory.engine.embedding.factory import create_embedding_provider
 from neural_memory.engine.encoder import MemoryEncoder
 from neural_memory.engine.retrieval import DepthLevel, ReflexPipeline
 from neural_memory.server.dependencies import get_brain, get_storage
@@ -51,7 +52,9 @@ async def encode_memory(
             "Remove secrets before storing.",
         )
 
-    encoder = MemoryEncoder(storage, brain.config)
+    encoder = MemoryEncoder(
+        storage, brain.config, embedding_provider=create_embedding_provider(brain.config)
+    )
 
     tags = set(request.tags) if request.tags else None
 
@@ -83,7 +86,9 @@ async def query_memory(
     storage: Annotated[NeuralStorage, Depends(get_storage)],
 ) -> QueryResponse:
     """Query memories using the reflex pipeline."""
-    pipeline = ReflexPipeline(storage, brain.config)
+    pipeline = ReflexPipeline(
+        storage, brain.config, embedding_provider=create_embedding_provider(brain.config)
+    )
 
     depth = DepthLevel(request.depth) if request.depth is not None else None
 
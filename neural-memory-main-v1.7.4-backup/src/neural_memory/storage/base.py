@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -12,8 +14,17 @@ if TYPE_CHECKING:
     from neural_memory.core.memory_types import MemoryType, Priority, TypedMemory
     from neural_memory.core.neuron import Neuron, NeuronState, NeuronType
     from neural_memory.core.synapse import Synapse, SynapseType
-    from neural_memory.engine.brain_versioning import BrainVersion
+    from neural_memory.engine.brain_versioning import BrainVersion, VersionManifest
+    from neural_memory.engine.consolidation import (
+        DirtySet,
+        ProgressCallback,
+        PrunePolicy,
+        PruneResult,
+    )
+    from neural_memory.engine.embedding.vector_index import VectorIndex
     from neural_memory.engine.memory_stages import MaturationRecord, MemoryStage
+    from neural_memory.engine.merge import ConflictStrategy, MergeReport
+    from neural_memory.storage.graph_snapshot import GraphSnapshot
 
 
 class NeuralStorage(ABC):
@@ -195,6 +206,23 @@ class NeuralStorage(ABC):
                 result[nid] = state
         return result
 
+    async def add_neurons_bulk(self, neurons: list[Neuron]) -> list[str]:
+        """Add several neurons in one call.
+
+        Default implementation falls back to sequential add_neuron.
+        Backends should override for batch efficiency.
+
+        Args:
+            neurons: The neurons to add
+
+        Returns:
+            The neuron IDs, in input order
+
+        Raises:
+            ValueError: If any neuron ID already exists
+        """
+        return [await self.add_neuron(neuron) for neuron in neurons]
+
     # ========== Synapse Operations ==========
 
     @abstractmethod
@@ -213,6 +241,23 @@ class NeuralStorage(ABC):
         """
         ...
 
+    async def add_synapses_bulk(self, synapses: list[Synapse]) -> list[str]:
+        """Add several synapses in one call.
+
+        Default implementation falls back to sequential add_synapse.
+        Backends should override for batch efficiency.
+
+        Args:
+            synapses: The synapses to add
+
+        Returns:
+            The synapse IDs, in input order
+
+        Raises:
+            ValueError: If any synapse ID exists, or an endpoint neuron doesn't
+        """
+        return [await self.add_synapse(synapse) for synapse in synapses]
+
     @abstractmethod
     async def get_synapse(self, synapse_id: str) -> Synapse | None:
         """
@@ -307,6 +352,79 @@ class NeuralStorage(ABC):
                 result[nid] = await self.get_synapses(target_id=nid)
         return result
 
+    async def get_neighbor_ids(self, neuron_ids: Sequence[str]) -> dict[str, set[str]]:
+        """Get the neighbor IDs of multiple neurons, ignoring synapse direction.
+
+        Default implementation uses get_synapses_for_neurons in both
+        directions. Backends should override to skip building synapses.
+
+        Args:
+            neuron_ids: List of neuron IDs
+
+        Returns:
+            Dict mapping neuron_id to the IDs of neurons it shares a synapse with
+        """
+        ids = list(dict.fromkeys(neuron_ids))
+        result: dict[str, set[str]] = {nid: set() for nid in ids}
+        for nid, synapses in (await self.get_synapses_for_neurons(ids, "out")).items():
+            result[nid].update(s.target_id for s in synapses)
+        for nid, synapses in (await self.get_synapses_for_neurons(ids, "in")).items():
+            result[nid].update(s.source_id for s in synapses)
+        return result
+
+    async def get_neurons_page(
+        self, brain_id: str, after_id: str | None = None, limit: int = 500
+    ) -> list[Neuron]:
+        """Return a page of a brain's neurons in ID order (keyset paging).
+
+        Unlike ``find_neurons`` this names the brain explicitly, so a scan
+        spread over many awaits is not redirected by ``set_brain()``.
+        Default implementation pages a full scan and only serves the
+        current brain. Backends should override with a query.
+
+        Args:
+            brain_id: Brain to read
+            after_id: Return neurons with IDs greater than this (None: from the start)
+            limit: Maximum neurons to return
+
+        Returns:
+            Neurons sorted by ID
+        """
+        import sys
+
+        if brain_id != self.current_brain_id:
+            return []
+        neurons = sorted(await self.find_neurons(limit=sys.maxsize), key=lambda n: n.id)
+        if after_id is not None:
+            neurons = [n for n in neurons if n.id > after_id]
+        return neurons[:limit]
+
+    async def sample_neuron_ids(self, limit: int) -> list[str]:
+        """Pick up to ``limit`` neuron IDs of the current brain at random.
+
+        Default implementation samples from a full neuron scan. Backends
+        should override with a query.
+
+        Args:
+            limit: Maximum number of IDs to return
+
+        Returns:
+            Distinct neuron IDs, in random order
+        """
+        import random
+        import sys
+
+        ids = [n.id for n in await self.find_neurons(limit=sys.maxsize)]
+        return random.sample(ids, min(limit, len(ids)))
+
+    async def count_synapses_with_metadata(self, key: str) -> int:
+        """Count synapses of the current brain whose metadata ``key`` is truthy.
+
+        Default implementation scans all synapses. Backends should
+        override with a query.
+        """
+        return sum(1 for s in await self.get_all_synapses() if s.metadata.get(key))
+
     # ========== Graph Traversal ==========
 
     @abstractmethod
@@ -354,6 +472,31 @@ class NeuralStorage(ABC):
         """
         ...
 
+    async def get_graph_snapshot(self) -> GraphSnapshot | None:
+        """Get the in-memory adjacency snapshot for the current brain.
+
+        Default returns None — backends that can keep a CSR snapshot
+        current from their write path should override.
+
+        Returns:
+            The snapshot, or None if the backend does not support it
+        """
+        return None
+
+    async def get_vector_index(self, dimension: int) -> VectorIndex | None:
+        """Get the persistent embedding index for the current brain.
+
+        Default returns None — callers fall back to scanning neuron
+        metadata for stored embeddings.
+
+        Args:
+            dimension: Embedding dimensionality of the active provider
+
+        Returns:
+            The index, or None if the backend does not support it
+        """
+        return None
+
     # ========== Fiber Operations ==========
 
     @abstractmethod
@@ -551,6 +694,84 @@ class NeuralStorage(ABC):
         """
         ...
 
+    async def export_brain_stream(self, brain_id: str) -> AsyncIterator[dict[str, Any]]:
+        """Yield a brain as stream records (see ``storage.brain_stream``).
+
+        Default implementation builds a full snapshot with export_brain.
+        Backends should override to keep memory bounded.
+
+        Args:
+            brain_id: The brain ID to export
+
+        Yields:
+            The header record, then entity records
+
+        Raises:
+            ValueError: If brain doesn't exist
+        """
+        from neural_memory.storage.brain_stream import snapshot_records
+
+        for record in snapshot_records(await self.export_brain(brain_id)):
+            yield record
+
+    async def import_brain_stream(
+        self,
+        records: AsyncIterable[dict[str, Any]],
+        target_brain_id: str | None = None,
+    ) -> str:
+        """Import a brain from stream records.
+
+        Default implementation collects a snapshot for import_brain.
+        Backends should override to keep memory bounded.
+
+        Args:
+            records: The header record, then entity records
+            target_brain_id: Optional ID for the imported brain
+
+        Returns:
+            The ID of the imported brain
+
+        Raises:
+            ValueError: If the records are not a valid brain stream
+        """
+        from neural_memory.storage.brain_stream import collect_snapshot
+
+        return await self.import_brain(await collect_snapshot(records), target_brain_id)
+
+    async def merge_brain_stream(
+        self,
+        brain_id: str,
+        records: AsyncIterable[dict[str, Any]],
+        strategy: ConflictStrategy,
+    ) -> MergeReport:
+        """Merge stream records into an existing brain.
+
+        Default implementation falls back to merge_snapshots on full
+        snapshots, then clears and re-imports the brain. Backends should
+        override to merge in place.
+
+        Args:
+            brain_id: The brain to merge into
+            records: The header record, then entity records
+            strategy: How to resolve conflicts
+
+        Returns:
+            Report of what was added, updated and skipped
+
+        Raises:
+            ValueError: If the brain doesn't exist or the records are not
+                a valid brain stream
+        """
+        from neural_memory.engine.merge import merge_snapshots
+        from neural_memory.storage.brain_stream import collect_snapshot
+
+        incoming = await collect_snapshot(records)
+        local = await self.export_brain(brain_id)
+        merged, report = merge_snapshots(local, incoming, strategy)
+        await self.clear(brain_id)
+        await self.import_brain(merged, brain_id)
+        return report
+
     # ========== Statistics ==========
 
     @abstractmethod
@@ -582,6 +803,50 @@ class NeuralStorage(ABC):
         """
         ...
 
+    async def get_health_stats(self, brain_id: str, fresh_days: int = 7) -> dict[str, Any]:
+        """Get the per-brain aggregates used by health diagnostics.
+
+        Default implementation scans fibers, synapses, neuron states and
+        maturation records. Backends should override with indexed counts.
+
+        Args:
+            brain_id: The brain ID
+            fresh_days: Fibers conducted or created within this many days
+                count as fresh
+
+        Returns:
+            Dict with keys: orphan_neurons, activated_neurons,
+            semantic_fibers, fresh_fibers, fiber_tags (sorted list)
+        """
+        from datetime import timedelta
+
+        from neural_memory.engine.memory_stages import MemoryStage
+        from neural_memory.utils.timeutils import utcnow
+
+        stats = await self.get_stats(brain_id)
+        connected: set[str] = set()
+        for synapse in await self.get_all_synapses():
+            connected.add(synapse.source_id)
+            connected.add(synapse.target_id)
+        states = await self.get_all_neuron_states()
+        semantic = await self.find_maturations(stage=MemoryStage.SEMANTIC)
+
+        cutoff = utcnow() - timedelta(days=fresh_days)
+        fresh = 0
+        tags: set[str] = set()
+        for fiber in await self.get_fibers(limit=10000):
+            if (fiber.last_conducted or fiber.created_at) >= cutoff:
+                fresh += 1
+            tags |= fiber.tags
+
+        return {
+            "orphan_neurons": max(0, stats.get("neuron_count", 0) - len(connected)),
+            "activated_neurons": sum(1 for s in states if s.access_frequency > 0),
+            "semantic_fibers": len(semantic),
+            "fresh_fibers": fresh,
+            "fiber_tags": sorted(tags),
+        }
+
     # ========== Typed Memory Operations ==========
 
     async def add_typed_memory(self, typed_memory: TypedMemory) -> str:
@@ -747,30 +1012,53 @@ class NeuralStorage(ABC):
         """
         raise NotImplementedError
 
+    async def record_co_activations_bulk(
+        self,
+        records: list[tuple[str, str, float, str | None]],
+    ) -> list[str]:
+        """Record several co-activation events in one call.
+
+        Default implementation falls back to sequential record_co_activation.
+        Backends should override for batch efficiency.
+
+        Args:
+            records: (neuron_a, neuron_b, binding_strength, source_anchor) tuples
+
+        Returns:
+            The event IDs, in input order
+        """
+        return [await self.record_co_activation(*record) for record in records]
+
     async def get_co_activation_counts(
         self,
         since: datetime | None = None,
         min_count: int = 1,
+        neuron_ids: set[str] | None = None,
     ) -> list[tuple[str, str, int, float]]:
         """Get aggregated co-activation counts for neuron pairs.
 
+        Backends that roll events up per pair may return time-decayed
+        counts, in which case ``since`` filters on a pair's latest event.
+
         Args:
             since: Only count events after this time
             min_count: Minimum co-activation count to include
+            neuron_ids: Only include pairs with at least one of these neurons
 
         Returns:
-            List of (neuron_a, neuron_b, count, avg_binding_strength) tuples
+            List of (neuron_a, neuron_b, count, avg_binding_strength) tuples,
+            highest count first
         """
         raise NotImplementedError
 
     async def prune_co_activations(self, older_than: datetime) -> int:
-        """Remove co-activation events older than the given time.
+        """Remove co-activation data older than the given time.
 
         Args:
-            older_than: Remove events created before this time
+            older_than: Remove events (or rolled-up pairs last seen) before this time
 
         Returns:
-            Number of events pruned
+            Number of events or pairs pruned
         """
         raise NotImplementedError
 
@@ -860,6 +1148,80 @@ class NeuralStorage(ABC):
         """
         raise NotImplementedError
 
+    async def save_version_delta(
+        self,
+        brain_id: str,
+        version: BrainVersion,
+        header: dict[str, Any],
+        parent_version_id: str | None,
+        changes: dict[tuple[str, str], str | None],
+        rows: dict[str, tuple[str, dict[str, Any]]],
+    ) -> None:
+        """Save a brain version as the manifest changes since its parent.
+
+        Row payloads are content-addressed: a payload already stored for
+        the brain under the same hash is not stored again.
+
+        Args:
+            brain_id: Brain ID
+            version: The version metadata
+            header: Brain stream header record (name, config, ...)
+            parent_version_id: Version the changes apply to, or None for
+                a version holding its full manifest
+            changes: Row hash by (kind, entity_id) for every entity that
+                differs from the parent; None marks an entity removed
+            rows: ``(kind, data)`` by row hash for the changed rows
+        """
+        raise NotImplementedError
+
+    async def get_version_header(
+        self,
+        brain_id: str,
+        version_id: str,
+    ) -> tuple[BrainVersion, dict[str, Any]] | None:
+        """Get a version and its brain stream header record by ID.
+
+        Args:
+            brain_id: Brain ID
+            version_id: Version ID
+
+        Returns:
+            Tuple of (BrainVersion, header) or None
+        """
+        raise NotImplementedError
+
+    async def get_version_manifest(
+        self,
+        brain_id: str,
+        version_id: str,
+    ) -> VersionManifest | None:
+        """Get the full manifest of a version without loading row payloads.
+
+        Args:
+            brain_id: Brain ID
+            version_id: Version ID
+
+        Returns:
+            Row hash by (kind, entity_id), or None if the version is not found
+        """
+        raise NotImplementedError
+
+    async def get_version_rows(
+        self,
+        brain_id: str,
+        row_hashes: Sequence[str],
+    ) -> dict[str, dict[str, Any]]:
+        """Get stored row payloads by hash.
+
+        Args:
+            brain_id: Brain ID
+            row_hashes: Hashes taken from a version manifest
+
+        Returns:
+            Payload by row hash
+        """
+        raise NotImplementedError
+
     async def list_versions(
         self,
         brain_id: str,
@@ -899,6 +1261,72 @@ class NeuralStorage(ABC):
         """
         raise NotImplementedError
 
+    # ========== Transactions ==========
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Group the writes made inside the block into one unit of work.
+
+        Usage::
+
+            async with storage.batch():
+                await storage.add_neuron(neuron)
+                await storage.add_synapse(synapse)
+
+        Default is a no-op — backends that commit per write (SQLite)
+        override it to commit once on exit and roll back on error.
+        """
+        yield
+
+    # ========== Maintenance ==========
+
+    async def prune_bulk(
+        self,
+        policy: PrunePolicy,
+        reference_time: datetime,
+        dry_run: bool = False,
+        progress_callback: ProgressCallback | None = None,
+        neuron_ids: set[str] | None = None,
+    ) -> PruneResult | None:
+        """Prune decayed synapses and orphan neurons in one set-based pass.
+
+        Default returns None — ConsolidationEngine then falls back to
+        pruning synapse by synapse through the regular CRUD methods.
+
+        Args:
+            policy: Decay thresholds and protection rules
+            reference_time: Reference time for age calculations
+            dry_run: If True, count what would be pruned without deleting
+            progress_callback: Optional (stage, done, total) callback
+            neuron_ids: If given, only consider synapses touching these
+                neurons (and orphans among them and the pruned endpoints)
+
+        Returns:
+            Prune counts, or None if the backend does not support it
+        """
+        return None
+
+    async def get_dirty_set(self) -> DirtySet | None:
+        """Get the entities changed since the last consolidation checkpoint.
+
+        Default returns None — incremental consolidation then falls back
+        to processing the whole brain.
+
+        Returns:
+            The dirty set, or None if the backend does not track changes
+        """
+        return None
+
+    async def clear_dirty_set(self, checkpoint: int) -> None:
+        """Forget changes up to and including ``checkpoint``.
+
+        Changes recorded after the checkpoint was read are kept.
+
+        Args:
+            checkpoint: The ``DirtySet.checkpoint`` that was consolidated
+        """
+        return None
+
     # ========== Cleanup ==========
 
     @abstractmethod
@@ -0,0 +1,360 @@
+"""Streaming brain export format (NDJSON, optionally gzip/zstd-compressed).
+
+A ``BrainSnapshot`` holds every neuron, synapse and fiber in memory at
+once. The stream format carries the same data one record per line, so a
+brain of any size is exported and imported with bounded memory::
+
+    {"kind": "header", "format": "neural-memory-brain", "format_version": 1, ...}
+    {"kind": "neuron", "data": {...}}
+    {"kind": "synapse", "data": {...}}
+    ...
+    {"kind": "end", "counts": {"neuron": 2, "synapse": 1, ...}}
+
+Entity records follow in dependency order (neurons, synapses, fibers,
+projects, typed memories) with the same ``data`` dicts as a snapshot.
+The ``end`` record makes a truncated stream detectable.
+
+Storage backends produce and consume records with
+``export_brain_stream()`` / ``import_brain_stream()``; this module turns
+records into bytes and back. Compression is picked by file extension on
+export (``.ndjson.gz``, ``.ndjson.zst``) and sniffed from magic bytes on
+import. zstd needs ``pip install neural-memory[zstd]``.
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from neural_memory.core.brain import BrainSnapshot
+
+if TYPE_CHECKING:
+    from neural_memory.storage.base import NeuralStorage
+
+STREAM_FORMAT = "neural-memory-brain"
+STREAM_FORMAT_VERSION = 1
+
+# Entity record kinds, in the order they are written and imported
+RECORD_KINDS = ("neuron", "synapse", "fiber", "project", "typed_memory")
+
+COMPRESSIONS = ("gzip", "zstd")
+MEDIA_TYPES = {
+    None: "application/x-ndjson",
+    "gzip": "application/gzip",
+    "zstd": "application/zstd",
+}
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_WRITE_BUFFER_BYTES = 64 * 1024
+_READ_CHUNK_BYTES = 64 * 1024
+_MAX_LINE_BYTES = 64 * 1024 * 1024
+
+
+class _Codec(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _Decompressor(Protocol):
+    def decompress(self, data: bytes) -> bytes: ...
+
+
+# ========== Records ==========
+
+
+def header_record(
+    brain_id: str,
+    brain_name: str,
+    exported_at: datetime,
+    version: str,
+    config: dict[str, Any],
+) -> dict[str, Any]:
+    """The first record of a stream."""
+    return {
+        "kind": "header",
+        "format": STREAM_FORMAT,
+        "format_version": STREAM_FORMAT_VERSION,
+        "brain_id": brain_id,
+        "brain_name": brain_name,
+        "exported_at": exported_at.isoformat(),
+        "version": version,
+        "config": config,
+    }
+
+
+def snapshot_records(snapshot: BrainSnapshot) -> Iterator[dict[str, Any]]:
+    """Stream records (header and entities) for an in-memory snapshot."""
+    yield header_record(
+        snapshot.brain_id,
+        snapshot.brain_name,
+        snapshot.exported_at,
+        snapshot.version,
+        snapshot.config,
+    )
+    entities: dict[str, list[dict[str, Any]]] = {
+        "neuron": snapshot.neurons,
+        "synapse": snapshot.synapses,
+        "fiber": snapshot.fibers,
+        "project": snapshot.metadata.get("projects", []),
+        "typed_memory": snapshot.metadata.get("typed_memories", []),
+    }
+    for kind in RECORD_KINDS:
+        for data in entities[kind]:
+            yield {"kind": kind, "data": data}
+
+
+async def collect_snapshot(records: AsyncIterable[dict[str, Any]]) -> BrainSnapshot:
+    """Gather stream records into a ``BrainSnapshot`` (not memory-bounded)."""
+    iterator = aiter(records)
+    header = await read_header(iterator)
+    entities: dict[str, list[dict[str, Any]]] = {kind: [] for kind in RECORD_KINDS}
+    async for record in iterator:
+        kind = record.get("kind")
+        if kind not in entities:
+            raise ValueError(f"Unknown brain stream record kind: {kind!r}")
+        entities[kind].append(record["data"])
+    return BrainSnapshot(
+        brain_id=header["brain_id"],
+        brain_name=header["brain_name"],
+        exported_at=datetime.fromisoformat(header["exported_at"]),
+        version=header["version"],
+        neurons=entities["neuron"],
+        synapses=entities["synapse"],
+        fibers=entities["fiber"],
+        config=header.get("config", {}),
+        metadata={
+            "projects": entities["project"],
+            "typed_memories": entities["typed_memory"],
+        },
+    )
+
+
+async def read_header(records: AsyncIterator[dict[str, Any]]) -> dict[str, Any]:
+    """Consume and validate the header record of ``records``."""
+    header = await anext(records, None)
+    if header is None or header.get("kind") != "header":
+        raise ValueError("Brain stream does not start with a header record")
+    if header.get("format") != STREAM_FORMAT:
+        raise ValueError(f"Not a brain stream: format {header.get('format')!r}")
+    if header.get("format_version", 0) > STREAM_FORMAT_VERSION:
+        raise ValueError(
+            f"Brain stream format version {header['format_version']} is newer than "
+            f"supported ({STREAM_FORMAT_VERSION})"
+        )
+    return header
+
+
+# ========== Encoding ==========
+
+
+def compression_for_path(path: str | Path) -> str | None:
+    """Compression implied by a file name (``.gz`` / ``.zst``), else None."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".gz":
+        return "gzip"
+    if suffix in (".zst", ".zstd"):
+        return "zstd"
+    return None
+
+
+def is_stream_path(path: str | Path) -> bool:
+    """Whether a file name denotes the stream format (``.ndjson``/``.jsonl``, maybe compressed)."""
+    name = Path(path).name.lower()
+    if compression_for_path(name) is not None:
+        name = name.rsplit(".", 1)[0]
+    return name.endswith((".ndjson", ".jsonl"))
+
+
+def _compressor(compression: str | None) -> _Codec | None:
+    if compression is None:
+        return None
+    if compression == "gzip":
+        return zlib.compressobj(6, zlib.DEFLATED, 31)
+    if compression == "zstd":
+        return _zstd().ZstdCompressor().compressobj()  # type: ignore[no-any-return]
+    raise ValueError(f"Unsupported compression {compression!r} (expected one of {COMPRESSIONS})")
+
+
+def _zstd() -> Any:
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ImportError(
+            "zstandard is required for zstd-compressed brain streams. "
+            "Install it with: pip install neural-memory[zstd]"
+        ) from exc
+    return zstandard
+
+
+def check_compression(compression: str | None) -> None:
+    """Raise ValueError/ImportError now if ``compression`` cannot be written."""
+    _compressor(compression)
+
+
+async def encode_stream(
+    records: AsyncIterable[dict[str, Any]],
+    compression: str | None = None,
+) -> AsyncIterator[bytes]:
+    """Serialize records to NDJSON byte chunks, appending the ``end`` record."""
+    codec = _compressor(compression)
+    counts = dict.fromkeys(RECORD_KINDS, 0)
+    buffer = bytearray()
+
+    def emit(data: bytes) -> bytes:
+        return codec.compress(data) if codec is not None else data
+
+    async for record in records:
+        kind = record.get("kind")
+        if kind in counts:
+            counts[kind] += 1
+        buffer += json.dumps(record, ensure_ascii=False, default=str).encode("utf-8")
+        buffer += b"\n"
+        if len(buffer) >= _WRITE_BUFFER_BYTES:
+            chunk = emit(bytes(buffer))
+            buffer.clear()
+            if chunk:
+                yield chunk
+
+    buffer += json.dumps({"kind": "end", "counts": counts}).encode("utf-8") + b"\n"
+    chunk = emit(bytes(buffer))
+    if codec is not None:
+        chunk += codec.flush()
+    if chunk:
+        yield chunk
+
+
+# ========== Decoding ==========
+
+
+def _decompressor(head: bytes) -> _Decompressor | None:
+    if head.startswith(_GZIP_MAGIC):
+        return zlib.decompressobj(31)
+    if head.startswith(_ZSTD_MAGIC):
+        return _zstd().ZstdDecompressor().decompressobj()  # type: ignore[no-any-return]
+    return None
+
+
+async def decode_stream(chunks: AsyncIterable[bytes]) -> AsyncIterator[dict[str, Any]]:
+    """Parse NDJSON byte chunks (compression sniffed) into records.
+
+    Yields the header and entity records; the ``end`` record is checked
+    against what was read and not yielded.
+
+    Raises:
+        ValueError: If the stream is malformed, truncated or its counts
+            do not match the ``end`` record
+    """
+    decompressor: _Decompressor | None = None
+    sniffed = False
+    pending = bytearray()
+    counts = dict.fromkeys(RECORD_KINDS, 0)
+    end: dict[str, Any] | None = None
+
+    def parse(line: bytes) -> dict[str, Any] | None:
+        nonlocal end
+        if not line.strip():
+            return None
+        if end is not None:
+            raise ValueError("Brain stream has records after its end record")
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            raise ValueError(f"Malformed brain stream record: {exc}") from exc
+        if not isinstance(record, dict):
+            raise ValueError("Malformed brain stream record: not an object")
+        if record.get("kind") == "end":
+            end = record
+            return None
+        if record.get("kind") in counts:
+            counts[record["kind"]] += 1
+        return record
+
+    async for chunk in chunks:
+        if not sniffed:
+            pending += chunk
+            if len(pending) < len(_ZSTD_MAGIC):
+                continue
+            decompressor = _decompressor(bytes(pending))
+            chunk, sniffed = bytes(pending), True
+            pending.clear()
+        data = decompressor.decompress(chunk) if decompressor is not None else chunk
+        pending += data
+        *lines, rest = bytes(pending).split(b"\n")
+        pending = bytearray(rest)
+        if len(pending) > _MAX_LINE_BYTES:
+            raise ValueError("Brain stream record exceeds the maximum line length")
+        for line in lines:
+            record = parse(line)
+            if record is not None:
+                yield record
+
+    if not sniffed and pending:
+        decompressor = _decompressor(bytes(pending))
+        if decompressor is not None:
+            pending = bytearray(decompressor.decompress(bytes(pending)))
+    record = parse(bytes(pending))
+    if record is not None:
+        yield record
+
+    if end is None:
+        raise ValueError("Brain stream is truncated (no end record)")
+    expected = {kind: end.get("counts", {}).get(kind, 0) for kind in RECORD_KINDS}
+    if expected != counts:
+        raise ValueError(f"Brain stream counts {counts} do not match end record {expected}")
+
+
+# ========== Files ==========
+
+
+async def read_file_chunks(
+    path: str | Path, chunk_size: int = _READ_CHUNK_BYTES
+) -> AsyncIterator[bytes]:
+    """Read a file in fixed-size chunks."""
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+async def export_brain_to_file(
+    storage: NeuralStorage,
+    brain_id: str,
+    path: str | Path,
+    compression: str | None = None,
+) -> dict[str, int]:
+    """Write a brain to ``path`` as a stream; returns record counts by kind."""
+    return await write_stream_file(storage.export_brain_stream(brain_id), path, compression)
+
+
+async def write_stream_file(
+    records: AsyncIterable[dict[str, Any]],
+    path: str | Path,
+    compression: str | None = None,
+) -> dict[str, int]:
+    """Encode records into ``path``; returns record counts by kind."""
+    counts = dict.fromkeys(RECORD_KINDS, 0)
+
+    async def counted() -> AsyncIterator[dict[str, Any]]:
+        async for record in records:
+            if record.get("kind") in counts:
+                counts[record["kind"]] += 1
+            yield record
+
+    with open(path, "wb") as f:
+        async for chunk in encode_stream(counted(), compression):
+            f.write(chunk)
+    return counts
+
+
+async def import_brain_from_file(
+    storage: NeuralStorage,
+    path: str | Path,
+    target_brain_id: str | None = None,
+) -> str:
+    """Import a brain stream file; returns the imported brain ID."""
+    return await storage.import_brain_stream(decode_stream(read_file_chunks(path)), target_brain_id)
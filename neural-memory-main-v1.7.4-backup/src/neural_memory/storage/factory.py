@@ -3,19 +3,27 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
 from neural_memory.core.brain_mode import BrainMode, BrainModeConfig
+from neural_memory.storage.health_cache import health_cache_for
 from neural_memory.storage.memory_store import InMemoryStorage
 from neural_memory.storage.shared_store import SharedStorage
 from neural_memory.storage.sqlite_store import SQLiteStorage
 
 logger = logging.getLogger(__name__)
 
+# A queued remote write: (SharedStorage method, positional args)
+_RemoteCall = tuple[Callable[..., Awaitable[Any]], tuple[Any, ...]]
+
 if TYPE_CHECKING:
     from neural_memory.core.brain import Brain, BrainSnapshot
     from neural_memory.core.neuron import Neuron, NeuronState, NeuronType
     from neural_memory.core.synapse import Synapse
+    from neural_memory.engine.merge import ConflictStrategy, MergeReport
     from neural_memory.storage.base import NeuralStorage
 
 
@@ -110,6 +118,10 @@ class HybridStorage:
         self._remote = remote
         self._auto_sync = auto_sync_on_encode
         self._brain_id: str | None = None
+        # Remote calls queued by the open batch(), sent after it commits
+        self._pending_sync: ContextVar[list[_RemoteCall] | None] = ContextVar(
+            f"hybrid_sync_{id(self)}", default=None
+        )
 
     @classmethod
     async def create(
@@ -142,24 +154,47 @@ class HybridStorage:
         storage._brain_id = brain_id
         return storage
 
+    @property
+    def current_brain_id(self) -> str | None:
+        """The active brain ID, or None if not set."""
+        return self._brain_id
+
     def set_brain(self, brain_id: str) -> None:
         """Set the current brain context."""
         self._brain_id = brain_id
         self._local.set_brain(brain_id)
         self._remote.set_brain(brain_id)
 
+    async def _sync_remote(self, call: Callable[..., Awaitable[Any]], *args: Any) -> None:
+        """Mirror a local write to the server (queued while a batch is open)."""
+        if not self._auto_sync:
+            return
+        pending = self._pending_sync.get()
+        if pending is not None:
+            pending.append((call, args))
+            return
+        await self._push(call, args)
+
+    async def _push(self, call: Callable[..., Awaitable[Any]], args: tuple[Any, ...]) -> None:
+        try:
+            await self._ensure_connected()
+            await call(*args)
+        except (ConnectionError, OSError) as e:
+            logger.debug("Remote sync failed for %s: %s", call.__name__, e)
+
     # Delegate all NeuralStorage methods to local storage
     # Sync to remote when appropriate
 
     async def add_neuron(self, neuron: Neuron) -> str:
         """Add neuron locally, optionally sync."""
         result = await self._local.add_neuron(neuron)
-        if self._auto_sync:
-            try:
-                await self._ensure_connected()
-                await self._remote.add_neuron(neuron)
-            except (ConnectionError, OSError) as e:
-                logger.debug("Remote sync failed for add_neuron: %s", e)
+        await self._sync_remote(self._remote.add_neuron, neuron)
+        return result
+
+    async def add_neurons_bulk(self, neurons: list[Neuron]) -> list[str]:
+        """Add neurons locally in bulk, optionally sync."""
+        result = await self._local.add_neurons_bulk(neurons)
+        await self._sync_remote(self._remote.add_neurons_bulk, neurons)
         return result
 
     async def get_neuron(self, neuron_id: str) -> Neuron | None:
@@ -170,25 +205,20 @@ class HybridStorage:
         """Find neurons in local storage."""
         return await self._local.find_neurons(**kwargs)
 
+    async def get_neurons_page(
+        self, brain_id: str, after_id: str | None = None, limit: int = 500
+    ) -> list[Neuron]:
+        return await self._local.get_neurons_page(brain_id, after_id, limit)
+
     async def update_neuron(self, neuron: Neuron) -> None:
         """Update neuron locally, optionally sync."""
         await self._local.update_neuron(neuron)
-        if self._auto_sync:
-            try:
-                await self._ensure_connected()
-                await self._remote.update_neuron(neuron)
-            except (ConnectionError, OSError) as e:
-                logger.debug("Remote sync failed for update_neuron: %s", e)
+        await self._sync_remote(self._remote.update_neuron, neuron)
 
     async def delete_neuron(self, neuron_id: str) -> bool:
         """Delete neuron locally, optionally sync."""
         result = await self._local.delete_neuron(neuron_id)
-        if self._auto_sync:
-            try:
-                await self._ensure_connected()
-                await self._remote.delete_neuron(neuron_id)
-            except (ConnectionError, OSError) as e:
-                logger.debug("Remote sync failed for delete_neuron: %s", e)
+        await self._sync_remote(self._remote.delete_neuron, neuron_id)
         return result
 
     async def suggest_neurons(
@@ -208,12 +238,12 @@ class HybridStorage:
 
     async def add_synapse(self, synapse: Synapse) -> str:
         result = await self._local.add_synapse(synapse)
-        if self._auto_sync:
-            try:
-                await self._ensure_connected()
-                await self._remote.add_synapse(synapse)
-            except (ConnectionError, OSError) as e:
-                logger.debug("Remote sync failed for add_synapse: %s", e)
+        await self._sync_remote(self._remote.add_synapse, synapse)
+        return result
+
+    async def add_synapses_bulk(self, synapses: list[Synapse]) -> list[str]:
+        result = await self._local.add_synapses_bulk(synapses)
+        await self._sync_remote(self._remote.add_synapses_bulk, synapses)
         return result
 
     async def get_synapse(self, synapse_id: str) -> Synapse | None:
@@ -224,21 +254,11 @@ class HybridStorage:
 
     async def update_synapse(self, synapse: Synapse) -> None:
         await self._local.update_synapse(synapse)
-        if self._auto_sync:
-            try:
-                await self._ensure_connected()
-                await self._remote.update_synapse(synapse)
-            except (ConnectionError, OSError) as e:
-                logger.debug("Remote sync failed for update_synapse: %s", e)
+        await self._sync_remote(self._remote.update_synapse, synapse)
 
     async def delete_synapse(self, synapse_id: str) -> bool:
         result = await self._local.delete_synapse(synapse_id)
-        if self._auto_sync:
-            try:
-                await self._ensure_connected()
-                await self._remote.delete_synapse(synapse_id)
-            except (ConnectionError, OSError) as e:
-                logger.debug("Remote sync failed for delete_synapse: %s", e)
+        await self._sync_remote(self._remote.delete_synapse, synapse_id)
         return result
 
     async def get_neighbors(self, neuron_id: str, **kwargs: Any) -> Any:
@@ -247,14 +267,39 @@ class HybridStorage:
     async def get_path(self, source_id: str, target_id: str, max_hops: int = 4) -> Any:
         return await self._local.get_path(source_id, target_id, max_hops)
 
+    async def get_graph_snapshot(self) -> Any:
+        return await self._local.get_graph_snapshot()
+
+    async def get_vector_index(self, dimension: int) -> Any:
+        return await self._local.get_vector_index(dimension)
+
+    async def prune_bulk(self, policy: Any, reference_time: Any, **kwargs: Any) -> Any:
+        # Bulk deletes bypass per-row remote sync; prune row by row instead
+        if self._auto_sync:
+            return None
+        return await self._local.prune_bulk(policy, reference_time, **kwargs)
+
+    async def get_dirty_set(self) -> Any:
+        return await self._local.get_dirty_set()
+
+    async def clear_dirty_set(self, checkpoint: int) -> None:
+        await self._local.clear_dirty_set(checkpoint)
+
+    async def record_co_activation(self, *args: Any, **kwargs: Any) -> str:
+        return await self._local.record_co_activation(*args, **kwargs)
+
+    async def record_co_activations_bulk(self, records: list[Any]) -> list[str]:
+        return await self._local.record_co_activations_bulk(records)
+
+    async def get_co_activation_counts(self, **kwargs: Any) -> Any:
+        return await self._local.get_co_activation_counts(**kwargs)
+
+    async def prune_co_activations(self, older_than: Any) -> int:
+        return await self._local.prune_co_activations(older_than)
+
     async def add_fiber(self, fiber: Any) -> str:
         result = await self._local.add_fiber(fiber)
-        if self._auto_sync:
-            try:
-                await self._ensure_connected()
-                await self._remote.add_fiber(fiber)
-            except (ConnectionError, OSError) as e:
-                logger.debug("Remote sync failed for add_fiber: %s", e)
+        await self._sync_remote(self._remote.add_fiber, fiber)
         return result
 
     async def get_fiber(self, fiber_id: str) -> Any:
@@ -265,21 +310,11 @@ class HybridStorage:
 
     async def update_fiber(self, fiber: Any) -> None:
         await self._local.update_fiber(fiber)
-        if self._auto_sync:
-            try:
-                await self._ensure_connected()
-                await self._remote.update_fiber(fiber)
-            except (ConnectionError, OSError) as e:
-                logger.debug("Remote sync failed for update_fiber: %s", e)
+        await self._sync_remote(self._remote.update_fiber, fiber)
 
     async def delete_fiber(self, fiber_id: str) -> bool:
         result = await self._local.delete_fiber(fiber_id)
-        if self._auto_sync:
-            try:
-                await self._ensure_connected()
-                await self._remote.delete_fiber(fiber_id)
-            except (ConnectionError, OSError) as e:
-                logger.debug("Remote sync failed for delete_fiber: %s", e)
+        await self._sync_remote(self._remote.delete_fiber, fiber_id)
         return result
 
     async def get_fibers(self, **kwargs: Any) -> Any:
@@ -297,7 +332,29 @@ class HybridStorage:
     async def import_brain(
         self, snapshot: BrainSnapshot, target_brain_id: str | None = None
     ) -> str:
-        return await self._local.import_brain(snapshot, target_brain_id)
+        brain_id = await self._local.import_brain(snapshot, target_brain_id)
+        health_cache_for(self).invalidate(brain_id)  # type: ignore[arg-type]
+        return brain_id
+
+    def export_brain_stream(self, brain_id: str) -> AsyncIterator[dict[str, Any]]:
+        return self._local.export_brain_stream(brain_id)
+
+    async def import_brain_stream(
+        self, records: AsyncIterable[dict[str, Any]], target_brain_id: str | None = None
+    ) -> str:
+        brain_id = await self._local.import_brain_stream(records, target_brain_id)
+        health_cache_for(self).invalidate(brain_id)  # type: ignore[arg-type]
+        return brain_id
+
+    async def merge_brain_stream(
+        self,
+        brain_id: str,
+        records: AsyncIterable[dict[str, Any]],
+        strategy: ConflictStrategy,
+    ) -> MergeReport:
+        report = await self._local.merge_brain_stream(brain_id, records, strategy)
+        health_cache_for(self).invalidate(brain_id)  # type: ignore[arg-type]
+        return report
 
     async def get_stats(self, brain_id: str) -> dict[str, int]:
         return await self._local.get_stats(brain_id)
@@ -305,8 +362,34 @@ class HybridStorage:
     async def get_enhanced_stats(self, brain_id: str) -> dict[str, Any]:
         return await self._local.get_enhanced_stats(brain_id)
 
+    async def get_health_stats(self, brain_id: str, fresh_days: int = 7) -> dict[str, Any]:
+        return await self._local.get_health_stats(brain_id, fresh_days)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Group local writes into one transaction.
+
+        Remote sync calls made inside the block are queued and sent once the
+        local transaction has committed, so no network round-trip runs while
+        SQLite's write lock is held. A rollback drops them.
+        """
+        outer = self._pending_sync.get()
+        pending: list[_RemoteCall] = []
+        token = self._pending_sync.set(pending)
+        try:
+            async with self._local.batch():
+                yield
+        finally:
+            self._pending_sync.reset(token)
+        if outer is not None:
+            outer.extend(pending)
+            return
+        for call, args in pending:
+            await self._push(call, args)
+
     async def clear(self, brain_id: str) -> None:
         await self._local.clear(brain_id)
+        health_cache_for(self).invalidate(brain_id)  # type: ignore[arg-type]
 
     # Sync operations
 
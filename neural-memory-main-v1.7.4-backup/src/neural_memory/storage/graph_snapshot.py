@@ -0,0 +1,423 @@
+"""Compact in-memory adjacency snapshot for I/O-free spreading activation.
+
+The snapshot stores the synapse graph of one brain in CSR (compressed
+sparse row) form: ``indptr``/``indices`` arrays of int neuron indices and a
+parallel float32 ``weights`` array, plus per-neuron access-frequency and
+refractory vectors. Every synapse appears in both endpoint rows, matching
+``get_neighbors(direction="both")``.
+
+Writes after the initial build go to a small overlay (added edges) and to
+tombstones (removed edges), which readers see alongside the packed arrays.
+Only once the overlay grows past a fraction of the CSR size are the arrays
+rebuilt in-process — no storage round-trip.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import NamedTuple
+
+# Weight written into CSR slots of deleted synapses; below any min_weight.
+_TOMBSTONE = -1.0
+
+# Rebuild CSR once overlay + tombstones exceed this share of CSR edges
+_COMPACT_RATIO = 0.25
+_COMPACT_MIN_EDGES = 1024
+
+# Keep at least this many state-change entries before truncating the log
+_STATE_LOG_MIN = 4096
+
+
+def refractory_timestamp(refractory_until: datetime | str | None) -> float:
+    """Convert a refractory deadline to the float stored in the snapshot.
+
+    Naive UTC datetimes are converted the same way as ``utcnow()`` so the
+    comparison in the activation loop stays consistent.
+    """
+    if refractory_until is None:
+        return 0.0
+    if isinstance(refractory_until, str):
+        refractory_until = datetime.fromisoformat(refractory_until)
+    return refractory_until.timestamp()
+
+
+class CSRArrays(NamedTuple):
+    """Packed snapshot buffers.
+
+    ``indptr``/``indices``/``weights`` are replaced, never resized, so they
+    are safe for zero-copy ``numpy.frombuffer``; the per-neuron vectors grow
+    on ``add_neuron`` and must be copied. Neurons added since the last
+    compaction have no ``indptr`` row; their edges, and every other edge
+    written since then, are in the ``overlay_*`` arrays: one entry per
+    endpoint row, sorted by row.
+    """
+
+    indptr: array[int]
+    indices: array[int]
+    weights: array[float]
+    alive: bytearray
+    access_frequency: array[int]
+    refractory_until: array[float]
+    overlay_rows: array[int]
+    overlay_indices: array[int]
+    overlay_weights: array[float]
+
+
+class GraphSnapshot:
+    """CSR adjacency for one brain, kept current by the storage write path.
+
+    Neuron indices are stable for the lifetime of the snapshot: deleted
+    neurons are only flagged dead, so activation results never need to be
+    remapped after a compaction.
+    """
+
+    def __init__(
+        self,
+        neuron_ids: Iterable[str],
+        synapses: Iterable[tuple[str, str, str, float]],
+        states: Iterable[tuple[str, int, float]] = (),
+    ) -> None:
+        """
+        Build a snapshot from raw rows.
+
+        Args:
+            neuron_ids: IDs of all neurons in the brain
+            synapses: (synapse_id, source_id, target_id, weight) rows
+            states: (neuron_id, access_frequency, refractory_timestamp) rows
+        """
+        self._ids: list[str] = list(neuron_ids)
+        self._index: dict[str, int] = {nid: i for i, nid in enumerate(self._ids)}
+        self._alive = bytearray(b"\x01" * len(self._ids))
+        self._freq = array("I", bytes(4 * len(self._ids)))
+        self._refractory = array("d", bytes(8 * len(self._ids)))
+
+        for neuron_id, frequency, refractory in states:
+            idx = self._index.get(neuron_id)
+            if idx is not None:
+                self._freq[idx] = max(0, frequency)
+                self._refractory[idx] = refractory
+
+        # synapse_id -> (source_idx, target_idx, weight) for every live synapse
+        self._edges: dict[str, tuple[int, int, float]] = {}
+        for synapse_id, source_id, target_id, weight in synapses:
+            src = self._index.get(source_id)
+            tgt = self._index.get(target_id)
+            if src is None or tgt is None:
+                continue
+            self._edges[synapse_id] = (src, tgt, weight)
+
+        self._indptr = array("q")
+        self._indices = array("i")
+        self._weights = array("f")
+        self._slots: dict[str, tuple[int, int]] = {}
+        self._slot_ids: list[str] = []
+        self._overlay: dict[int, dict[str, tuple[int, float]]] = {}
+        self._overlay_size = 0
+        self._tombstones = 0
+        self._version = 0
+        # Indices whose frequency/refractory changed, for in-place patching
+        self._state_log: list[int] = []
+        self._state_epoch = 0
+        self._rebuild()
+
+    # ========== Read API ==========
+
+    @property
+    def neuron_count(self) -> int:
+        """Number of live neurons."""
+        return sum(self._alive)
+
+    @property
+    def synapse_count(self) -> int:
+        """Number of live synapses."""
+        return len(self._edges)
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every graph mutation, for caching derived arrays.
+
+        State-only writes (``update_state``) do not bump it; they go to the
+        state-change log instead (see ``state_changes``).
+        """
+        return self._version
+
+    @property
+    def state_cursor(self) -> tuple[int, int]:
+        """Position in the state-change log: (epoch, entries so far)."""
+        return self._state_epoch, len(self._state_log)
+
+    def state_changes(self, cursor: tuple[int, int]) -> list[int] | None:
+        """Return indices whose state changed since a cursor.
+
+        Returns None when the log was reset since then (neurons were added
+        or the log was truncated): the caller must re-read every vector.
+        """
+        epoch, position = cursor
+        if epoch != self._state_epoch:
+            return None
+        return self._state_log[position:]
+
+    def csr(self) -> CSRArrays:
+        """Return the packed buffers and the pending overlay, without re-packing.
+
+        Costs O(overlay), not O(edges): compaction happens only on the
+        write path, once the overlay passes its size threshold. Tombstoned
+        slots stay in place with a negative weight, so callers must filter
+        on weight like ``neighbors`` does.
+        """
+        rows = array("i")
+        indices = array("i")
+        weights = array("f")
+        for row in sorted(self._overlay):
+            for neighbor, weight in self._overlay[row].values():
+                rows.append(row)
+                indices.append(neighbor)
+                weights.append(weight)
+        return CSRArrays(
+            indptr=self._indptr,
+            indices=self._indices,
+            weights=self._weights,
+            alive=self._alive,
+            access_frequency=self._freq,
+            refractory_until=self._refractory,
+            overlay_rows=rows,
+            overlay_indices=indices,
+            overlay_weights=weights,
+        )
+
+    def index_of(self, neuron_id: str) -> int | None:
+        """Return the snapshot index of a live neuron, or None."""
+        idx = self._index.get(neuron_id)
+        if idx is None or not self._alive[idx]:
+            return None
+        return idx
+
+    def neuron_id(self, idx: int) -> str:
+        """Return the neuron ID stored at an index."""
+        return self._ids[idx]
+
+    def access_frequency(self, idx: int) -> int:
+        """Return the cached access frequency of a neuron."""
+        return self._freq[idx]
+
+    def refractory_until(self, idx: int) -> float:
+        """Return the refractory deadline timestamp (0.0 when not refractory)."""
+        return self._refractory[idx]
+
+    def neighbors(self, idx: int, min_weight: float = 0.0) -> Iterator[tuple[int, float]]:
+        """Yield (neighbor_idx, weight) for live edges touching a neuron."""
+        alive = self._alive
+        if idx + 1 < len(self._indptr):
+            indices = self._indices
+            weights = self._weights
+            for pos in range(self._indptr[idx], self._indptr[idx + 1]):
+                weight = weights[pos]
+                if weight < min_weight or weight == _TOMBSTONE:
+                    continue
+                neighbor = indices[pos]
+                if alive[neighbor]:
+                    yield neighbor, weight
+        extra = self._overlay.get(idx)
+        if extra:
+            for neighbor, weight in extra.values():
+                if weight >= min_weight and alive[neighbor]:
+                    yield neighbor, weight
+
+    # ========== Write-path hooks ==========
+
+    def add_neuron(self, neuron_id: str) -> None:
+        """Register a newly stored neuron."""
+        self._version += 1
+        self._reset_state_log()
+        idx = self._index.get(neuron_id)
+        if idx is not None:
+            self._alive[idx] = 1
+            self._freq[idx] = 0
+            self._refractory[idx] = 0.0
+            return
+        self._index[neuron_id] = len(self._ids)
+        self._ids.append(neuron_id)
+        self._alive.append(1)
+        self._freq.append(0)
+        self._refractory.append(0.0)
+
+    def remove_neuron(self, neuron_id: str) -> None:
+        """Mark a neuron dead and drop every synapse touching it.
+
+        The synapses go too, so re-adding the same ID starts with no edges.
+        """
+        self._version += 1
+        idx = self._index.get(neuron_id)
+        if idx is None:
+            return
+        self._alive[idx] = 0
+        incident = set(self._overlay.get(idx, ()))
+        if idx + 1 < len(self._indptr):
+            incident.update(self._slot_ids[self._indptr[idx] : self._indptr[idx + 1]])
+        for synapse_id in incident:
+            self.remove_synapse(synapse_id)
+
+    def update_state(self, neuron_id: str, access_frequency: int, refractory: float) -> None:
+        """Refresh the frequency/refractory entries of a neuron."""
+        idx = self._index.get(neuron_id)
+        if idx is None:
+            return
+        self._freq[idx] = max(0, access_frequency)
+        self._refractory[idx] = refractory
+        self._state_log.append(idx)
+        if len(self._state_log) > max(_STATE_LOG_MIN, len(self._ids)):
+            self._reset_state_log()
+
+    def upsert_synapse(
+        self, synapse_id: str, source_id: str, target_id: str, weight: float
+    ) -> None:
+        """Insert a new synapse or update the weight of an existing one."""
+        self._version += 1
+        src = self._index.get(source_id)
+        tgt = self._index.get(target_id)
+        if src is None or tgt is None:
+            return
+
+        existing = self._edges.get(synapse_id)
+        if existing is not None and existing[:2] != (src, tgt):
+            self.remove_synapse(synapse_id)
+            existing = None
+        self._edges[synapse_id] = (src, tgt, weight)
+
+        slots = self._slots.get(synapse_id)
+        if slots is not None:
+            for pos in slots:
+                if pos >= 0:
+                    self._weights[pos] = weight
+            return
+
+        if existing is None:
+            self._overlay_size += 1
+        self._overlay.setdefault(src, {})[synapse_id] = (tgt, weight)
+        if tgt != src:
+            self._overlay.setdefault(tgt, {})[synapse_id] = (src, weight)
+        self._maybe_compact()
+
+    def remove_synapse(self, synapse_id: str) -> None:
+        """Drop a synapse from the snapshot."""
+        self._version += 1
+        edge = self._edges.pop(synapse_id, None)
+        if edge is None:
+            return
+        src, tgt, _ = edge
+
+        slots = self._slots.pop(synapse_id, None)
+        if slots is not None:
+            for pos in slots:
+                if pos >= 0:
+                    self._weights[pos] = _TOMBSTONE
+            self._tombstones += 1
+            self._maybe_compact()
+            return
+
+        for idx in (src, tgt):
+            row = self._overlay.get(idx)
+            if row is not None:
+                row.pop(synapse_id, None)
+                if not row:
+                    del self._overlay[idx]
+        self._overlay_size -= 1
+
+    # ========== Internals ==========
+
+    def _reset_state_log(self) -> None:
+        self._state_log = []
+        self._state_epoch += 1
+
+    def _maybe_compact(self) -> None:
+        pending = self._overlay_size + self._tombstones
+        if pending > max(_COMPACT_MIN_EDGES, int(len(self._indices) * _COMPACT_RATIO)):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Re-pack all live edges into fresh CSR arrays (counting sort by row)."""
+        self._version += 1
+        alive = self._alive
+        live = {sid: edge for sid, edge in self._edges.items() if alive[edge[0]] and alive[edge[1]]}
+        self._edges = live
+
+        n = len(self._ids)
+        degree = [0] * (n + 1)
+        for src, tgt, _ in live.values():
+            degree[src + 1] += 1
+            if tgt != src:
+                degree[tgt + 1] += 1
+        for i in range(n):
+            degree[i + 1] += degree[i]
+
+        total = degree[n]
+        indptr = array("q", degree)
+        indices = array("i", bytes(4 * total))
+        weights = array("f", bytes(4 * total))
+        cursor = degree[:n]
+        slots: dict[str, tuple[int, int]] = {}
+        slot_ids = [""] * total
+
+        for sid, (src, tgt, weight) in live.items():
+            out_pos = cursor[src]
+            cursor[src] += 1
+            indices[out_pos] = tgt
+            weights[out_pos] = weight
+            slot_ids[out_pos] = sid
+            in_pos = -1
+            if tgt != src:
+                in_pos = cursor[tgt]
+                cursor[tgt] += 1
+                indices[in_pos] = src
+                weights[in_pos] = weight
+                slot_ids[in_pos] = sid
+            slots[sid] = (out_pos, in_pos)
+
+        self._indptr = indptr
+        self._indices = indices
+        self._weights = weights
+        self._slots = slots
+        self._slot_ids = slot_ids
+        self._overlay = {}
+        self._overlay_size = 0
+        self._tombstones = 0
+
+
+class GraphSnapshotRegistry:
+    """Per-brain snapshot holder used by storage backends.
+
+    Every write-path lookup bumps a per-brain generation counter, so a
+    snapshot built across several awaits can detect writes that landed
+    while it was loading and be discarded instead of going stale.
+    """
+
+    def __init__(self) -> None:
+        self._snapshots: dict[str, GraphSnapshot] = {}
+        self._generations: dict[str, int] = {}
+
+    def get(self, brain_id: str) -> GraphSnapshot | None:
+        """Return the registered snapshot for a brain, if any."""
+        return self._snapshots.get(brain_id)
+
+    def for_write(self, brain_id: str) -> GraphSnapshot | None:
+        """Record a write to a brain and return its snapshot for patching."""
+        self._generations[brain_id] = self._generations.get(brain_id, 0) + 1
+        return self._snapshots.get(brain_id)
+
+    def generation(self, brain_id: str) -> int:
+        """Return the current write generation of a brain."""
+        return self._generations.get(brain_id, 0)
+
+    def register(self, brain_id: str, snapshot: GraphSnapshot, generation: int) -> bool:
+        """Register a freshly built snapshot if no write happened during the build."""
+        if self.generation(brain_id) != generation:
+            return False
+        self._snapshots[brain_id] = snapshot
+        return True
+
+    def invalidate(self, brain_id: str) -> None:
+        """Drop the snapshot of a brain after a bulk rewrite."""
+        self.for_write(brain_id)
+        self._snapshots.pop(brain_id, None)
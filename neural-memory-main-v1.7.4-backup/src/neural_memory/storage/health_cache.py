@@ -0,0 +1,102 @@
+"""Per-storage cache of brain health reports.
+
+Writes that change a brain's shape invalidate its entry, so every storage
+backend reaches the cache through ``health_cache_for``; the diagnostics
+engine fills it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from neural_memory.engine.diagnostics import BrainHealthReport
+    from neural_memory.storage.base import NeuralStorage
+
+logger = logging.getLogger(__name__)
+
+
+class HealthReportCache:
+    """Health reports per brain with a staleness budget.
+
+    A report younger than ``max_age`` seconds is returned as is. An older
+    one is still returned immediately while a single background task
+    recomputes it; a failed refresh is logged and the old report kept.
+    Concurrent callers share one computation per brain.
+    """
+
+    DEFAULT_MAX_AGE = 60.0
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE) -> None:
+        self.max_age = max_age
+        self._reports: dict[str, tuple[float, BrainHealthReport]] = {}
+        self._refreshing: dict[str, asyncio.Task[BrainHealthReport]] = {}
+
+    async def get(
+        self,
+        brain_id: str,
+        compute: Callable[[], Awaitable[BrainHealthReport]],
+    ) -> BrainHealthReport:
+        """Cached report for ``brain_id``, computing it with ``compute`` when due."""
+        cached = self._reports.get(brain_id)
+        if cached is None:
+            # Shielded so one cancelled caller does not cancel the shared refresh
+            return await asyncio.shield(self._refresh(brain_id, compute))
+
+        computed_at, report = cached
+        if time.monotonic() - computed_at > self.max_age:
+            self._refresh(brain_id, compute)
+        return report
+
+    def invalidate(self, brain_id: str | None = None) -> None:
+        """Drop the cached report for one brain, or for all brains."""
+        if brain_id is None:
+            self._reports.clear()
+        else:
+            self._reports.pop(brain_id, None)
+
+    def _refresh(
+        self,
+        brain_id: str,
+        compute: Callable[[], Awaitable[BrainHealthReport]],
+    ) -> asyncio.Task[BrainHealthReport]:
+        task = self._refreshing.get(brain_id)
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return task
+
+        async def run() -> BrainHealthReport:
+            report = await compute()
+            self._reports[brain_id] = (time.monotonic(), report)
+            return report
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._refreshing[brain_id] = task
+        task.add_done_callback(lambda t: self._refresh_done(brain_id, t))
+        return task
+
+    def _refresh_done(self, brain_id: str, task: asyncio.Task[BrainHealthReport]) -> None:
+        if self._refreshing.get(brain_id) is task:
+            del self._refreshing[brain_id]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                "Health report refresh failed for brain %s", brain_id, exc_info=task.exception()
+            )
+
+
+_health_caches: weakref.WeakKeyDictionary[NeuralStorage, HealthReportCache] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def health_cache_for(storage: NeuralStorage) -> HealthReportCache:
+    """The health report cache shared by all users of ``storage``."""
+    cache = _health_caches.get(storage)
+    if cache is None:
+        cache = HealthReportCache()
+        _health_caches[storage] = cache
+    return cache
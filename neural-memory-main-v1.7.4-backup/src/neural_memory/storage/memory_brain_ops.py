@@ -18,6 +18,7 @@ from neural_memory.core.memory_types import (
 from neural_memory.core.neuron import Neuron, NeuronType
 from neural_memory.core.project import Project
 from neural_memory.core.synapse import Direction, Synapse, SynapseType
+from neural_memory.storage.health_cache import health_cache_for
 from neural_memory.utils.timeutils import utcnow
 
 
@@ -177,6 +178,7 @@ class InMemoryBrainMixin:
             self._import_projects(brain_id, snapshot.metadata.get("projects", []))
         finally:
             self._current_brain_id = old_brain_id
+        health_cache_for(self).invalidate(brain_id)  # type: ignore[arg-type]
 
         return brain_id
 
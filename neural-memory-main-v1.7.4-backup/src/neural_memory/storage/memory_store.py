@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Sequence
 from datetime import datetime, timedelta
 from typing import Any, Literal
 from uuid import uuid4
@@ -15,8 +16,15 @@ from neural_memory.core.memory_types import TypedMemory
 from neural_memory.core.neuron import Neuron, NeuronState, NeuronType
 from neural_memory.core.project import Project
 from neural_memory.core.synapse import Synapse, SynapseType
-from neural_memory.engine.brain_versioning import BrainVersion
+from neural_memory.engine.brain_versioning import (
+    BrainVersion,
+    VersionManifest,
+    _snapshot_to_json,
+    manifest_snapshot,
+    snapshot_manifest,
+)
 from neural_memory.storage.base import NeuralStorage
+from neural_memory.storage.health_cache import health_cache_for
 from neural_memory.storage.memory_brain_ops import InMemoryBrainMixin
 from neural_memory.storage.memory_collections import InMemoryCollectionsMixin
 from neural_memory.utils.timeutils import utcnow
@@ -40,6 +48,11 @@ class InMemoryStorage(InMemoryCollectionsMixin, InMemoryBrainMixin, NeuralStorag
         self._co_activations: dict[str, list[dict[str, Any]]] = defaultdict(list)
         self._action_events: dict[str, list[dict[str, Any]]] = defaultdict(list)
         self._versions: dict[str, dict[str, tuple[BrainVersion, str]]] = defaultdict(dict)
+        # Full manifest and header per version; payloads shared by row hash
+        self._version_manifests: dict[str, dict[str, tuple[dict[str, Any], VersionManifest]]] = (
+            defaultdict(dict)
+        )
+        self._version_rows: dict[str, dict[str, dict[str, Any]]] = defaultdict(dict)
         self._current_brain_id: str | None = None
 
     @property
@@ -517,6 +530,7 @@ class InMemoryStorage(InMemoryCollectionsMixin, InMemoryBrainMixin, NeuralStorag
         self,
         since: datetime | None = None,
         min_count: int = 1,
+        neuron_ids: set[str] | None = None,
     ) -> list[tuple[str, str, int, float]]:
         brain_id = self._get_brain_id()
         pair_counts: dict[tuple[str, str], list[float]] = defaultdict(list)
@@ -524,6 +538,12 @@ class InMemoryStorage(InMemoryCollectionsMixin, InMemoryBrainMixin, NeuralStorag
         for event in self._co_activations[brain_id]:
             if since is not None and event["created_at"] < since:
                 continue
+            if (
+                neuron_ids is not None
+                and event["neuron_a"] not in neuron_ids
+                and event["neuron_b"] not in neuron_ids
+            ):
+                continue
             pair = (event["neuron_a"], event["neuron_b"])
             pair_counts[pair].append(event["binding_strength"])
 
@@ -621,20 +641,93 @@ class InMemoryStorage(InMemoryCollectionsMixin, InMemoryBrainMixin, NeuralStorag
         version: BrainVersion,
         snapshot_json: str,
     ) -> None:
-        # Check unique name constraint
+        self._check_version_name(brain_id, version)
+        self._versions[brain_id][version.id] = (version, snapshot_json)
+
+    async def save_version_delta(
+        self,
+        brain_id: str,
+        version: BrainVersion,
+        header: dict[str, Any],
+        parent_version_id: str | None,
+        changes: dict[tuple[str, str], str | None],
+        rows: dict[str, tuple[str, dict[str, Any]]],
+    ) -> None:
+        self._check_version_name(brain_id, version)
+        manifest: VersionManifest = {}
+        if parent_version_id is not None:
+            manifest = await self.get_version_manifest(brain_id, parent_version_id) or {}
+        for key, digest_hex in changes.items():
+            if digest_hex is None:
+                manifest.pop(key, None)
+            else:
+                manifest[key] = digest_hex
+        for digest_hex, (_, data) in rows.items():
+            self._version_rows[brain_id].setdefault(digest_hex, data)
+        self._versions[brain_id][version.id] = (version, "")
+        self._version_manifests[brain_id][version.id] = (header, manifest)
+
+    def _check_version_name(self, brain_id: str, version: BrainVersion) -> None:
         for existing_version, _ in self._versions[brain_id].values():
             if existing_version.version_name == version.version_name:
                 raise ValueError(
                     f"Version name '{version.version_name}' already exists for brain {brain_id}"
                 )
-        self._versions[brain_id][version.id] = (version, snapshot_json)
+
+    def _version_entry(
+        self, brain_id: str, version_id: str
+    ) -> tuple[dict[str, Any], VersionManifest] | None:
+        """Header and manifest of a version, converting a whole-snapshot version."""
+        entry = self._version_manifests[brain_id].get(version_id)
+        if entry is not None or version_id not in self._versions[brain_id]:
+            return entry
+        try:
+            header, manifest, rows = snapshot_manifest(self._versions[brain_id][version_id][1])
+        except (ValueError, KeyError, TypeError):
+            return None
+        for digest_hex, (_, data) in rows.items():
+            self._version_rows[brain_id].setdefault(digest_hex, data)
+        self._version_manifests[brain_id][version_id] = (header, manifest)
+        return header, manifest
 
     async def get_version(
         self,
         brain_id: str,
         version_id: str,
     ) -> tuple[BrainVersion, str] | None:
-        return self._versions[brain_id].get(version_id)
+        result = self._versions[brain_id].get(version_id)
+        entry = self._version_manifests[brain_id].get(version_id)
+        if result is None or entry is None or result[1]:
+            return result
+        header, manifest = entry
+        snapshot = manifest_snapshot(header, manifest, self._version_rows[brain_id])
+        return result[0], _snapshot_to_json(snapshot)
+
+    async def get_version_header(
+        self,
+        brain_id: str,
+        version_id: str,
+    ) -> tuple[BrainVersion, dict[str, Any]] | None:
+        entry = self._version_entry(brain_id, version_id)
+        if entry is None:
+            return None
+        return self._versions[brain_id][version_id][0], entry[0]
+
+    async def get_version_manifest(
+        self,
+        brain_id: str,
+        version_id: str,
+    ) -> VersionManifest | None:
+        entry = self._version_entry(brain_id, version_id)
+        return dict(entry[1]) if entry is not None else None
+
+    async def get_version_rows(
+        self,
+        brain_id: str,
+        row_hashes: Sequence[str],
+    ) -> dict[str, dict[str, Any]]:
+        stored = self._version_rows[brain_id]
+        return {h: stored[h] for h in row_hashes if h in stored}
 
     async def list_versions(
         self,
@@ -654,6 +747,7 @@ class InMemoryStorage(InMemoryCollectionsMixin, InMemoryBrainMixin, NeuralStorag
     async def delete_version(self, brain_id: str, version_id: str) -> bool:
         if version_id in self._versions[brain_id]:
             del self._versions[brain_id][version_id]
+            self._version_manifests[brain_id].pop(version_id, None)
             return True
         return False
 
@@ -674,4 +768,5 @@ class InMemoryStorage(InMemoryCollectionsMixin, InMemoryBrainMixin, NeuralStorag
         self._co_activations[brain_id].clear()
         self._action_events[brain_id].clear()
         self._brains.pop(brain_id, None)
+        health_cache_for(self).invalidate(brain_id)
         # Note: versions are NOT cleared — they survive rollbacks (matches SQLite behavior)
@@ -10,6 +10,7 @@ import aiohttp
 from neural_memory.core.neuron import Neuron, NeuronState, NeuronType
 from neural_memory.core.synapse import Synapse, SynapseType
 from neural_memory.storage.base import NeuralStorage
+from neural_memory.storage.health_cache import health_cache_for
 from neural_memory.storage.shared_store_collections import SharedFiberBrainMixin, SharedStorageError
 from neural_memory.storage.shared_store_mappers import (
     dict_to_neuron,
@@ -415,3 +416,4 @@ class SharedStorage(SharedFiberBrainMixin, NeuralStorage):
     async def clear(self, brain_id: str) -> None:
         """Clear all data for a brain."""
         await self._request("DELETE", f"/brain/{brain_id}")
+        health_cache_for(self).invalidate(brain_id)
@@ -7,6 +7,7 @@ from typing import Any, Literal
 
 from neural_memory.core.brain import Brain, BrainSnapshot
 from neural_memory.core.fiber import Fiber
+from neural_memory.storage.health_cache import health_cache_for
 from neural_memory.storage.shared_store_mappers import dict_to_brain, dict_to_fiber
 
 
@@ -204,4 +205,6 @@ class SharedFiberBrainMixin:
             f"/brain/{brain_id}/import",
             json_data=data,
         )
-        return str(result.get("id", brain_id))
+        imported = str(result.get("id", brain_id))
+        health_cache_for(self).invalidate(imported)  # type: ignore[arg-type]
+        return imported
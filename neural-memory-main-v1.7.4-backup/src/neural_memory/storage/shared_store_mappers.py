@@ -119,6 +119,7 @@ def dict_to_brain(data: dict[str, Any]) -> Brain:
             weight_normalization_budget=config_data.get("weight_normalization_budget", 5.0),
             novelty_boost_max=config_data.get("novelty_boost_max", 3.0),
             novelty_decay_rate=config_data.get("novelty_decay_rate", 0.06),
+            activation_backend=config_data.get("activation_backend", "storage"),
         )
     else:
         config = BrainConfig()
@@ -28,6 +28,9 @@ class SQLiteActionLogMixin:
     def _get_brain_id(self) -> str:
         raise NotImplementedError
 
+    async def _commit(self) -> None:
+        raise NotImplementedError
+
     async def record_action(
         self,
         action_type: str,
@@ -67,7 +70,7 @@ class SQLiteActionLogMixin:
                 utcnow().isoformat(),
             ),
         )
-        await conn.commit()
+        await self._commit()
         return event_id
 
     async def get_action_sequences(
@@ -148,5 +151,5 @@ class SQLiteActionLogMixin:
             "DELETE FROM action_events WHERE brain_id = ? AND created_at < ?",
             (brain_id, older_than.isoformat()),
         )
-        await conn.commit()
+        await self._commit()
         return int(cursor.rowcount)
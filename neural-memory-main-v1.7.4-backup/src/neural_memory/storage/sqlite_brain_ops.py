@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import json
+import sqlite3
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
 from datetime import datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from neural_memory.core.brain import Brain, BrainConfig, BrainSnapshot
@@ -18,12 +22,19 @@ from neural_memory.core.memory_types import (
 from neural_memory.core.neuron import Neuron, NeuronType
 from neural_memory.core.project import Project
 from neural_memory.core.synapse import Direction, Synapse, SynapseType
-from neural_memory.storage.sqlite_row_mappers import row_to_brain
+from neural_memory.storage.brain_stream import RECORD_KINDS, header_record, read_header
+from neural_memory.storage.health_cache import health_cache_for
+from neural_memory.storage.sqlite_row_mappers import provenance_to_dict, row_to_brain
 from neural_memory.utils.timeutils import utcnow
 
 if TYPE_CHECKING:
     import aiosqlite
 
+    from neural_memory.storage.graph_snapshot import GraphSnapshotRegistry
+
+# Stream records buffered per import statement batch
+_IMPORT_CHUNK_SIZE = 1000
+
 
 class SQLiteBrainMixin:
     """Mixin providing brain CRUD, export, and import operations."""
@@ -31,18 +42,10 @@ class SQLiteBrainMixin:
     def _ensure_conn(self) -> aiosqlite.Connection:
         raise NotImplementedError
 
-    def _get_brain_id(self) -> str:
-        raise NotImplementedError
-
-    _current_brain_id: str | None
-
-    def set_brain(self, brain_id: str) -> None: ...
+    _graph_snapshots: GraphSnapshotRegistry
 
     # Protocol stubs for methods provided by other mixins
-    async def add_project(self, project: Project) -> str:
-        raise NotImplementedError
-
-    async def add_typed_memory(self, typed_memory: TypedMemory) -> str:
+    def batch(self) -> AbstractAsyncContextManager[None]:
         raise NotImplementedError
 
     async def save_brain(self, brain: Brain) -> None:
@@ -69,6 +72,13 @@ class SQLiteBrainMixin:
                         "consolidation_prune_threshold": brain.config.consolidation_prune_threshold,
                         "prune_min_inactive_days": brain.config.prune_min_inactive_days,
                         "merge_overlap_threshold": brain.config.merge_overlap_threshold,
+                        "activation_backend": brain.config.activation_backend,
+                        "embedding_enabled": brain.config.embedding_enabled,
+                        "embedding_provider": brain.config.embedding_provider,
+                        "embedding_model": brain.config.embedding_model,
+                        "embedding_similarity_threshold": (
+                            brain.config.embedding_similarity_threshold
+                        ),
                     }
                 ),
                 brain.owner_id,
@@ -105,11 +115,11 @@ class SQLiteBrainMixin:
         if brain is None:
             raise ValueError(f"Brain {brain_id} does not exist")
 
-        neurons = await _export_neurons(conn, brain_id)
-        synapses = await _export_synapses(conn, brain_id)
-        fibers = await _export_fibers(conn, brain_id)
-        typed_memories = await _export_typed_memories(conn, brain_id)
-        projects = await _export_projects(conn, brain_id)
+        neurons = [n async for n in _iter_neurons(conn, brain_id)]
+        synapses = [s async for s in _iter_synapses(conn, brain_id)]
+        fibers = [f async for f in _iter_fibers(conn, brain_id)]
+        typed_memories = [t async for t in _iter_typed_memories(conn, brain_id)]
+        projects = [p async for p in _iter_projects(conn, brain_id)]
 
         return BrainSnapshot(
             brain_id=brain_id,
@@ -119,26 +129,33 @@ class SQLiteBrainMixin:
             neurons=neurons,
             synapses=synapses,
             fibers=fibers,
-            config={
-                "decay_rate": brain.config.decay_rate,
-                "reinforcement_delta": brain.config.reinforcement_delta,
-                "activation_threshold": brain.config.activation_threshold,
-                "max_spread_hops": brain.config.max_spread_hops,
-                "max_context_tokens": brain.config.max_context_tokens,
-                "default_synapse_weight": brain.config.default_synapse_weight,
-                "hebbian_delta": brain.config.hebbian_delta,
-                "hebbian_threshold": brain.config.hebbian_threshold,
-                "hebbian_initial_weight": brain.config.hebbian_initial_weight,
-                "consolidation_prune_threshold": brain.config.consolidation_prune_threshold,
-                "prune_min_inactive_days": brain.config.prune_min_inactive_days,
-                "merge_overlap_threshold": brain.config.merge_overlap_threshold,
-            },
+            config=_config_dict(brain.config),
             metadata={
                 "typed_memories": typed_memories,
                 "projects": projects,
             },
         )
 
+    async def export_brain_stream(self, brain_id: str) -> AsyncIterator[dict[str, Any]]:
+        """Yield stream records straight from table cursors."""
+        conn = self._ensure_conn()
+
+        brain = await self.get_brain(brain_id)
+        if brain is None:
+            raise ValueError(f"Brain {brain_id} does not exist")
+
+        yield header_record(brain_id, brain.name, utcnow(), "0.1.0", _config_dict(brain.config))
+        tables = {
+            "neuron": _iter_neurons,
+            "synapse": _iter_synapses,
+            "fiber": _iter_fibers,
+            "project": _iter_projects,
+            "typed_memory": _iter_typed_memories,
+        }
+        for kind in RECORD_KINDS:
+            async for data in tables[kind](conn, brain_id):
+                yield {"kind": kind, "data": data}
+
     async def import_brain(
         self,
         snapshot: BrainSnapshot,
@@ -154,38 +171,53 @@ class SQLiteBrainMixin:
         )
         await self.save_brain(brain)
 
-        old_brain_id = self._current_brain_id
-        self.set_brain(brain_id)
+        async with self.batch():
+            await self._import_neurons(brain_id, snapshot.neurons)
+            await self._import_synapses(brain_id, snapshot.synapses)
+            await self._import_fibers(brain_id, snapshot.fibers)
+            await self._import_projects(brain_id, snapshot.metadata.get("projects", []))
+            await self._import_typed_memories(brain_id, snapshot.metadata.get("typed_memories", []))
+        self._graph_snapshots.invalidate(brain_id)
+        health_cache_for(self).invalidate(brain_id)  # type: ignore[arg-type]
 
-        try:
-            conn = self._ensure_conn()
-            await conn.execute("BEGIN IMMEDIATE")
-            try:
-                await self._import_neurons(snapshot.neurons)
-                await self._import_synapses(snapshot.synapses)
-                await self._import_fibers(snapshot.fibers)
-                await self._import_projects(snapshot.metadata.get("projects", []))
-                await self._import_typed_memories(snapshot.metadata.get("typed_memories", []))
-                await conn.commit()
-            except Exception:
-                await conn.execute("ROLLBACK")
-                raise
-        finally:
-            self._current_brain_id = old_brain_id
+        return brain_id
+
+    async def import_brain_stream(
+        self,
+        records: AsyncIterable[dict[str, Any]],
+        target_brain_id: str | None = None,
+    ) -> str:
+        """Import stream records in chunks, as one transaction."""
+        iterator = aiter(records)
+        header = await read_header(iterator)
+        brain_id = target_brain_id or header["brain_id"]
+
+        brain = Brain.create(
+            name=header["brain_name"],
+            config=BrainConfig(**header.get("config", {})),
+            brain_id=brain_id,
+        )
+        await self.save_brain(brain)
+
+        importers: dict[str, Callable[[list[dict[str, Any]]], Awaitable[None]]] = {
+            "neuron": partial(self._import_neurons, brain_id),
+            "synapse": partial(self._import_synapses, brain_id),
+            "fiber": partial(self._import_fibers, brain_id),
+            "project": partial(self._import_projects, brain_id),
+            "typed_memory": partial(self._import_typed_memories, brain_id),
+        }
+
+        async with self.batch():
+            await _apply_in_chunks(iterator, importers)
+        self._graph_snapshots.invalidate(brain_id)
+        health_cache_for(self).invalidate(brain_id)  # type: ignore[arg-type]
 
         return brain_id
 
-    async def _import_neurons(self, neurons_data: list[dict[str, Any]]) -> None:
+    async def _import_neurons(self, brain_id: str, neurons_data: list[dict[str, Any]]) -> None:
         conn = self._ensure_conn()
-        brain_id = self._get_brain_id()
         for n_data in neurons_data:
-            neuron = Neuron(
-                id=n_data["id"],
-                type=NeuronType(n_data["type"]),
-                content=n_data["content"],
-                metadata=n_data.get("metadata", {}),
-                created_at=datetime.fromisoformat(n_data["created_at"]),
-            )
+            neuron = _neuron_from_dict(n_data)
             # Insert neuron directly (skip per-statement commit)
             await conn.execute(
                 """INSERT INTO neurons (id, brain_id, type, content, metadata, content_hash, created_at)
@@ -209,21 +241,10 @@ class SQLiteBrainMixin:
                 (neuron.id, brain_id, 0.3, 500.0, 0.5, utcnow().isoformat()),
             )
 
-    async def _import_synapses(self, synapses_data: list[dict[str, Any]]) -> None:
+    async def _import_synapses(self, brain_id: str, synapses_data: list[dict[str, Any]]) -> None:
         conn = self._ensure_conn()
-        brain_id = self._get_brain_id()
         for s_data in synapses_data:
-            synapse = Synapse(
-                id=s_data["id"],
-                source_id=s_data["source_id"],
-                target_id=s_data["target_id"],
-                type=SynapseType(s_data["type"]),
-                weight=s_data["weight"],
-                direction=Direction(s_data["direction"]),
-                metadata=s_data.get("metadata", {}),
-                reinforced_count=s_data.get("reinforced_count", 0),
-                created_at=datetime.fromisoformat(s_data["created_at"]),
-            )
+            synapse = _synapse_from_dict(s_data)
             # Insert directly (skip per-statement commit and neuron existence check)
             await conn.execute(
                 """INSERT INTO synapses
@@ -245,37 +266,10 @@ class SQLiteBrainMixin:
                 ),
             )
 
-    async def _import_fibers(self, fibers_data: list[dict[str, Any]]) -> None:
+    async def _import_fibers(self, brain_id: str, fibers_data: list[dict[str, Any]]) -> None:
         conn = self._ensure_conn()
-        brain_id = self._get_brain_id()
         for f_data in fibers_data:
-            auto_tags = set(f_data.get("auto_tags", []))
-            agent_tags = set(f_data.get("agent_tags", []))
-            if not auto_tags and not agent_tags:
-                agent_tags = set(f_data.get("tags", []))
-
-            fiber = Fiber(
-                id=f_data["id"],
-                neuron_ids=set(f_data["neuron_ids"]),
-                synapse_ids=set(f_data["synapse_ids"]),
-                anchor_neuron_id=f_data["anchor_neuron_id"],
-                time_start=(
-                    datetime.fromisoformat(f_data["time_start"])
-                    if f_data.get("time_start")
-                    else None
-                ),
-                time_end=(
-                    datetime.fromisoformat(f_data["time_end"]) if f_data.get("time_end") else None
-                ),
-                coherence=f_data.get("coherence", 0.0),
-                salience=f_data.get("salience", 0.0),
-                frequency=f_data.get("frequency", 0),
-                summary=f_data.get("summary"),
-                auto_tags=auto_tags,
-                agent_tags=agent_tags,
-                metadata=f_data.get("metadata", {}),
-                created_at=datetime.fromisoformat(f_data["created_at"]),
-            )
+            fiber = _fiber_from_dict(f_data)
             # Insert directly without per-fiber commit
             all_tags = sorted(fiber.auto_tags | fiber.agent_tags)
             await conn.execute(
@@ -314,7 +308,8 @@ class SQLiteBrainMixin:
                     [(brain_id, fiber.id, nid) for nid in fiber.neuron_ids],
                 )
 
-    async def _import_projects(self, projects_data: list[dict[str, Any]]) -> None:
+    async def _import_projects(self, brain_id: str, projects_data: list[dict[str, Any]]) -> None:
+        conn = self._ensure_conn()
         for p_data in projects_data:
             project = Project(
                 id=p_data["id"],
@@ -329,9 +324,32 @@ class SQLiteBrainMixin:
                 metadata=p_data.get("metadata", {}),
                 created_at=datetime.fromisoformat(p_data["created_at"]),
             )
-            await self.add_project(project)
+            try:
+                await conn.execute(
+                    """INSERT INTO projects
+                       (id, brain_id, name, description, start_date, end_date,
+                        tags, priority, metadata, created_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (
+                        project.id,
+                        brain_id,
+                        project.name,
+                        project.description,
+                        project.start_date.isoformat(),
+                        project.end_date.isoformat() if project.end_date else None,
+                        json.dumps(list(project.tags)),
+                        project.priority,
+                        json.dumps(project.metadata),
+                        project.created_at.isoformat(),
+                    ),
+                )
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Project {project.id} already exists")
 
-    async def _import_typed_memories(self, typed_memories_data: list[dict[str, Any]]) -> None:
+    async def _import_typed_memories(
+        self, brain_id: str, typed_memories_data: list[dict[str, Any]]
+    ) -> None:
+        conn = self._ensure_conn()
         for tm_data in typed_memories_data:
             prov_data = tm_data.get("provenance", {})
             provenance = Provenance(
@@ -366,109 +384,220 @@ class SQLiteBrainMixin:
                 metadata=tm_data.get("metadata", {}),
                 created_at=datetime.fromisoformat(tm_data["created_at"]),
             )
-            await self.add_typed_memory(typed_memory)
+            async with conn.execute(
+                "SELECT id FROM fibers WHERE id = ? AND brain_id = ?",
+                (typed_memory.fiber_id, brain_id),
+            ) as cursor:
+                if await cursor.fetchone() is None:
+                    raise ValueError(f"Fiber {typed_memory.fiber_id} does not exist")
+            await conn.execute(
+                """INSERT OR REPLACE INTO typed_memories
+                   (fiber_id, brain_id, memory_type, priority, provenance,
+                    expires_at, project_id, tags, metadata, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    typed_memory.fiber_id,
+                    brain_id,
+                    typed_memory.memory_type.value,
+                    typed_memory.priority.value,
+                    json.dumps(provenance_to_dict(typed_memory.provenance)),
+                    typed_memory.expires_at.isoformat() if typed_memory.expires_at else None,
+                    typed_memory.project_id,
+                    json.dumps(list(typed_memory.tags)),
+                    json.dumps(typed_memory.metadata),
+                    typed_memory.created_at.isoformat(),
+                ),
+            )
+
+
+# ========== Import helpers (module-level) ==========
+
+
+async def _apply_in_chunks(
+    records: AsyncIterator[dict[str, Any]],
+    handlers: dict[str, Callable[[list[dict[str, Any]]], Awaitable[None]]],
+    chunk_size: int = _IMPORT_CHUNK_SIZE,
+) -> None:
+    """Pass runs of same-kind stream records' data to the kind's handler, in chunks."""
+    kind: str | None = None
+    chunk: list[dict[str, Any]] = []
+    async for record in records:
+        if record.get("kind") != kind or len(chunk) >= chunk_size:
+            if kind is not None and chunk:
+                await handlers[kind](chunk)
+            kind, chunk = record.get("kind"), []
+            if kind not in handlers:
+                raise ValueError(f"Unknown brain stream record kind: {kind!r}")
+        chunk.append(record["data"])
+    if kind is not None and chunk:
+        await handlers[kind](chunk)
+
+
+def _neuron_from_dict(n_data: dict[str, Any]) -> Neuron:
+    return Neuron(
+        id=n_data["id"],
+        type=NeuronType(n_data["type"]),
+        content=n_data["content"],
+        metadata=n_data.get("metadata", {}),
+        created_at=datetime.fromisoformat(n_data["created_at"]),
+    )
+
+
+def _synapse_from_dict(s_data: dict[str, Any]) -> Synapse:
+    return Synapse(
+        id=s_data["id"],
+        source_id=s_data["source_id"],
+        target_id=s_data["target_id"],
+        type=SynapseType(s_data["type"]),
+        weight=s_data["weight"],
+        direction=Direction(s_data["direction"]),
+        metadata=s_data.get("metadata", {}),
+        reinforced_count=s_data.get("reinforced_count", 0),
+        created_at=datetime.fromisoformat(s_data["created_at"]),
+    )
+
+
+def _fiber_from_dict(f_data: dict[str, Any]) -> Fiber:
+    auto_tags = set(f_data.get("auto_tags", []))
+    agent_tags = set(f_data.get("agent_tags", []))
+    if not auto_tags and not agent_tags:
+        agent_tags = set(f_data.get("tags", []))
+
+    return Fiber(
+        id=f_data["id"],
+        neuron_ids=set(f_data["neuron_ids"]),
+        synapse_ids=set(f_data["synapse_ids"]),
+        anchor_neuron_id=f_data["anchor_neuron_id"],
+        time_start=(
+            datetime.fromisoformat(f_data["time_start"]) if f_data.get("time_start") else None
+        ),
+        time_end=(datetime.fromisoformat(f_data["time_end"]) if f_data.get("time_end") else None),
+        coherence=f_data.get("coherence", 0.0),
+        salience=f_data.get("salience", 0.0),
+        frequency=f_data.get("frequency", 0),
+        summary=f_data.get("summary"),
+        auto_tags=auto_tags,
+        agent_tags=agent_tags,
+        metadata=f_data.get("metadata", {}),
+        created_at=datetime.fromisoformat(f_data["created_at"]),
+    )
 
 
 # ========== Export helpers (module-level) ==========
 
 
-async def _export_neurons(conn: aiosqlite.Connection, brain_id: str) -> list[dict[str, Any]]:
-    neurons: list[dict[str, Any]] = []
+def _config_dict(config: BrainConfig) -> dict[str, Any]:
+    return {
+        "decay_rate": config.decay_rate,
+        "reinforcement_delta": config.reinforcement_delta,
+        "activation_threshold": config.activation_threshold,
+        "max_spread_hops": config.max_spread_hops,
+        "max_context_tokens": config.max_context_tokens,
+        "default_synapse_weight": config.default_synapse_weight,
+        "hebbian_delta": config.hebbian_delta,
+        "hebbian_threshold": config.hebbian_threshold,
+        "hebbian_initial_weight": config.hebbian_initial_weight,
+        "consolidation_prune_threshold": config.consolidation_prune_threshold,
+        "prune_min_inactive_days": config.prune_min_inactive_days,
+        "merge_overlap_threshold": config.merge_overlap_threshold,
+    }
+
+
+def _neuron_dict(row: aiosqlite.Row) -> dict[str, Any]:
+    return {
+        "id": row["id"],
+        "type": row["type"],
+        "content": row["content"],
+        "metadata": json.loads(row["metadata"]),
+        "created_at": row["created_at"],
+    }
+
+
+def _synapse_dict(row: aiosqlite.Row) -> dict[str, Any]:
+    return {
+        "id": row["id"],
+        "source_id": row["source_id"],
+        "target_id": row["target_id"],
+        "type": row["type"],
+        "weight": row["weight"],
+        "direction": row["direction"],
+        "metadata": json.loads(row["metadata"]),
+        "reinforced_count": row["reinforced_count"],
+        "created_at": row["created_at"],
+    }
+
+
+def _fiber_dict(row: aiosqlite.Row) -> dict[str, Any]:
+    return {
+        "id": row["id"],
+        "neuron_ids": json.loads(row["neuron_ids"]),
+        "synapse_ids": json.loads(row["synapse_ids"]),
+        "anchor_neuron_id": row["anchor_neuron_id"],
+        "time_start": row["time_start"],
+        "time_end": row["time_end"],
+        "coherence": row["coherence"],
+        "salience": row["salience"],
+        "frequency": row["frequency"],
+        "summary": row["summary"],
+        "tags": json.loads(row["tags"]),
+        "metadata": json.loads(row["metadata"]),
+        "created_at": row["created_at"],
+    }
+
+
+async def _iter_neurons(conn: aiosqlite.Connection, brain_id: str) -> AsyncIterator[dict[str, Any]]:
     async with conn.execute("SELECT * FROM neurons WHERE brain_id = ?", (brain_id,)) as cursor:
         async for row in cursor:
-            neurons.append(
-                {
-                    "id": row["id"],
-                    "type": row["type"],
-                    "content": row["content"],
-                    "metadata": json.loads(row["metadata"]),
-                    "created_at": row["created_at"],
-                }
-            )
-    return neurons
+            yield _neuron_dict(row)
 
 
-async def _export_synapses(conn: aiosqlite.Connection, brain_id: str) -> list[dict[str, Any]]:
-    synapses: list[dict[str, Any]] = []
+async def _iter_synapses(
+    conn: aiosqlite.Connection, brain_id: str
+) -> AsyncIterator[dict[str, Any]]:
     async with conn.execute("SELECT * FROM synapses WHERE brain_id = ?", (brain_id,)) as cursor:
         async for row in cursor:
-            synapses.append(
-                {
-                    "id": row["id"],
-                    "source_id": row["source_id"],
-                    "target_id": row["target_id"],
-                    "type": row["type"],
-                    "weight": row["weight"],
-                    "direction": row["direction"],
-                    "metadata": json.loads(row["metadata"]),
-                    "reinforced_count": row["reinforced_count"],
-                    "created_at": row["created_at"],
-                }
-            )
-    return synapses
+            yield _synapse_dict(row)
 
 
-async def _export_fibers(conn: aiosqlite.Connection, brain_id: str) -> list[dict[str, Any]]:
-    fibers: list[dict[str, Any]] = []
+async def _iter_fibers(conn: aiosqlite.Connection, brain_id: str) -> AsyncIterator[dict[str, Any]]:
     async with conn.execute("SELECT * FROM fibers WHERE brain_id = ?", (brain_id,)) as cursor:
         async for row in cursor:
-            fibers.append(
-                {
-                    "id": row["id"],
-                    "neuron_ids": json.loads(row["neuron_ids"]),
-                    "synapse_ids": json.loads(row["synapse_ids"]),
-                    "anchor_neuron_id": row["anchor_neuron_id"],
-                    "time_start": row["time_start"],
-                    "time_end": row["time_end"],
-                    "coherence": row["coherence"],
-                    "salience": row["salience"],
-                    "frequency": row["frequency"],
-                    "summary": row["summary"],
-                    "tags": json.loads(row["tags"]),
-                    "metadata": json.loads(row["metadata"]),
-                    "created_at": row["created_at"],
-                }
-            )
-    return fibers
+            yield _fiber_dict(row)
 
 
-async def _export_typed_memories(conn: aiosqlite.Connection, brain_id: str) -> list[dict[str, Any]]:
-    typed_memories: list[dict[str, Any]] = []
+async def _iter_typed_memories(
+    conn: aiosqlite.Connection, brain_id: str
+) -> AsyncIterator[dict[str, Any]]:
     async with conn.execute(
         "SELECT * FROM typed_memories WHERE brain_id = ?", (brain_id,)
     ) as cursor:
         async for row in cursor:
-            typed_memories.append(
-                {
-                    "fiber_id": row["fiber_id"],
-                    "memory_type": row["memory_type"],
-                    "priority": row["priority"],
-                    "provenance": json.loads(row["provenance"]),
-                    "expires_at": row["expires_at"],
-                    "project_id": row["project_id"],
-                    "tags": json.loads(row["tags"]),
-                    "metadata": json.loads(row["metadata"]),
-                    "created_at": row["created_at"],
-                }
-            )
-    return typed_memories
-
-
-async def _export_projects(conn: aiosqlite.Connection, brain_id: str) -> list[dict[str, Any]]:
-    projects: list[dict[str, Any]] = []
+            yield {
+                "fiber_id": row["fiber_id"],
+                "memory_type": row["memory_type"],
+                "priority": row["priority"],
+                "provenance": json.loads(row["provenance"]),
+                "expires_at": row["expires_at"],
+                "project_id": row["project_id"],
+                "tags": json.loads(row["tags"]),
+                "metadata": json.loads(row["metadata"]),
+                "created_at": row["created_at"],
+            }
+
+
+async def _iter_projects(
+    conn: aiosqlite.Connection, brain_id: str
+) -> AsyncIterator[dict[str, Any]]:
     async with conn.execute("SELECT * FROM projects WHERE brain_id = ?", (brain_id,)) as cursor:
         async for row in cursor:
-            projects.append(
-                {
-                    "id": row["id"],
-                    "name": row["name"],
-                    "description": row["description"],
-                    "start_date": row["start_date"],
-                    "end_date": row["end_date"],
-                    "tags": json.loads(row["tags"]),
-                    "priority": row["priority"],
-                    "metadata": json.loads(row["metadata"]),
-                    "created_at": row["created_at"],
-                }
-            )
-    return projects
+            yield {
+                "id": row["id"],
+                "name": row["name"],
+                "description": row["description"],
+                "start_date": row["start_date"],
+                "end_date": row["end_date"],
+                "tags": json.loads(row["tags"]),
+                "priority": row["priority"],
+                "metadata": json.loads(row["metadata"]),
+                "created_at": row["created_at"],
+            }
@@ -0,0 +1,82 @@
+"""SQLite mixin for the consolidation change log (dirty set)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from neural_memory.engine.consolidation import DirtySet
+
+if TYPE_CHECKING:
+    import aiosqlite
+
+
+class SQLiteChangeTrackingMixin:
+    """Dirty-set reads for SQLiteStorage.
+
+    Rows in ``dirty_entities`` are written by triggers on the neuron,
+    synapse, fiber and co-activation tables (see ``sqlite_schema``), so
+    every write path is tracked without touching the mixins.
+    """
+
+    def _ensure_conn(self) -> aiosqlite.Connection:
+        raise NotImplementedError
+
+    def _get_brain_id(self) -> str:
+        raise NotImplementedError
+
+    async def _commit(self) -> None:
+        raise NotImplementedError
+
+    async def get_dirty_set(self) -> DirtySet | None:
+        conn = self._ensure_conn()
+        brain_id = self._get_brain_id()
+
+        async with conn.execute(
+            "SELECT MAX(seq) FROM dirty_entities WHERE brain_id = ?", (brain_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        checkpoint = row[0] if row and row[0] is not None else 0
+
+        ids: dict[str, set[str]] = {"neuron": set(), "synapse": set(), "fiber": set()}
+        async with conn.execute(
+            "SELECT entity_type, entity_id FROM dirty_entities WHERE brain_id = ? AND seq <= ?",
+            (brain_id, checkpoint),
+        ) as cursor:
+            async for entity_type, entity_id in cursor:
+                ids.setdefault(entity_type, set()).add(entity_id)
+
+        neighbourhood = set(ids["neuron"])
+        async with conn.execute(
+            """SELECT s.source_id, s.target_id FROM dirty_entities d
+               JOIN synapses s ON s.brain_id = d.brain_id AND s.id = d.entity_id
+               WHERE d.brain_id = ? AND d.entity_type = 'synapse' AND d.seq <= ?""",
+            (brain_id, checkpoint),
+        ) as cursor:
+            async for source_id, target_id in cursor:
+                neighbourhood.add(source_id)
+                neighbourhood.add(target_id)
+        async with conn.execute(
+            """SELECT fn.neuron_id FROM dirty_entities d
+               JOIN fiber_neurons fn ON fn.brain_id = d.brain_id AND fn.fiber_id = d.entity_id
+               WHERE d.brain_id = ? AND d.entity_type = 'fiber' AND d.seq <= ?""",
+            (brain_id, checkpoint),
+        ) as cursor:
+            async for (neuron_id,) in cursor:
+                neighbourhood.add(neuron_id)
+
+        return DirtySet(
+            neuron_ids=frozenset(neighbourhood),
+            synapse_ids=frozenset(ids["synapse"]),
+            fiber_ids=frozenset(ids["fiber"]),
+            checkpoint=checkpoint,
+        )
+
+    async def clear_dirty_set(self, checkpoint: int) -> None:
+        conn = self._ensure_conn()
+        brain_id = self._get_brain_id()
+
+        await conn.execute(
+            "DELETE FROM dirty_entities WHERE brain_id = ? AND seq <= ?",
+            (brain_id, checkpoint),
+        )
+        await self._commit()
@@ -1,7 +1,8 @@
-"""SQLite mixin for co-activation event storage."""
+"""SQLite mixin for co-activation storage."""
 
 from __future__ import annotations
 
+import json
 from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import uuid4
@@ -11,20 +12,78 @@ from neural_memory.utils.timeutils import utcnow
 if TYPE_CHECKING:
     import aiosqlite
 
+# A batch is rolled in with plain INSERT/UPDATE rather than an UPSERT: the
+# outer statement's conflict clause would override the INSERT OR REPLACE in
+# the dirty-tracking triggers.
+_INSERT_PAIR = """
+    INSERT INTO co_activation_pairs
+        (brain_id, neuron_a, neuron_b, decayed_count, mean_strength, total_count,
+         first_seen, last_seen)
+    SELECT :brain_id, :a, :b, 0, 0, 0, :now, :now
+    WHERE NOT EXISTS (
+        SELECT 1 FROM co_activation_pairs
+        WHERE brain_id = :brain_id AND neuron_a = :a AND neuron_b = :b
+    )
+"""
+
+# SET expressions read the old row, so the stored count is decayed from its
+# last_seen to the batch time before the new events are added.
+_UPDATE_PAIR = """
+    UPDATE co_activation_pairs SET
+        decayed_count = decayed_count * co_activation_decay(
+            julianday(:now) - julianday(last_seen), :half_life
+        ) + :count,
+        mean_strength = (
+            mean_strength * decayed_count * co_activation_decay(
+                julianday(:now) - julianday(last_seen), :half_life
+            ) + :strength_sum
+        ) / (
+            decayed_count * co_activation_decay(
+                julianday(:now) - julianday(last_seen), :half_life
+            ) + :count
+        ),
+        total_count = total_count + :count,
+        last_seen = MAX(last_seen, :now)
+    WHERE brain_id = :brain_id AND neuron_a = :a AND neuron_b = :b
+"""
+
+
+def co_activation_decay(elapsed_days: float | None, half_life_days: float) -> float:
+    """Decay factor for a count last updated ``elapsed_days`` ago.
+
+    Registered as a SQLite function by ``SQLiteStorage.initialize``.
+    A non-positive half-life disables decay.
+    """
+    if not elapsed_days or elapsed_days <= 0 or half_life_days <= 0:
+        return 1.0
+    return float(0.5 ** (elapsed_days / half_life_days))
+
 
 class SQLiteCoActivationMixin:
-    """Co-activation event persistence for SQLiteStorage.
+    """Co-activation persistence for SQLiteStorage.
+
+    Each canonical pair (neuron_a < neuron_b) is one row in
+    ``co_activation_pairs`` holding an exponentially decayed count, a
+    decay-weighted mean binding strength and first/last seen times, so
+    inference reads an index instead of aggregating an event log.
 
-    Stores individual co-activation events with canonical pair ordering
-    (neuron_a < neuron_b) for consistent aggregation.
+    Raw events go to ``co_activation_events`` only when
+    ``co_activation_log_size`` is positive; the log then keeps the newest
+    that many events per brain, for debugging.
     """
 
+    co_activation_half_life_days: float = 7.0
+    co_activation_log_size: int = 0
+
     def _ensure_conn(self) -> aiosqlite.Connection:
         raise NotImplementedError
 
     def _get_brain_id(self) -> str:
         raise NotImplementedError
 
+    async def _commit(self) -> None:
+        raise NotImplementedError
+
     async def record_co_activation(
         self,
         neuron_a: str,
@@ -33,75 +92,141 @@ class SQLiteCoActivationMixin:
         source_anchor: str | None = None,
     ) -> str:
         """Record a co-activation event between two neurons."""
+        ids = await self.record_co_activations_bulk(
+            [(neuron_a, neuron_b, binding_strength, source_anchor)]
+        )
+        return ids[0]
+
+    async def record_co_activations_bulk(
+        self,
+        records: list[tuple[str, str, float, str | None]],
+    ) -> list[str]:
+        """Roll many co-activation events into their pairs in one batch of statements."""
+        if not records:
+            return []
         conn = self._ensure_conn()
         brain_id = self._get_brain_id()
-        event_id = str(uuid4())
+        now = utcnow().isoformat()
+        event_ids = [str(uuid4()) for _ in records]
 
         # Canonical ordering: a < b
-        a, b = (neuron_a, neuron_b) if neuron_a < neuron_b else (neuron_b, neuron_a)
-
-        await conn.execute(
-            """INSERT INTO co_activation_events
-               (id, brain_id, neuron_a, neuron_b, binding_strength, source_anchor, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (
-                event_id,
-                brain_id,
-                a,
-                b,
-                binding_strength,
-                source_anchor,
-                utcnow().isoformat(),
-            ),
+        events = [
+            (a, b, strength, anchor) if a < b else (b, a, strength, anchor)
+            for a, b, strength, anchor in records
+        ]
+        totals: dict[tuple[str, str], list[float]] = {}
+        for a, b, strength, _ in events:
+            entry = totals.setdefault((a, b), [0.0, 0.0])
+            entry[0] += 1
+            entry[1] += strength
+
+        await conn.executemany(
+            _INSERT_PAIR,
+            [{"brain_id": brain_id, "a": a, "b": b, "now": now} for a, b in totals],
         )
-        await conn.commit()
-        return event_id
+        await conn.executemany(
+            _UPDATE_PAIR,
+            [
+                {
+                    "brain_id": brain_id,
+                    "a": a,
+                    "b": b,
+                    "count": int(count),
+                    "strength_sum": strength_sum,
+                    "now": now,
+                    "half_life": self.co_activation_half_life_days,
+                }
+                for (a, b), (count, strength_sum) in totals.items()
+            ],
+        )
+
+        if self.co_activation_log_size > 0:
+            await conn.executemany(
+                """INSERT INTO co_activation_events
+                   (id, brain_id, neuron_a, neuron_b, binding_strength, source_anchor, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (event_id, brain_id, a, b, strength, anchor, now)
+                    for event_id, (a, b, strength, anchor) in zip(event_ids, events, strict=True)
+                ],
+            )
+            await conn.execute(
+                """DELETE FROM co_activation_events
+                   WHERE brain_id = ? AND rowid NOT IN (
+                       SELECT rowid FROM co_activation_events
+                       WHERE brain_id = ? ORDER BY rowid DESC LIMIT ?
+                   )""",
+                (brain_id, brain_id, self.co_activation_log_size),
+            )
+
+        await self._commit()
+        return event_ids
 
     async def get_co_activation_counts(
         self,
         since: datetime | None = None,
         min_count: int = 1,
+        neuron_ids: set[str] | None = None,
     ) -> list[tuple[str, str, int, float]]:
-        """Get aggregated co-activation counts for neuron pairs."""
+        """Get co-activation counts for neuron pairs, decayed to now.
+
+        ``since`` keeps pairs last seen at or after that time. Counts are
+        rounded half up; a stored count only shrinks with time, so the
+        ``decayed_count`` index bounds the scan. ``neuron_ids`` (passed as
+        one JSON parameter, so any size fits) keeps pairs touching those
+        neurons and is looked up on the neuron_a / neuron_b indexes.
+        """
         conn = self._ensure_conn()
         brain_id = self._get_brain_id()
 
+        query = """
+            SELECT neuron_a, neuron_b, mean_strength,
+                   decayed_count * co_activation_decay(julianday(?) - julianday(last_seen), ?)
+                       AS cnt
+            FROM co_activation_pairs
+            WHERE brain_id = ? AND decayed_count >= ?
+        """
+        params: list[object] = [
+            utcnow().isoformat(),
+            self.co_activation_half_life_days,
+            brain_id,
+            min_count - 0.5,
+        ]
         if since is not None:
-            query = """
-                SELECT neuron_a, neuron_b, COUNT(*) as cnt, AVG(binding_strength) as avg_bs
-                FROM co_activation_events
-                WHERE brain_id = ? AND created_at >= ?
-                GROUP BY neuron_a, neuron_b
-                HAVING cnt >= ?
-                ORDER BY cnt DESC
-            """
-            params = (brain_id, since.isoformat(), min_count)
-        else:
-            query = """
-                SELECT neuron_a, neuron_b, COUNT(*) as cnt, AVG(binding_strength) as avg_bs
-                FROM co_activation_events
-                WHERE brain_id = ?
-                GROUP BY neuron_a, neuron_b
-                HAVING cnt >= ?
-                ORDER BY cnt DESC
-            """
-            params = (brain_id, min_count)  # type: ignore[assignment]
+            query += " AND last_seen >= ?"
+            params.append(since.isoformat())
+        if neuron_ids is not None:
+            scope = json.dumps(sorted(neuron_ids))
+            query += (
+                " AND (neuron_a IN (SELECT value FROM json_each(?))"
+                " OR neuron_b IN (SELECT value FROM json_each(?)))"
+            )
+            params.extend((scope, scope))
+        query += " ORDER BY cnt DESC"
 
         results: list[tuple[str, str, int, float]] = []
         async with conn.execute(query, params) as cursor:
             async for row in cursor:
-                results.append((row["neuron_a"], row["neuron_b"], row["cnt"], row["avg_bs"]))
+                count = int(row["cnt"] + 0.5)
+                if count < min_count:
+                    continue
+                results.append((row["neuron_a"], row["neuron_b"], count, row["mean_strength"]))
 
         return results
 
     async def prune_co_activations(self, older_than: datetime) -> int:
-        """Remove co-activation events older than the given time."""
+        """Remove pairs last seen, and logged events recorded, before the given time."""
         conn = self._ensure_conn()
         brain_id = self._get_brain_id()
+        cutoff = older_than.isoformat()
 
-        cursor = await conn.execute(
+        pairs = await conn.execute(
+            "DELETE FROM co_activation_pairs WHERE brain_id = ? AND last_seen < ?",
+            (brain_id, cutoff),
+        )
+        events = await conn.execute(
             "DELETE FROM co_activation_events WHERE brain_id = ? AND created_at < ?",
-            (brain_id, older_than.isoformat()),
+            (brain_id, cutoff),
         )
-        await conn.commit()
-        return int(cursor.rowcount)
+        await self._commit()
+        return int(pairs.rowcount) + int(events.rowcount)
@@ -23,6 +23,9 @@ class SQLiteFiberMixin:
     def _get_brain_id(self) -> str:
         raise NotImplementedError
 
+    async def _commit(self) -> None:
+        raise NotImplementedError
+
     async def add_fiber(self, fiber: Fiber) -> str:
         conn = self._ensure_conn()
         brain_id = self._get_brain_id()
@@ -65,7 +68,7 @@ class SQLiteFiberMixin:
                     [(brain_id, fiber.id, nid) for nid in fiber.neuron_ids],
                 )
 
-            await conn.commit()
+            await self._commit()
             return fiber.id
         except sqlite3.IntegrityError:
             raise ValueError(f"Fiber {fiber.id} already exists")
@@ -201,7 +204,7 @@ class SQLiteFiberMixin:
                 [(brain_id, fiber.id, nid) for nid in fiber.neuron_ids],
             )
 
-        await conn.commit()
+        await self._commit()
 
     async def delete_fiber(self, fiber_id: str) -> bool:
         conn = self._ensure_conn()
@@ -217,7 +220,7 @@ class SQLiteFiberMixin:
             "DELETE FROM fibers WHERE id = ? AND brain_id = ?",
             (fiber_id, brain_id),
         )
-        await conn.commit()
+        await self._commit()
 
         return cursor.rowcount > 0
 
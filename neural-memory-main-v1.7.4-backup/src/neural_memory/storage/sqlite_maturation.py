@@ -28,6 +28,9 @@ class SQLiteMaturationMixin:
             raise RuntimeError("No brain selected")
         return self._current_brain_id
 
+    async def _commit(self) -> None:
+        raise NotImplementedError
+
     async def save_maturation(self, record: MaturationRecord) -> None:
         """Save or update a maturation record."""
         conn = self._ensure_conn()
@@ -47,7 +50,7 @@ class SQLiteMaturationMixin:
                 json.dumps(record.reinforcement_timestamps),
             ),
         )
-        await conn.commit()
+        await self._commit()
 
     async def get_maturation(self, fiber_id: str) -> MaturationRecord | None:
         """Get a maturation record for a fiber."""
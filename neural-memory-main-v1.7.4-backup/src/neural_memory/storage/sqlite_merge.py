@@ -0,0 +1,451 @@
+"""SQLite mixin for merging an incoming brain stream into a live brain."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterable, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from neural_memory.engine.merge import (
+    ConflictItem,
+    ConflictStrategy,
+    MergeReport,
+    _add_provenance,
+    _neuron_fingerprint,
+    _remap_ids_in_list,
+    _resolve_neuron_conflict,
+    _resolve_synapse_conflict,
+    _synapse_triple,
+)
+from neural_memory.storage.brain_stream import read_header
+from neural_memory.storage.health_cache import health_cache_for
+from neural_memory.storage.sqlite_brain_ops import (
+    _apply_in_chunks,
+    _fiber_dict,
+    _fiber_from_dict,
+    _neuron_dict,
+    _neuron_from_dict,
+    _synapse_dict,
+)
+
+if TYPE_CHECKING:
+    import aiosqlite
+
+    from neural_memory.storage.graph_snapshot import GraphSnapshotRegistry
+
+# Bound parameters per lookup statement (synapse lookups bind three per row)
+_LOOKUP_SIZE = 300
+
+# Fingerprints of neurons that have none yet; the neuron_merge_keys_au
+# trigger drops a neuron's row when its type or content changes.
+_REFRESH_MERGE_KEYS = """
+    INSERT INTO neuron_merge_keys (brain_id, neuron_id, merge_key)
+    SELECT n.brain_id, n.id, neuron_merge_key(n.type, n.content)
+    FROM neurons n
+    WHERE n.brain_id = ? AND NOT EXISTS (
+        SELECT 1 FROM neuron_merge_keys k
+        WHERE k.brain_id = n.brain_id AND k.neuron_id = n.id
+    )
+"""
+
+
+def neuron_merge_key(neuron_type: str, content: str) -> str:
+    """Merge fingerprint of a stored neuron, as computed by ``merge_snapshots``.
+
+    Registered as a SQLite function by ``SQLiteStorage.initialize``, so
+    case folding matches Python's rather than SQLite's ASCII-only ``lower()``.
+    """
+    return _neuron_fingerprint({"type": neuron_type, "content": content})
+
+
+@dataclass
+class _MergeState:
+    """What a merge has decided so far, carried across record chunks."""
+
+    brain_id: str
+    source_brain_id: str
+    strategy: ConflictStrategy
+    report: MergeReport = field(default_factory=MergeReport)
+    # Incoming neuron/synapse/fiber ID -> local ID it was folded into
+    id_remap: dict[str, str] = field(default_factory=dict)
+    # Rows inserted by this merge never match later incoming records
+    added_synapses: set[str] = field(default_factory=set)
+    added_fibers: set[str] = field(default_factory=set)
+    seen_typed_memories: set[str] = field(default_factory=set)
+
+
+class SQLiteMergeMixin:
+    """In-place brain merge for SQLiteStorage.
+
+    ``merge_brain_stream`` applies the same rules as ``merge_snapshots``
+    (neurons match by fingerprint, synapses by remapped triple, fibers by
+    neuron set), but looks matches up through indexes and writes only the
+    rows that change, instead of rebuilding the brain from a merged
+    snapshot. Neuron fingerprints live in ``neuron_merge_keys``, filled
+    lazily for neurons that lack one when a merge starts.
+    """
+
+    _graph_snapshots: GraphSnapshotRegistry
+
+    def _ensure_conn(self) -> aiosqlite.Connection:
+        raise NotImplementedError
+
+    def batch(self) -> AbstractAsyncContextManager[None]:
+        raise NotImplementedError
+
+    async def _import_neurons(self, brain_id: str, neurons_data: list[dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    async def _import_synapses(self, brain_id: str, synapses_data: list[dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    async def _import_fibers(self, brain_id: str, fibers_data: list[dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    async def _import_projects(self, brain_id: str, projects_data: list[dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    async def _import_typed_memories(
+        self, brain_id: str, typed_memories_data: list[dict[str, Any]]
+    ) -> None:
+        raise NotImplementedError
+
+    async def merge_brain_stream(
+        self,
+        brain_id: str,
+        records: AsyncIterable[dict[str, Any]],
+        strategy: ConflictStrategy,
+    ) -> MergeReport:
+        """Merge stream records into an existing brain, as one transaction.
+
+        The merge runs in ``batch()``, on the batch connection: readers,
+        including this storage's own connection, keep seeing the brain as
+        it was until the merge commits, and other writers wait for it. A
+        failure rolls every write back.
+
+        Raises:
+            ValueError: If the brain does not exist or the stream is malformed
+        """
+        conn = self._ensure_conn()
+        iterator = aiter(records)
+        header = await read_header(iterator)
+
+        async with conn.execute("SELECT 1 FROM brains WHERE id = ?", (brain_id,)) as cursor:
+            if await cursor.fetchone() is None:
+                raise ValueError(f"Brain {brain_id} does not exist")
+
+        state = _MergeState(
+            brain_id=brain_id, source_brain_id=header["brain_id"], strategy=strategy
+        )
+        handlers: dict[str, Callable[[list[dict[str, Any]]], Awaitable[None]]] = {
+            "neuron": lambda chunk: self._merge_neurons(chunk, state),
+            "synapse": lambda chunk: self._merge_synapses(chunk, state),
+            "fiber": lambda chunk: self._merge_fibers(chunk, state),
+            "project": lambda chunk: self._merge_projects(chunk, state),
+            "typed_memory": lambda chunk: self._merge_typed_memories(chunk, state),
+        }
+
+        async with self.batch():
+            # The batch runs on its own connection
+            await self._ensure_conn().execute(_REFRESH_MERGE_KEYS, (brain_id,))
+            await _apply_in_chunks(iterator, handlers)
+        self._graph_snapshots.invalidate(brain_id)
+        health_cache_for(self).invalidate(brain_id)  # type: ignore[arg-type]
+
+        return state.report
+
+    async def _merge_neurons(self, neurons_data: list[dict[str, Any]], state: _MergeState) -> None:
+        conn = self._ensure_conn()
+        brain_id = state.brain_id
+        report = state.report
+
+        keys = [_neuron_fingerprint(n) for n in neurons_data]
+        local: dict[str, dict[str, Any]] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), _LOOKUP_SIZE):
+            part = unique_keys[start : start + _LOOKUP_SIZE]
+            placeholders = ",".join("?" * len(part))
+            # Neurons added by this merge have no key row yet, so they never match
+            async with conn.execute(
+                f"""SELECT k.merge_key, n.* FROM neuron_merge_keys k
+                    JOIN neurons n ON n.brain_id = k.brain_id AND n.id = k.neuron_id
+                    WHERE k.brain_id = ? AND k.merge_key IN ({placeholders})
+                    ORDER BY n.rowid""",
+                (brain_id, *part),
+            ) as cursor:
+                async for row in cursor:
+                    local[row["merge_key"]] = _neuron_dict(row)
+
+        added: list[dict[str, Any]] = []
+        for incoming, key in zip(neurons_data, keys, strict=True):
+            local_neuron = local.get(key)
+            if local_neuron is None:
+                added.append(_add_provenance(incoming, state.source_brain_id, "added"))
+                report.neurons_added += 1
+                continue
+
+            resolution = _resolve_neuron_conflict(local_neuron, incoming, state.strategy)
+            state.id_remap[incoming["id"]] = local_neuron["id"]
+            report.id_remap[incoming["id"]] = local_neuron["id"]
+
+            if resolution == "kept_incoming":
+                updated = _add_provenance(
+                    {**incoming, "id": local_neuron["id"]}, state.source_brain_id, resolution
+                )
+                neuron = _neuron_from_dict(updated)
+                await conn.execute(
+                    """UPDATE neurons SET type = ?, content = ?, metadata = ?,
+                           content_hash = ?, created_at = ?
+                       WHERE brain_id = ? AND id = ?""",
+                    (
+                        neuron.type.value,
+                        neuron.content,
+                        json.dumps(neuron.metadata),
+                        neuron.content_hash,
+                        neuron.created_at.isoformat(),
+                        brain_id,
+                        neuron.id,
+                    ),
+                )
+                # The update dropped the key row; the fingerprint itself is unchanged
+                await conn.execute(
+                    "INSERT INTO neuron_merge_keys (brain_id, neuron_id, merge_key) VALUES (?, ?, ?)",
+                    (brain_id, neuron.id, key),
+                )
+                local[key] = updated
+                report.neurons_updated += 1
+            else:
+                report.neurons_skipped += 1
+
+            report.conflicts.append(
+                ConflictItem(
+                    entity_type="neuron",
+                    local_id=local_neuron["id"],
+                    incoming_id=incoming["id"],
+                    resolution=resolution,
+                    reason=f"fingerprint match: {key[:50]}",
+                )
+            )
+
+        await self._import_neurons(brain_id, added)
+
+    async def _merge_synapses(
+        self, synapses_data: list[dict[str, Any]], state: _MergeState
+    ) -> None:
+        conn = self._ensure_conn()
+        brain_id = state.brain_id
+        report = state.report
+
+        remapped_data = [
+            {
+                **s,
+                "source_id": state.id_remap.get(s["source_id"], s["source_id"]),
+                "target_id": state.id_remap.get(s["target_id"], s["target_id"]),
+            }
+            for s in synapses_data
+        ]
+        wanted = list(
+            dict.fromkeys((s["source_id"], s["target_id"], s["type"]) for s in remapped_data)
+        )
+        local: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(wanted), _LOOKUP_SIZE):
+            part = wanted[start : start + _LOOKUP_SIZE]
+            values = ",".join(["(?, ?, ?)"] * len(part))
+            async with conn.execute(
+                f"""WITH wanted(source_id, target_id, type) AS (VALUES {values})
+                    SELECT s.* FROM wanted w
+                    JOIN synapses s ON s.brain_id = ? AND s.source_id = w.source_id
+                        AND s.target_id = w.target_id AND s.type = w.type
+                    ORDER BY s.rowid""",
+                (*(v for triple in part for v in triple), brain_id),
+            ) as cursor:
+                async for row in cursor:
+                    if row["id"] not in state.added_synapses:
+                        synapse = _synapse_dict(row)
+                        local[_synapse_triple(synapse, {})] = synapse
+
+        added: list[dict[str, Any]] = []
+        for incoming, remapped in zip(synapses_data, remapped_data, strict=True):
+            triple = _synapse_triple(remapped, {})
+            local_synapse = local.get(triple)
+            if local_synapse is None:
+                added.append(_add_provenance(remapped, state.source_brain_id, "added"))
+                state.added_synapses.add(remapped["id"])
+                report.synapses_added += 1
+                continue
+
+            resolution = _resolve_synapse_conflict(local_synapse, remapped, state.strategy)
+            state.id_remap[incoming["id"]] = local_synapse["id"]
+
+            if resolution == "kept_incoming":
+                updated = _add_provenance(
+                    {**remapped, "id": local_synapse["id"]}, state.source_brain_id, resolution
+                )
+                await conn.execute(
+                    """UPDATE synapses SET weight = ?, direction = ?, metadata = ?,
+                           reinforced_count = ?, created_at = ?
+                       WHERE brain_id = ? AND id = ?""",
+                    (
+                        updated["weight"],
+                        updated["direction"],
+                        json.dumps(updated["metadata"]),
+                        updated.get("reinforced_count", 0),
+                        updated["created_at"],
+                        brain_id,
+                        updated["id"],
+                    ),
+                )
+                local[triple] = updated
+                report.synapses_updated += 1
+
+            report.conflicts.append(
+                ConflictItem(
+                    entity_type="synapse",
+                    local_id=local_synapse["id"],
+                    incoming_id=incoming["id"],
+                    resolution=resolution,
+                    reason=f"triple match: {triple[:60]}",
+                )
+            )
+
+        await self._import_synapses(brain_id, added)
+
+    async def _merge_fibers(self, fibers_data: list[dict[str, Any]], state: _MergeState) -> None:
+        conn = self._ensure_conn()
+        brain_id = state.brain_id
+        report = state.report
+
+        added: list[dict[str, Any]] = []
+        for incoming in fibers_data:
+            remapped = {
+                **incoming,
+                "neuron_ids": _remap_ids_in_list(incoming.get("neuron_ids", []), state.id_remap),
+                "synapse_ids": _remap_ids_in_list(incoming.get("synapse_ids", []), state.id_remap),
+                "anchor_neuron_id": state.id_remap.get(
+                    incoming.get("anchor_neuron_id", ""), incoming.get("anchor_neuron_id", "")
+                ),
+            }
+            local_fiber = await self._find_fiber_by_neurons(
+                brain_id, frozenset(remapped["neuron_ids"]), state.added_fibers
+            )
+            if local_fiber is None:
+                added.append(_add_provenance(remapped, state.source_brain_id, "added"))
+                state.added_fibers.add(remapped["id"])
+                report.fibers_added += 1
+                continue
+
+            resolution = _resolve_neuron_conflict(local_fiber, remapped, state.strategy)
+            state.id_remap[incoming["id"]] = local_fiber["id"]
+
+            if resolution == "kept_incoming":
+                fiber = _fiber_from_dict(
+                    _add_provenance(
+                        {**remapped, "id": local_fiber["id"]}, state.source_brain_id, resolution
+                    )
+                )
+                # Pathway and conductivity are not exported; the local ones stay
+                await conn.execute(
+                    """UPDATE fibers SET neuron_ids = ?, synapse_ids = ?, anchor_neuron_id = ?,
+                           time_start = ?, time_end = ?, coherence = ?, salience = ?,
+                           frequency = ?, summary = ?, tags = ?, auto_tags = ?,
+                           agent_tags = ?, metadata = ?, created_at = ?
+                       WHERE brain_id = ? AND id = ?""",
+                    (
+                        json.dumps(sorted(fiber.neuron_ids)),
+                        json.dumps(sorted(fiber.synapse_ids)),
+                        fiber.anchor_neuron_id,
+                        fiber.time_start.isoformat() if fiber.time_start else None,
+                        fiber.time_end.isoformat() if fiber.time_end else None,
+                        fiber.coherence,
+                        fiber.salience,
+                        fiber.frequency,
+                        fiber.summary,
+                        json.dumps(sorted(fiber.auto_tags | fiber.agent_tags)),
+                        json.dumps(sorted(fiber.auto_tags)),
+                        json.dumps(sorted(fiber.agent_tags)),
+                        json.dumps(fiber.metadata),
+                        fiber.created_at.isoformat(),
+                        brain_id,
+                        fiber.id,
+                    ),
+                )
+                report.fibers_updated += 1
+            else:
+                report.fibers_skipped += 1
+
+            report.conflicts.append(
+                ConflictItem(
+                    entity_type="fiber",
+                    local_id=local_fiber["id"],
+                    incoming_id=incoming["id"],
+                    resolution=resolution,
+                    reason="neuron set match",
+                )
+            )
+
+        await self._import_fibers(brain_id, added)
+
+    async def _find_fiber_by_neurons(
+        self, brain_id: str, neuron_ids: frozenset[str], exclude: set[str]
+    ) -> dict[str, Any] | None:
+        """The last local fiber (in table order) with exactly this neuron set."""
+        conn = self._ensure_conn()
+        if neuron_ids:
+            placeholders = ",".join("?" * len(neuron_ids))
+            query = f"""SELECT f.* FROM fibers f
+                WHERE f.brain_id = ? AND f.id IN (
+                    SELECT fiber_id FROM fiber_neurons
+                    WHERE brain_id = ? AND neuron_id IN ({placeholders})
+                    GROUP BY fiber_id HAVING COUNT(*) = ?
+                )
+                ORDER BY f.rowid"""
+            params: tuple[Any, ...] = (brain_id, brain_id, *neuron_ids, len(neuron_ids))
+        else:
+            query = "SELECT * FROM fibers WHERE brain_id = ? AND neuron_ids = '[]' ORDER BY rowid"
+            params = (brain_id,)
+
+        match: dict[str, Any] | None = None
+        async with conn.execute(query, params) as cursor:
+            async for row in cursor:
+                fiber = _fiber_dict(row)
+                # The junction only proves a superset; compare the full set
+                if fiber["id"] not in exclude and frozenset(fiber["neuron_ids"]) == neuron_ids:
+                    match = fiber
+        return match
+
+    async def _merge_projects(
+        self, projects_data: list[dict[str, Any]], state: _MergeState
+    ) -> None:
+        conn = self._ensure_conn()
+        brain_id = state.brain_id
+
+        new: dict[str, dict[str, Any]] = {}
+        for project in projects_data:
+            async with conn.execute(
+                "SELECT 1 FROM projects WHERE brain_id = ? AND id = ?", (brain_id, project["id"])
+            ) as cursor:
+                if await cursor.fetchone() is None:
+                    new.setdefault(project["id"], project)
+        await self._import_projects(brain_id, list(new.values()))
+
+    async def _merge_typed_memories(
+        self, typed_memories_data: list[dict[str, Any]], state: _MergeState
+    ) -> None:
+        conn = self._ensure_conn()
+        brain_id = state.brain_id
+
+        new: list[dict[str, Any]] = []
+        for tm in typed_memories_data:
+            fiber_id = state.id_remap.get(tm["fiber_id"], tm["fiber_id"])
+            if fiber_id in state.seen_typed_memories:
+                continue
+            state.seen_typed_memories.add(fiber_id)
+            async with conn.execute(
+                "SELECT 1 FROM typed_memories WHERE brain_id = ? AND fiber_id = ?",
+                (brain_id, fiber_id),
+            ) as cursor:
+                if await cursor.fetchone() is None:
+                    new.append({**tm, "fiber_id": fiber_id})
+        await self._import_typed_memories(brain_id, new)
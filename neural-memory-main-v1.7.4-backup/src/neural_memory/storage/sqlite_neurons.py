@@ -9,12 +9,18 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from neural_memory.core.neuron import Neuron, NeuronState, NeuronType
+from neural_memory.storage.graph_snapshot import refractory_timestamp
 from neural_memory.storage.sqlite_row_mappers import row_to_neuron, row_to_neuron_state
 from neural_memory.utils.timeutils import utcnow
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import aiosqlite
 
+    from neural_memory.engine.embedding.vector_index import VectorIndex
+    from neural_memory.storage.graph_snapshot import GraphSnapshot
+
 
 def _build_fts_query(search_term: str) -> str:
     """Build an FTS5 MATCH expression from a user search string.
@@ -59,7 +65,14 @@ class SQLiteNeuronMixin:
     def _get_brain_id(self) -> str:
         raise NotImplementedError
 
+    async def _commit(self) -> None:
+        raise NotImplementedError
+
+    def _patch_snapshot(self, brain_id: str, patch: Callable[[GraphSnapshot], None]) -> None:
+        raise NotImplementedError
+
     _has_fts: bool
+    _vector_indexes: dict[str, VectorIndex]
 
     # ========== Neuron Operations ==========
 
@@ -91,11 +104,66 @@ class SQLiteNeuronMixin:
                 (neuron.id, brain_id, 0.3, 500.0, 0.5, utcnow().isoformat()),
             )
 
-            await conn.commit()
-            return neuron.id
+            await self._commit()
         except sqlite3.IntegrityError:
             raise ValueError(f"Neuron {neuron.id} already exists")
 
+        self._patch_snapshot(brain_id, lambda snapshot: snapshot.add_neuron(neuron.id))
+        return neuron.id
+
+    async def add_neurons_bulk(self, neurons: list[Neuron]) -> list[str]:
+        """Insert many neurons with two ``executemany`` calls.
+
+        Runs under a savepoint, so a duplicate ID leaves nothing behind
+        even inside an enclosing ``batch()``.
+        """
+        if not neurons:
+            return []
+        conn = self._ensure_conn()
+        brain_id = self._get_brain_id()
+        now = utcnow().isoformat()
+
+        await conn.execute("SAVEPOINT add_neurons_bulk")
+        try:
+            await conn.executemany(
+                """INSERT INTO neurons (id, brain_id, type, content, metadata, content_hash, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (
+                        neuron.id,
+                        brain_id,
+                        neuron.type.value,
+                        neuron.content,
+                        json.dumps(neuron.metadata),
+                        neuron.content_hash,
+                        neuron.created_at.isoformat(),
+                    )
+                    for neuron in neurons
+                ],
+            )
+            await conn.executemany(
+                """INSERT INTO neuron_states
+                   (neuron_id, brain_id, firing_threshold, refractory_period_ms,
+                    homeostatic_target, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                [(neuron.id, brain_id, 0.3, 500.0, 0.5, now) for neuron in neurons],
+            )
+        except sqlite3.IntegrityError:
+            await conn.execute("ROLLBACK TO add_neurons_bulk")
+            await conn.execute("RELEASE add_neurons_bulk")
+            raise ValueError("One or more neurons already exist")
+        await conn.execute("RELEASE add_neurons_bulk")
+        await self._commit()
+
+        neuron_ids = [neuron.id for neuron in neurons]
+
+        def patch(snapshot: GraphSnapshot) -> None:
+            for neuron_id in neuron_ids:
+                snapshot.add_neuron(neuron_id)
+
+        self._patch_snapshot(brain_id, patch)
+        return neuron_ids
+
     async def get_neuron(self, neuron_id: str) -> Neuron | None:
         conn = self._ensure_conn()
         brain_id = self._get_brain_id()
@@ -125,6 +193,29 @@ class SQLiteNeuronMixin:
             rows = await cursor.fetchall()
             return {row["id"]: row_to_neuron(row) for row in rows}
 
+    async def get_neurons_page(
+        self, brain_id: str, after_id: str | None = None, limit: int = 500
+    ) -> list[Neuron]:
+        """Keyset page over the (brain_id, id) primary key."""
+        conn = self._ensure_conn()
+
+        async with conn.execute(
+            "SELECT * FROM neurons WHERE brain_id = ? AND id > ? ORDER BY id LIMIT ?",
+            (brain_id, after_id or "", limit),
+        ) as cursor:
+            return [row_to_neuron(row) async for row in cursor]
+
+    async def sample_neuron_ids(self, limit: int) -> list[str]:
+        """Pick random neuron IDs from the covering primary key index."""
+        conn = self._ensure_conn()
+        brain_id = self._get_brain_id()
+
+        async with conn.execute(
+            "SELECT id FROM neurons WHERE brain_id = ? ORDER BY random() LIMIT ?",
+            (brain_id, limit),
+        ) as cursor:
+            return [row["id"] async for row in cursor]
+
     async def find_neurons(
         self,
         type: NeuronType | None = None,
@@ -210,7 +301,7 @@ class SQLiteNeuronMixin:
         if cursor.rowcount == 0:
             raise ValueError(f"Neuron {neuron.id} does not exist")
 
-        await conn.commit()
+        await self._commit()
 
     async def delete_neuron(self, neuron_id: str) -> bool:
         conn = self._ensure_conn()
@@ -220,7 +311,12 @@ class SQLiteNeuronMixin:
             "DELETE FROM neurons WHERE id = ? AND brain_id = ?",
             (neuron_id, brain_id),
         )
-        await conn.commit()
+        await self._commit()
+
+        self._patch_snapshot(brain_id, lambda snapshot: snapshot.remove_neuron(neuron_id))
+        index = self._vector_indexes.get(brain_id)
+        if index is not None:
+            index.remove(neuron_id)
 
         return cursor.rowcount > 0
 
@@ -283,7 +379,15 @@ class SQLiteNeuronMixin:
                 state.created_at.isoformat(),
             ),
         )
-        await conn.commit()
+        await self._commit()
+
+        refractory = refractory_timestamp(state.refractory_until)
+        self._patch_snapshot(
+            brain_id,
+            lambda snapshot: snapshot.update_state(
+                state.neuron_id, state.access_frequency, refractory
+            ),
+        )
 
     async def get_all_neuron_states(self) -> list[NeuronState]:
         """Get all neuron states for current brain."""
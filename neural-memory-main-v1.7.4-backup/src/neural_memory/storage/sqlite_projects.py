@@ -23,6 +23,9 @@ class SQLiteProjectMixin:
     def _get_brain_id(self) -> str:
         raise NotImplementedError
 
+    async def _commit(self) -> None:
+        raise NotImplementedError
+
     async def add_project(self, project: Project) -> str:
         conn = self._ensure_conn()
         brain_id = self._get_brain_id()
@@ -46,7 +49,7 @@ class SQLiteProjectMixin:
                     project.created_at.isoformat(),
                 ),
             )
-            await conn.commit()
+            await self._commit()
             return project.id
         except sqlite3.IntegrityError:
             raise ValueError(f"Project {project.id} already exists")
@@ -132,7 +135,7 @@ class SQLiteProjectMixin:
         if cursor.rowcount == 0:
             raise ValueError(f"Project {project.id} does not exist")
 
-        await conn.commit()
+        await self._commit()
 
     async def delete_project(self, project_id: str) -> bool:
         conn = self._ensure_conn()
@@ -142,6 +145,6 @@ class SQLiteProjectMixin:
             "DELETE FROM projects WHERE id = ? AND brain_id = ?",
             (project_id, brain_id),
         )
-        await conn.commit()
+        await self._commit()
 
         return cursor.rowcount > 0
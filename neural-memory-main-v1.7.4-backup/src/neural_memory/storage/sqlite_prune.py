@@ -0,0 +1,267 @@
+"""SQLite mixin for set-based consolidation pruning."""
+
+from __future__ import annotations
+
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from neural_memory.engine.consolidation import PruneResult
+
+if TYPE_CHECKING:
+    import aiosqlite
+
+    from neural_memory.engine.consolidation import ProgressCallback, PrunePolicy
+    from neural_memory.engine.embedding.vector_index import VectorIndex
+    from neural_memory.storage.graph_snapshot import GraphSnapshotRegistry
+
+_SCAN_BATCH_SIZE = 5000
+
+
+class SQLitePruneMixin:
+    """Bulk prune for SQLiteStorage.
+
+    Candidates are streamed in batches, decayed in Python and collected in
+    a temp table; salience and bridge protection, fiber cleanup, orphan
+    detection and the deletes are then joins driven from that table, all
+    in one transaction. With ``neuron_ids`` the scan is restricted to
+    synapses touching those neurons, so the cost follows the scope rather
+    than the brain.
+    """
+
+    def _ensure_conn(self) -> aiosqlite.Connection:
+        raise NotImplementedError
+
+    def _get_brain_id(self) -> str:
+        raise NotImplementedError
+
+    def batch(self) -> AbstractAsyncContextManager[None]:
+        raise NotImplementedError
+
+    _graph_snapshots: GraphSnapshotRegistry
+    _vector_indexes: dict[str, VectorIndex]
+
+    async def prune_bulk(
+        self,
+        policy: PrunePolicy,
+        reference_time: datetime,
+        dry_run: bool = False,
+        progress_callback: ProgressCallback | None = None,
+        neuron_ids: set[str] | None = None,
+    ) -> PruneResult | None:
+        brain_id = self._get_brain_id()
+        ref = reference_time.isoformat()
+
+        scope_clause = ""
+        if neuron_ids is not None:
+            scope_clause = (
+                " AND (source_id IN (SELECT id FROM temp.prune_scope)"
+                " OR target_id IN (SELECT id FROM temp.prune_scope))"
+            )
+
+        async with self.batch():
+            # The batch's connection (the temp tables live on it)
+            conn = self._ensure_conn()
+            await self._create_prune_tables(conn)
+            if neuron_ids:
+                await conn.executemany(
+                    "INSERT INTO temp.prune_scope (id) VALUES (?)",
+                    [(nid,) for nid in neuron_ids],
+                )
+
+            # 1. Decay pass over inactive synapses
+            async with conn.execute(
+                f"""SELECT COUNT(*) FROM synapses
+                    WHERE brain_id = ?
+                      AND julianday(?) - julianday(COALESCE(last_activated, created_at)) >= ?
+                      {scope_clause}""",
+                (brain_id, ref, policy.min_inactive_days),
+            ) as cursor:
+                row = await cursor.fetchone()
+                total = row[0] if row else 0
+
+            scanned = 0
+            async with conn.execute(
+                f"""SELECT id, source_id, target_id, weight, reinforced_count,
+                           json_extract(metadata, '$._inferred'),
+                           json_extract(metadata, '$._dream'),
+                           (julianday(?) - julianday(COALESCE(last_activated, created_at))) * 24.0
+                    FROM synapses
+                    WHERE brain_id = ?
+                      AND julianday(?) - julianday(COALESCE(last_activated, created_at)) >= ?
+                      {scope_clause}""",
+                (ref, brain_id, ref, policy.min_inactive_days),
+            ) as cursor:
+                while rows := list(await cursor.fetchmany(_SCAN_BATCH_SIZE)):
+                    candidates = [
+                        (syn_id, source_id, target_id, weight)
+                        for syn_id, source_id, target_id, weight, count, inferred, dream, hours in rows
+                        if policy.decayed_weight(
+                            weight, hours, bool(inferred), bool(dream), count or 0
+                        )
+                        < policy.weight_threshold
+                    ]
+                    if candidates:
+                        await conn.executemany(
+                            "INSERT INTO temp.prune_synapses (id, source_id, target_id, weight) "
+                            "VALUES (?, ?, ?, ?)",
+                            candidates,
+                        )
+                    scanned += len(rows)
+                    if progress_callback is not None:
+                        progress_callback("decay", scanned, total)
+
+            # 2. High-salience fibers protect their neurons' outgoing synapses
+            await conn.execute(
+                """DELETE FROM temp.prune_synapses WHERE EXISTS (
+                       SELECT 1 FROM fiber_neurons fn
+                       JOIN fibers f ON f.brain_id = fn.brain_id AND f.id = fn.fiber_id
+                       WHERE fn.brain_id = ? AND fn.neuron_id = prune_synapses.source_id
+                         AND f.salience > ?
+                   )""",
+                (brain_id, policy.salience_threshold),
+            )
+
+            # 3. Bridge protection: a source whose only neighbor is the target
+            await conn.execute(
+                """INSERT INTO temp.prune_degree (neuron_id, degree)
+                   SELECT neuron_id, COUNT(DISTINCT other) FROM (
+                       SELECT source_id AS neuron_id, target_id AS other FROM synapses
+                       WHERE brain_id = ?
+                         AND source_id IN (SELECT source_id FROM temp.prune_synapses)
+                       UNION ALL
+                       SELECT target_id, source_id FROM synapses
+                       WHERE brain_id = ?
+                         AND target_id IN (SELECT source_id FROM temp.prune_synapses)
+                   )
+                   GROUP BY neuron_id""",
+                (brain_id, brain_id),
+            )
+            await conn.execute(
+                """DELETE FROM temp.prune_synapses
+                   WHERE weight >= ?
+                     AND source_id IN (SELECT neuron_id FROM temp.prune_degree WHERE degree <= 1)""",
+                (policy.bridge_min_weight,),
+            )
+
+            synapses_pruned = await self._count_rows(conn, "temp.prune_synapses")
+            if synapses_pruned == 0:
+                await self._drop_prune_tables(conn)
+                return PruneResult(synapses_pruned=0, neurons_pruned=0)
+
+            # 4. Orphans: no surviving synapse and not a fiber anchor
+            if policy.prune_isolated_neurons:
+                candidate_clause = ""
+                if neuron_ids is not None:
+                    candidate_clause = """AND n.id IN (
+                        SELECT id FROM temp.prune_scope
+                        UNION SELECT source_id FROM temp.prune_synapses
+                        UNION SELECT target_id FROM temp.prune_synapses
+                    )"""
+                await conn.execute(
+                    f"""INSERT INTO temp.prune_neurons (id)
+                       SELECT n.id FROM neurons n
+                       WHERE n.brain_id = ? {candidate_clause}
+                         AND NOT EXISTS (
+                             SELECT 1 FROM fibers f
+                             WHERE f.brain_id = n.brain_id AND f.anchor_neuron_id = n.id
+                         )
+                         AND NOT EXISTS (
+                             SELECT 1 FROM synapses s
+                             WHERE s.brain_id = n.brain_id AND s.source_id = n.id
+                               AND s.id NOT IN (SELECT id FROM temp.prune_synapses)
+                         )
+                         AND NOT EXISTS (
+                             SELECT 1 FROM synapses s
+                             WHERE s.brain_id = n.brain_id AND s.target_id = n.id
+                               AND s.id NOT IN (SELECT id FROM temp.prune_synapses)
+                         )""",
+                    (brain_id,),
+                )
+            neurons_pruned = await self._count_rows(conn, "temp.prune_neurons")
+
+            orphan_ids: list[str] = []
+            if not dry_run:
+                orphan_ids = await self._apply_prune(conn, brain_id)
+
+            await self._drop_prune_tables(conn)
+
+        if not dry_run:
+            # Too many removals to patch one by one; rebuilt on next read
+            self._graph_snapshots.invalidate(brain_id)
+            index = self._vector_indexes.get(brain_id)
+            if index is not None:
+                for neuron_id in orphan_ids:
+                    index.remove(neuron_id)
+            if progress_callback is not None:
+                progress_callback("synapses", synapses_pruned, synapses_pruned)
+                progress_callback("neurons", neurons_pruned, neurons_pruned)
+
+        return PruneResult(synapses_pruned=synapses_pruned, neurons_pruned=neurons_pruned)
+
+    async def _apply_prune(self, conn: aiosqlite.Connection, brain_id: str) -> list[str]:
+        """Delete the collected synapses and orphans and drop fiber refs to them.
+
+        Returns the deleted orphan IDs when a vector index needs updating.
+        """
+        # A fiber's synapses connect its own neurons, so candidate fibers
+        # are found through the junction table on the pruned endpoints
+        await conn.execute(
+            """UPDATE fibers SET synapse_ids = (
+                   SELECT json_group_array(j.value) FROM json_each(fibers.synapse_ids) j
+                   WHERE j.value NOT IN (SELECT id FROM temp.prune_synapses)
+               )
+               WHERE brain_id = ? AND id IN (
+                   SELECT fn.fiber_id FROM fiber_neurons fn
+                   WHERE fn.brain_id = ? AND fn.neuron_id IN (
+                       SELECT source_id FROM temp.prune_synapses
+                       UNION SELECT target_id FROM temp.prune_synapses
+                   )
+               )
+               AND EXISTS (
+                   SELECT 1 FROM json_each(fibers.synapse_ids) j
+                   JOIN temp.prune_synapses p ON p.id = j.value
+               )""",
+            (brain_id, brain_id),
+        )
+        await conn.execute(
+            "DELETE FROM synapses WHERE brain_id = ? AND id IN (SELECT id FROM temp.prune_synapses)",
+            (brain_id,),
+        )
+
+        orphan_ids: list[str] = []
+        if brain_id in self._vector_indexes:
+            async with conn.execute("SELECT id FROM temp.prune_neurons") as cursor:
+                orphan_ids = [row[0] async for row in cursor]
+        await conn.execute(
+            "DELETE FROM neurons WHERE brain_id = ? AND id IN (SELECT id FROM temp.prune_neurons)",
+            (brain_id,),
+        )
+        return orphan_ids
+
+    @staticmethod
+    async def _create_prune_tables(conn: aiosqlite.Connection) -> None:
+        await SQLitePruneMixin._drop_prune_tables(conn)
+        await conn.execute(
+            "CREATE TEMP TABLE prune_synapses (id TEXT PRIMARY KEY, "
+            "source_id TEXT NOT NULL, target_id TEXT NOT NULL, weight REAL NOT NULL)"
+        )
+        await conn.execute(
+            "CREATE INDEX temp.idx_prune_synapses_source ON prune_synapses(source_id)"
+        )
+        await conn.execute(
+            "CREATE TEMP TABLE prune_degree (neuron_id TEXT PRIMARY KEY, degree INTEGER NOT NULL)"
+        )
+        await conn.execute("CREATE TEMP TABLE prune_neurons (id TEXT PRIMARY KEY)")
+        await conn.execute("CREATE TEMP TABLE prune_scope (id TEXT PRIMARY KEY)")
+
+    @staticmethod
+    async def _drop_prune_tables(conn: aiosqlite.Connection) -> None:
+        for table in ("prune_synapses", "prune_degree", "prune_neurons", "prune_scope"):
+            await conn.execute(f"DROP TABLE IF EXISTS temp.{table}")
+
+    @staticmethod
+    async def _count_rows(conn: aiosqlite.Connection, table: str) -> int:
+        async with conn.execute(f"SELECT COUNT(*) FROM {table}") as cursor:
+            row = await cursor.fetchone()
+            return row[0] if row else 0
@@ -11,7 +11,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Schema version for migrations
-SCHEMA_VERSION = 13
+SCHEMA_VERSION = 18
 
 # â”€â”€ Migrations â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 # Each entry maps (from_version -> to_version) with a list of SQL statements.
@@ -192,6 +192,115 @@ MIGRATIONS: dict[tuple[int, int], list[str]] = {
             PRIMARY KEY (brain_id, source_system, source_collection)
         )""",
     ],
+    (13, 14): [
+        # Change log for incremental consolidation (the triggers that fill it are in SCHEMA)
+        """CREATE TABLE IF NOT EXISTS dirty_entities (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            brain_id TEXT NOT NULL,
+            entity_type TEXT NOT NULL,
+            entity_id TEXT NOT NULL,
+            UNIQUE (brain_id, entity_type, entity_id)
+        )""",
+        # Orphan checks look up fibers by anchor
+        "CREATE INDEX IF NOT EXISTS idx_fibers_anchor ON fibers(brain_id, anchor_neuron_id)",
+    ],
+    (14, 15): [
+        # Rolled-up co-activation counters (co_activation_events becomes a debug ring buffer)
+        """CREATE TABLE IF NOT EXISTS co_activation_pairs (
+            brain_id TEXT NOT NULL,
+            neuron_a TEXT NOT NULL,
+            neuron_b TEXT NOT NULL,
+            decayed_count REAL NOT NULL,
+            mean_strength REAL NOT NULL,
+            total_count INTEGER NOT NULL,
+            first_seen TEXT NOT NULL,
+            last_seen TEXT NOT NULL,
+            PRIMARY KEY (brain_id, neuron_a, neuron_b),
+            FOREIGN KEY (brain_id) REFERENCES brains(id) ON DELETE CASCADE
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_co_activation_pairs_count ON co_activation_pairs(brain_id, decayed_count DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_co_activation_pairs_seen ON co_activation_pairs(brain_id, last_seen)",
+        "CREATE INDEX IF NOT EXISTS idx_co_activation_pairs_b ON co_activation_pairs(brain_id, neuron_b)",
+        # Backfill from the event log (undecayed: counts as of each pair's last event)
+        (
+            "INSERT OR IGNORE INTO co_activation_pairs "
+            "(brain_id, neuron_a, neuron_b, decayed_count, mean_strength, total_count, "
+            "first_seen, last_seen) "
+            "SELECT brain_id, neuron_a, neuron_b, COUNT(*), AVG(binding_strength), COUNT(*), "
+            "MIN(created_at), MAX(created_at) "
+            "FROM co_activation_events GROUP BY brain_id, neuron_a, neuron_b"
+        ),
+    ],
+    (15, 16): [
+        # Content-addressed versions: base manifest + delta chain (legacy
+        # snapshot_data versions are converted on first read)
+        "ALTER TABLE brain_versions ADD COLUMN storage_format TEXT DEFAULT 'snapshot'",
+        "ALTER TABLE brain_versions ADD COLUMN parent_version_id TEXT",
+        """CREATE TABLE IF NOT EXISTS version_rows (
+            brain_id TEXT NOT NULL,
+            row_hash TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (brain_id, row_hash)
+        )""",
+        """CREATE TABLE IF NOT EXISTS version_entries (
+            brain_id TEXT NOT NULL,
+            version_id TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            entity_id TEXT NOT NULL,
+            row_hash TEXT,
+            PRIMARY KEY (brain_id, version_id, kind, entity_id)
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_version_entries_hash ON version_entries(brain_id, row_hash)",
+        "CREATE INDEX IF NOT EXISTS idx_brain_versions_parent ON brain_versions(brain_id, parent_version_id)",
+    ],
+    (16, 17): [
+        # Merge fingerprints (filled lazily by merge_brain_stream; reset trigger is in SCHEMA)
+        """CREATE TABLE IF NOT EXISTS neuron_merge_keys (
+            brain_id TEXT NOT NULL,
+            neuron_id TEXT NOT NULL,
+            merge_key TEXT NOT NULL,
+            PRIMARY KEY (brain_id, neuron_id),
+            FOREIGN KEY (brain_id, neuron_id) REFERENCES neurons(brain_id, id) ON DELETE CASCADE
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_neuron_merge_keys_key ON neuron_merge_keys(brain_id, merge_key)",
+    ],
+    (17, 18): [
+        # Materialized row counts for get_stats (maintenance triggers are in SCHEMA)
+        """CREATE TABLE IF NOT EXISTS neuron_type_counts (
+            brain_id TEXT NOT NULL,
+            type TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (brain_id, type),
+            FOREIGN KEY (brain_id) REFERENCES brains(id) ON DELETE CASCADE
+        )""",
+        """CREATE TABLE IF NOT EXISTS synapse_type_counts (
+            brain_id TEXT NOT NULL,
+            type TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            weight_sum REAL NOT NULL DEFAULT 0.0,
+            reinforced_sum INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (brain_id, type),
+            FOREIGN KEY (brain_id) REFERENCES brains(id) ON DELETE CASCADE
+        )""",
+        """CREATE TABLE IF NOT EXISTS fiber_counts (
+            brain_id TEXT PRIMARY KEY,
+            count INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY (brain_id) REFERENCES brains(id) ON DELETE CASCADE
+        )""",
+        # Backfill from scratch (re-running the migration must not double count);
+        # SCHEMA then creates the triggers that keep these current
+        "DELETE FROM neuron_type_counts",
+        "DELETE FROM synapse_type_counts",
+        "DELETE FROM fiber_counts",
+        """INSERT INTO neuron_type_counts (brain_id, type, count)
+           SELECT brain_id, type, COUNT(*) FROM neurons GROUP BY brain_id, type""",
+        """INSERT INTO synapse_type_counts (brain_id, type, count, weight_sum, reinforced_sum)
+           SELECT brain_id, type, COUNT(*), TOTAL(weight), TOTAL(reinforced_count)
+           FROM synapses GROUP BY brain_id, type""",
+        """INSERT INTO fiber_counts (brain_id, count)
+           SELECT brain_id, COUNT(*) FROM fibers GROUP BY brain_id""",
+    ],
 }
 
 
@@ -288,6 +397,20 @@ CREATE INDEX IF NOT EXISTS idx_neurons_type ON neurons(brain_id, type);
 CREATE INDEX IF NOT EXISTS idx_neurons_created ON neurons(brain_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_neurons_hash ON neurons(brain_id, content_hash);
 
+-- Merge fingerprint per neuron (type + normalized content), filled lazily
+-- by merge_brain_stream; a content/type change drops the stale key
+CREATE TABLE IF NOT EXISTS neuron_merge_keys (
+    brain_id TEXT NOT NULL,
+    neuron_id TEXT NOT NULL,
+    merge_key TEXT NOT NULL,
+    PRIMARY KEY (brain_id, neuron_id),
+    FOREIGN KEY (brain_id, neuron_id) REFERENCES neurons(brain_id, id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_neuron_merge_keys_key ON neuron_merge_keys(brain_id, merge_key);
+CREATE TRIGGER IF NOT EXISTS neuron_merge_keys_au AFTER UPDATE OF type, content ON neurons BEGIN
+    DELETE FROM neuron_merge_keys WHERE brain_id = old.brain_id AND neuron_id = old.id;
+END;
+
 -- Neuron states table
 CREATE TABLE IF NOT EXISTS neuron_states (
     neuron_id TEXT NOT NULL,
@@ -355,6 +478,7 @@ CREATE TABLE IF NOT EXISTS fibers (
 CREATE INDEX IF NOT EXISTS idx_fibers_created ON fibers(brain_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_fibers_salience ON fibers(brain_id, salience);
 CREATE INDEX IF NOT EXISTS idx_fibers_conductivity ON fibers(brain_id, conductivity);
+CREATE INDEX IF NOT EXISTS idx_fibers_anchor ON fibers(brain_id, anchor_neuron_id);
 
 -- Fiber-neuron junction table (fast lookups)
 CREATE TABLE IF NOT EXISTS fiber_neurons (
@@ -367,6 +491,100 @@ CREATE TABLE IF NOT EXISTS fiber_neurons (
 );
 CREATE INDEX IF NOT EXISTS idx_fiber_neurons_neuron ON fiber_neurons(brain_id, neuron_id);
 
+-- Row counts per brain and type, kept current by the triggers below so
+-- stats and health checks read a few rows instead of counting tables
+CREATE TABLE IF NOT EXISTS neuron_type_counts (
+    brain_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (brain_id, type),
+    FOREIGN KEY (brain_id) REFERENCES brains(id) ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS synapse_type_counts (
+    brain_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    weight_sum REAL NOT NULL DEFAULT 0.0,
+    reinforced_sum INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (brain_id, type),
+    FOREIGN KEY (brain_id) REFERENCES brains(id) ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS fiber_counts (
+    brain_id TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (brain_id) REFERENCES brains(id) ON DELETE CASCADE
+);
+-- Missing rows are added with INSERT ... WHERE NOT EXISTS: a conflict clause
+-- here would be overridden by the one on the outer statement
+CREATE TRIGGER IF NOT EXISTS neuron_type_counts_ai AFTER INSERT ON neurons BEGIN
+    INSERT INTO neuron_type_counts (brain_id, type)
+    SELECT new.brain_id, new.type WHERE NOT EXISTS (
+        SELECT 1 FROM neuron_type_counts WHERE brain_id = new.brain_id AND type = new.type
+    );
+    UPDATE neuron_type_counts SET count = count + 1
+    WHERE brain_id = new.brain_id AND type = new.type;
+END;
+CREATE TRIGGER IF NOT EXISTS neuron_type_counts_ad AFTER DELETE ON neurons BEGIN
+    UPDATE neuron_type_counts SET count = count - 1
+    WHERE brain_id = old.brain_id AND type = old.type;
+END;
+CREATE TRIGGER IF NOT EXISTS neuron_type_counts_au AFTER UPDATE OF type ON neurons
+WHEN new.type IS NOT old.type BEGIN
+    UPDATE neuron_type_counts SET count = count - 1
+    WHERE brain_id = old.brain_id AND type = old.type;
+    INSERT INTO neuron_type_counts (brain_id, type)
+    SELECT new.brain_id, new.type WHERE NOT EXISTS (
+        SELECT 1 FROM neuron_type_counts WHERE brain_id = new.brain_id AND type = new.type
+    );
+    UPDATE neuron_type_counts SET count = count + 1
+    WHERE brain_id = new.brain_id AND type = new.type;
+END;
+CREATE TRIGGER IF NOT EXISTS synapse_type_counts_ai AFTER INSERT ON synapses BEGIN
+    INSERT INTO synapse_type_counts (brain_id, type)
+    SELECT new.brain_id, new.type WHERE NOT EXISTS (
+        SELECT 1 FROM synapse_type_counts WHERE brain_id = new.brain_id AND type = new.type
+    );
+    UPDATE synapse_type_counts SET
+        count = count + 1,
+        weight_sum = weight_sum + COALESCE(new.weight, 0.0),
+        reinforced_sum = reinforced_sum + COALESCE(new.reinforced_count, 0)
+    WHERE brain_id = new.brain_id AND type = new.type;
+END;
+CREATE TRIGGER IF NOT EXISTS synapse_type_counts_ad AFTER DELETE ON synapses BEGIN
+    UPDATE synapse_type_counts SET
+        count = count - 1,
+        weight_sum = weight_sum - COALESCE(old.weight, 0.0),
+        reinforced_sum = reinforced_sum - COALESCE(old.reinforced_count, 0)
+    WHERE brain_id = old.brain_id AND type = old.type;
+END;
+CREATE TRIGGER IF NOT EXISTS synapse_type_counts_au AFTER UPDATE OF type, weight, reinforced_count
+ON synapses BEGIN
+    UPDATE synapse_type_counts SET
+        count = count - 1,
+        weight_sum = weight_sum - COALESCE(old.weight, 0.0),
+        reinforced_sum = reinforced_sum - COALESCE(old.reinforced_count, 0)
+    WHERE brain_id = old.brain_id AND type = old.type;
+    INSERT INTO synapse_type_counts (brain_id, type)
+    SELECT new.brain_id, new.type WHERE NOT EXISTS (
+        SELECT 1 FROM synapse_type_counts WHERE brain_id = new.brain_id AND type = new.type
+    );
+    UPDATE synapse_type_counts SET
+        count = count + 1,
+        weight_sum = weight_sum + COALESCE(new.weight, 0.0),
+        reinforced_sum = reinforced_sum + COALESCE(new.reinforced_count, 0)
+    WHERE brain_id = new.brain_id AND type = new.type;
+END;
+CREATE TRIGGER IF NOT EXISTS fiber_counts_ai AFTER INSERT ON fibers BEGIN
+    INSERT INTO fiber_counts (brain_id)
+    SELECT new.brain_id WHERE NOT EXISTS (
+        SELECT 1 FROM fiber_counts WHERE brain_id = new.brain_id
+    );
+    UPDATE fiber_counts SET count = count + 1 WHERE brain_id = new.brain_id;
+END;
+CREATE TRIGGER IF NOT EXISTS fiber_counts_ad AFTER DELETE ON fibers BEGIN
+    UPDATE fiber_counts SET count = count - 1 WHERE brain_id = old.brain_id;
+END;
+
 -- Typed memories table
 CREATE TABLE IF NOT EXISTS typed_memories (
     fiber_id TEXT NOT NULL,
@@ -419,7 +637,7 @@ CREATE TABLE IF NOT EXISTS memory_maturations (
 );
 CREATE INDEX IF NOT EXISTS idx_maturations_stage ON memory_maturations(brain_id, stage);
 
--- Co-activation events for associative inference
+-- Raw co-activation events: optional bounded debug log (inference reads co_activation_pairs)
 CREATE TABLE IF NOT EXISTS co_activation_events (
     id TEXT NOT NULL,
     brain_id TEXT NOT NULL,
@@ -435,6 +653,23 @@ CREATE INDEX IF NOT EXISTS idx_co_activation_pair ON co_activation_events(brain_
 CREATE INDEX IF NOT EXISTS idx_co_activation_created ON co_activation_events(brain_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_co_activation_time ON co_activation_events(brain_id, created_at, neuron_a, neuron_b);
 
+-- Rolled-up co-activation counters per pair (decayed_count is as of last_seen)
+CREATE TABLE IF NOT EXISTS co_activation_pairs (
+    brain_id TEXT NOT NULL,
+    neuron_a TEXT NOT NULL,  -- canonical: a < b
+    neuron_b TEXT NOT NULL,
+    decayed_count REAL NOT NULL,
+    mean_strength REAL NOT NULL,  -- decay-weighted mean binding strength
+    total_count INTEGER NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    PRIMARY KEY (brain_id, neuron_a, neuron_b),
+    FOREIGN KEY (brain_id) REFERENCES brains(id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_co_activation_pairs_count ON co_activation_pairs(brain_id, decayed_count DESC);
+CREATE INDEX IF NOT EXISTS idx_co_activation_pairs_seen ON co_activation_pairs(brain_id, last_seen);
+CREATE INDEX IF NOT EXISTS idx_co_activation_pairs_b ON co_activation_pairs(brain_id, neuron_b);
+
 -- Action event log for habit learning
 CREATE TABLE IF NOT EXISTS action_events (
     id TEXT NOT NULL,
@@ -464,14 +699,38 @@ CREATE TABLE IF NOT EXISTS brain_versions (
     synapse_count INTEGER DEFAULT 0,
     fiber_count INTEGER DEFAULT 0,
     snapshot_hash TEXT NOT NULL,
-    snapshot_data TEXT NOT NULL,
+    snapshot_data TEXT NOT NULL,  -- 'snapshot': compressed JSON; 'delta': header JSON
     created_at TEXT NOT NULL,
     metadata TEXT DEFAULT '{}',
+    storage_format TEXT DEFAULT 'snapshot',
+    parent_version_id TEXT,  -- NULL: version_entries hold the full manifest
     PRIMARY KEY (brain_id, id),
     UNIQUE (brain_id, version_name)
 );
 CREATE INDEX IF NOT EXISTS idx_brain_versions_number ON brain_versions(brain_id, version_number DESC);
 CREATE INDEX IF NOT EXISTS idx_brain_versions_created ON brain_versions(brain_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_brain_versions_parent ON brain_versions(brain_id, parent_version_id);
+
+-- Version row payloads, stored once per content hash
+CREATE TABLE IF NOT EXISTS version_rows (
+    brain_id TEXT NOT NULL,
+    row_hash TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (brain_id, row_hash)
+);
+
+-- Version manifest entries: the full manifest for a base version, the
+-- changes since the parent for a delta version (NULL row_hash = removed)
+CREATE TABLE IF NOT EXISTS version_entries (
+    brain_id TEXT NOT NULL,
+    version_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    entity_id TEXT NOT NULL,
+    row_hash TEXT,
+    PRIMARY KEY (brain_id, version_id, kind, entity_id)
+);
+CREATE INDEX IF NOT EXISTS idx_version_entries_hash ON version_entries(brain_id, row_hash);
 
 -- Sync state persistence for external source auto-sync
 CREATE TABLE IF NOT EXISTS sync_states (
@@ -484,4 +743,67 @@ CREATE TABLE IF NOT EXISTS sync_states (
     metadata TEXT DEFAULT '{}',
     PRIMARY KEY (brain_id, source_system, source_collection)
 );
+
+-- Entities touched since the last consolidation checkpoint
+CREATE TABLE IF NOT EXISTS dirty_entities (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    brain_id TEXT NOT NULL,
+    entity_type TEXT NOT NULL,  -- neuron | synapse | fiber
+    entity_id TEXT NOT NULL,
+    UNIQUE (brain_id, entity_type, entity_id)
+);
+-- Every neuron, synapse and fiber write (and every co-activation) marks the
+-- touched IDs dirty; INSERT OR REPLACE moves a re-touched row to a fresh seq
+-- so it survives a checkpoint taken before the write
+CREATE TRIGGER IF NOT EXISTS neurons_dirty_ai AFTER INSERT ON neurons BEGIN
+    INSERT OR REPLACE INTO dirty_entities (brain_id, entity_type, entity_id)
+    VALUES (new.brain_id, 'neuron', new.id);
+END;
+CREATE TRIGGER IF NOT EXISTS neurons_dirty_au AFTER UPDATE ON neurons BEGIN
+    INSERT OR REPLACE INTO dirty_entities (brain_id, entity_type, entity_id)
+    VALUES (new.brain_id, 'neuron', new.id);
+END;
+CREATE TRIGGER IF NOT EXISTS synapses_dirty_ai AFTER INSERT ON synapses BEGIN
+    INSERT OR REPLACE INTO dirty_entities (brain_id, entity_type, entity_id)
+    VALUES (new.brain_id, 'synapse', new.id);
+END;
+CREATE TRIGGER IF NOT EXISTS synapses_dirty_au AFTER UPDATE ON synapses BEGIN
+    INSERT OR REPLACE INTO dirty_entities (brain_id, entity_type, entity_id)
+    VALUES (new.brain_id, 'synapse', new.id);
+END;
+-- A deleted synapse cannot be looked up later, so mark its endpoints
+CREATE TRIGGER IF NOT EXISTS synapses_dirty_ad AFTER DELETE ON synapses BEGIN
+    INSERT OR REPLACE INTO dirty_entities (brain_id, entity_type, entity_id)
+    VALUES (old.brain_id, 'neuron', old.source_id);
+    INSERT OR REPLACE INTO dirty_entities (brain_id, entity_type, entity_id)
+    VALUES (old.brain_id, 'neuron', old.target_id);
+END;
+CREATE TRIGGER IF NOT EXISTS fibers_dirty_ai AFTER INSERT ON fibers BEGIN
+    INSERT OR REPLACE INTO dirty_entities (brain_id, entity_type, entity_id)
+    VALUES (new.brain_id, 'fiber', new.id);
+END;
+CREATE TRIGGER IF NOT EXISTS fibers_dirty_au AFTER UPDATE ON fibers BEGIN
+    INSERT OR REPLACE INTO dirty_entities (brain_id, entity_type, entity_id)
+    VALUES (new.brain_id, 'fiber', new.id);
+END;
+CREATE TRIGGER IF NOT EXISTS co_activation_dirty_ai AFTER INSERT ON co_activation_events BEGIN
+    INSERT OR REPLACE INTO dirty_entities (brain_id, entity_type, entity_id)
+    VALUES (new.brain_id, 'neuron', new.neuron_a);
+    INSERT OR REPLACE INTO dirty_entities (brain_id, entity_type, entity_id)
+    VALUES (new.brain_id, 'neuron', new.neuron_b);
+END;
+CREATE TRIGGER IF NOT EXISTS co_activation_pairs_dirty_ai AFTER INSERT ON co_activation_pairs
+BEGIN
+    INSERT OR REPLACE INTO dirty_entities (brain_id, entity_type, entity_id)
+    VALUES (new.brain_id, 'neuron', new.neuron_a);
+    INSERT OR REPLACE INTO dirty_entities (brain_id, entity_type, entity_id)
+    VALUES (new.brain_id, 'neuron', new.neuron_b);
+END;
+CREATE TRIGGER IF NOT EXISTS co_activation_pairs_dirty_au AFTER UPDATE OF last_seen
+ON co_activation_pairs BEGIN
+    INSERT OR REPLACE INTO dirty_entities (brain_id, entity_type, entity_id)
+    VALUES (new.brain_id, 'neuron', new.neuron_a);
+    INSERT OR REPLACE INTO dirty_entities (brain_id, entity_type, entity_id)
+    VALUES (new.brain_id, 'neuron', new.neuron_b);
+END;
 """
@@ -2,20 +2,37 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import timedelta
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import aiosqlite
 
 from neural_memory.storage.base import NeuralStorage
+from neural_memory.storage.graph_snapshot import (
+    GraphSnapshot,
+    GraphSnapshotRegistry,
+    refractory_timestamp,
+)
+from neural_memory.storage.health_cache import health_cache_for
 from neural_memory.storage.sqlite_action_log import SQLiteActionLogMixin
 from neural_memory.storage.sqlite_brain_ops import SQLiteBrainMixin
-from neural_memory.storage.sqlite_coactivation import SQLiteCoActivationMixin
+from neural_memory.storage.sqlite_changes import SQLiteChangeTrackingMixin
+from neural_memory.storage.sqlite_coactivation import (
+    SQLiteCoActivationMixin,
+    co_activation_decay,
+)
 from neural_memory.storage.sqlite_fibers import SQLiteFiberMixin
 from neural_memory.storage.sqlite_maturation import SQLiteMaturationMixin
+from neural_memory.storage.sqlite_merge import SQLiteMergeMixin, neuron_merge_key
 from neural_memory.storage.sqlite_neurons import SQLiteNeuronMixin
 from neural_memory.storage.sqlite_projects import SQLiteProjectMixin
+from neural_memory.storage.sqlite_prune import SQLitePruneMixin
 from neural_memory.storage.sqlite_schema import (
     SCHEMA,
     SCHEMA_VERSION,
@@ -27,8 +44,14 @@ from neural_memory.storage.sqlite_sync_state import SQLiteSyncStateMixin
 from neural_memory.storage.sqlite_typed import SQLiteTypedMemoryMixin
 from neural_memory.storage.sqlite_versioning import SQLiteVersioningMixin
 
+if TYPE_CHECKING:
+    from neural_memory.engine.embedding.vector_index import VectorIndex
+
 logger = logging.getLogger(__name__)
 
+# How long a write waits for another connection's transaction (a batch)
+_BUSY_TIMEOUT_S = 60.0
+
 
 class SQLiteStorage(
     SQLiteNeuronMixin,
@@ -41,7 +64,10 @@ class SQLiteStorage(
     SQLiteCoActivationMixin,
     SQLiteVersioningMixin,
     SQLiteSyncStateMixin,
+    SQLitePruneMixin,
+    SQLiteChangeTrackingMixin,
     SQLiteBrainMixin,
+    SQLiteMergeMixin,
     NeuralStorage,
 ):
     """SQLite-based storage for persistent neural memory.
@@ -55,6 +81,19 @@ class SQLiteStorage(
         self._conn: aiosqlite.Connection | None = None
         self._current_brain_id: str | None = None
         self._has_fts: bool = False
+        self._graph_snapshots = GraphSnapshotRegistry()
+        self._vector_indexes: dict[str, VectorIndex] = {}
+        # batch(): one open batch at a time, on its own connection; nested
+        # blocks are savepoints, tracked as a stack of frame numbers
+        self._batch_conn: aiosqlite.Connection | None = None
+        self._batch_frames: list[int] = []
+        self._batch_gate = asyncio.Condition()
+        self._batch_frame: ContextVar[int | None] = ContextVar(
+            f"sqlite_batch_{id(self)}", default=None
+        )
+        self._next_batch_frame = 0
+        # Snapshot patches of the open batch, applied once it commits
+        self._snapshot_patches: list[tuple[str, Callable[[GraphSnapshot], None]]] = []
 
     async def initialize(self) -> None:
         """Initialize database connection and schema.
@@ -66,13 +105,7 @@ class SQLiteStorage(
         """
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._conn = await aiosqlite.connect(self._db_path)
-        self._conn.row_factory = aiosqlite.Row
-
-        await self._conn.execute("PRAGMA foreign_keys = ON")
-        await self._conn.execute("PRAGMA journal_mode=WAL")
-        await self._conn.execute("PRAGMA synchronous=NORMAL")
-        await self._conn.execute("PRAGMA cache_size=-8000")
+        self._conn = await self._connect()
 
         # Ensure version table exists so we can read the current version
         await self._conn.execute(
@@ -103,8 +136,29 @@ class SQLiteStorage(
                 )
                 await self._conn.commit()
 
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open a connection with this storage's pragmas and SQL functions."""
+        conn = await aiosqlite.connect(self._db_path, timeout=_BUSY_TIMEOUT_S)
+        conn.row_factory = aiosqlite.Row
+
+        await conn.execute("PRAGMA foreign_keys = ON")
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute("PRAGMA synchronous=NORMAL")
+        await conn.execute("PRAGMA cache_size=-8000")
+        await conn.create_function(
+            "co_activation_decay", 2, co_activation_decay, deterministic=True
+        )
+        await conn.create_function("neuron_merge_key", 2, neuron_merge_key, deterministic=True)
+        return conn
+
     async def close(self) -> None:
         """Close database connection."""
+        for index in self._vector_indexes.values():
+            index.close()
+        self._vector_indexes.clear()
+        if self._batch_conn:
+            await self._batch_conn.close()
+            self._batch_conn = None
         if self._conn:
             await self._conn.close()
             self._conn = None
@@ -125,11 +179,128 @@ class SQLiteStorage(
         return self._current_brain_id
 
     def _ensure_conn(self) -> aiosqlite.Connection:
-        """Ensure connection is available."""
+        """Ensure connection is available.
+
+        Inside a ``batch()`` block (and tasks started from it) this is the
+        batch's connection, so the block reads its own uncommitted writes.
+        """
         if self._conn is None:
             raise RuntimeError("Database not initialized. Call initialize() first.")
+        if self._batch_conn is not None and self._in_batch():
+            return self._batch_conn
         return self._conn
 
+    def _in_batch(self) -> bool:
+        """Whether the current task runs inside an open ``batch()`` block."""
+        return self._batch_frame.get() in self._batch_frames
+
+    async def _commit(self) -> None:
+        """Commit the pending write, unless a ``batch()`` block owns it."""
+        if not self._in_batch():
+            await self._ensure_conn().commit()
+
+    def _patch_snapshot(self, brain_id: str, patch: Callable[[GraphSnapshot], None]) -> None:
+        """Mirror a write into the brain's graph snapshot once it is committed.
+
+        Outside a batch the write is already committed and the patch runs
+        now. Inside one it is queued: applied when the batch commits, dropped
+        with the savepoint or transaction that rolls the write back.
+        """
+        if self._in_batch():
+            # Still bump the generation so a concurrent build is discarded
+            self._graph_snapshots.for_write(brain_id)
+            self._snapshot_patches.append((brain_id, patch))
+            return
+        snapshot = self._graph_snapshots.for_write(brain_id)
+        if snapshot is not None:
+            patch(snapshot)
+
+    def _apply_snapshot_patches(self) -> None:
+        patches, self._snapshot_patches = self._snapshot_patches, []
+        for brain_id, patch in patches:
+            snapshot = self._graph_snapshots.for_write(brain_id)
+            if snapshot is not None:
+                patch(snapshot)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Run the writes inside the block as a single transaction.
+
+        Per-call commits are suppressed until the outermost block exits,
+        then committed once; an exception rolls everything back. Nested
+        blocks are savepoints, so a failing inner block only undoes its
+        own writes.
+
+        The block runs on a dedicated connection, bound to the entering
+        task and the tasks it starts. Other tasks never join it: a second
+        ``batch()`` waits for this one to finish, and plain writes wait on
+        SQLite's write lock, so a rollback only ever undoes this block's
+        writes. Readers outside the block see the last committed state;
+        that includes the graph snapshot, whose patches are queued on the
+        batch and applied on commit (so snapshot reads inside the block do
+        not see its own writes yet). Nested blocks opened concurrently by
+        tasks of one batch take turns.
+
+        The write lock is held from entry to exit, so keep slow awaits
+        (network calls, embedding) out of the block; other writers wait on
+        it up to the busy timeout.
+        """
+        self._ensure_conn()
+        frame = self._batch_frame.get()
+        outer = frame if frame in self._batch_frames else None
+
+        async with self._batch_gate:
+            await self._batch_gate.wait_for(
+                lambda: (
+                    self._batch_frames[-1] == outer if outer is not None else not self._batch_frames
+                )
+            )
+            if self._batch_conn is None:
+                self._batch_conn = await self._connect()
+            self._next_batch_frame += 1
+            current = self._next_batch_frame
+            self._batch_frames.append(current)
+        token = self._batch_frame.set(current)
+
+        conn = self._batch_conn
+        savepoint = f"batch_{current}"
+        if outer is None:
+            self._snapshot_patches = []
+        patch_mark = len(self._snapshot_patches)
+        try:
+            if outer is None:
+                # Take the write lock up front: upgrading a read later can
+                # fail at once if another connection committed meanwhile
+                await conn.execute("BEGIN IMMEDIATE")
+            else:
+                await conn.execute(f"SAVEPOINT {savepoint}")
+            try:
+                yield
+            except BaseException:
+                # The rolled-back writes never reach the snapshot
+                del self._snapshot_patches[patch_mark:]
+                if outer is None:
+                    await conn.rollback()
+                else:
+                    await conn.execute(f"ROLLBACK TO {savepoint}")
+                    await conn.execute(f"RELEASE {savepoint}")
+                raise
+            if outer is None:
+                await conn.commit()
+                self._apply_snapshot_patches()
+            else:
+                await conn.execute(f"RELEASE {savepoint}")
+        finally:
+            if outer is None:
+                self._snapshot_patches = []
+            self._batch_frame.reset(token)
+            await self._pop_batch_frame(current)
+
+    async def _pop_batch_frame(self, frame: int) -> None:
+        async with self._batch_gate:
+            self._batch_frames.remove(frame)
+            self._batch_gate.notify_all()
+
     async def _check_fts_available(self) -> bool:
         """Check whether the neurons_fts table is usable.
 
@@ -144,25 +315,98 @@ class SQLiteStorage(
             logger.debug("FTS5 table not available", exc_info=True)
             return False
 
+    # ========== Graph Snapshot ==========
+
+    async def get_graph_snapshot(self) -> GraphSnapshot:
+        """Get (building on first use) the CSR snapshot of the current brain.
+
+        The snapshot is patched by every neuron/synapse/state write made
+        through this storage, so it only needs to be loaded once per brain.
+        """
+        brain_id = self._get_brain_id()
+        cached = self._graph_snapshots.get(brain_id)
+        if cached is not None:
+            return cached
+
+        # A write landing between the SELECTs below makes the build stale:
+        # retry a few times, then serve the unregistered copy for this call.
+        for _ in range(3):
+            generation = self._graph_snapshots.generation(brain_id)
+            snapshot = await self._load_graph_snapshot(brain_id)
+            if self._graph_snapshots.register(brain_id, snapshot, generation):
+                break
+        return snapshot
+
+    async def _load_graph_snapshot(self, brain_id: str) -> GraphSnapshot:
+        conn = self._ensure_conn()
+
+        async with conn.execute("SELECT id FROM neurons WHERE brain_id = ?", (brain_id,)) as cursor:
+            neuron_ids = [row[0] for row in await cursor.fetchall()]
+
+        async with conn.execute(
+            "SELECT id, source_id, target_id, weight FROM synapses WHERE brain_id = ?",
+            (brain_id,),
+        ) as cursor:
+            synapse_rows = [(row[0], row[1], row[2], row[3]) for row in await cursor.fetchall()]
+
+        async with conn.execute(
+            "SELECT neuron_id, access_frequency, refractory_until FROM neuron_states"
+            " WHERE brain_id = ?",
+            (brain_id,),
+        ) as cursor:
+            state_rows = [
+                (row[0], row[1] or 0, refractory_timestamp(row[2]))
+                for row in await cursor.fetchall()
+            ]
+
+        return GraphSnapshot(neuron_ids, synapse_rows, state_rows)
+
+    # ========== Vector Index ==========
+
+    async def get_vector_index(self, dimension: int) -> VectorIndex | None:
+        """Get the embedding index of the current brain.
+
+        Stored as memory-mapped files in ``<db stem>.vectors/`` next to the
+        database. Returns None when numpy is unavailable.
+        """
+        brain_id = self._get_brain_id()
+        index = self._vector_indexes.get(brain_id)
+        if index is not None and index.dimension == dimension:
+            return index
+
+        try:
+            from neural_memory.engine.embedding.vector_index import VectorIndex
+        except ImportError:
+            logger.debug("Vector index unavailable (numpy not installed)")
+            return None
+
+        if index is not None:
+            index.close()
+        directory = self._db_path.with_name(f"{self._db_path.stem}.vectors")
+        index = VectorIndex(directory, brain_id, dimension)
+        self._vector_indexes[brain_id] = index
+        return index
+
     # ========== Statistics ==========
 
     async def get_stats(self, brain_id: str) -> dict[str, int]:
         conn = self._ensure_conn()
 
+        # Entity counts come from the trigger-maintained counter tables
         async with conn.execute(
             """SELECT
-                (SELECT COUNT(*) FROM neurons WHERE brain_id = ?) as neuron_count,
-                (SELECT COUNT(*) FROM synapses WHERE brain_id = ?) as synapse_count,
-                (SELECT COUNT(*) FROM fibers WHERE brain_id = ?) as fiber_count,
+                (SELECT TOTAL(count) FROM neuron_type_counts WHERE brain_id = ?) as neuron_count,
+                (SELECT TOTAL(count) FROM synapse_type_counts WHERE brain_id = ?) as synapse_count,
+                (SELECT TOTAL(count) FROM fiber_counts WHERE brain_id = ?) as fiber_count,
                 (SELECT COUNT(*) FROM projects WHERE brain_id = ?) as project_count
             """,
             (brain_id, brain_id, brain_id, brain_id),
         ) as cursor:
             row = await cursor.fetchone()
             return {
-                "neuron_count": row["neuron_count"] if row else 0,
-                "synapse_count": row["synapse_count"] if row else 0,
-                "fiber_count": row["fiber_count"] if row else 0,
+                "neuron_count": int(row["neuron_count"]) if row else 0,
+                "synapse_count": int(row["synapse_count"]) if row else 0,
+                "fiber_count": int(row["fiber_count"]) if row else 0,
                 "project_count": row["project_count"] if row else 0,
             }
 
@@ -214,9 +458,8 @@ class SQLiteStorage(
             "by_type": {},
         }
         async with conn.execute(
-            """SELECT type, AVG(weight) as avg_w, SUM(reinforced_count) as total_r, COUNT(*) as cnt
-               FROM synapses WHERE brain_id = ?
-               GROUP BY type""",
+            """SELECT type, count, weight_sum, reinforced_sum FROM synapse_type_counts
+               WHERE brain_id = ? AND count > 0""",
             (brain_id,),
         ) as cursor:
             total_weight = 0.0
@@ -224,13 +467,13 @@ class SQLiteStorage(
             total_reinforcements = 0
             async for row in cursor:
                 synapse_stats["by_type"][row["type"]] = {
-                    "count": row["cnt"],
-                    "avg_weight": round(row["avg_w"], 4),
-                    "total_reinforcements": row["total_r"] or 0,
+                    "count": row["count"],
+                    "avg_weight": round(row["weight_sum"] / row["count"], 4),
+                    "total_reinforcements": row["reinforced_sum"],
                 }
-                total_weight += (row["avg_w"] or 0.0) * row["cnt"]
-                total_count += row["cnt"]
-                total_reinforcements += row["total_r"] or 0
+                total_weight += row["weight_sum"]
+                total_count += row["count"]
+                total_reinforcements += row["reinforced_sum"]
 
         if total_count > 0:
             synapse_stats["avg_weight"] = round(total_weight / total_count, 4)
@@ -239,11 +482,11 @@ class SQLiteStorage(
         # Neuron type breakdown
         neuron_type_breakdown: dict[str, int] = {}
         async with conn.execute(
-            "SELECT type, COUNT(*) as cnt FROM neurons WHERE brain_id = ? GROUP BY type",
+            "SELECT type, count FROM neuron_type_counts WHERE brain_id = ? AND count > 0",
             (brain_id,),
         ) as cursor:
             async for row in cursor:
-                neuron_type_breakdown[row["type"]] = row["cnt"]
+                neuron_type_breakdown[row["type"]] = row["count"]
 
         # Memory time range
         oldest_memory: str | None = None
@@ -268,6 +511,56 @@ class SQLiteStorage(
             "newest_memory": newest_memory,
         }
 
+    async def get_health_stats(self, brain_id: str, fresh_days: int = 7) -> dict[str, Any]:
+        from neural_memory.engine.memory_stages import MemoryStage
+        from neural_memory.utils.timeutils import utcnow
+
+        conn = self._ensure_conn()
+        cutoff = utcnow() - timedelta(days=fresh_days)
+
+        # Each count is an index lookup per row rather than loading the graph
+        async with conn.execute(
+            """SELECT
+                (SELECT COUNT(*) FROM neurons n WHERE n.brain_id = ?
+                    AND NOT EXISTS (SELECT 1 FROM synapses s
+                                    WHERE s.brain_id = n.brain_id AND s.source_id = n.id)
+                    AND NOT EXISTS (SELECT 1 FROM synapses s
+                                    WHERE s.brain_id = n.brain_id AND s.target_id = n.id)
+                ) as orphan_neurons,
+                (SELECT COUNT(*) FROM neuron_states
+                    WHERE brain_id = ? AND access_frequency > 0) as activated_neurons,
+                (SELECT COUNT(*) FROM memory_maturations
+                    WHERE brain_id = ? AND stage = ?) as semantic_fibers,
+                (SELECT COUNT(*) FROM fibers
+                    WHERE brain_id = ? AND COALESCE(last_conducted, created_at) >= ?
+                ) as fresh_fibers
+            """,
+            (
+                brain_id,
+                brain_id,
+                brain_id,
+                MemoryStage.SEMANTIC.value,
+                brain_id,
+                cutoff.isoformat(),
+            ),
+        ) as cursor:
+            row = await cursor.fetchone()
+
+        async with conn.execute(
+            """SELECT DISTINCT j.value AS tag FROM fibers f, json_each(f.tags) j
+               WHERE f.brain_id = ? ORDER BY tag""",
+            (brain_id,),
+        ) as cursor:
+            fiber_tags = [r["tag"] async for r in cursor]
+
+        return {
+            "orphan_neurons": row["orphan_neurons"] if row else 0,
+            "activated_neurons": row["activated_neurons"] if row else 0,
+            "semantic_fibers": row["semantic_fibers"] if row else 0,
+            "fresh_fibers": row["fresh_fibers"] if row else 0,
+            "fiber_tags": fiber_tags,
+        }
+
     # ========== Cleanup ==========
 
     async def clear(self, brain_id: str) -> None:
@@ -277,15 +570,24 @@ class SQLiteStorage(
             "sync_states",
             "action_events",
             "brain_versions",
+            "version_entries",
+            "version_rows",
             "memory_maturations",
             "co_activation_events",
+            "co_activation_pairs",
             "typed_memories",
             "projects",
             "fiber_neurons",
             "fibers",
             "synapses",
             "neuron_states",
+            "neuron_merge_keys",
             "neurons",
+            # Last: the deletes above update counts and mark entities dirty via triggers
+            "neuron_type_counts",
+            "synapse_type_counts",
+            "fiber_counts",
+            "dirty_entities",
         )
         for table in brain_tables:
             # Table name is from a hardcoded tuple — safe to interpolate.
@@ -293,6 +595,11 @@ class SQLiteStorage(
 
         await conn.execute("DELETE FROM brains WHERE id = ?", (brain_id,))
         await conn.commit()
+        self._graph_snapshots.invalidate(brain_id)
+        health_cache_for(self).invalidate(brain_id)
+        index = self._vector_indexes.get(brain_id)
+        if index is not None:
+            index.clear()
 
     # ========== Compatibility with PersistentStorage ==========
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import sqlite3
 from collections import deque
+from collections.abc import Sequence
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -13,8 +14,15 @@ from neural_memory.core.synapse import Direction, Synapse, SynapseType
 from neural_memory.storage.sqlite_row_mappers import row_to_neuron, row_to_synapse
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import aiosqlite
 
+    from neural_memory.storage.graph_snapshot import GraphSnapshot
+
+# Neuron IDs per IN (...) lookup, below SQLite's bound-parameter limit
+_ID_LOOKUP_SIZE = 500
+
 
 class SQLiteSynapseMixin:
     """Mixin providing synapse CRUD and graph traversal operations."""
@@ -25,6 +33,12 @@ class SQLiteSynapseMixin:
     def _get_brain_id(self) -> str:
         raise NotImplementedError
 
+    async def _commit(self) -> None:
+        raise NotImplementedError
+
+    def _patch_snapshot(self, brain_id: str, patch: Callable[[GraphSnapshot], None]) -> None:
+        raise NotImplementedError
+
     async def get_neurons_batch(self, neuron_ids: list[str]) -> dict[str, Neuron]:
         raise NotImplementedError
 
@@ -67,11 +81,76 @@ class SQLiteSynapseMixin:
                     synapse.created_at.isoformat(),
                 ),
             )
-            await conn.commit()
-            return synapse.id
+            await self._commit()
         except sqlite3.IntegrityError:
             raise ValueError(f"Synapse {synapse.id} already exists")
 
+        self._patch_graph_snapshot(brain_id, synapse)
+        return synapse.id
+
+    async def add_synapses_bulk(self, synapses: list[Synapse]) -> list[str]:
+        """Insert many synapses with one endpoint check and one ``executemany``.
+
+        Runs under a savepoint, so a failure leaves nothing behind even
+        inside an enclosing ``batch()``.
+        """
+        if not synapses:
+            return []
+        conn = self._ensure_conn()
+        brain_id = self._get_brain_id()
+
+        endpoints = list({nid for s in synapses for nid in (s.source_id, s.target_id)})
+        found_ids: set[str] = set()
+        for start in range(0, len(endpoints), 500):
+            chunk = endpoints[start : start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            async with conn.execute(
+                f"SELECT id FROM neurons WHERE brain_id = ? AND id IN ({placeholders})",
+                [brain_id, *chunk],
+            ) as cursor:
+                found_ids.update(row["id"] for row in await cursor.fetchall())
+
+        for synapse in synapses:
+            if synapse.source_id not in found_ids:
+                raise ValueError(f"Source neuron {synapse.source_id} does not exist")
+            if synapse.target_id not in found_ids:
+                raise ValueError(f"Target neuron {synapse.target_id} does not exist")
+
+        await conn.execute("SAVEPOINT add_synapses_bulk")
+        try:
+            await conn.executemany(
+                """INSERT INTO synapses
+                   (id, brain_id, source_id, target_id, type, weight, direction,
+                    metadata, reinforced_count, last_activated, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (
+                        synapse.id,
+                        brain_id,
+                        synapse.source_id,
+                        synapse.target_id,
+                        synapse.type.value,
+                        synapse.weight,
+                        synapse.direction.value,
+                        json.dumps(synapse.metadata),
+                        synapse.reinforced_count,
+                        synapse.last_activated.isoformat() if synapse.last_activated else None,
+                        synapse.created_at.isoformat(),
+                    )
+                    for synapse in synapses
+                ],
+            )
+        except sqlite3.IntegrityError:
+            await conn.execute("ROLLBACK TO add_synapses_bulk")
+            await conn.execute("RELEASE add_synapses_bulk")
+            raise ValueError("One or more synapses already exist")
+        await conn.execute("RELEASE add_synapses_bulk")
+        await self._commit()
+
+        for synapse in synapses:
+            self._patch_graph_snapshot(brain_id, synapse)
+        return [synapse.id for synapse in synapses]
+
     async def get_synapse(self, synapse_id: str) -> Synapse | None:
         conn = self._ensure_conn()
         brain_id = self._get_brain_id()
@@ -145,7 +224,8 @@ class SQLiteSynapseMixin:
         if cursor.rowcount == 0:
             raise ValueError(f"Synapse {synapse.id} does not exist")
 
-        await conn.commit()
+        await self._commit()
+        self._patch_graph_snapshot(brain_id, synapse)
 
     async def delete_synapse(self, synapse_id: str) -> bool:
         conn = self._ensure_conn()
@@ -155,10 +235,21 @@ class SQLiteSynapseMixin:
             "DELETE FROM synapses WHERE id = ? AND brain_id = ?",
             (synapse_id, brain_id),
         )
-        await conn.commit()
+        await self._commit()
+
+        self._patch_snapshot(brain_id, lambda snapshot: snapshot.remove_synapse(synapse_id))
 
         return cursor.rowcount > 0
 
+    def _patch_graph_snapshot(self, brain_id: str, synapse: Synapse) -> None:
+        """Mirror a synapse insert/update into the graph snapshot."""
+        self._patch_snapshot(
+            brain_id,
+            lambda snapshot: snapshot.upsert_synapse(
+                synapse.id, synapse.source_id, synapse.target_id, synapse.weight
+            ),
+        )
+
     async def get_synapses_for_neurons(
         self,
         neuron_ids: list[str],
@@ -185,6 +276,45 @@ class SQLiteSynapseMixin:
 
         return result
 
+    async def get_neighbor_ids(self, neuron_ids: Sequence[str]) -> dict[str, set[str]]:
+        """Batch fetch undirected neighbor IDs, without building synapses."""
+        conn = self._ensure_conn()
+        brain_id = self._get_brain_id()
+
+        result: dict[str, set[str]] = {nid: set() for nid in neuron_ids}
+        ids = list(result)
+        for start in range(0, len(ids), _ID_LOOKUP_SIZE):
+            part = ids[start : start + _ID_LOOKUP_SIZE]
+            placeholders = ",".join("?" for _ in part)
+            async with conn.execute(
+                f"""SELECT source_id, target_id FROM synapses
+                    WHERE brain_id = ? AND source_id IN ({placeholders})
+                    UNION ALL
+                    SELECT source_id, target_id FROM synapses
+                    WHERE brain_id = ? AND target_id IN ({placeholders})""",
+                (brain_id, *part, brain_id, *part),
+            ) as cursor:
+                async for row in cursor:
+                    source_id, target_id = row["source_id"], row["target_id"]
+                    if source_id in result:
+                        result[source_id].add(target_id)
+                    if target_id in result:
+                        result[target_id].add(source_id)
+
+        return result
+
+    async def count_synapses_with_metadata(self, key: str) -> int:
+        """Count synapses whose metadata key is truthy, without loading them."""
+        conn = self._ensure_conn()
+        brain_id = self._get_brain_id()
+
+        async with conn.execute(
+            "SELECT COUNT(*) FROM synapses WHERE brain_id = ? AND json_extract(metadata, ?)",
+            (brain_id, f'$."{key}"'),
+        ) as cursor:
+            row = await cursor.fetchone()
+        return int(row[0]) if row else 0
+
     # ========== Graph Traversal ==========
 
     async def get_neighbors(
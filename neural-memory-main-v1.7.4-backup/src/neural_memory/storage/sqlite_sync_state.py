@@ -24,6 +24,9 @@ class SQLiteSyncStateMixin:
     def _get_brain_id(self) -> str:
         raise NotImplementedError
 
+    async def _commit(self) -> None:
+        raise NotImplementedError
+
     async def get_sync_state(
         self, source: str, collection: str, brain_id: str | None = None
     ) -> SyncState | None:
@@ -114,4 +117,4 @@ class SQLiteSyncStateMixin:
                 metadata_json,
             ),
         )
-        await conn.commit()
+        await self._commit()
@@ -22,6 +22,9 @@ class SQLiteTypedMemoryMixin:
     def _get_brain_id(self) -> str:
         raise NotImplementedError
 
+    async def _commit(self) -> None:
+        raise NotImplementedError
+
     async def add_typed_memory(self, typed_memory: TypedMemory) -> str:
         conn = self._ensure_conn()
         brain_id = self._get_brain_id()
@@ -52,7 +55,7 @@ class SQLiteTypedMemoryMixin:
                 typed_memory.created_at.isoformat(),
             ),
         )
-        await conn.commit()
+        await self._commit()
         return typed_memory.fiber_id
 
     async def get_typed_memory(self, fiber_id: str) -> TypedMemory | None:
@@ -137,7 +140,7 @@ class SQLiteTypedMemoryMixin:
         if cursor.rowcount == 0:
             raise ValueError(f"TypedMemory for fiber {typed_memory.fiber_id} does not exist")
 
-        await conn.commit()
+        await self._commit()
 
     async def delete_typed_memory(self, fiber_id: str) -> bool:
         conn = self._ensure_conn()
@@ -147,7 +150,7 @@ class SQLiteTypedMemoryMixin:
             "DELETE FROM typed_memories WHERE fiber_id = ? AND brain_id = ?",
             (fiber_id, brain_id),
         )
-        await conn.commit()
+        await self._commit()
 
         return cursor.rowcount > 0
 
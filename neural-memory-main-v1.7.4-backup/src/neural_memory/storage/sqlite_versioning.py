@@ -1,27 +1,66 @@
-"""SQLite versioning mixin — version storage operations."""
+"""SQLite versioning mixin — version storage operations.
+
+Versions are stored as manifests (see ``engine.brain_versioning``): row
+payloads go to ``version_rows`` once per content hash, and
+``version_entries`` holds either a version's full manifest (a base
+version) or only the entries changed since its parent. A chain of delta
+versions is rebased onto a new base once it reaches
+``version_chain_limit`` deltas, bounding how many versions a manifest
+read has to visit.
+"""
 
 from __future__ import annotations
 
 import base64
 import json
 import zlib
+from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from neural_memory.engine.brain_versioning import BrainVersion
+from neural_memory.engine.brain_versioning import (
+    BrainVersion,
+    VersionManifest,
+    _snapshot_to_json,
+    manifest_snapshot,
+    snapshot_manifest,
+)
 
 if TYPE_CHECKING:
     import aiosqlite
 
+# Row hashes per IN (...) lookup, below SQLite's bound-parameter limit
+_ROW_LOOKUP_SIZE = 500
+
+# Ancestors of a version, nearest first, down to its base version
+_CHAIN_QUERY = """
+    WITH RECURSIVE chain(id, depth) AS (
+        SELECT id, 0 FROM brain_versions WHERE brain_id = :brain_id AND id = :version_id
+        UNION ALL
+        SELECT v.parent_version_id, chain.depth + 1
+        FROM chain JOIN brain_versions v ON v.brain_id = :brain_id AND v.id = chain.id
+        WHERE v.parent_version_id IS NOT NULL
+    )
+"""
+
 
 class SQLiteVersioningMixin:
     """Mixin providing brain version persistence for SQLiteStorage."""
 
     _conn: aiosqlite.Connection | None
 
+    version_chain_limit: int = 16
+
     def _ensure_conn(self) -> aiosqlite.Connection:
         raise NotImplementedError
 
+    async def _commit(self) -> None:
+        raise NotImplementedError
+
+    def batch(self) -> AbstractAsyncContextManager[None]:
+        raise NotImplementedError
+
     async def save_version(
         self,
         brain_id: str,
@@ -34,28 +73,105 @@ class SQLiteVersioningMixin:
         compressed = base64.b64encode(zlib.compress(snapshot_json.encode("utf-8"), level=6)).decode(
             "ascii"
         )
-        await conn.execute(
-            """INSERT INTO brain_versions
-               (id, brain_id, version_name, version_number, description,
-                neuron_count, synapse_count, fiber_count, snapshot_hash,
-                snapshot_data, created_at, metadata)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                version.id,
-                brain_id,
-                version.version_name,
-                version.version_number,
-                version.description,
-                version.neuron_count,
-                version.synapse_count,
-                version.fiber_count,
-                version.snapshot_hash,
-                compressed,
-                version.created_at.isoformat(),
-                json.dumps(version.metadata),
-            ),
-        )
-        await conn.commit()
+        await _insert_version(conn, brain_id, version, compressed, "snapshot", None)
+        await self._commit()
+
+    async def save_version_delta(
+        self,
+        brain_id: str,
+        version: BrainVersion,
+        header: dict[str, Any],
+        parent_version_id: str | None,
+        changes: dict[tuple[str, str], str | None],
+        rows: dict[str, tuple[str, dict[str, Any]]],
+    ) -> None:
+        """Persist a version as a delta on its parent, or as a new base."""
+        async with self.batch():
+            conn = self._ensure_conn()
+
+            if parent_version_id is not None:
+                chain = await self._version_chain_length(brain_id, parent_version_id)
+                if chain is None or chain >= self.version_chain_limit:
+                    # Rebase: store the full manifest (payloads are still shared)
+                    parent = await self.get_version_manifest(brain_id, parent_version_id) or {}
+                    changes = {**parent, **changes}
+                    parent_version_id = None
+            if parent_version_id is None:
+                changes = {key: h for key, h in changes.items() if h is not None}
+
+            await _insert_version(
+                conn, brain_id, version, json.dumps(header), "delta", parent_version_id
+            )
+            await _insert_rows(conn, brain_id, rows)
+            await conn.executemany(
+                """INSERT INTO version_entries (brain_id, version_id, kind, entity_id, row_hash)
+                   VALUES (?, ?, ?, ?, ?)""",
+                [
+                    (brain_id, version.id, kind, entity_id, digest_hex)
+                    for (kind, entity_id), digest_hex in changes.items()
+                ],
+            )
+
+    async def _version_chain_length(self, brain_id: str, version_id: str) -> int | None:
+        """Number of deltas between a version and its base; None if unusable as a parent."""
+        conn = self._ensure_conn()
+        async with conn.execute(
+            "SELECT storage_format FROM brain_versions WHERE brain_id = ? AND id = ?",
+            (brain_id, version_id),
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
+            return None
+        if row["storage_format"] != "delta" and not await self._convert_snapshot_version(
+            brain_id, version_id
+        ):
+            return None
+        async with conn.execute(
+            _CHAIN_QUERY + "SELECT MAX(depth) AS depth FROM chain",
+            {"brain_id": brain_id, "version_id": version_id},
+        ) as cursor:
+            row = await cursor.fetchone()
+        return int(row["depth"]) if row is not None and row["depth"] is not None else None
+
+    async def _convert_snapshot_version(self, brain_id: str, version_id: str) -> bool:
+        """Rewrite a legacy whole-snapshot version as a base manifest.
+
+        Returns False (leaving the row untouched) if its snapshot cannot be
+        parsed as a brain snapshot.
+        """
+        async with self.batch():
+            conn = self._ensure_conn()
+            async with conn.execute(
+                """SELECT snapshot_data FROM brain_versions
+                   WHERE brain_id = ? AND id = ? AND storage_format = 'snapshot'""",
+                (brain_id, version_id),
+            ) as cursor:
+                row = await cursor.fetchone()
+            if row is None:
+                return True
+            try:
+                header, manifest, rows = snapshot_manifest(
+                    _decompress_snapshot(row["snapshot_data"])
+                )
+            except (ValueError, KeyError, TypeError):
+                return False
+
+            await _insert_rows(conn, brain_id, rows)
+            await conn.executemany(
+                """INSERT INTO version_entries (brain_id, version_id, kind, entity_id, row_hash)
+                   VALUES (?, ?, ?, ?, ?)""",
+                [
+                    (brain_id, version_id, kind, entity_id, digest_hex)
+                    for (kind, entity_id), digest_hex in manifest.items()
+                ],
+            )
+            await conn.execute(
+                """UPDATE brain_versions
+                   SET storage_format = 'delta', parent_version_id = NULL, snapshot_data = ?
+                   WHERE brain_id = ? AND id = ?""",
+                (json.dumps(header), brain_id, version_id),
+            )
+            return True
 
     async def get_version(
         self,
@@ -74,11 +190,89 @@ class SQLiteVersioningMixin:
             return None
 
         version = _row_to_version(row)
+        if row["storage_format"] == "delta":
+            manifest = await self.get_version_manifest(brain_id, version_id) or {}
+            rows = await self.get_version_rows(brain_id, list(set(manifest.values())))
+            snapshot = manifest_snapshot(json.loads(row["snapshot_data"]), manifest, rows)
+            return version, _snapshot_to_json(snapshot)
+
         raw_data = row["snapshot_data"]
         # Decompress: try zlib first, fall back to raw JSON for legacy data
         snapshot_json = _decompress_snapshot(raw_data)
         return version, snapshot_json
 
+    async def get_version_header(
+        self,
+        brain_id: str,
+        version_id: str,
+    ) -> tuple[BrainVersion, dict[str, Any]] | None:
+        """Get a version and its brain stream header record by ID."""
+        if not await self._convert_snapshot_version(brain_id, version_id):
+            return None
+        conn = self._ensure_conn()
+        async with conn.execute(
+            "SELECT * FROM brain_versions WHERE brain_id = ? AND id = ?",
+            (brain_id, version_id),
+        ) as cursor:
+            row = await cursor.fetchone()
+
+        if row is None:
+            return None
+        return _row_to_version(row), json.loads(row["snapshot_data"])
+
+    async def get_version_manifest(
+        self,
+        brain_id: str,
+        version_id: str,
+    ) -> VersionManifest | None:
+        """Resolve a version's manifest by replaying its chain from the base."""
+        if not await self._convert_snapshot_version(brain_id, version_id):
+            return None
+        conn = self._ensure_conn()
+        async with conn.execute(
+            "SELECT 1 FROM brain_versions WHERE brain_id = ? AND id = ?",
+            (brain_id, version_id),
+        ) as cursor:
+            if await cursor.fetchone() is None:
+                return None
+
+        manifest: VersionManifest = {}
+        async with conn.execute(
+            _CHAIN_QUERY
+            + """SELECT e.kind, e.entity_id, e.row_hash
+                 FROM version_entries e JOIN chain ON e.version_id = chain.id
+                 WHERE e.brain_id = :brain_id
+                 ORDER BY chain.depth DESC""",
+            {"brain_id": brain_id, "version_id": version_id},
+        ) as cursor:
+            async for row in cursor:
+                key = (row["kind"], row["entity_id"])
+                if row["row_hash"] is None:
+                    manifest.pop(key, None)
+                else:
+                    manifest[key] = row["row_hash"]
+        return manifest
+
+    async def get_version_rows(
+        self,
+        brain_id: str,
+        row_hashes: Sequence[str],
+    ) -> dict[str, dict[str, Any]]:
+        """Get stored row payloads by hash."""
+        conn = self._ensure_conn()
+        rows: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(row_hashes), _ROW_LOOKUP_SIZE):
+            batch = row_hashes[start : start + _ROW_LOOKUP_SIZE]
+            placeholders = ",".join("?" for _ in batch)
+            async with conn.execute(
+                f"SELECT row_hash, data FROM version_rows "
+                f"WHERE brain_id = ? AND row_hash IN ({placeholders})",
+                (brain_id, *batch),
+            ) as cursor:
+                async for row in cursor:
+                    rows[row["row_hash"]] = json.loads(row["data"])
+        return rows
+
     async def list_versions(
         self,
         brain_id: str,
@@ -111,14 +305,115 @@ class SQLiteVersioningMixin:
         return int(row["max_num"]) + 1
 
     async def delete_version(self, brain_id: str, version_id: str) -> bool:
-        """Delete a specific version."""
-        conn = self._ensure_conn()
-        cursor = await conn.execute(
-            "DELETE FROM brain_versions WHERE brain_id = ? AND id = ?",
-            (brain_id, version_id),
-        )
-        await conn.commit()
-        return cursor.rowcount > 0
+        """Delete a specific version.
+
+        Child versions absorb the deleted version's entries so their
+        manifests are unchanged; payloads no version references any more
+        are dropped.
+        """
+        async with self.batch():
+            conn = self._ensure_conn()
+            async with conn.execute(
+                "SELECT parent_version_id FROM brain_versions WHERE brain_id = ? AND id = ?",
+                (brain_id, version_id),
+            ) as cursor:
+                row = await cursor.fetchone()
+            if row is None:
+                return False
+            grandparent = row["parent_version_id"]
+
+            async with conn.execute(
+                "SELECT id FROM brain_versions WHERE brain_id = ? AND parent_version_id = ?",
+                (brain_id, version_id),
+            ) as cursor:
+                children = [child["id"] async for child in cursor]
+            for child_id in children:
+                await conn.execute(
+                    """INSERT INTO version_entries (brain_id, version_id, kind, entity_id, row_hash)
+                       SELECT brain_id, ?, kind, entity_id, row_hash FROM version_entries e
+                       WHERE e.brain_id = ? AND e.version_id = ? AND NOT EXISTS (
+                           SELECT 1 FROM version_entries c
+                           WHERE c.brain_id = e.brain_id AND c.version_id = ?
+                             AND c.kind = e.kind AND c.entity_id = e.entity_id
+                       )""",
+                    (child_id, brain_id, version_id, child_id),
+                )
+                await conn.execute(
+                    "UPDATE brain_versions SET parent_version_id = ? WHERE brain_id = ? AND id = ?",
+                    (grandparent, brain_id, child_id),
+                )
+                if grandparent is None:
+                    # Now a base version: removals have nothing to apply to
+                    await conn.execute(
+                        """DELETE FROM version_entries
+                           WHERE brain_id = ? AND version_id = ? AND row_hash IS NULL""",
+                        (brain_id, child_id),
+                    )
+
+            await conn.execute(
+                "DELETE FROM version_entries WHERE brain_id = ? AND version_id = ?",
+                (brain_id, version_id),
+            )
+            await conn.execute(
+                "DELETE FROM brain_versions WHERE brain_id = ? AND id = ?",
+                (brain_id, version_id),
+            )
+            await conn.execute(
+                """DELETE FROM version_rows WHERE brain_id = ? AND NOT EXISTS (
+                       SELECT 1 FROM version_entries e
+                       WHERE e.brain_id = version_rows.brain_id AND e.row_hash = version_rows.row_hash
+                   )""",
+                (brain_id,),
+            )
+            return True
+
+
+async def _insert_version(
+    conn: aiosqlite.Connection,
+    brain_id: str,
+    version: BrainVersion,
+    snapshot_data: str,
+    storage_format: str,
+    parent_version_id: str | None,
+) -> None:
+    await conn.execute(
+        """INSERT INTO brain_versions
+           (id, brain_id, version_name, version_number, description,
+            neuron_count, synapse_count, fiber_count, snapshot_hash,
+            snapshot_data, created_at, metadata, storage_format, parent_version_id)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        (
+            version.id,
+            brain_id,
+            version.version_name,
+            version.version_number,
+            version.description,
+            version.neuron_count,
+            version.synapse_count,
+            version.fiber_count,
+            version.snapshot_hash,
+            snapshot_data,
+            version.created_at.isoformat(),
+            json.dumps(version.metadata),
+            storage_format,
+            parent_version_id,
+        ),
+    )
+
+
+async def _insert_rows(
+    conn: aiosqlite.Connection,
+    brain_id: str,
+    rows: dict[str, tuple[str, dict[str, Any]]],
+) -> None:
+    await conn.executemany(
+        """INSERT OR IGNORE INTO version_rows (brain_id, row_hash, kind, data)
+           VALUES (?, ?, ?, ?)""",
+        [
+            (brain_id, digest_hex, kind, json.dumps(data, sort_keys=True, default=str))
+            for digest_hex, (kind, data) in rows.items()
+        ],
+    )
 
 
 def _decompress_snapshot(raw_data: str) -> str:
@@ -96,6 +96,16 @@ class AutoConfig:
         )
 
 
+_ACTIVATION_BACKENDS = frozenset({"storage", "snapshot", "vectorized"})
+
+
+def _activation_backend(value: Any) -> str:
+    """Validate an activation backend name, falling back to per-hop storage reads."""
+    if isinstance(value, str) and value in _ACTIVATION_BACKENDS:
+        return value
+    return "storage"
+
+
 @dataclass
 class BrainSettings:
     """Settings for brain behavior."""
@@ -105,6 +115,7 @@ class BrainSettings:
     activation_threshold: float = 0.2
     max_spread_hops: int = 4
     max_context_tokens: int = 1500
+    activation_backend: str = "storage"
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -113,6 +124,7 @@ class BrainSettings:
             "activation_threshold": self.activation_threshold,
             "max_spread_hops": self.max_spread_hops,
             "max_context_tokens": self.max_context_tokens,
+            "activation_backend": self.activation_backend,
         }
 
     @classmethod
@@ -123,6 +135,7 @@ class BrainSettings:
             activation_threshold=data.get("activation_threshold", 0.2),
             max_spread_hops=data.get("max_spread_hops", 4),
             max_context_tokens=data.get("max_context_tokens", 1500),
+            activation_backend=_activation_backend(data.get("activation_backend", "storage")),
         )
 
 
@@ -380,6 +393,8 @@ class UnifiedConfig:
             f"activation_threshold = {self.brain.activation_threshold}",
             f"max_spread_hops = {self.brain.max_spread_hops}",
             f"max_context_tokens = {self.brain.max_context_tokens}",
+            "# storage | snapshot (in-memory graph) | vectorized (needs numpy)",
+            f'activation_backend = "{self.brain.activation_backend}"',
             "",
             "# Auto-capture settings for MCP server",
             "[auto]",
@@ -549,9 +564,16 @@ async def get_shared_storage(brain_name: str | None = None) -> SQLiteStorage:
             activation_threshold=config.brain.activation_threshold,
             max_spread_hops=config.brain.max_spread_hops,
             max_context_tokens=config.brain.max_context_tokens,
+            activation_backend=config.brain.activation_backend,
         )
         brain = Brain.create(name=name, config=brain_config, brain_id=name)
         await storage.save_brain(brain)
+    elif brain.config.activation_backend != config.brain.activation_backend:
+        # The backend is a runtime choice, not learned state: config.toml wins
+        brain = brain.with_config(
+            brain.config.with_updates(activation_backend=config.brain.activation_backend)
+        )
+        await storage.save_brain(brain)
 
     storage.set_brain(brain.id)
     return storage
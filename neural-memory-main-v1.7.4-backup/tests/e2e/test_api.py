@@ -283,3 +283,69 @@ class TestExportImport:
         assert import_response.status_code == 200
         data = import_response.json()
         assert data["neuron_count"] > 0
+
+    def test_stream_export_import(self, client: TestClient) -> None:
+        """Test the NDJSON stream export feeding the stream import."""
+        create_response = client.post(
+            "/brain/create",
+            json={"name": "stream_source"},
+        )
+        brain_id = create_response.json()["id"]
+
+        client.post(
+            "/memory/encode",
+            json={"content": "Memory to stream"},
+            headers={"X-Brain-ID": brain_id},
+        )
+
+        export_response = client.get(f"/brain/{brain_id}/export/stream?compression=gzip")
+        assert export_response.status_code == 200
+        assert export_response.headers["content-type"] == "application/gzip"
+
+        import_response = client.post(
+            "/brain/streamed_brain/import/stream",
+            content=export_response.content,
+        )
+
+        assert import_response.status_code == 200
+        data = import_response.json()
+        assert data["id"] == "streamed_brain"
+        assert data["neuron_count"] > 0
+
+    def test_stream_import_rejects_truncated_body(self, client: TestClient) -> None:
+        """Test that a stream without its end record is refused."""
+        create_response = client.post(
+            "/brain/create",
+            json={"name": "truncated_source"},
+        )
+        brain_id = create_response.json()["id"]
+
+        body = client.get(f"/brain/{brain_id}/export/stream").content
+        truncated = body[: body.rindex(b'{"kind": "end"')]
+
+        response = client.post("/brain/truncated/import/stream", content=truncated)
+
+        assert response.status_code == 400
+
+    def test_merge_rejects_malformed_snapshot(self, client: TestClient) -> None:
+        """Test that a snapshot with an invalid record is refused, not a 500."""
+        create_response = client.post(
+            "/brain/create",
+            json={"name": "merge_target"},
+        )
+        brain_id = create_response.json()["id"]
+
+        snapshot = client.get(f"/brain/{brain_id}/export").json()
+        snapshot["neurons"] = [
+            {
+                "id": "bad",
+                "type": "not-a-type",
+                "content": "x",
+                "created_at": snapshot["exported_at"],
+            }
+        ]
+
+        response = client.post(f"/brain/{brain_id}/merge", json={"snapshot": snapshot})
+
+        assert response.status_code == 400
+        assert client.get(f"/brain/{brain_id}/stats").json()["neuron_count"] == 0
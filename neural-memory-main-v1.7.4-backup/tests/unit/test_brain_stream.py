@@ -0,0 +1,188 @@
+"""Tests for the streaming NDJSON brain export/import format."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import sqlite3
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from neural_memory.core.brain import Brain, BrainConfig
+from neural_memory.core.fiber import Fiber
+from neural_memory.core.neuron import Neuron, NeuronType
+from neural_memory.core.synapse import Synapse, SynapseType
+from neural_memory.storage.brain_stream import (
+    compression_for_path,
+    decode_stream,
+    encode_stream,
+    export_brain_to_file,
+    import_brain_from_file,
+    is_stream_path,
+)
+from neural_memory.storage.memory_store import InMemoryStorage
+from neural_memory.storage.sqlite_store import SQLiteStorage
+
+
+async def _populate(storage: SQLiteStorage | InMemoryStorage, brain_id: str) -> None:
+    await storage.save_brain(Brain.create(name="streamed", config=BrainConfig(), brain_id=brain_id))
+    storage.set_brain(brain_id)
+    for i in range(5):
+        await storage.add_neuron(
+            Neuron.create(type=NeuronType.CONCEPT, content=f"c{i}", neuron_id=f"n{i}")
+        )
+    for i in range(4):
+        await storage.add_synapse(
+            Synapse.create(
+                f"n{i}", f"n{i + 1}", SynapseType.RELATED_TO, weight=0.5, synapse_id=f"s{i}"
+            )
+        )
+    await storage.add_fiber(Fiber.create({"n0", "n1"}, {"s0"}, "n0", fiber_id="f0"))
+
+
+async def _chunks(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def _encode(records: list[dict[str, Any]], compression: str | None = None) -> bytes:
+    async def source() -> AsyncIterator[dict[str, Any]]:
+        for record in records:
+            yield record
+
+    return b"".join([chunk async for chunk in encode_stream(source(), compression)])
+
+
+@pytest.fixture
+async def sqlite_storage(tmp_path: Path) -> AsyncIterator[SQLiteStorage]:
+    storage = SQLiteStorage(tmp_path / "brain.db")
+    await storage.initialize()
+    await _populate(storage, "src")
+    yield storage
+    await storage.close()
+
+
+class TestBrainStream:
+    """Tests for brain_stream encoding and SQLite streaming export/import."""
+
+    @pytest.mark.parametrize("suffix", [".ndjson", ".ndjson.gz", ".ndjson.zst"])
+    async def test_file_round_trip(
+        self, sqlite_storage: SQLiteStorage, tmp_path: Path, suffix: str
+    ) -> None:
+        path = tmp_path / f"brain{suffix}"
+        counts = await export_brain_to_file(sqlite_storage, "src", path, compression_for_path(path))
+        assert (counts["neuron"], counts["synapse"], counts["fiber"]) == (5, 4, 1)
+
+        brain_id = await import_brain_from_file(sqlite_storage, path, "copy")
+
+        assert brain_id == "copy"
+        original = await sqlite_storage.export_brain("src")
+        copy = await sqlite_storage.export_brain("copy")
+        assert copy.brain_name == "streamed"
+        assert copy.neurons == original.neurons
+        assert copy.synapses == original.synapses
+        assert [set(f["neuron_ids"]) for f in copy.fibers] == [{"n0", "n1"}]
+        assert [f["id"] for f in copy.fibers] == [f["id"] for f in original.fibers]
+
+    async def test_sqlite_export_does_not_build_a_snapshot(
+        self, sqlite_storage: SQLiteStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def no_snapshot(brain_id: str) -> None:
+            raise AssertionError("export_brain called")
+
+        monkeypatch.setattr(sqlite_storage, "export_brain", no_snapshot)
+        kinds = [r["kind"] async for r in sqlite_storage.export_brain_stream("src")]
+
+        assert kinds[0] == "header"
+        assert kinds.count("neuron") == 5 and kinds.count("synapse") == 4
+
+    async def test_in_memory_storage_uses_snapshot_fallback(self, tmp_path: Path) -> None:
+        storage = InMemoryStorage()
+        await _populate(storage, "mem")
+        path = tmp_path / "mem.ndjson"
+
+        await export_brain_to_file(storage, "mem", path)
+        await import_brain_from_file(storage, path, "mem-copy")
+
+        stats = await storage.get_stats("mem-copy")
+        assert (stats["neuron_count"], stats["synapse_count"]) == (5, 4)
+
+    async def test_decode_reassembles_lines_across_chunks(self) -> None:
+        records = [
+            {"kind": "header", "format": "neural-memory-brain", "format_version": 1},
+            {"kind": "neuron", "data": {"id": "n1", "content": "xin chào " * 50}},
+        ]
+        data = await _encode(records, "gzip")
+        assert gzip.decompress(data).count(b"\n") == 3
+
+        decoded = [r async for r in decode_stream(_chunks(data, 7))]
+        assert decoded == records
+
+    async def test_truncated_stream_is_rejected(self) -> None:
+        data = await _encode([{"kind": "header"}, {"kind": "neuron", "data": {}}])
+        truncated = data[: data.rindex(b'{"kind": "end"')]
+
+        with pytest.raises(ValueError, match="truncated"):
+            [r async for r in decode_stream(_chunks(truncated, 64))]
+
+    async def test_count_mismatch_is_rejected(self) -> None:
+        lines = [
+            json.dumps({"kind": "header"}),
+            json.dumps({"kind": "end", "counts": {"neuron": 2}}),
+        ]
+        with pytest.raises(ValueError, match="do not match"):
+            [r async for r in decode_stream(_chunks("\n".join(lines).encode(), 64))]
+
+    async def test_failed_import_rolls_back(
+        self, sqlite_storage: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "bad.ndjson"
+        await export_brain_to_file(sqlite_storage, "src", path)
+        lines = path.read_text(encoding="utf-8").splitlines()
+        # A synapse pointing at a missing neuron fails the foreign key
+        bad = json.loads(lines[6])
+        bad["data"]["source_id"] = "missing"
+        lines[6] = json.dumps(bad)
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await import_brain_from_file(sqlite_storage, path, "broken")
+
+        stats = await sqlite_storage.get_stats("broken")
+        assert stats["neuron_count"] == 0
+
+    async def test_import_ignores_brain_switch_mid_stream(
+        self, sqlite_storage: SQLiteStorage
+    ) -> None:
+        records = [r async for r in sqlite_storage.export_brain_stream("src")]
+        halfway = asyncio.Event()
+        resume = asyncio.Event()
+
+        async def slow_records() -> AsyncIterator[dict[str, Any]]:
+            for i, record in enumerate(records):
+                if i == 3:
+                    halfway.set()
+                    await resume.wait()
+                yield record
+
+        task = asyncio.create_task(sqlite_storage.import_brain_stream(slow_records(), "copy"))
+        await halfway.wait()
+        sqlite_storage.set_brain("other")  # another request switching brains
+        resume.set()
+        await task
+
+        assert sqlite_storage._current_brain_id == "other"
+        stats = await sqlite_storage.get_stats("copy")
+        assert (stats["neuron_count"], stats["synapse_count"], stats["fiber_count"]) == (5, 4, 1)
+        assert (await sqlite_storage.get_stats("other"))["neuron_count"] == 0
+
+    def test_stream_paths(self) -> None:
+        assert is_stream_path("a.ndjson") and is_stream_path("a.NDJSON.gz")
+        assert is_stream_path("a.jsonl.zst")
+        assert not is_stream_path("a.json") and not is_stream_path("a.json.gz")
+        assert compression_for_path("a.ndjson.gz") == "gzip"
+        assert compression_for_path("a.ndjson") is None
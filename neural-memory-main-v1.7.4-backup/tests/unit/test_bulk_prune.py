@@ -0,0 +1,169 @@
+"""Tests for the set-based (storage-level) consolidation prune."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from neural_memory.core.brain import Brain, BrainConfig
+from neural_memory.core.fiber import Fiber
+from neural_memory.core.neuron import Neuron, NeuronType
+from neural_memory.core.synapse import Synapse, SynapseType
+from neural_memory.engine.consolidation import (
+    ConsolidationEngine,
+    ConsolidationStrategy,
+    PrunePolicy,
+)
+from neural_memory.storage.base import NeuralStorage
+from neural_memory.storage.memory_store import InMemoryStorage
+from neural_memory.storage.sqlite_store import SQLiteStorage
+from neural_memory.utils.timeutils import utcnow
+
+NOW = utcnow()
+OLD = NOW - timedelta(days=120)
+
+# (id, source, target, weight, metadata, created_at)
+_SYNAPSES = [
+    ("s-weak", "a", "b", 0.1, {}, OLD),  # pruned
+    ("s-strong", "a", "c", 0.9, {}, OLD),
+    ("s-bridge", "d", "e", 0.1, {}, OLD),  # only neighbor of d -> kept
+    ("s-inferred", "f", "g", 0.3, {"_inferred": True}, OLD),  # pruned (2x decay)
+    ("s-fh", "f", "h", 0.9, {}, OLD),
+    ("s-faint", "h", "x", 0.01, {}, OLD),  # too faint to count as a bridge -> pruned
+    ("s-recent", "g", "c", 0.01, {}, NOW),  # not inactive long enough
+    ("s-salient", "p", "q", 0.05, {}, OLD),  # source in a high-salience fiber
+    ("s-pc", "p", "c", 0.9, {}, OLD),
+    ("s-dream", "c", "h", 0.5, {"_dream": True}, OLD),  # pruned (10x decay)
+]
+_PRUNED_SYNAPSES = {"s-weak", "s-inferred", "s-faint", "s-dream"}
+_PRUNED_NEURONS = {"b", "x", "lonely"}
+
+
+async def _populate(storage: NeuralStorage) -> None:
+    brain = Brain.create(name="prune", config=BrainConfig(), brain_id="prune-brain")
+    await storage.save_brain(brain)
+    storage.set_brain(brain.id)  # type: ignore[attr-defined]
+
+    for nid in ["a", "b", "c", "d", "e", "f", "g", "h", "x", "p", "q", "z", "lonely"]:
+        await storage.add_neuron(Neuron.create(type=NeuronType.CONCEPT, content=nid, neuron_id=nid))
+    for sid, src, tgt, weight, metadata, created_at in _SYNAPSES:
+        synapse = Synapse.create(
+            src, tgt, SynapseType.RELATED_TO, weight=weight, metadata=metadata, synapse_id=sid
+        )
+        await storage.add_synapse(replace(synapse, created_at=created_at))
+
+    await storage.add_fiber(
+        Fiber(
+            id="f-plain",
+            neuron_ids={"a", "b", "c"},
+            synapse_ids={"s-weak", "s-strong"},
+            anchor_neuron_id="a",
+        )
+    )
+    await storage.add_fiber(
+        Fiber(
+            id="f-salient",
+            neuron_ids={"p", "q"},
+            synapse_ids={"s-salient"},
+            anchor_neuron_id="p",
+            salience=0.9,
+        )
+    )
+    # z has no synapses but anchors a fiber, so it is not an orphan
+    await storage.add_fiber(
+        Fiber(id="f-anchor", neuron_ids={"z"}, synapse_ids=set(), anchor_neuron_id="z")
+    )
+
+
+@pytest.fixture
+async def sqlite_storage(tmp_path: Path) -> SQLiteStorage:
+    storage = SQLiteStorage(tmp_path / "brain.db")
+    await storage.initialize()
+    await _populate(storage)
+    yield storage
+    await storage.close()
+
+
+class TestPrunePolicy:
+    """Tests for PrunePolicy.decayed_weight."""
+
+    def test_matches_synapse_time_decay(self) -> None:
+        synapse = replace(
+            Synapse.create("a", "b", SynapseType.RELATED_TO, weight=0.8), created_at=OLD
+        )
+        hours = (NOW - OLD).total_seconds() / 3600
+        policy = PrunePolicy(weight_threshold=0.05, min_inactive_days=7.0)
+
+        expected = synapse.time_decay(reference_time=NOW).weight
+        assert policy.decayed_weight(0.8, hours, False, False, 0) == pytest.approx(expected)
+        assert policy.decayed_weight(0.8, hours, False, True, 0) == pytest.approx(expected / 10)
+        assert policy.decayed_weight(0.8, hours, True, True, 5) == pytest.approx(expected)
+
+
+class TestBulkPrune:
+    """SQLiteStorage.prune_bulk must prune what the per-synapse path prunes."""
+
+    async def test_matches_per_synapse_path(self, sqlite_storage: SQLiteStorage) -> None:
+        memory = InMemoryStorage()
+        await _populate(memory)
+
+        fast = await ConsolidationEngine(sqlite_storage).run(
+            strategies=[ConsolidationStrategy.PRUNE], reference_time=NOW
+        )
+        slow = await ConsolidationEngine(memory).run(
+            strategies=[ConsolidationStrategy.PRUNE], reference_time=NOW
+        )
+
+        assert fast.synapses_pruned == slow.synapses_pruned == len(_PRUNED_SYNAPSES)
+        assert fast.neurons_pruned == slow.neurons_pruned == len(_PRUNED_NEURONS)
+        remaining = {s.id for s in await sqlite_storage.get_all_synapses()}
+        assert remaining == {s.id for s in await memory.get_all_synapses()}
+        assert remaining.isdisjoint(_PRUNED_SYNAPSES)
+        for nid in _PRUNED_NEURONS:
+            assert await sqlite_storage.get_neuron(nid) is None
+        assert await sqlite_storage.get_neuron("z") is not None
+
+    async def test_fiber_refs_removed(self, sqlite_storage: SQLiteStorage) -> None:
+        await ConsolidationEngine(sqlite_storage).run(
+            strategies=[ConsolidationStrategy.PRUNE], reference_time=NOW
+        )
+
+        fiber = await sqlite_storage.get_fiber("f-plain")
+        assert fiber is not None
+        assert fiber.synapse_ids == {"s-strong"}
+
+    async def test_dry_run_changes_nothing(self, sqlite_storage: SQLiteStorage) -> None:
+        report = await ConsolidationEngine(sqlite_storage).run(
+            strategies=[ConsolidationStrategy.PRUNE], dry_run=True, reference_time=NOW
+        )
+
+        assert report.synapses_pruned == len(_PRUNED_SYNAPSES)
+        assert report.neurons_pruned == len(_PRUNED_NEURONS)
+        assert len(await sqlite_storage.get_all_synapses()) == len(_SYNAPSES)
+        assert await sqlite_storage.get_neuron("lonely") is not None
+
+    async def test_reports_progress(self, sqlite_storage: SQLiteStorage) -> None:
+        calls: list[tuple[str, int, int]] = []
+        await ConsolidationEngine(sqlite_storage).run(
+            strategies=[ConsolidationStrategy.PRUNE],
+            reference_time=NOW,
+            progress_callback=lambda stage, done, total: calls.append((stage, done, total)),
+        )
+
+        inactive = sum(1 for s in _SYNAPSES if s[5] == OLD)
+        assert ("decay", inactive, inactive) in calls
+        assert ("synapses", 4, 4) in calls
+        assert ("neurons", 3, 3) in calls
+
+    async def test_invalidates_graph_snapshot(self, sqlite_storage: SQLiteStorage) -> None:
+        snapshot = await sqlite_storage.get_graph_snapshot()
+        await ConsolidationEngine(sqlite_storage).run(
+            strategies=[ConsolidationStrategy.PRUNE], reference_time=NOW
+        )
+
+        rebuilt = await sqlite_storage.get_graph_snapshot()
+        assert rebuilt is not snapshot
+        assert rebuilt.index_of("x") is None
@@ -1,14 +1,18 @@
-"""Tests for co-activation event storage — both InMemory and interface."""
+"""Tests for co-activation event storage — InMemory, SQLite and interface."""
 
 from __future__ import annotations
 
+import sqlite3
 from datetime import timedelta
+from pathlib import Path
 
 import pytest
 import pytest_asyncio
 
 from neural_memory.core.brain import Brain
+from neural_memory.engine.write_queue import DeferredWriteQueue
 from neural_memory.storage.memory_store import InMemoryStorage
+from neural_memory.storage.sqlite_store import SQLiteStorage
 from neural_memory.utils.timeutils import utcnow
 
 
@@ -57,6 +61,16 @@ async def test_min_count_filter(store: InMemoryStorage) -> None:
     assert counts[0][0:2] == ("n1", "n2")
 
 
+@pytest.mark.asyncio
+async def test_neuron_scope_filter(store: InMemoryStorage) -> None:
+    """neuron_ids keeps pairs touching any of those neurons."""
+    await store.record_co_activation("n1", "n2", 0.8)
+    await store.record_co_activation("n3", "n4", 0.5)
+
+    counts = await store.get_co_activation_counts(neuron_ids={"n4"})
+    assert [c[0:2] for c in counts] == [("n3", "n4")]
+
+
 @pytest.mark.asyncio
 async def test_since_filter(store: InMemoryStorage) -> None:
     """since filter excludes old events."""
@@ -133,3 +147,150 @@ async def test_clear_removes_co_activations(store: InMemoryStorage) -> None:
 
     counts = await store.get_co_activation_counts()
     assert counts == []
+
+
+@pytest_asyncio.fixture
+async def sqlite_store(tmp_path: Path) -> SQLiteStorage:
+    """SQLiteStorage with a brain context set."""
+    storage = SQLiteStorage(tmp_path / "coact.db")
+    await storage.initialize()
+    brain = Brain.create(name="coact-test", brain_id="coact-brain")
+    await storage.save_brain(brain)
+    storage.set_brain(brain.id)
+    yield storage
+    await storage.close()
+
+
+def _pair_rows(storage: SQLiteStorage) -> list[sqlite3.Row]:
+    with sqlite3.connect(storage._db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        return conn.execute("SELECT * FROM co_activation_pairs ORDER BY neuron_a").fetchall()
+
+
+async def _age_pairs(storage: SQLiteStorage, days: float) -> None:
+    last_seen = (utcnow() - timedelta(days=days)).isoformat()
+    conn = storage._ensure_conn()
+    await conn.execute("UPDATE co_activation_pairs SET last_seen = ?", (last_seen,))
+    await conn.commit()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_rolls_events_into_one_pair(sqlite_store: SQLiteStorage) -> None:
+    """Repeated co-activations update one row instead of appending events."""
+    for strength in (0.8, 0.6, 0.7):
+        await sqlite_store.record_co_activation("n2", "n1", strength)
+
+    rows = _pair_rows(sqlite_store)
+    assert len(rows) == 1
+    assert (rows[0]["neuron_a"], rows[0]["neuron_b"], rows[0]["total_count"]) == ("n1", "n2", 3)
+
+    counts = await sqlite_store.get_co_activation_counts(min_count=3)
+    assert counts == [("n1", "n2", 3, pytest.approx(0.7, abs=0.01))]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_counts_decay_with_age(sqlite_store: SQLiteStorage) -> None:
+    """A pair unseen for one half-life reports half its count."""
+    await sqlite_store.record_co_activations_bulk([("a", "b", 0.9, None)] * 4)
+    await _age_pairs(sqlite_store, sqlite_store.co_activation_half_life_days)
+
+    assert (await sqlite_store.get_co_activation_counts())[0][2] == 2
+    assert await sqlite_store.get_co_activation_counts(min_count=3) == []
+
+    # New events add to the decayed count; the mean weights recent strength more
+    await sqlite_store.record_co_activations_bulk([("b", "a", 0.3, None)] * 2)
+    [(a, b, count, mean)] = await sqlite_store.get_co_activation_counts()
+    assert (a, b, count) == ("a", "b", 4)
+    assert mean == pytest.approx((2 * 0.9 + 2 * 0.3) / 4, abs=0.01)
+    assert _pair_rows(sqlite_store)[0]["total_count"] == 6
+
+
+@pytest.mark.asyncio
+async def test_sqlite_since_and_prune_use_last_seen(sqlite_store: SQLiteStorage) -> None:
+    """Stale pairs are filtered by since and removed by prune."""
+    await sqlite_store.record_co_activation("old-a", "old-b", 0.5)
+    await _age_pairs(sqlite_store, 10)
+    await sqlite_store.record_co_activation("new-a", "new-b", 0.5)
+
+    cutoff = utcnow() - timedelta(days=1)
+    counts = await sqlite_store.get_co_activation_counts(since=cutoff)
+    assert [c[0] for c in counts] == ["new-a"]
+
+    assert await sqlite_store.prune_co_activations(older_than=cutoff) == 1
+    assert [row["neuron_a"] for row in _pair_rows(sqlite_store)] == ["new-a"]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_counts_scoped_to_neurons(sqlite_store: SQLiteStorage) -> None:
+    """A neuron scope keeps pairs with either endpoint in it."""
+    await sqlite_store.record_co_activations_bulk(
+        [("a", "b", 0.5, None), ("b", "c", 0.5, None), ("c", "d", 0.5, None)]
+    )
+
+    counts = await sqlite_store.get_co_activation_counts(neuron_ids={"b"})
+    assert sorted((a, b) for a, b, _, _ in counts) == [("a", "b"), ("b", "c")]
+    assert await sqlite_store.get_co_activation_counts(neuron_ids=set()) == []
+
+
+@pytest.mark.asyncio
+async def test_sqlite_event_log_is_a_bounded_ring(sqlite_store: SQLiteStorage) -> None:
+    """Raw events are kept only when the log is enabled, newest first."""
+    await sqlite_store.record_co_activation("n1", "n2", 0.5)
+    sqlite_store.co_activation_log_size = 3
+    ids = await sqlite_store.record_co_activations_bulk(
+        [("n1", "n2", 0.1 * i, None) for i in range(5)]
+    )
+
+    with sqlite3.connect(sqlite_store._db_path) as conn:
+        kept = {row[0] for row in conn.execute("SELECT id FROM co_activation_events")}
+    assert kept == set(ids[-3:])
+
+
+@pytest.mark.asyncio
+async def test_write_queue_flushes_co_activations_in_one_batch(
+    sqlite_store: SQLiteStorage,
+) -> None:
+    """Deferred co-activations reach the pair table through one bulk call."""
+    queue = DeferredWriteQueue()
+    for _ in range(3):
+        queue.defer_co_activation("x", "y", 0.6)
+    queue.defer_co_activation("y", "z", 0.4)
+
+    assert await queue.flush(sqlite_store) == 4
+    counts = await sqlite_store.get_co_activation_counts()
+    assert [(a, b, n) for a, b, n, _ in counts] == [("x", "y", 3), ("y", "z", 1)]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_migration_backfills_pairs(tmp_path: Path) -> None:
+    """Upgrading from v14 rolls the existing event log into pairs."""
+    db_path = tmp_path / "legacy.db"
+    storage = SQLiteStorage(db_path)
+    await storage.initialize()
+    brain = Brain.create(name="legacy", brain_id="legacy-brain")
+    await storage.save_brain(brain)
+    await storage.close()
+
+    now = utcnow().isoformat()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE co_activation_pairs")
+        conn.executemany(
+            "INSERT INTO co_activation_events VALUES (?, 'legacy-brain', 'a', 'b', ?, NULL, ?)",
+            [("e1", 0.4, now), ("e2", 0.6, now)],
+        )
+        conn.execute("UPDATE schema_version SET version = 14")
+
+    storage = SQLiteStorage(db_path)
+    await storage.initialize()
+    storage.set_brain("legacy-brain")
+    try:
+        assert await storage.get_co_activation_counts() == [
+            ("a", "b", 2, pytest.approx(0.5)),
+        ]
+        # The recreated table gets its change-tracking triggers from SCHEMA
+        await storage.record_co_activation("c", "d", 0.5)
+        with sqlite3.connect(db_path) as conn:
+            dirty = {row[0] for row in conn.execute("SELECT entity_id FROM dirty_entities")}
+        assert {"c", "d"} <= dirty
+    finally:
+        await storage.close()
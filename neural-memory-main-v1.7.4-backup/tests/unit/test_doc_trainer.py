@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import logging
+from contextlib import nullcontext
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from neural_memory.engine.doc_trainer import DocTrainer, TrainingConfig, TrainingResult
+from neural_memory.core.brain import Brain, BrainConfig
+from neural_memory.core.fiber import Fiber
+from neural_memory.engine.doc_trainer import (
+    DocTrainer,
+    TrainingConfig,
+    TrainingResult,
+    _extract_chunk_features,
+)
+from neural_memory.storage.sqlite_store import SQLiteStorage
 
 
 @pytest.fixture
@@ -16,6 +26,9 @@ def mock_storage() -> AsyncMock:
     storage = AsyncMock()
     storage.add_neuron = AsyncMock()
     storage.add_synapse = AsyncMock()
+    storage.add_neurons_bulk = AsyncMock()
+    storage.add_synapses_bulk = AsyncMock()
+    storage.batch = MagicMock(return_value=nullcontext())
     storage.add_fiber = AsyncMock()
     storage.save_maturation = AsyncMock()
     storage.find_neurons = AsyncMock(return_value=[])
@@ -48,6 +61,8 @@ class TestTrainingConfig:
         assert tc.extensions == (".md",)
         assert tc.initial_stage == "episodic"
         assert tc.salience_ceiling == 0.5
+        assert tc.workers == 0
+        assert tc.batch_size == 64
 
     def test_custom_values(self) -> None:
         """Custom values are preserved."""
@@ -415,3 +430,82 @@ class TestDocTrainer:
 
         # Only .rst file should be processed
         assert result.files_processed == 1
+
+
+class TestBulkIngestion:
+    """Staged pipeline: pooled extraction, shared entity dedup, batched writes."""
+
+    @pytest.fixture
+    async def storage(self, tmp_path: Path) -> SQLiteStorage:
+        storage = SQLiteStorage(tmp_path / "brain.db")
+        await storage.initialize()
+        brain = Brain.create(name="docs", config=BrainConfig())
+        await storage.save_brain(brain)
+        storage.set_brain(brain.id)
+        yield storage
+        await storage.close()
+
+    def _write_docs(self, directory: Path, count: int) -> None:
+        for i in range(count):
+            body = " ".join([f"Kubernetes schedules pods for service number {i} reliably"] * 4)
+            (directory / f"doc{i}.md").write_text(f"# Section {i}\n\n{body}", encoding="utf-8")
+
+    def test_worker_extraction_isolates_failures(self) -> None:
+        results = _extract_chunk_features(["Alice met Bob in Paris", None])  # type: ignore[list-item]
+        assert results[0] is not None
+        assert results[1] is None
+
+    async def test_pooled_extraction(
+        self, storage: SQLiteStorage, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        self._write_docs(docs, 4)
+        tc = TrainingConfig(consolidate=False, workers=2, batch_size=1)
+        caplog.set_level(logging.DEBUG, logger="neural_memory.engine.doc_trainer")
+
+        result = await DocTrainer(storage, BrainConfig()).train_directory(docs, tc)
+
+        assert "extracting inline" not in caplog.text
+        assert result.chunks_encoded == 4
+        assert result.chunks_failed == 0
+        assert result.hierarchy_synapses == 4
+        fibers = await storage.get_fibers(limit=10)
+        assert len(fibers) == 4
+
+    async def test_entities_deduped_across_batches(
+        self, storage: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        self._write_docs(docs, 3)
+        tc = TrainingConfig(consolidate=False, workers=1, batch_size=2)
+
+        await DocTrainer(storage, BrainConfig()).train_directory(docs, tc)
+
+        matches = await storage.find_neurons(content_exact="Kubernetes", limit=10)
+        assert len([n for n in matches if n.metadata.get("entity_type")]) == 1
+
+    async def test_failed_chunk_does_not_cache_its_entities(
+        self, storage: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        self._write_docs(docs, 3)
+        tc = TrainingConfig(consolidate=False, workers=1, batch_size=3)
+        add_fiber = storage.add_fiber
+        calls: list[int] = []
+
+        async def fail_first(fiber: Fiber) -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("disk full")
+            return await add_fiber(fiber)
+
+        with patch.object(storage, "add_fiber", side_effect=fail_first):
+            result = await DocTrainer(storage, BrainConfig()).train_directory(docs, tc)
+
+        # The first chunk's Kubernetes neuron was rolled back; the next chunk recreates it
+        assert (result.chunks_encoded, result.chunks_failed) == (2, 1)
+        matches = await storage.find_neurons(content_exact="Kubernetes", limit=10)
+        assert len([n for n in matches if n.metadata.get("entity_type")]) == 1
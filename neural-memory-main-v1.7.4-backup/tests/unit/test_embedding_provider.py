@@ -499,3 +499,43 @@ class TestEmbeddingProviderEdgeCases:
         v2 = [0.0, 0.0, 0.0, 1.0]
         sim = await provider.similarity(v1, v2)
         assert sim == pytest.approx(0.0, abs=1e-6)
+
+
+# ── Provider factory ─────────────────────────────────────────────
+
+
+class TestCreateEmbeddingProvider:
+    """Test provider selection from BrainConfig."""
+
+    def test_disabled_returns_none(self) -> None:
+        from neural_memory.core.brain import BrainConfig
+        from neural_memory.engine.embedding import create_embedding_provider
+
+        assert create_embedding_provider(BrainConfig()) is None
+
+    def test_enabled_provider_is_shared(self) -> None:
+        from neural_memory.core.brain import BrainConfig
+        from neural_memory.engine.embedding import create_embedding_provider
+        from neural_memory.engine.embedding.sentence_transformer import (
+            SentenceTransformerEmbedding,
+        )
+
+        config = BrainConfig(embedding_enabled=True)
+        provider = create_embedding_provider(config)
+
+        assert isinstance(provider, SentenceTransformerEmbedding)
+        assert create_embedding_provider(config.with_updates()) is provider
+
+    def test_unavailable_provider_returns_none(self) -> None:
+        import os
+        import unittest.mock
+
+        from neural_memory.core.brain import BrainConfig
+        from neural_memory.engine.embedding import create_embedding_provider
+
+        config = BrainConfig(
+            embedding_enabled=True, embedding_provider="openai", embedding_model="no-key-model"
+        )
+        env_without_key = {k: v for k, v in os.environ.items() if k != "OPENAI_API_KEY"}
+        with unittest.mock.patch.dict(os.environ, env_without_key, clear=True):
+            assert create_embedding_provider(config) is None
@@ -0,0 +1,330 @@
+"""Tests for the in-memory CSR graph snapshot and snapshot-backed activation."""
+
+from __future__ import annotations
+
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from neural_memory.core.brain import Brain, BrainConfig
+from neural_memory.core.neuron import Neuron, NeuronState, NeuronType
+from neural_memory.core.synapse import Synapse, SynapseType
+from neural_memory.engine.activation import SpreadingActivation
+from neural_memory.engine.retrieval import ReflexPipeline
+from neural_memory.storage.graph_snapshot import GraphSnapshot
+from neural_memory.storage.memory_store import InMemoryStorage
+from neural_memory.storage.sqlite_store import SQLiteStorage
+from neural_memory.utils.timeutils import utcnow
+
+
+@pytest.fixture
+def config() -> BrainConfig:
+    return BrainConfig(activation_threshold=0.05, max_spread_hops=3)
+
+
+@pytest.fixture
+async def storage(config: BrainConfig) -> SQLiteStorage:
+    """SQLite storage with graph: a->b->c->d, a->e->c, f->a (0.05, non-conducting)."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = SQLiteStorage(Path(tmpdir) / "test.db")
+        await storage.initialize()
+        brain = Brain.create(name="snap", config=config)
+        await storage.save_brain(brain)
+        storage.set_brain(brain.id)
+
+        for nid in "abcdef":
+            await storage.add_neuron(
+                Neuron.create(type=NeuronType.CONCEPT, content=nid.upper(), neuron_id=nid)
+            )
+        for sid, src, tgt, weight in [
+            ("ab", "a", "b", 0.8),
+            ("bc", "b", "c", 0.8),
+            ("cd", "c", "d", 0.8),
+            ("ae", "a", "e", 0.5),
+            ("ec", "e", "c", 0.5),
+            ("fa", "f", "a", 0.05),
+        ]:
+            await storage.add_synapse(
+                Synapse.create(src, tgt, SynapseType.RELATED_TO, weight=weight, synapse_id=sid)
+            )
+
+        yield storage
+        await storage.close()
+
+
+def _levels(results: dict) -> dict[str, float]:
+    return {nid: round(r.activation_level, 5) for nid, r in results.items()}
+
+
+class TestGraphSnapshot:
+    """Tests for the GraphSnapshot data structure."""
+
+    def test_neighbors_are_bidirectional(self) -> None:
+        snap = GraphSnapshot(["a", "b", "c"], [("ab", "a", "b", 0.5), ("bc", "b", "c", 0.9)])
+
+        b = snap.index_of("b")
+        assert b is not None
+        neighbors = {snap.neuron_id(i): w for i, w in snap.neighbors(b)}
+        assert neighbors == {"a": pytest.approx(0.5), "c": pytest.approx(0.9)}
+
+    def test_self_loop_listed_once(self) -> None:
+        snap = GraphSnapshot(["a"], [("aa", "a", "a", 0.5)])
+        assert len(list(snap.neighbors(0))) == 1
+
+    def test_min_weight_filter(self) -> None:
+        snap = GraphSnapshot(["a", "b", "c"], [("ab", "a", "b", 0.05), ("ac", "a", "c", 0.5)])
+        assert [snap.neuron_id(i) for i, _ in snap.neighbors(0, 0.1)] == ["c"]
+
+    def test_incremental_updates(self) -> None:
+        snap = GraphSnapshot(["a", "b"], [("ab", "a", "b", 0.5)])
+
+        snap.add_neuron("c")
+        snap.upsert_synapse("ac", "a", "c", 0.7)
+        snap.upsert_synapse("ab", "a", "b", 0.9)
+        neighbors = {snap.neuron_id(i): w for i, w in snap.neighbors(0)}
+        assert neighbors == {"b": pytest.approx(0.9), "c": pytest.approx(0.7)}
+
+        snap.remove_synapse("ab")
+        snap.remove_neuron("c")
+        assert list(snap.neighbors(0)) == []
+        assert snap.index_of("c") is None
+        assert snap.synapse_count == 0
+
+    def test_readded_neuron_has_no_old_edges(self) -> None:
+        snap = GraphSnapshot(["a", "b"], [("ab", "a", "b", 0.9)])
+        snap.add_neuron("c")
+        snap.upsert_synapse("bc", "b", "c", 0.7)
+
+        snap.remove_neuron("b")
+        snap.add_neuron("b")
+
+        assert list(snap.neighbors(0)) == []
+        assert list(snap.neighbors(1)) == []
+        assert snap.synapse_count == 0
+        assert len(snap.csr().overlay_rows) == 0
+
+    def test_compaction_preserves_edges(self) -> None:
+        ids = [f"n{i}" for i in range(2000)]
+        snap = GraphSnapshot(ids, [])
+        for i in range(1, 2000):
+            snap.upsert_synapse(f"s{i}", "n0", f"n{i}", 0.5)
+        for i in range(1, 1000):
+            snap.remove_synapse(f"s{i}")
+
+        assert snap.synapse_count == 1000
+        assert {snap.neuron_id(i) for i, _ in snap.neighbors(0)} == {
+            f"n{i}" for i in range(1000, 2000)
+        }
+
+    def test_csr_returns_overlay_without_repacking(self) -> None:
+        snap = GraphSnapshot(["a", "b"], [("ab", "a", "b", 0.5)])
+        packed = snap.csr().indices
+
+        snap.add_neuron("c")
+        snap.upsert_synapse("bc", "b", "c", 0.7)
+        csr = snap.csr()
+
+        assert csr.indices is packed
+        assert len(csr.indptr) == 3
+        assert list(csr.overlay_rows) == [1, 2]
+        assert list(csr.overlay_indices) == [2, 1]
+        assert list(csr.overlay_weights) == [pytest.approx(0.7)] * 2
+
+
+class TestSnapshotActivation:
+    """Snapshot-backed activation must match the storage-backed spread."""
+
+    async def test_matches_storage_spread(
+        self, storage: SQLiteStorage, config: BrainConfig
+    ) -> None:
+        classic = await SpreadingActivation(storage, config).activate(["a"])
+        fast = await SpreadingActivation(storage, config, use_snapshot=True).activate(["a"])
+
+        assert _levels(fast) == _levels(classic)
+        assert "f" not in fast
+        assert fast["d"].source_anchor == "a"
+        assert fast["d"].path[0] == "a" and fast["d"].path[-1] == "d"
+
+    async def test_write_path_keeps_snapshot_current(
+        self, storage: SQLiteStorage, config: BrainConfig
+    ) -> None:
+        activator = SpreadingActivation(storage, config, use_snapshot=True)
+        await activator.activate(["a"])
+
+        await storage.add_neuron(Neuron.create(type=NeuronType.CONCEPT, content="G", neuron_id="g"))
+        await storage.add_synapse(
+            Synapse.create("d", "g", SynapseType.RELATED_TO, weight=0.9, synapse_id="dg")
+        )
+        await storage.delete_synapse("ae")
+        synapse = await storage.get_synapse("fa")
+        assert synapse is not None
+        await storage.update_synapse(synapse.reinforce(0.5))
+
+        fast = await activator.activate(["a"], max_hops=4, min_activation=0.01)
+        classic = await SpreadingActivation(storage, config).activate(
+            ["a"], max_hops=4, min_activation=0.01
+        )
+        assert _levels(fast) == _levels(classic)
+        assert "g" in fast
+        assert "f" in fast
+
+    async def test_refractory_neuron_skipped(
+        self, storage: SQLiteStorage, config: BrainConfig
+    ) -> None:
+        activator = SpreadingActivation(storage, config, use_snapshot=True)
+        await activator.activate(["a"])
+
+        await storage.update_neuron_state(
+            NeuronState(neuron_id="b", refractory_until=utcnow() + timedelta(minutes=5))
+        )
+        results = await activator.activate(["a"])
+        assert "b" not in results
+
+    async def test_deleted_neuron_not_reached(
+        self, storage: SQLiteStorage, config: BrainConfig
+    ) -> None:
+        activator = SpreadingActivation(storage, config, use_snapshot=True)
+        await activator.activate(["a"])
+
+        await storage.delete_neuron("e")
+        results = await activator.activate(["a"])
+        assert "e" not in results
+        assert (await activator.activate(["e"])) == {}
+
+    async def test_backend_comes_from_brain_config(
+        self, storage: SQLiteStorage, config: BrainConfig
+    ) -> None:
+        brain = Brain.create(name="fast", config=config.with_updates(activation_backend="snapshot"))
+        await storage.save_brain(brain)
+        loaded = await storage.get_brain(brain.id)
+        assert loaded is not None
+        assert loaded.config.activation_backend == "snapshot"
+
+        pipeline = ReflexPipeline(storage, loaded.config)
+        assert pipeline._activator._use_snapshot
+        assert pipeline._activator._frontier is None
+        assert not ReflexPipeline(storage, config)._activator._use_snapshot
+
+    async def test_falls_back_without_snapshot_support(self, config: BrainConfig) -> None:
+        storage = InMemoryStorage()
+        brain = Brain.create(name="mem", config=config)
+        await storage.save_brain(brain)
+        storage.set_brain(brain.id)
+        await storage.add_neuron(Neuron.create(type=NeuronType.CONCEPT, content="A", neuron_id="a"))
+
+        results = await SpreadingActivation(storage, config, use_snapshot=True).activate(["a"])
+        assert set(results) == {"a"}
+
+
+class TestFrontierActivation:
+    """Vectorized frontier mode must agree with the heap-based spread."""
+
+    @pytest.fixture(autouse=True)
+    def _require_numpy(self) -> None:
+        pytest.importorskip("numpy")
+
+    async def test_matches_heap_spread(self, storage: SQLiteStorage, config: BrainConfig) -> None:
+        classic = await SpreadingActivation(storage, config).activate(["a"])
+        fast = await SpreadingActivation(storage, config, vectorized=True).activate(["a"])
+
+        assert _levels(fast) == _levels(classic)
+        assert {nid: r.hop_distance for nid, r in fast.items()} == {
+            nid: r.hop_distance for nid, r in classic.items()
+        }
+
+    async def test_paths_recorded_at_relaxation(
+        self, storage: SQLiteStorage, config: BrainConfig
+    ) -> None:
+        results = await SpreadingActivation(storage, config, vectorized=True).activate(["a"])
+
+        assert results["a"].path == ["a"]
+        assert results["d"].path == ["a", "b", "c", "d"]
+        assert results["d"].source_anchor == "a"
+        assert results["d"].hop_distance == 3
+
+    async def test_multiple_sets_batched(self, storage: SQLiteStorage, config: BrainConfig) -> None:
+        anchor_sets = [["a"], ["d"], ["missing"]]
+        classic, classic_hits = await SpreadingActivation(storage, config).activate_from_multiple(
+            anchor_sets
+        )
+        fast, fast_hits = await SpreadingActivation(
+            storage, config, vectorized=True
+        ).activate_from_multiple(anchor_sets)
+
+        assert _levels(fast) == _levels(classic)
+        assert set(fast_hits) == set(classic_hits)
+
+    async def test_sees_writes_after_build(
+        self, storage: SQLiteStorage, config: BrainConfig
+    ) -> None:
+        activator = SpreadingActivation(storage, config, vectorized=True)
+        await activator.activate(["a"])
+
+        await storage.add_neuron(Neuron.create(type=NeuronType.CONCEPT, content="G", neuron_id="g"))
+        await storage.add_synapse(
+            Synapse.create("a", "g", SynapseType.RELATED_TO, weight=0.9, synapse_id="ag")
+        )
+        await storage.delete_neuron("b")
+
+        results = await activator.activate(["a"])
+        assert "g" in results
+        assert "b" not in results
+        assert results["c"].path == ["a", "e", "c"]
+
+    def test_spreads_through_overlay(self) -> None:
+        from neural_memory.engine.frontier_activation import FrontierActivation
+
+        snap = GraphSnapshot(["a", "b"], [("ab", "a", "b", 0.8)])
+        frontier = FrontierActivation(min_weight=0.1)
+        frontier.activate_batch(snap, [["a"]], 3, 0.5, 0.01, now=0.0)
+        snap.add_neuron("c")
+        snap.upsert_synapse("bc", "b", "c", 0.8)
+        snap.upsert_synapse("ab", "a", "b", 0.6)
+
+        (results,) = frontier.activate_batch(snap, [["a"]], 3, 0.5, 0.01, now=0.0)
+
+        assert snap.csr().overlay_rows
+        assert results["c"].path == ["a", "b", "c"]
+        assert results["c"].activation_level == pytest.approx(0.5 * 0.6 * 0.5 * 0.8)
+
+    def test_path_survives_parent_improvement(self) -> None:
+        from neural_memory.engine.frontier_activation import FrontierActivation
+
+        snap = GraphSnapshot(
+            ["a", "b", "c", "d"],
+            [
+                ("ab", "a", "b", 0.5),
+                ("ac", "a", "c", 1.0),
+                ("cb", "c", "b", 1.0),
+                ("bd", "b", "d", 1.0),
+            ],
+        )
+        frontier = FrontierActivation(min_weight=0.1)
+
+        (results,) = frontier.activate_batch(snap, [["a"]], 2, 0.9, 0.01, now=0.0)
+
+        # b is improved via c on hop 2, after d was reached through a->b
+        assert results["b"].path == ["a", "c", "b"]
+        assert results["d"].path == ["a", "b", "d"]
+        assert results["d"].source_anchor == "a"
+        assert results["d"].hop_distance == 2
+        assert results["d"].activation_level == pytest.approx(0.9 * 0.5 * 0.9)
+
+    def test_state_writes_patch_cached_vectors(self) -> None:
+        from neural_memory.engine.frontier_activation import FrontierActivation
+
+        snap = GraphSnapshot(["a", "b", "c"], [("ab", "a", "b", 0.8), ("bc", "b", "c", 0.8)])
+        frontier = FrontierActivation(min_weight=0.1)
+        frontier.activate_batch(snap, [["a"]], 3, 0.5, 0.01, now=10.0)
+        refractory = frontier._arrays["refractory"]
+        version = snap.version
+
+        snap.update_state("b", 5, 100.0)
+        (results,) = frontier.activate_batch(snap, [["a"]], 3, 0.5, 0.01, now=10.0)
+
+        assert snap.version == version
+        assert frontier._arrays["refractory"] is refractory
+        assert "b" not in results
+        assert "c" not in results
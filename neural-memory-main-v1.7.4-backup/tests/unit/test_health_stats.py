@@ -0,0 +1,254 @@
+"""Tests for materialized brain stats and the cached health report."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from neural_memory.core.brain import Brain, BrainConfig
+from neural_memory.core.fiber import Fiber
+from neural_memory.core.neuron import Neuron, NeuronState, NeuronType
+from neural_memory.core.synapse import Synapse, SynapseType
+from neural_memory.engine.diagnostics import BrainHealthReport, DiagnosticsEngine
+from neural_memory.engine.memory_stages import MaturationRecord, MemoryStage
+from neural_memory.engine.merge import ConflictStrategy
+from neural_memory.storage.base import NeuralStorage
+from neural_memory.storage.health_cache import HealthReportCache, health_cache_for
+from neural_memory.storage.sqlite_store import SQLiteStorage
+
+_SCANNED_STATS = """SELECT
+    (SELECT COUNT(*) FROM neurons WHERE brain_id = 'b1') AS neurons,
+    (SELECT COUNT(*) FROM synapses WHERE brain_id = 'b1') AS synapses,
+    (SELECT COUNT(*) FROM fibers WHERE brain_id = 'b1') AS fibers,
+    (SELECT COUNT(DISTINCT type) FROM neurons WHERE brain_id = 'b1') AS neuron_types,
+    (SELECT ROUND(AVG(weight), 4) FROM synapses WHERE brain_id = 'b1') AS avg_weight
+"""
+
+
+async def _populate(storage: SQLiteStorage) -> None:
+    await storage.save_brain(Brain.create(name="b1", config=BrainConfig(), brain_id="b1"))
+    storage.set_brain("b1")
+    for i in range(6):
+        neuron_type = NeuronType.CONCEPT if i % 2 else NeuronType.ENTITY
+        await storage.add_neuron(
+            Neuron.create(type=neuron_type, content=f"c{i}", neuron_id=f"n{i}")
+        )
+    for i in range(4):
+        await storage.add_synapse(
+            Synapse.create(
+                f"n{i}",
+                f"n{i + 1}",
+                SynapseType.RELATED_TO if i % 2 else SynapseType.CO_OCCURS,
+                weight=0.2 * (i + 1),
+                synapse_id=f"s{i}",
+            )
+        )
+    await storage.add_fiber(
+        Fiber.create({"n0", "n1"}, {"s0"}, "n0", fiber_id="f0", tags={"python", "Python"})
+    )
+    await storage.add_fiber(Fiber.create({"n2", "n3"}, {"s2"}, "n2", fiber_id="f1"))
+    await storage.update_neuron_state(NeuronState(neuron_id="n1", access_frequency=3))
+    await storage.save_maturation(
+        MaturationRecord(fiber_id="f0", brain_id="b1", stage=MemoryStage.SEMANTIC)
+    )
+
+
+async def _assert_counters_match(storage: SQLiteStorage) -> None:
+    conn = storage._ensure_conn()
+    async with conn.execute(_SCANNED_STATS) as cursor:
+        scanned = await cursor.fetchone()
+    assert scanned is not None
+    stats = await storage.get_enhanced_stats("b1")
+
+    assert stats["neuron_count"] == scanned["neurons"]
+    assert stats["synapse_count"] == scanned["synapses"]
+    assert stats["fiber_count"] == scanned["fibers"]
+    assert len(stats["neuron_type_breakdown"]) == scanned["neuron_types"]
+    assert sum(stats["neuron_type_breakdown"].values()) == scanned["neurons"]
+    assert stats["synapse_stats"]["avg_weight"] == pytest.approx(scanned["avg_weight"] or 0.0)
+
+
+async def _replay(records: Iterable[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+    for record in records:
+        yield record
+
+
+def _report(score: float) -> BrainHealthReport:
+    return replace(DiagnosticsEngine._empty_brain_report(0, 0, 0), purity_score=score)
+
+
+def _constant(report: BrainHealthReport) -> Callable[[], Awaitable[BrainHealthReport]]:
+    async def compute() -> BrainHealthReport:
+        return report
+
+    return compute
+
+
+@pytest.fixture
+async def storage(tmp_path: Path) -> AsyncIterator[SQLiteStorage]:
+    storage = SQLiteStorage(tmp_path / "brain.db")
+    await storage.initialize()
+    await _populate(storage)
+    yield storage
+    await storage.close()
+
+
+class TestMaterializedStats:
+    """Tests for the trigger-maintained counters and get_health_stats."""
+
+    async def test_counters_follow_writes(self, storage: SQLiteStorage) -> None:
+        await _assert_counters_match(storage)
+
+        neuron = await storage.get_neuron("n5")
+        assert neuron is not None
+        await storage.update_neuron(replace(neuron, type=NeuronType.ACTION))
+        synapse = await storage.get_synapse("s1")
+        assert synapse is not None
+        await storage.update_synapse(replace(synapse, weight=0.95, reinforced_count=4))
+        await _assert_counters_match(storage)
+        stats = await storage.get_enhanced_stats("b1")
+        assert stats["neuron_type_breakdown"]["action"] == 1
+        assert stats["synapse_stats"]["total_reinforcements"] == 4
+
+        # Deleting a neuron cascades to its synapses
+        await storage.delete_neuron("n1")
+        await storage.delete_fiber("f1")
+        await _assert_counters_match(storage)
+        stats = await storage.get_stats("b1")
+        assert (stats["neuron_count"], stats["synapse_count"], stats["fiber_count"]) == (5, 2, 1)
+
+    async def test_migration_backfills_counters(self, storage: SQLiteStorage) -> None:
+        await storage.close()
+        with sqlite3.connect(storage._db_path) as conn:
+            for table in ("neuron_type_counts", "synapse_type_counts", "fiber_counts"):
+                conn.execute("DROP TABLE " + table)
+            conn.execute("UPDATE schema_version SET version = 17")
+
+        await storage.initialize()
+
+        await _assert_counters_match(storage)
+        stats = await storage.get_stats("b1")
+        assert (stats["neuron_count"], stats["synapse_count"], stats["fiber_count"]) == (6, 4, 2)
+
+    async def test_health_stats_match_default(self, storage: SQLiteStorage) -> None:
+        expected = await NeuralStorage.get_health_stats(storage, "b1")
+
+        health = await storage.get_health_stats("b1")
+
+        assert health == expected
+        assert health == {
+            "orphan_neurons": 1,
+            "activated_neurons": 1,
+            "semantic_fibers": 1,
+            "fresh_fibers": 2,
+            "fiber_tags": ["Python", "python"],
+        }
+
+    async def test_analyze_uses_health_stats(self, storage: SQLiteStorage) -> None:
+        report = await DiagnosticsEngine(storage).analyze("b1")
+
+        assert report.orphan_rate == pytest.approx(1 / 6, abs=1e-4)
+        assert report.consolidation_ratio == 0.5
+        assert report.freshness == 1.0
+        assert "TAG_DRIFT" in {w.code for w in report.warnings}
+
+
+class TestHealthReportCache:
+    """Tests for HealthReportCache staleness and refresh."""
+
+    async def test_fresh_report_is_reused(self) -> None:
+        cache = HealthReportCache(max_age=60)
+        calls: list[int] = []
+
+        async def compute() -> BrainHealthReport:
+            calls.append(1)
+            return _report(len(calls))
+
+        first = await cache.get("b1", compute)
+        second = await cache.get("b1", compute)
+
+        assert first is second
+        assert len(calls) == 1
+
+    async def test_stale_report_refreshes_in_background(self) -> None:
+        cache = HealthReportCache(max_age=0)
+        release = asyncio.Event()
+        scores = iter([1.0, 2.0])
+
+        async def compute() -> BrainHealthReport:
+            report = _report(next(scores))
+            if report.purity_score == 2.0:
+                await release.wait()
+            return report
+
+        assert (await cache.get("b1", compute)).purity_score == 1.0
+        # Stale: served at once, one refresh started for both callers
+        assert (await cache.get("b1", compute)).purity_score == 1.0
+        assert (await cache.get("b1", compute)).purity_score == 1.0
+
+        release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        cache.max_age = 60
+        assert (await cache.get("b1", compute)).purity_score == 2.0
+
+    async def test_failed_refresh_keeps_report(self, caplog: pytest.LogCaptureFixture) -> None:
+        cache = HealthReportCache(max_age=0)
+        await cache.get("b1", _constant(_report(1.0)))
+
+        async def failing() -> BrainHealthReport:
+            raise RuntimeError("boom")
+
+        assert (await cache.get("b1", failing)).purity_score == 1.0
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert (await cache.get("b1", failing)).purity_score == 1.0
+        assert "Health report refresh failed" in caplog.text
+
+    async def test_concurrent_first_calls_share_one_computation(self) -> None:
+        cache = HealthReportCache()
+        calls: list[int] = []
+
+        async def compute() -> BrainHealthReport:
+            calls.append(1)
+            await asyncio.sleep(0)
+            return _report(1.0)
+
+        reports = await asyncio.gather(*(cache.get("b1", compute) for _ in range(5)))
+
+        assert len(calls) == 1
+        assert all(r is reports[0] for r in reports)
+
+    async def test_analyze_cached_is_shared_per_storage(self, storage: SQLiteStorage) -> None:
+        first = await DiagnosticsEngine(storage).analyze_cached("b1")
+        await storage.add_neuron(
+            Neuron.create(type=NeuronType.CONCEPT, content="new", neuron_id="n9")
+        )
+
+        assert await DiagnosticsEngine(storage).analyze_cached("b1") is first
+        health_cache_for(storage).invalidate("b1")
+        refreshed = await DiagnosticsEngine(storage).analyze_cached("b1")
+        assert refreshed.neuron_count == first.neuron_count + 1
+
+    async def test_brain_rewrites_drop_cached_report(self, storage: SQLiteStorage) -> None:
+        engine = DiagnosticsEngine(storage)
+        records = [r async for r in storage.export_brain_stream("b1")]
+
+        empty = await engine.analyze_cached("b2")
+        await storage.import_brain_stream(_replay(records), "b2")
+        assert (await engine.analyze_cached("b2")).neuron_count == 6
+        assert empty.neuron_count == 0
+
+        first = await engine.analyze_cached("b1")
+        await storage.merge_brain_stream("b1", _replay(records), ConflictStrategy.PREFER_LOCAL)
+        assert await engine.analyze_cached("b1") is not first
+
+        await storage.clear("b1")
+        assert (await engine.analyze_cached("b1")).neuron_count == 0
@@ -0,0 +1,229 @@
+"""Tests for change tracking and incremental consolidation."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from neural_memory.core.brain import Brain, BrainConfig
+from neural_memory.core.fiber import Fiber
+from neural_memory.core.neuron import Neuron, NeuronType
+from neural_memory.core.synapse import Synapse, SynapseType
+from neural_memory.engine.consolidation import ConsolidationEngine, ConsolidationStrategy
+from neural_memory.storage.memory_store import InMemoryStorage
+from neural_memory.storage.sqlite_store import SQLiteStorage
+from neural_memory.utils.timeutils import utcnow
+
+NOW = utcnow()
+OLD = NOW - timedelta(days=120)
+
+
+def _neuron(nid: str) -> Neuron:
+    return Neuron.create(type=NeuronType.CONCEPT, content=nid.upper(), neuron_id=nid)
+
+
+def _old_synapse(sid: str, src: str, tgt: str, weight: float) -> Synapse:
+    synapse = Synapse.create(src, tgt, SynapseType.RELATED_TO, weight=weight, synapse_id=sid)
+    return replace(synapse, created_at=OLD)
+
+
+async def _add_region(storage: SQLiteStorage, prefix: str) -> None:
+    """a-b weak (prunable), a-c strong: a is not a bridge source."""
+    for n in "abc":
+        await storage.add_neuron(_neuron(f"{prefix}{n}"))
+    await storage.add_synapse(_old_synapse(f"{prefix}-weak", f"{prefix}a", f"{prefix}b", 0.1))
+    await storage.add_synapse(_old_synapse(f"{prefix}-strong", f"{prefix}a", f"{prefix}c", 0.9))
+
+
+@pytest.fixture
+async def storage(tmp_path: Path) -> SQLiteStorage:
+    storage = SQLiteStorage(tmp_path / "brain.db")
+    await storage.initialize()
+    brain = Brain.create(name="incremental", config=BrainConfig())
+    await storage.save_brain(brain)
+    storage.set_brain(brain.id)
+    yield storage
+    await storage.close()
+
+
+class TestDirtySet:
+    """Storage mutations are recorded in the change log."""
+
+    async def test_writes_mark_entities_dirty(self, storage: SQLiteStorage) -> None:
+        await storage.add_neurons_bulk([_neuron("a"), _neuron("b"), _neuron("c")])
+        await storage.add_synapse(Synapse.create("a", "b", SynapseType.RELATED_TO, synapse_id="ab"))
+        await storage.add_fiber(
+            Fiber(id="f1", neuron_ids={"b", "c"}, synapse_ids=set(), anchor_neuron_id="b")
+        )
+
+        dirty = await storage.get_dirty_set()
+        assert dirty is not None
+        assert dirty.neuron_ids == {"a", "b", "c"}
+        assert dirty.synapse_ids == {"ab"}
+        assert dirty.fiber_ids == {"f1"}
+
+    async def test_neighbourhood_from_synapses_and_fibers(self, storage: SQLiteStorage) -> None:
+        await storage.add_neurons_bulk([_neuron(n) for n in "abcd"])
+        await storage.add_synapse(Synapse.create("a", "b", SynapseType.RELATED_TO, synapse_id="ab"))
+        await storage.add_fiber(
+            Fiber(id="f1", neuron_ids={"c", "d"}, synapse_ids=set(), anchor_neuron_id="c")
+        )
+        dirty = await storage.get_dirty_set()
+        assert dirty is not None
+        await storage.clear_dirty_set(dirty.checkpoint)
+
+        synapse = await storage.get_synapse("ab")
+        assert synapse is not None
+        await storage.update_synapse(synapse.reinforce(0.1))
+        fiber = await storage.get_fiber("f1")
+        assert fiber is not None
+        await storage.update_fiber(replace(fiber, salience=0.5))
+
+        dirty = await storage.get_dirty_set()
+        assert dirty is not None
+        assert dirty.neuron_ids == {"a", "b", "c", "d"}
+
+    async def test_delete_marks_endpoints(self, storage: SQLiteStorage) -> None:
+        await storage.add_neurons_bulk([_neuron("a"), _neuron("b")])
+        await storage.add_synapse(Synapse.create("a", "b", SynapseType.RELATED_TO, synapse_id="ab"))
+        dirty = await storage.get_dirty_set()
+        assert dirty is not None
+        await storage.clear_dirty_set(dirty.checkpoint)
+
+        await storage.delete_synapse("ab")
+        dirty = await storage.get_dirty_set()
+        assert dirty is not None
+        assert dirty.neuron_ids == {"a", "b"}
+
+    async def test_clear_keeps_later_changes(self, storage: SQLiteStorage) -> None:
+        await storage.add_neuron(_neuron("a"))
+        dirty = await storage.get_dirty_set()
+        assert dirty is not None
+
+        await storage.add_neuron(_neuron("b"))
+        await storage.clear_dirty_set(dirty.checkpoint)
+
+        remaining = await storage.get_dirty_set()
+        assert remaining is not None
+        assert remaining.neuron_ids == {"b"}
+
+    async def test_default_backend_does_not_track(self) -> None:
+        assert await InMemoryStorage().get_dirty_set() is None
+
+
+class TestIncrementalConsolidation:
+    """The incremental strategy only touches the dirty neighbourhood."""
+
+    async def test_prunes_only_dirty_region(self, storage: SQLiteStorage) -> None:
+        await _add_region(storage, "old")
+        dirty = await storage.get_dirty_set()
+        assert dirty is not None
+        await storage.clear_dirty_set(dirty.checkpoint)
+        await _add_region(storage, "new")
+
+        report = await ConsolidationEngine(storage).run(
+            strategies=[ConsolidationStrategy.INCREMENTAL], reference_time=NOW
+        )
+
+        assert report.synapses_pruned == 1
+        assert await storage.get_synapse("new-weak") is None
+        assert await storage.get_synapse("old-weak") is not None
+        assert await storage.get_neuron("newb") is None
+        assert await storage.get_neuron("oldb") is not None
+
+        # The run's own deletes are picked up once more, then the log settles
+        remaining = await storage.get_dirty_set()
+        assert remaining is not None
+        assert remaining.neuron_ids == {"newa", "newb"}
+        assert not remaining.synapse_ids
+
+        await ConsolidationEngine(storage).run(
+            strategies=[ConsolidationStrategy.INCREMENTAL], reference_time=NOW
+        )
+        settled = await storage.get_dirty_set()
+        assert settled is not None
+        assert settled.is_empty
+
+    async def test_merges_new_fiber_with_overlapping_neighbour(
+        self, storage: SQLiteStorage
+    ) -> None:
+        await storage.add_neurons_bulk([_neuron(n) for n in "abcxyz"])
+        await storage.add_fiber(
+            Fiber(id="f-old", neuron_ids={"a", "b", "c"}, synapse_ids=set(), anchor_neuron_id="a")
+        )
+        await storage.add_fiber(
+            Fiber(id="f-other", neuron_ids={"x", "y"}, synapse_ids=set(), anchor_neuron_id="x")
+        )
+        await storage.add_fiber(
+            Fiber(
+                id="f-other2", neuron_ids={"x", "y", "z"}, synapse_ids=set(), anchor_neuron_id="x"
+            )
+        )
+        dirty = await storage.get_dirty_set()
+        assert dirty is not None
+        await storage.clear_dirty_set(dirty.checkpoint)
+
+        await storage.add_fiber(
+            Fiber(id="f-new", neuron_ids={"a", "b", "c"}, synapse_ids=set(), anchor_neuron_id="b")
+        )
+        report = await ConsolidationEngine(storage).run(
+            strategies=[ConsolidationStrategy.INCREMENTAL], reference_time=NOW
+        )
+
+        assert len(report.merge_details) == 1
+        assert set(report.merge_details[0].original_fiber_ids) == {"f-old", "f-new"}
+        # Overlapping pair outside the dirty neighbourhood is left for a full run
+        assert await storage.get_fiber("f-other") is not None
+
+    async def test_nothing_changed_is_a_no_op(self, storage: SQLiteStorage) -> None:
+        await _add_region(storage, "old")
+        dirty = await storage.get_dirty_set()
+        assert dirty is not None
+        await storage.clear_dirty_set(dirty.checkpoint)
+
+        report = await ConsolidationEngine(storage).run(
+            strategies=[ConsolidationStrategy.INCREMENTAL], reference_time=NOW
+        )
+        assert report.synapses_pruned == 0
+        assert await storage.get_synapse("old-weak") is not None
+
+    async def test_dry_run_keeps_dirty_set(self, storage: SQLiteStorage) -> None:
+        await _add_region(storage, "new")
+
+        report = await ConsolidationEngine(storage).run(
+            strategies=[ConsolidationStrategy.INCREMENTAL], dry_run=True, reference_time=NOW
+        )
+
+        assert report.synapses_pruned == 1
+        dirty = await storage.get_dirty_set()
+        assert dirty is not None
+        assert "newa" in dirty.neuron_ids
+
+    async def test_full_run_clears_dirty_set(self, storage: SQLiteStorage) -> None:
+        await _add_region(storage, "new")
+
+        await ConsolidationEngine(storage).run(reference_time=NOW)
+
+        dirty = await storage.get_dirty_set()
+        assert dirty is not None
+        # Only the endpoints of the synapse the run itself pruned remain
+        assert not dirty.synapse_ids
+        assert dirty.neuron_ids == {"newa", "newb"}
+
+    async def test_falls_back_to_full_run_without_tracking(self) -> None:
+        storage = InMemoryStorage()
+        brain = Brain.create(name="mem", config=BrainConfig())
+        await storage.save_brain(brain)
+        storage.set_brain(brain.id)
+        for n in "abc":
+            await storage.add_neuron(_neuron(n))
+        await storage.add_synapse(_old_synapse("weak", "a", "b", 0.1))
+        await storage.add_synapse(_old_synapse("strong", "a", "c", 0.9))
+
+        report = await ConsolidationEngine(storage).run(
+            strategies=[ConsolidationStrategy.INCREMENTAL], reference_time=NOW
+        )
+        assert report.synapses_pruned == 1
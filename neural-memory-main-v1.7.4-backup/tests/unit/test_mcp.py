@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -598,6 +599,7 @@ class TestMCPToolCalls:
         mock_brain = MagicMock(id="test-brain", name="test", config=MagicMock())
         mock_storage.get_brain = AsyncMock(return_value=mock_brain)
         mock_storage._current_brain_id = "test-brain"
+        mock_storage.batch = MagicMock(return_value=nullcontext())
         mock_storage.find_typed_memories = AsyncMock(return_value=[])
 
         mock_fiber = MagicMock(id="session-123")
@@ -635,6 +637,7 @@ class TestMCPToolCalls:
         mock_brain = MagicMock(id="test-brain", name="test", config=MagicMock())
         mock_storage.get_brain = AsyncMock(return_value=mock_brain)
         mock_storage._current_brain_id = "test-brain"
+        mock_storage.batch = MagicMock(return_value=nullcontext())
 
         mock_existing = MagicMock(
             metadata={
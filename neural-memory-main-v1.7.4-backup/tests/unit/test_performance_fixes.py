@@ -104,6 +104,8 @@ class TestEmbeddingFallback:
         storage.get_neurons_batch = AsyncMock(return_value={})
         storage.get_fibers = AsyncMock(return_value=[])
         storage.get_synapses_for_neurons = AsyncMock(return_value={})
+        # No vector index: the metadata scan is the only embedding path
+        storage.get_vector_index = AsyncMock(return_value=None)
         return storage
 
     @pytest.fixture
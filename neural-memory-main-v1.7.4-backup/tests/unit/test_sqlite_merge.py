@@ -0,0 +1,221 @@
+"""Tests for the in-place SQLite brain merge."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from neural_memory.core.brain import Brain, BrainConfig
+from neural_memory.core.fiber import Fiber
+from neural_memory.core.memory_types import MemoryType, TypedMemory
+from neural_memory.core.neuron import Neuron, NeuronState, NeuronType
+from neural_memory.core.project import Project
+from neural_memory.core.synapse import Synapse, SynapseType
+from neural_memory.engine.brain_versioning import VersioningEngine
+from neural_memory.engine.merge import ConflictStrategy
+from neural_memory.storage.base import NeuralStorage
+from neural_memory.storage.sqlite_store import SQLiteStorage
+from neural_memory.utils.timeutils import utcnow
+
+
+async def _populate(storage: SQLiteStorage) -> None:
+    earlier = utcnow() - timedelta(days=1)
+    await storage.save_brain(Brain.create(name="local", config=BrainConfig(), brain_id="local"))
+    storage.set_brain("local")
+    for nid, content in (("l1", "Hà Nội"), ("l2", "phở"), ("l3", "only local")):
+        await storage.add_neuron(
+            Neuron.create(type=NeuronType.CONCEPT, content=content, neuron_id=nid)
+        )
+    await storage.add_synapse(
+        Synapse.create("l1", "l2", SynapseType.RELATED_TO, weight=0.3, synapse_id="ls1")
+    )
+    await storage.add_fiber(Fiber.create({"l1", "l2"}, {"ls1"}, "l1", fiber_id="lf"))
+    await storage.add_typed_memory(TypedMemory.create("lf", MemoryType.FACT))
+
+    await storage.save_brain(Brain.create(name="remote", config=BrainConfig(), brain_id="remote"))
+    storage.set_brain("remote")
+    for nid, content in (("r1", "hà nội "), ("r2", "PHỞ"), ("r3", "only remote")):
+        neuron = Neuron.create(
+            type=NeuronType.CONCEPT,
+            content=content,
+            metadata={"source": "remote"},
+            neuron_id=nid,
+        )
+        await storage.add_neuron(neuron)
+    await storage.add_synapse(
+        Synapse.create("r1", "r2", SynapseType.RELATED_TO, weight=0.9, synapse_id="rs1")
+    )
+    await storage.add_synapse(
+        Synapse.create("r1", "r3", SynapseType.RELATED_TO, weight=0.5, synapse_id="rs2")
+    )
+    await storage.add_fiber(Fiber.create({"r1", "r2"}, {"rs1"}, "r1", fiber_id="rf"))
+    await storage.add_fiber(Fiber.create({"r3"}, set(), "r3", fiber_id="rf2"))
+    await storage.add_project(Project.create(name="trip"))
+    await storage.add_typed_memory(TypedMemory.create("rf", MemoryType.DECISION))
+    await storage.add_typed_memory(TypedMemory.create("rf2", MemoryType.FACT))
+    # Local rows are older, so prefer_recent keeps the incoming ones
+    conn = storage._ensure_conn()
+    for query in (
+        "UPDATE neurons SET created_at = ? WHERE brain_id = 'local'",
+        "UPDATE synapses SET created_at = ? WHERE brain_id = 'local'",
+        "UPDATE fibers SET created_at = ? WHERE brain_id = 'local'",
+    ):
+        await conn.execute(query, (earlier.isoformat(),))
+    await conn.commit()
+
+
+async def _brain_state(storage: SQLiteStorage) -> dict[str, Any]:
+    snapshot = await storage.export_brain("local")
+    return {
+        "neurons": sorted((n["id"], n["content"]) for n in snapshot.neurons),
+        "synapses": sorted(
+            (s["id"], s["source_id"], s["target_id"], s["weight"]) for s in snapshot.synapses
+        ),
+        "fibers": sorted((f["id"], tuple(sorted(f["neuron_ids"]))) for f in snapshot.fibers),
+        "typed": sorted(
+            (t["fiber_id"], t["memory_type"]) for t in snapshot.metadata["typed_memories"]
+        ),
+        "projects": sorted(p["name"] for p in snapshot.metadata["projects"]),
+    }
+
+
+@pytest.fixture
+async def storage(tmp_path: Path) -> AsyncIterator[SQLiteStorage]:
+    storage = SQLiteStorage(tmp_path / "brain.db")
+    await storage.initialize()
+    await _populate(storage)
+    yield storage
+    await storage.close()
+
+
+class TestSQLiteMerge:
+    """Tests for SQLiteStorage.merge_brain_stream."""
+
+    @pytest.mark.parametrize("strategy", list(ConflictStrategy))
+    async def test_matches_snapshot_merge(
+        self, storage: SQLiteStorage, tmp_path: Path, strategy: ConflictStrategy
+    ) -> None:
+        reference = SQLiteStorage(tmp_path / "reference.db")
+        await reference.initialize()
+        await _populate(reference)
+        try:
+            expected = await NeuralStorage.merge_brain_stream(
+                reference, "local", reference.export_brain_stream("remote"), strategy
+            )
+            report = await storage.merge_brain_stream(
+                "local", storage.export_brain_stream("remote"), strategy
+            )
+
+            assert report.summary() == expected.summary()
+            assert report.id_remap == expected.id_remap == {"r1": "l1", "r2": "l2"}
+            # Pathway and conductivity are not exported, so the fiber rows
+            # differ there; everything a snapshot carries matches
+            assert await _brain_state(storage) == await _brain_state(reference)
+        finally:
+            await reference.close()
+
+    async def test_non_ascii_content_matches_case_insensitively(
+        self, storage: SQLiteStorage
+    ) -> None:
+        report = await storage.merge_brain_stream(
+            "local", storage.export_brain_stream("remote"), ConflictStrategy.PREFER_REMOTE
+        )
+
+        assert (report.neurons_added, report.neurons_updated) == (1, 2)
+        storage.set_brain("local")
+        neuron = await storage.get_neuron("l2")
+        assert neuron is not None and neuron.content == "PHỞ"
+        assert neuron.metadata["_merge_resolution"] == "kept_incoming"
+
+    async def test_merges_in_place(self, storage: SQLiteStorage) -> None:
+        storage.set_brain("local")
+        await storage.update_neuron_state(
+            NeuronState(neuron_id="l3", activation_level=0.8, access_frequency=7)
+        )
+        await VersioningEngine(storage).create_version("local", "before")
+
+        await storage.merge_brain_stream(
+            "local", storage.export_brain_stream("remote"), ConflictStrategy.PREFER_LOCAL
+        )
+
+        storage.set_brain("local")
+        state = await storage.get_neuron_state("l3")
+        assert state is not None and state.access_frequency == 7
+        assert [v.version_name for v in await storage.list_versions("local")] == ["before"]
+
+    async def test_failed_merge_rolls_back(self, storage: SQLiteStorage) -> None:
+        before = await _brain_state(storage)
+
+        async def records() -> AsyncIterator[dict[str, Any]]:
+            async for record in storage.export_brain_stream("remote"):
+                if record["kind"] == "synapse" and record["data"]["id"] == "rs2":
+                    record = {**record, "data": {**record["data"], "target_id": "missing"}}
+                yield record
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await storage.merge_brain_stream("local", records(), ConflictStrategy.PREFER_REMOTE)
+
+        assert await _brain_state(storage) == before
+
+    async def test_merge_key_follows_content_updates(self, storage: SQLiteStorage) -> None:
+        await storage.merge_brain_stream(
+            "local", storage.export_brain_stream("remote"), ConflictStrategy.PREFER_LOCAL
+        )
+        storage.set_brain("local")
+        neuron = await storage.get_neuron("l3")
+        assert neuron is not None
+        await storage.update_neuron(replace(neuron, content="Bún chả"))
+
+        await storage.save_brain(Brain.create(name="other", config=BrainConfig(), brain_id="other"))
+        storage.set_brain("other")
+        for nid, content in (("o1", "bún chả"), ("o2", "only local")):
+            await storage.add_neuron(
+                Neuron.create(type=NeuronType.CONCEPT, content=content, neuron_id=nid)
+            )
+        report = await storage.merge_brain_stream(
+            "local", storage.export_brain_stream("other"), ConflictStrategy.PREFER_LOCAL
+        )
+
+        assert report.id_remap == {"o1": "l3"}
+        assert report.neurons_added == 1
+
+    async def test_missing_brain_is_rejected(self, storage: SQLiteStorage) -> None:
+        with pytest.raises(ValueError, match="does not exist"):
+            await storage.merge_brain_stream(
+                "nope", storage.export_brain_stream("remote"), ConflictStrategy.PREFER_LOCAL
+            )
+
+    async def test_brain_switch_mid_merge(self, storage: SQLiteStorage) -> None:
+        before = await _brain_state(storage)
+        halfway = asyncio.Event()
+        resume = asyncio.Event()
+
+        async def records() -> AsyncIterator[dict[str, Any]]:
+            async for record in storage.export_brain_stream("remote"):
+                if record["kind"] == "fiber" and not halfway.is_set():
+                    halfway.set()
+                    await resume.wait()
+                yield record
+
+        merge = asyncio.create_task(
+            storage.merge_brain_stream("local", records(), ConflictStrategy.PREFER_REMOTE)
+        )
+        await halfway.wait()
+        storage.set_brain("remote")  # another request switching brains
+        # Readers see the brain as it was until the merge commits
+        assert await _brain_state(storage) == before
+        resume.set()
+        report = await merge
+
+        assert storage._current_brain_id == "remote"
+        assert report.neurons_added == 1
+        neurons = (await _brain_state(storage))["neurons"]
+        assert ("r3", "only remote") in neurons
+        assert len((await storage.export_brain("remote")).neurons) == 3
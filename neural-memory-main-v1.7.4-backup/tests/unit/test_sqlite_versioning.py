@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import sqlite3
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 
@@ -13,11 +15,21 @@ from neural_memory.core.brain import Brain, BrainConfig
 from neural_memory.core.fiber import Fiber
 from neural_memory.core.neuron import Neuron, NeuronType
 from neural_memory.core.synapse import Synapse, SynapseType
-from neural_memory.engine.brain_versioning import BrainVersion
+from neural_memory.engine.brain_versioning import (
+    BrainVersion,
+    VersioningEngine,
+    _snapshot_to_json,
+)
 from neural_memory.storage.sqlite_store import SQLiteStorage
 from neural_memory.storage.sqlite_versioning import _row_to_version
 from neural_memory.utils.timeutils import utcnow
 
+_VERSION_TABLE_COUNTS = (
+    "SELECT COUNT(*) FROM brain_versions",
+    "SELECT COUNT(*) FROM version_rows",
+    "SELECT COUNT(*) FROM version_entries",
+)
+
 # ── Fixtures ─────────────────────────────────────────────────────
 
 
@@ -262,6 +274,194 @@ class TestDeleteVersion:
         assert result[0].version_name == "v2"
 
 
+# ── Content-addressed delta versions ────────────────────────────
+
+
+async def _table_count(storage: SQLiteStorage, sql: str, *params: object) -> int:
+    conn = storage._ensure_conn()
+    async with conn.execute(sql, params) as cursor:
+        row = await cursor.fetchone()
+    return int(row[0])
+
+
+class TestDeltaVersions:
+    """Test manifest/delta version storage through the VersioningEngine."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_rows_stored_once(self, storage: SQLiteStorage) -> None:
+        """A second version only writes the rows that changed."""
+        engine = VersioningEngine(storage)
+        v1 = await engine.create_version("brain-1", "v1")
+        rows_after_v1 = await _table_count(storage, "SELECT COUNT(*) FROM version_rows")
+
+        neuron = await storage.get_neuron("n-1")
+        await storage.update_neuron(replace(neuron, content="Redis 7"))
+        v2 = await engine.create_version("brain-1", "v2")
+
+        assert rows_after_v1 == 4
+        assert await _table_count(storage, "SELECT COUNT(*) FROM version_rows") == 5
+        assert (
+            await _table_count(
+                storage, "SELECT COUNT(*) FROM version_entries WHERE version_id = ?", v2.id
+            )
+            == 1
+        )
+        assert v1.snapshot_hash != v2.snapshot_hash
+        assert (v2.neuron_count, v2.synapse_count, v2.fiber_count) == (2, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_diff_loads_only_changed_rows(
+        self, storage: SQLiteStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Diff compares manifests and fetches payloads for changed rows only."""
+        engine = VersioningEngine(storage)
+        v1 = await engine.create_version("brain-1", "v1")
+        synapse = await storage.get_synapse("s-1")
+        await storage.update_synapse(replace(synapse, weight=0.2))
+        await storage.add_neuron(
+            Neuron.create(type=NeuronType.CONCEPT, content="x", neuron_id="n-3")
+        )
+        v2 = await engine.create_version("brain-1", "v2")
+
+        fetched: list[str] = []
+        get_rows = storage.get_version_rows
+
+        async def spy(brain_id: str, row_hashes: list[str]) -> dict:
+            fetched.extend(row_hashes)
+            return await get_rows(brain_id, row_hashes)
+
+        monkeypatch.setattr(storage, "get_version_rows", spy)
+        diff = await engine.diff("brain-1", v1.id, v2.id)
+
+        assert diff.neurons_added == ("n-3",)
+        assert diff.synapses_weight_changed == (("s-1", 0.7, 0.2),)
+        assert len(fetched) == 2
+
+    @pytest.mark.asyncio
+    async def test_chain_rebases_at_limit(self, storage: SQLiteStorage) -> None:
+        """Once the delta chain is full, the next version is a new base."""
+        storage.version_chain_limit = 2
+        engine = VersioningEngine(storage)
+        versions = []
+        for i in range(5):
+            await storage.add_neuron(
+                Neuron.create(type=NeuronType.CONCEPT, content=f"c{i}", neuron_id=f"c-{i}")
+            )
+            versions.append(await engine.create_version("brain-1", f"v{i}"))
+
+        conn = storage._ensure_conn()
+        async with conn.execute(
+            "SELECT id, parent_version_id FROM brain_versions ORDER BY version_number"
+        ) as cursor:
+            parents = [row["parent_version_id"] async for row in cursor]
+        assert parents == [None, versions[0].id, versions[1].id, None, versions[3].id]
+
+        manifest = await storage.get_version_manifest("brain-1", versions[4].id)
+        assert manifest is not None
+        assert sum(1 for kind, _ in manifest if kind == "neuron") == 7
+
+    @pytest.mark.asyncio
+    async def test_delete_folds_into_child_and_drops_orphan_rows(
+        self, storage: SQLiteStorage
+    ) -> None:
+        """Deleting a version keeps later manifests intact."""
+        engine = VersioningEngine(storage)
+        v1 = await engine.create_version("brain-1", "v1")
+        await storage.delete_neuron("n-2")
+        v2 = await engine.create_version("brain-1", "v2")
+        await storage.add_neuron(
+            Neuron.create(type=NeuronType.CONCEPT, content="x", neuron_id="n-3")
+        )
+        v3 = await engine.create_version("brain-1", "v3")
+        expected = await storage.get_version_manifest("brain-1", v3.id)
+
+        assert await storage.delete_version("brain-1", v1.id)
+        assert await storage.get_version_manifest("brain-1", v3.id) == expected
+        assert await storage.delete_version("brain-1", v2.id)
+        assert await storage.get_version_manifest("brain-1", v3.id) == expected
+
+        referenced = await _table_count(
+            storage, "SELECT COUNT(DISTINCT row_hash) FROM version_entries"
+        )
+        assert await _table_count(storage, "SELECT COUNT(*) FROM version_rows") == referenced
+
+    @pytest.mark.asyncio
+    async def test_failed_save_leaves_no_partial_version(
+        self, storage: SQLiteStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A version whose entries fail to insert is not saved at all."""
+        engine = VersioningEngine(storage)
+        await engine.create_version("brain-1", "v1")
+        await storage.add_neuron(
+            Neuron.create(type=NeuronType.CONCEPT, content="x", neuron_id="n-3")
+        )
+        counts = [await _table_count(storage, query) for query in _VERSION_TABLE_COUNTS]
+
+        async def fail(*args: object) -> None:
+            raise sqlite3.OperationalError("disk I/O error")
+
+        conn = storage._ensure_conn()
+        monkeypatch.setattr(type(conn), "executemany", fail)
+        with pytest.raises(sqlite3.OperationalError):
+            await engine.create_version("brain-1", "v2")
+        monkeypatch.undo()
+
+        assert [await _table_count(storage, query) for query in _VERSION_TABLE_COUNTS] == counts
+
+    @pytest.mark.asyncio
+    async def test_rollback_restores_state(self, storage: SQLiteStorage) -> None:
+        """Rollback replays the version's rows into the brain."""
+        engine = VersioningEngine(storage)
+        v1 = await engine.create_version("brain-1", "v1")
+        await storage.delete_neuron("n-2")
+        await storage.add_neuron(
+            Neuron.create(type=NeuronType.CONCEPT, content="x", neuron_id="n-3")
+        )
+
+        rollback = await engine.rollback("brain-1", v1.id)
+
+        assert await storage.get_neuron("n-2") is not None
+        assert await storage.get_neuron("n-3") is None
+        assert rollback.snapshot_hash == v1.snapshot_hash
+        assert rollback.metadata == {"rollback_from": v1.id}
+
+    @pytest.mark.asyncio
+    async def test_legacy_snapshot_version_survives_migration(self, storage: SQLiteStorage) -> None:
+        """Whole-snapshot versions from a v15 database diff against new ones."""
+        snapshot = await storage.export_brain("brain-1")
+        legacy = _make_version(version_id="legacy", version_name="legacy")
+        await storage.save_version("brain-1", legacy, _snapshot_to_json(snapshot))
+        await storage.close()
+
+        with sqlite3.connect(storage._db_path) as conn:
+            conn.execute("DROP TABLE version_rows")
+            conn.execute("DROP TABLE version_entries")
+            conn.execute("DROP INDEX idx_brain_versions_parent")
+            conn.execute("ALTER TABLE brain_versions DROP COLUMN storage_format")
+            conn.execute("ALTER TABLE brain_versions DROP COLUMN parent_version_id")
+            conn.execute("UPDATE schema_version SET version = 15")
+
+        await storage.initialize()
+        storage.set_brain("brain-1")
+        await storage.add_neuron(
+            Neuron.create(type=NeuronType.CONCEPT, content="x", neuron_id="n-3")
+        )
+        engine = VersioningEngine(storage)
+        v2 = await engine.create_version("brain-1", "v2")
+        diff = await engine.diff("brain-1", legacy.id, v2.id)
+
+        assert diff.summary == "+1 neurons"
+        assert (
+            await _table_count(
+                storage, "SELECT COUNT(*) FROM version_entries WHERE version_id = ?", v2.id
+            )
+            == 1
+        )
+        result = await storage.get_version("brain-1", v2.id)
+        assert result is not None
+        assert len(json.loads(result[1])["neurons"]) == 3
+
+
 # ── _row_to_version metadata parsing ────────────────────────────
 
 
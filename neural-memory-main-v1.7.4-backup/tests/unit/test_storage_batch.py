@@ -0,0 +1,297 @@
+"""Tests for batched (single-transaction) storage writes."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from neural_memory.core.brain import Brain, BrainConfig
+from neural_memory.core.neuron import Neuron, NeuronType
+from neural_memory.core.synapse import Synapse, SynapseType
+from neural_memory.engine.encoder import MemoryEncoder
+from neural_memory.storage.factory import HybridStorage
+from neural_memory.storage.memory_store import InMemoryStorage
+from neural_memory.storage.sqlite_store import SQLiteStorage
+
+
+def _neuron(nid: str) -> Neuron:
+    return Neuron.create(type=NeuronType.CONCEPT, content=nid.upper(), neuron_id=nid)
+
+
+def _committed_neuron_ids(db_path: Path) -> set[str]:
+    """Read neuron IDs through a separate connection (sees committed rows only)."""
+    with sqlite3.connect(db_path) as conn:
+        return {row[0] for row in conn.execute("SELECT id FROM neurons")}
+
+
+@pytest.fixture
+async def storage(tmp_path: Path) -> SQLiteStorage:
+    storage = SQLiteStorage(tmp_path / "brain.db")
+    await storage.initialize()
+    brain = Brain.create(name="batch", config=BrainConfig())
+    await storage.save_brain(brain)
+    storage.set_brain(brain.id)
+    yield storage
+    await storage.close()
+
+
+class TestBatch:
+    """Tests for SQLiteStorage.batch()."""
+
+    async def test_commits_once_on_exit(self, storage: SQLiteStorage, tmp_path: Path) -> None:
+        async with storage.batch():
+            await storage.add_neuron(_neuron("a"))
+            await storage.add_neuron(_neuron("b"))
+            await storage.add_synapse(
+                Synapse.create("a", "b", SynapseType.RELATED_TO, synapse_id="ab")
+            )
+            assert _committed_neuron_ids(tmp_path / "brain.db") == set()
+            # Uncommitted writes are visible on the storage's own connection
+            assert await storage.get_neuron("a") is not None
+
+        assert _committed_neuron_ids(tmp_path / "brain.db") == {"a", "b"}
+        assert await storage.get_synapse("ab") is not None
+
+    async def test_rolls_back_on_error(self, storage: SQLiteStorage) -> None:
+        snapshot = await storage.get_graph_snapshot()
+
+        async def failing_write() -> None:
+            async with storage.batch():
+                await storage.add_neuron(_neuron("a"))
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await failing_write()
+
+        assert await storage.get_neuron("a") is None
+        # The rolled-back write never reached the snapshot, so it is kept
+        assert await storage.get_graph_snapshot() is snapshot
+        assert snapshot.index_of("a") is None
+
+    async def test_snapshot_patched_on_commit(self, storage: SQLiteStorage) -> None:
+        snapshot = await storage.get_graph_snapshot()
+
+        async def failing_chunk() -> None:
+            async with storage.batch():
+                await storage.add_neuron(_neuron("b"))
+                raise RuntimeError("chunk failed")
+
+        async with storage.batch():
+            await storage.add_neuron(_neuron("a"))
+            with pytest.raises(RuntimeError):
+                await failing_chunk()
+            # Readers outside the batch must not see uncommitted writes
+            assert snapshot.index_of("a") is None
+
+        assert snapshot.index_of("a") is not None
+        assert snapshot.index_of("b") is None
+
+    async def test_nested_blocks_join_outer(self, storage: SQLiteStorage, tmp_path: Path) -> None:
+        async with storage.batch():
+            async with storage.batch():
+                await storage.add_neuron(_neuron("a"))
+            assert _committed_neuron_ids(tmp_path / "brain.db") == set()
+
+        assert _committed_neuron_ids(tmp_path / "brain.db") == {"a"}
+
+    async def test_failed_inner_block_only_undoes_itself(self, storage: SQLiteStorage) -> None:
+        async def failing_chunk() -> None:
+            async with storage.batch():
+                await storage.add_neuron(_neuron("b"))
+                raise RuntimeError("chunk failed")
+
+        async with storage.batch():
+            await storage.add_neuron(_neuron("a"))
+            with pytest.raises(RuntimeError):
+                await failing_chunk()
+            await storage.add_neuron(_neuron("c"))
+
+        assert await storage.get_neuron("b") is None
+        assert await storage.get_neuron("a") is not None
+        assert await storage.get_neuron("c") is not None
+
+    async def test_concurrent_batches_do_not_share_a_transaction(
+        self, storage: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        opened = asyncio.Event()
+
+        async def failing() -> None:
+            async with storage.batch():
+                await storage.add_neuron(_neuron("a"))
+                opened.set()
+                await asyncio.sleep(0.05)
+                raise RuntimeError("boom")
+
+        async def succeeding() -> None:
+            await opened.wait()
+            async with storage.batch():
+                await storage.add_neuron(_neuron("b"))
+
+        results = await asyncio.gather(failing(), succeeding(), return_exceptions=True)
+
+        assert isinstance(results[0], RuntimeError)
+        assert results[1] is None
+        assert _committed_neuron_ids(tmp_path / "brain.db") == {"b"}
+
+    async def test_failed_batch_keeps_writes_of_other_tasks(
+        self, storage: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        opened = asyncio.Event()
+
+        async def failing() -> None:
+            async with storage.batch():
+                await storage.add_neuron(_neuron("a"))
+                opened.set()
+                await asyncio.sleep(0.05)
+                raise RuntimeError("boom")
+
+        async def plain() -> bool:
+            await opened.wait()
+            # The open batch is invisible outside it; this write waits for it
+            assert await storage.get_neuron("a") is None
+            await storage.add_neuron(_neuron("b"))
+            return True
+
+        results = await asyncio.gather(failing(), plain(), return_exceptions=True)
+
+        assert isinstance(results[0], RuntimeError)
+        assert results[1] is True
+        assert _committed_neuron_ids(tmp_path / "brain.db") == {"b"}
+
+    async def test_concurrent_nested_blocks_take_turns(
+        self, storage: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        async def chunk(nid: str, fail: bool) -> None:
+            async with storage.batch():
+                await storage.add_neuron(_neuron(nid))
+                await asyncio.sleep(0.01)
+                if fail:
+                    raise RuntimeError(nid)
+
+        async with storage.batch():
+            results = await asyncio.gather(
+                chunk("a", fail=False), chunk("b", fail=True), return_exceptions=True
+            )
+
+        assert results[0] is None
+        assert isinstance(results[1], RuntimeError)
+        assert _committed_neuron_ids(tmp_path / "brain.db") == {"a"}
+
+
+class TestHybridBatch:
+    """HybridStorage sends remote writes only after the local commit."""
+
+    @pytest.fixture
+    def remote(self) -> MagicMock:
+        remote = MagicMock()
+        remote.is_connected = True
+        remote.add_neuron = AsyncMock()
+        return remote
+
+    async def test_remote_sync_waits_for_commit(
+        self, storage: SQLiteStorage, remote: MagicMock
+    ) -> None:
+        hybrid = HybridStorage(storage, remote)
+
+        async with hybrid.batch():
+            async with hybrid.batch():
+                await hybrid.add_neuron(_neuron("a"))
+            remote.add_neuron.assert_not_awaited()
+
+        remote.add_neuron.assert_awaited_once()
+
+    async def test_rollback_drops_remote_sync(
+        self, storage: SQLiteStorage, remote: MagicMock
+    ) -> None:
+        hybrid = HybridStorage(storage, remote)
+
+        async def failing_write() -> None:
+            async with hybrid.batch():
+                await hybrid.add_neuron(_neuron("a"))
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await failing_write()
+
+        remote.add_neuron.assert_not_awaited()
+        await hybrid.add_neuron(_neuron("b"))
+        remote.add_neuron.assert_awaited_once()
+
+
+class TestBulkWrites:
+    """Tests for add_neurons_bulk / add_synapses_bulk."""
+
+    async def test_bulk_insert(self, storage: SQLiteStorage) -> None:
+        ids = await storage.add_neurons_bulk([_neuron(n) for n in "abc"])
+        assert ids == ["a", "b", "c"]
+        assert await storage.get_neuron_state("b") is not None
+
+        synapses = [
+            Synapse.create("a", "b", SynapseType.RELATED_TO, synapse_id="ab"),
+            Synapse.create("b", "c", SynapseType.RELATED_TO, synapse_id="bc"),
+        ]
+        assert await storage.add_synapses_bulk(synapses) == ["ab", "bc"]
+        assert len(await storage.get_all_synapses()) == 2
+
+    async def test_duplicate_neuron_leaves_nothing(self, storage: SQLiteStorage) -> None:
+        await storage.add_neuron(_neuron("b"))
+
+        async with storage.batch():
+            with pytest.raises(ValueError, match="already exist"):
+                await storage.add_neurons_bulk([_neuron("a"), _neuron("b")])
+
+        assert await storage.get_neuron("a") is None
+        assert await storage.get_neuron("b") is not None
+
+    async def test_missing_endpoint_rejected(self, storage: SQLiteStorage) -> None:
+        await storage.add_neuron(_neuron("a"))
+
+        with pytest.raises(ValueError, match="Target neuron missing"):
+            await storage.add_synapses_bulk(
+                [Synapse.create("a", "missing", SynapseType.RELATED_TO, synapse_id="am")]
+            )
+        assert await storage.get_synapse("am") is None
+
+    async def test_bulk_patches_graph_snapshot(self, storage: SQLiteStorage) -> None:
+        snapshot = await storage.get_graph_snapshot()
+        await storage.add_neurons_bulk([_neuron("a"), _neuron("b")])
+        await storage.add_synapses_bulk(
+            [Synapse.create("a", "b", SynapseType.RELATED_TO, weight=0.7, synapse_id="ab")]
+        )
+
+        a = snapshot.index_of("a")
+        assert a is not None
+        assert [snapshot.neuron_id(i) for i, _ in snapshot.neighbors(a)] == ["b"]
+
+    async def test_default_implementation(self) -> None:
+        storage = InMemoryStorage()
+        brain = Brain.create(name="mem", config=BrainConfig())
+        await storage.save_brain(brain)
+        storage.set_brain(brain.id)
+
+        async with storage.batch():
+            await storage.add_neurons_bulk([_neuron("a"), _neuron("b")])
+            await storage.add_synapses_bulk(
+                [Synapse.create("a", "b", SynapseType.RELATED_TO, synapse_id="ab")]
+            )
+        assert await storage.get_synapse("ab") is not None
+
+
+class TestEncoderBatch:
+    """MemoryEncoder.encode writes each memory in one transaction."""
+
+    async def test_encode_commits_whole_memory(
+        self, storage: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        encoder = MemoryEncoder(storage, BrainConfig())
+        result = await encoder.encode("Alice deployed the Python service on Friday")
+
+        committed = _committed_neuron_ids(tmp_path / "brain.db")
+        assert {n.id for n in result.neurons_created} <= committed
+        assert await storage.get_fiber(result.fiber.id) is not None
+        for synapse in result.synapses_created:
+            assert await storage.get_synapse(synapse.id) is not None
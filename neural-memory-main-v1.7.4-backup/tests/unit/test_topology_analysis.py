@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import random
+from collections.abc import Sequence
+from dataclasses import asdict
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from neural_memory.core.brain import Brain, BrainConfig
+from neural_memory.core.neuron import Neuron, NeuronType
+from neural_memory.core.synapse import Synapse, SynapseType
+from neural_memory.engine import topology_analysis
 from neural_memory.engine.topology_analysis import (
     TopologyMetrics,
     _clustering_coefficient,
     _largest_component_ratio,
     compute_topology,
 )
+from neural_memory.storage.sqlite_store import SQLiteStorage
 
 
 def _mock_synapse(source_id: str, target_id: str, enriched: bool = False) -> MagicMock:
@@ -23,6 +32,23 @@ def _mock_synapse(source_id: str, target_id: str, enriched: bool = False) -> Mag
     return s
 
 
+def _wire_graph(storage: AsyncMock, synapses: Sequence[MagicMock]) -> None:
+    """Answer the sampling storage reads from an in-memory synapse list."""
+    adj: dict[str, set[str]] = {}
+    for s in synapses:
+        adj.setdefault(s.source_id, set()).add(s.target_id)
+        adj.setdefault(s.target_id, set()).add(s.source_id)
+
+    async def neighbor_ids(neuron_ids: Sequence[str]) -> dict[str, set[str]]:
+        return {nid: set(adj.get(nid, ())) for nid in neuron_ids}
+
+    storage.sample_neuron_ids = AsyncMock(side_effect=lambda limit: sorted(adj)[:limit])
+    storage.get_neighbor_ids = AsyncMock(side_effect=neighbor_ids)
+    storage.count_synapses_with_metadata = AsyncMock(
+        return_value=sum(1 for s in synapses if s.metadata.get("_enriched"))
+    )
+
+
 @pytest.fixture
 def mock_storage() -> AsyncMock:
     """Storage with empty brain."""
@@ -32,6 +58,7 @@ def mock_storage() -> AsyncMock:
     )
     storage.get_all_synapses = AsyncMock(return_value=[])
     storage.get_neighbors = AsyncMock(return_value=[])
+    _wire_graph(storage, [])
     return storage
 
 
@@ -104,6 +131,39 @@ class TestLargestComponentRatio:
         ratio = _largest_component_ratio([], neuron_count=0)
         assert ratio == 0.0
 
+    def test_sampled_estimate_on_large_graph(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Above the exact-size threshold the ratio is estimated from a sample."""
+        # A 3000-node chain plus 500 two-node islands: exact ratio 3000/4000
+        synapses = [_mock_synapse(f"g{i}", f"g{i + 1}") for i in range(2999)]
+        synapses += [_mock_synapse(f"i{i}a", f"i{i}b") for i in range(500)]
+        exact = _largest_component_ratio(synapses, neuron_count=4000)
+        monkeypatch.setattr(topology_analysis, "_MAX_EXACT_COMPONENT_NODES", 100)
+
+        sampled = _largest_component_ratio(synapses, neuron_count=4000)
+
+        assert exact == 0.75
+        assert sampled == pytest.approx(exact, abs=0.1)
+        assert sampled == _largest_component_ratio(synapses, neuron_count=4000)
+
+    @pytest.mark.asyncio
+    async def test_sampled_from_storage(self, mock_storage: AsyncMock) -> None:
+        """Without preloaded synapses the ratio comes from walks over storage reads."""
+        synapses = [_mock_synapse(f"g{i}", f"g{i + 1}") for i in range(2999)]
+        synapses += [_mock_synapse(f"i{i}a", f"i{i}b") for i in range(500)]
+        _wire_graph(mock_storage, synapses)
+        nodes = sorted({s.source_id for s in synapses} | {s.target_id for s in synapses})
+        mock_storage.sample_neuron_ids = AsyncMock(
+            return_value=random.Random(7).sample(nodes, topology_analysis._MAX_SAMPLE_NODES)
+        )
+        mock_storage.get_stats = AsyncMock(
+            return_value={"neuron_count": 4000, "synapse_count": 3499, "fiber_count": 0}
+        )
+
+        result = await compute_topology(mock_storage, "brain-1")
+
+        assert result.largest_component_ratio == pytest.approx(0.75, abs=0.1)
+        mock_storage.get_all_synapses.assert_not_called()
+
 
 class TestClusteringCoefficient:
     """Tests for clustering coefficient."""
@@ -182,7 +242,7 @@ class TestEnrichedRatio:
         mock_storage.get_stats = AsyncMock(
             return_value={"neuron_count": 3, "synapse_count": 3, "fiber_count": 0}
         )
-        mock_storage.get_all_synapses = AsyncMock(return_value=synapses)
+        _wire_graph(mock_storage, synapses)
 
         result = await compute_topology(mock_storage, "brain-1")
         assert abs(result.enriched_synapse_ratio - 2 / 3) < 0.01
@@ -197,9 +257,7 @@ class TestKnowledgeDensity:
         mock_storage.get_stats = AsyncMock(
             return_value={"neuron_count": 10, "synapse_count": 30, "fiber_count": 5}
         )
-        mock_storage.get_all_synapses = AsyncMock(
-            return_value=[_mock_synapse("a", "b") for _ in range(30)]
-        )
+        _wire_graph(mock_storage, [_mock_synapse("a", "b") for _ in range(30)])
 
         result = await compute_topology(mock_storage, "brain-1")
         assert result.knowledge_density == 3.0
@@ -215,12 +273,13 @@ class TestUndirectedDensity:
         mock_storage.get_stats = AsyncMock(
             return_value={"neuron_count": 3, "synapse_count": 3, "fiber_count": 0}
         )
-        mock_storage.get_all_synapses = AsyncMock(
-            return_value=[
+        _wire_graph(
+            mock_storage,
+            [
                 _mock_synapse("a", "b"),
                 _mock_synapse("b", "c"),
                 _mock_synapse("a", "c"),
-            ]
+            ],
         )
 
         result = await compute_topology(mock_storage, "brain-1")
@@ -233,9 +292,7 @@ class TestUndirectedDensity:
         mock_storage.get_stats = AsyncMock(
             return_value={"neuron_count": 2, "synapse_count": 5, "fiber_count": 0}
         )
-        mock_storage.get_all_synapses = AsyncMock(
-            return_value=[_mock_synapse("a", "b") for _ in range(5)]
-        )
+        _wire_graph(mock_storage, [_mock_synapse("a", "b") for _ in range(5)])
 
         result = await compute_topology(mock_storage, "brain-1")
         assert result.density == 1.0
@@ -260,3 +317,48 @@ class TestPreloadedSynapses:
         # Should NOT have called get_all_synapses
         mock_storage.get_all_synapses.assert_not_called()
         assert result.largest_component_ratio > 0.0
+
+
+class TestStorageSampling:
+    """Tests for topology sampled from SQLite storage reads."""
+
+    @pytest.mark.asyncio
+    async def test_matches_preloaded_without_loading_synapses(self, tmp_path: Path) -> None:
+        """Sampled reads agree with the in-memory path on a small graph."""
+        storage = SQLiteStorage(tmp_path / "brain.db")
+        await storage.initialize()
+        try:
+            await storage.save_brain(Brain.create(name="b1", config=BrainConfig(), brain_id="b1"))
+            storage.set_brain("b1")
+            for nid in ("a", "b", "c", "d", "e", "f", "lonely"):
+                await storage.add_neuron(
+                    Neuron.create(type=NeuronType.CONCEPT, content=nid, neuron_id=nid)
+                )
+            # A triangle with a tail, plus a separate pair
+            for i, (source, target) in enumerate(
+                [("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"), ("e", "f")]
+            ):
+                metadata = {"_enriched": True} if i < 2 else None
+                await storage.add_synapse(
+                    Synapse.create(
+                        source,
+                        target,
+                        SynapseType.RELATED_TO,
+                        metadata=metadata,
+                        synapse_id=f"s{i}",
+                    )
+                )
+            preloaded = await compute_topology(
+                storage, "b1", _preloaded_synapses=await storage.get_all_synapses()
+            )
+            storage.get_all_synapses = AsyncMock(side_effect=AssertionError)  # type: ignore[method-assign]
+
+            sampled = await compute_topology(storage, "b1")
+
+            # Nodes are averaged in sample order, so compare within float error
+            assert asdict(sampled) == pytest.approx(asdict(preloaded))
+            assert sampled.largest_component_ratio == pytest.approx(4 / 7)
+            assert sampled.enriched_synapse_ratio == pytest.approx(2 / 5)
+            assert sampled.clustering_coefficient == pytest.approx((1 + 1 + 1 / 3) / 3)
+        finally:
+            await storage.close()
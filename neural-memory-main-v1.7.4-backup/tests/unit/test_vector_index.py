@@ -0,0 +1,222 @@
+"""Tests for the persistent embedding vector index."""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from neural_memory.core.brain import Brain, BrainConfig  # noqa: E402
+from neural_memory.core.neuron import Neuron, NeuronType  # noqa: E402
+from neural_memory.engine import retrieval  # noqa: E402
+from neural_memory.engine.embedding import vector_index  # noqa: E402
+from neural_memory.engine.embedding.provider import EmbeddingProvider  # noqa: E402
+from neural_memory.engine.embedding.vector_index import (  # noqa: E402
+    VectorIndex,
+    backfill_vector_index,
+)
+from neural_memory.engine.encoder import MemoryEncoder  # noqa: E402
+from neural_memory.engine.retrieval import ReflexPipeline  # noqa: E402
+from neural_memory.storage.sqlite_store import SQLiteStorage  # noqa: E402
+
+
+class KeywordEmbedding(EmbeddingProvider):
+    """Deterministic embedding: one axis per known keyword."""
+
+    _AXES = ("python", "coffee", "deploy", "music")
+
+    async def embed(self, text: str) -> list[float]:
+        lower = text.lower()
+        vec = [1.0 if word in lower else 0.0 for word in self._AXES]
+        return vec if any(vec) else [0.5] * len(self._AXES)
+
+    @property
+    def dimension(self) -> int:
+        return len(self._AXES)
+
+
+def _unit(dim: int, axis: int) -> list[float]:
+    return [1.0 if i == axis else 0.0 for i in range(dim)]
+
+
+class TestVectorIndex:
+    """Tests for VectorIndex add/search/remove/persistence."""
+
+    def test_search_ranks_by_cosine(self, tmp_path: Path) -> None:
+        index = VectorIndex(tmp_path, "brain", 3)
+        index.add("x", [1.0, 0.0, 0.0])
+        index.add("xy", [1.0, 1.0, 0.0])
+        index.add("z", [0.0, 0.0, 2.0])
+
+        hits = index.search([1.0, 0.1, 0.0], k=2)
+        assert [h[0] for h in hits] == ["x", "xy"]
+        assert hits[0][1] == pytest.approx(1 / math.sqrt(1.01), rel=1e-5)
+
+    def test_min_similarity_and_remove(self, tmp_path: Path) -> None:
+        index = VectorIndex(tmp_path, "brain", 3)
+        index.add("a", _unit(3, 0))
+        index.add("b", _unit(3, 1))
+
+        assert index.search(_unit(3, 0), k=5, min_similarity=0.5) == [("a", pytest.approx(1.0))]
+        assert index.remove("a")
+        assert not index.remove("a")
+        assert index.search(_unit(3, 0), k=5, min_similarity=0.5) == []
+        assert len(index) == 1
+
+    def test_replace_vector(self, tmp_path: Path) -> None:
+        index = VectorIndex(tmp_path, "brain", 2)
+        index.add("a", [1.0, 0.0])
+        index.add("a", [0.0, 1.0])
+        assert len(index) == 1
+        assert index.search([0.0, 1.0], k=1)[0][0] == "a"
+
+    def test_persists_across_reopen(self, tmp_path: Path) -> None:
+        index = VectorIndex(tmp_path, "brain", 3)
+        index.add("a", _unit(3, 0))
+        index.add("b", _unit(3, 1))
+        index.remove("a")
+        index.add("c", _unit(3, 2))
+        index.close()
+
+        reopened = VectorIndex(tmp_path, "brain", 3)
+        assert len(reopened) == 2
+        assert "a" not in reopened
+        assert reopened.search(_unit(3, 2), k=1)[0][0] == "c"
+
+    def test_backfilled_flag_persists_until_clear(self, tmp_path: Path) -> None:
+        index = VectorIndex(tmp_path, "brain", 3)
+        index.backfilled = True
+        index.close()
+
+        reopened = VectorIndex(tmp_path, "brain", 3)
+        assert reopened.backfilled
+        reopened.clear()
+        assert not VectorIndex(tmp_path, "brain", 3).backfilled
+
+    def test_dimension_change_resets(self, tmp_path: Path) -> None:
+        index = VectorIndex(tmp_path, "brain", 3)
+        index.add("a", _unit(3, 0))
+        index.close()
+
+        reopened = VectorIndex(tmp_path, "brain", 5)
+        assert len(reopened) == 0
+
+    def test_ivf_recall_after_growth(self, tmp_path: Path) -> None:
+        rng = np.random.default_rng(42)
+        dim = 16
+        centers = rng.normal(size=(32, dim))
+        index = VectorIndex(tmp_path, "brain", dim)
+        for i in range(6000):
+            vec = centers[i % 32] + 0.05 * rng.normal(size=dim)
+            index.add(f"v{i}", vec.tolist())
+
+        query = centers[7].tolist()
+        hits = index.search(query, k=10)
+        assert len(hits) == 10
+        assert all(int(item_id[1:]) % 32 == 7 for item_id, _ in hits)
+
+    async def test_ivf_trains_off_the_loop_and_persists(self, tmp_path: Path) -> None:
+        rng = np.random.default_rng(7)
+        dim = 8
+        centers = rng.normal(size=(16, dim))
+        index = VectorIndex(tmp_path, "brain", dim)
+        for i in range(4200):
+            index.add(f"v{i}", (centers[i % 16] + 0.05 * rng.normal(size=dim)).tolist())
+
+        # add() only scheduled training; vectors added meanwhile still land
+        assert index._centroids is None
+        index.add("late", centers[3].tolist())
+        index.remove("v0")
+        await index.wait_trained()
+
+        assert index._centroids is not None
+        assert index._assign[index._rows["late"]] >= 0
+        assert index.search(centers[3].tolist(), k=1)[0][0] == "late"
+        index.close()
+
+        reopened = VectorIndex(tmp_path, "brain", dim)
+        assert reopened._training is None
+        assert reopened._centroids is not None
+        assert reopened.search(centers[3].tolist(), k=1)[0][0] == "late"
+        assert "v0" not in {item_id for item_id, _ in reopened.search(centers[0].tolist(), k=50)}
+
+
+class TestEmbeddingAnchors:
+    """Encoder keeps the index current and the pipeline queries it."""
+
+    @pytest.fixture
+    async def storage(self, tmp_path: Path) -> SQLiteStorage:
+        storage = SQLiteStorage(tmp_path / "brain.db")
+        await storage.initialize()
+        brain = Brain.create(name="vec", config=BrainConfig())
+        await storage.save_brain(brain)
+        storage.set_brain(brain.id)
+        yield storage
+        await storage.close()
+
+    async def test_encode_indexes_and_pipeline_finds_anchor(self, storage: SQLiteStorage) -> None:
+        provider = KeywordEmbedding()
+        encoder = MemoryEncoder(storage, BrainConfig(), embedding_provider=provider)
+        coffee = await encoder.encode("Morning coffee ritual", skip_conflicts=True)
+        await encoder.encode("Deploy pipeline finished", skip_conflicts=True)
+
+        index = await storage.get_vector_index(provider.dimension)
+        assert index is not None
+        assert len(index) == 2
+
+        pipeline = ReflexPipeline(storage, BrainConfig(), embedding_provider=provider)
+        # Legacy scan until the backfill this call starts has finished
+        assert await pipeline._find_embedding_anchors("coffee") == []
+        await retrieval._backfills[index]
+        anchors = await pipeline._find_embedding_anchors("coffee")
+        assert anchors == [coffee.fiber.anchor_neuron_id]
+
+    async def test_backfill_adds_existing_memories(
+        self, storage: SQLiteStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(vector_index, "_BACKFILL_PAGE", 2)
+        provider = KeywordEmbedding()
+        # Stored before any provider was wired in
+        coffee = await MemoryEncoder(storage, BrainConfig()).encode(
+            "Morning coffee ritual", skip_conflicts=True
+        )
+        await storage.add_neuron(
+            Neuron.create(
+                type=NeuronType.CONCEPT,
+                content="legacy",
+                metadata={"_embedding": _unit(4, 3)},
+                neuron_id="legacy",
+            )
+        )
+        index = await storage.get_vector_index(provider.dimension)
+        assert index is not None
+        assert not index.backfilled
+
+        # The backfill reads the brain it was started for, not the selected one
+        other = Brain.create(name="other", config=BrainConfig())
+        await storage.save_brain(other)
+        brain_id = storage.current_brain_id
+        assert brain_id is not None
+        storage.set_brain(other.id)
+        added = await backfill_vector_index(index, storage, provider, brain_id)
+        storage.set_brain(brain_id)
+
+        assert added == 2
+        assert index.backfilled
+        pipeline = ReflexPipeline(storage, BrainConfig(), embedding_provider=provider)
+        assert await pipeline._find_embedding_anchors("coffee") == [coffee.fiber.anchor_neuron_id]
+        assert await pipeline._find_embedding_anchors("music") == ["legacy"]
+
+    async def test_delete_neuron_removes_vector(self, storage: SQLiteStorage) -> None:
+        provider = KeywordEmbedding()
+        encoder = MemoryEncoder(storage, BrainConfig(), embedding_provider=provider)
+        result = await encoder.encode("Python music playlist", skip_conflicts=True)
+        anchor_id = result.fiber.anchor_neuron_id
+
+        await storage.delete_neuron(anchor_id)
+        index = await storage.get_vector_index(provider.dimension)
+        assert index is not None
+        assert anchor_id not in index